@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import collections
 import functools
+import itertools
 import logging
 import random
 import secrets
@@ -11,7 +12,7 @@ from collections import Counter, deque, defaultdict
 from collections.abc import Collection, MutableSequence
 from enum import IntEnum, IntFlag
 from typing import (AbstractSet, Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Literal, Mapping, NamedTuple,
-                    Optional, Protocol, Set, Tuple, Union, TYPE_CHECKING, Literal, overload)
+                    Optional, Protocol, Sequence, Set, Tuple, TypeVar, Union, TYPE_CHECKING, Literal, overload)
 import dataclasses
 
 from typing_extensions import NotRequired, TypedDict
@@ -24,6 +25,8 @@ if TYPE_CHECKING:
     from entrance_rando import ERPlacementState
     from worlds import AutoWorld
 
+T = TypeVar("T")
+
 
 class Group(TypedDict):
     name: str
@@ -527,11 +530,13 @@ class MultiWorld():
 
     def get_reachable_locations(self, state: Optional[CollectionState] = None, player: Optional[int] = None) -> List[Location]:
         state: CollectionState = state if state else self.state
-        return [location for location in self.get_locations(player) if location.can_reach(state)]
+        locations = list(self.get_locations(player))
+        return list(select_by_bitset(locations, state.reachable_locations(locations)))
 
     def get_placeable_locations(self, state=None, player=None) -> List[Location]:
         state: CollectionState = state if state else self.state
-        return [location for location in self.get_locations(player) if location.item is None and location.can_reach(state)]
+        locations = [location for location in self.get_locations(player) if location.item is None]
+        return list(select_by_bitset(locations, state.reachable_locations(locations)))
 
     def get_unfilled_locations_for_players(self, location_names: List[str], players: Iterable[int]):
         for player in players:
@@ -593,11 +598,8 @@ class MultiWorld():
         locations = set(self.get_filled_locations())
 
         while locations:
-            sphere: Set[Location] = set()
-
-            for location in locations:
-                if location.can_reach(state):
-                    sphere.add(location)
+            candidates = list(locations)
+            sphere: Set[Location] = set(select_by_bitset(candidates, state.reachable_locations(candidates)))
             yield sphere
             if not sphere:
                 if locations:
@@ -625,8 +627,6 @@ class MultiWorld():
                 events.add(location)
 
         while locations:
-            sphere: Set[Location] = set()
-
             # cull events out
             done_events: Set[Union[Location, None]] = {None}
             while done_events:
@@ -637,9 +637,8 @@ class MultiWorld():
                         done_events.add(event)
                 events -= done_events
 
-            for location in locations:
-                if location.can_reach(state):
-                    sphere.add(location)
+            candidates = list(locations)
+            sphere = set(select_by_bitset(candidates, state.reachable_locations(candidates)))
 
             yield sphere
             if not sphere:
@@ -717,6 +716,243 @@ class MultiWorld():
 
 PathValue = Tuple[str, Optional["PathValue"]]
 
+_bit_characters = b"01" + bytes(254)
+
+
+def bitset_from_flags(flags: Iterable[bool]) -> int:
+    """Returns an int with bit i set when flags[i] is truthy."""
+    flags = bytearray(map(bool, flags))
+    if not flags:
+        return 0
+    flags.reverse()
+    return int(flags.translate(_bit_characters), 2)
+
+
+def select_by_bitset(sequence: Iterable[T], bitset: int) -> Iterator[T]:
+    """Yields the elements of sequence whose bit is set in bitset, in order."""
+    return itertools.compress(sequence, map("1".__eq__, bin(bitset)[:1:-1]))
+
+
+class CopyOnAccessDict(dict):
+    """
+    Dict of per-player containers for CollectionState, which copies a container the first time it is accessed
+    after the dict was shared with a copy. Until then, both copies refer to the same container in a snapshot,
+    which no longer gets modified. Containers that are already copied are looked up like in a normal dict.
+    """
+    __slots__ = ("_shared",)
+    _shared: Dict[Any, Any]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._shared = {}
+
+    def __missing__(self, key: Any) -> Any:
+        value = self._shared[key].copy()
+        self[key] = value
+        return value
+
+    def share(self) -> CopyOnAccessDict:
+        """Returns a copy of this dict, in O(1) if nothing was accessed since the last time it was shared."""
+        if dict.__len__(self):
+            snapshot = self._shared.copy()
+            snapshot.update(dict.items(self))
+            dict.clear(self)
+            self._shared = snapshot
+        ret = CopyOnAccessDict()
+        ret._shared = self._shared
+        return ret
+
+    def _copy_all(self) -> None:
+        if self._shared:
+            for key in self._shared.keys() - dict.keys(self):
+                self[key] = self._shared[key].copy()
+            self._shared = {}
+
+    # anything but direct access goes over all containers, so they all get copied first
+
+    def __iter__(self) -> Iterator[Any]:
+        self._copy_all()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        self._copy_all()
+        return dict.__len__(self)
+
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(self, key) or key in self._shared
+
+    def __eq__(self, other: object) -> bool:
+        self._copy_all()
+        if isinstance(other, CopyOnAccessDict):
+            other._copy_all()
+        return dict.__eq__(self, other)
+
+    def __repr__(self) -> str:
+        self._copy_all()
+        return dict.__repr__(self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        self._copy_all()
+        return CopyOnAccessDict, (dict(self),)
+
+    def keys(self):  # type: ignore[override]
+        self._copy_all()
+        return dict.keys(self)
+
+    def values(self):  # type: ignore[override]
+        self._copy_all()
+        return dict.values(self)
+
+    def items(self):  # type: ignore[override]
+        self._copy_all()
+        return dict.items(self)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def copy(self) -> Dict[Any, Any]:  # type: ignore[override]
+        return dict(self.items())
+
+
+class ReadRecorder:
+    """
+    Stands in for one of a player's containers in a CollectionState while rules are evaluated, and records which keys
+    were looked up. Anything other than looking up a key, like iterating over the container, counts as reading all of it.
+    """
+    __slots__ = ("container", "keys", "read_all")
+    container: Any
+    keys: Set[Any]
+    read_all: bool
+
+    def __init__(self, container: Any) -> None:
+        self.container = container
+        self.keys = set()
+        self.read_all = False
+
+    def __getitem__(self, key: Any) -> Any:
+        self.keys.add(key)
+        return self.container[key]
+
+    def __contains__(self, key: Any) -> bool:
+        self.keys.add(key)
+        return key in self.container
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self.keys.add(key)
+        return self.container.get(key, default)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        # rules that store something in the state, like a cache, can depend on anything
+        self.read_all = True
+        self.container[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        self.read_all = True
+        del self.container[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        self.read_all = True
+        return iter(self.container)
+
+    def __len__(self) -> int:
+        self.read_all = True
+        return len(self.container)
+
+    def __eq__(self, other: object) -> bool:
+        self.read_all = True
+        return self.container == other
+
+    def __getattr__(self, name: str) -> Any:
+        self.read_all = True
+        return getattr(self.container, name)
+
+
+class SweepDependencies:
+    """
+    Keeps track of what the rules of one player's unreachable locations read during a sweep, which is the item names
+    they looked up in prog_items and the regions they asked the reachability of, so that after collecting items only
+    the locations that read something that changed have to be checked again.
+    Only reads of the player's own items and regions are recorded, and rules are assumed to only become True
+    as items get collected. The sweep checks all locations again before it finishes to confirm that.
+    """
+    player: int
+    order: Dict[Location, int]
+    """remaining locations, with their index to check them in the order they were given"""
+    to_check: List[Location]
+    waiting_on_item: Dict[str, List[Location]]
+    waiting_on_region: Dict[Region, List[Location]]
+    counts: Dict[str, int]
+    """the counts of the item names in waiting_on_item when the locations were last checked"""
+
+    def __init__(self, player: int, locations: Iterable[Location]) -> None:
+        self.player = player
+        self.order = {location: index for index, location in enumerate(locations)}
+        self.to_check = list(self.order)
+        self.waiting_on_item = defaultdict(list)
+        self.waiting_on_region = defaultdict(list)
+        self.counts = {}
+
+    def check_all(self) -> None:
+        """Forgets what the rules read, so that every remaining location is checked next time."""
+        self.to_check = list(self.order)
+        self.waiting_on_item.clear()
+        self.waiting_on_region.clear()
+
+    def candidates(self, state: CollectionState) -> List[Location]:
+        """Returns the locations that read something that changed since they were last checked."""
+        player = self.player
+        if state.stale[player]:
+            state.update_reachable_regions(player)
+        candidates = set(self.to_check)
+        self.to_check = []
+        prog_items = state.prog_items[player]
+        counts = self.counts
+        for name in [name for name in self.waiting_on_item if prog_items[name] != counts[name]]:
+            candidates.update(self.waiting_on_item.pop(name))
+        reachable_regions = state.reachable_regions[player]
+        for region in [region for region in self.waiting_on_region if region in reachable_regions]:
+            candidates.update(self.waiting_on_region.pop(region))
+        # entries of locations that were checked again since they were added are left behind, so filter those out
+        order = self.order
+        return sorted((location for location in candidates if location in order), key=order.__getitem__)
+
+    def check(self, state: CollectionState, locations: Iterable[Location]) -> List[Location]:
+        """
+        Checks the locations, recording what their rules read, and returns the reachable ones,
+        which are no longer tracked afterwards.
+        """
+        player = self.player
+        if state.stale[player]:
+            state.update_reachable_regions(player)
+        prog_items = state.prog_items[player]
+        reachable_regions = state.reachable_regions[player]
+        items = ReadRecorder(prog_items)
+        regions = ReadRecorder(reachable_regions)
+        reachable: List[Location] = []
+        state.prog_items[player] = items  # type: ignore[assignment]
+        state.reachable_regions[player] = regions  # type: ignore[assignment]
+        try:
+            for location in locations:
+                items.keys = set()
+                regions.keys = set()
+                items.read_all = regions.read_all = False
+                if location.can_reach(state):
+                    reachable.append(location)
+                    del self.order[location]
+                elif items.read_all or regions.read_all:
+                    self.to_check.append(location)
+                else:
+                    for name in items.keys:
+                        self.waiting_on_item[name].append(location)
+                    for region in regions.keys:
+                        if region not in reachable_regions:
+                            self.waiting_on_region[region].append(location)
+        finally:
+            state.prog_items[player] = prog_items
+            state.reachable_regions[player] = reachable_regions
+        self.counts = {name: prog_items[name] for name in self.waiting_on_item}
+        return reachable
+
 
 class CollectionState():
     prog_items: Dict[int, Counter[str]]
@@ -730,13 +966,14 @@ class CollectionState():
     allow_partial_entrances: bool
     additional_init_functions: List[Callable[[CollectionState, MultiWorld], None]] = []
     additional_copy_functions: List[Callable[[CollectionState, CollectionState], CollectionState]] = []
+    _copy_on_write_attributes: ClassVar[Tuple[str, ...]] = ("advancements", "path", "locations_checked")
 
     def __init__(self, parent: MultiWorld, allow_partial_entrances: bool = False):
         assert parent.worlds, "CollectionState created without worlds initialized in parent"
-        self.prog_items = {player: Counter() for player in parent.get_all_ids()}
+        self.prog_items = CopyOnAccessDict({player: Counter() for player in parent.get_all_ids()})
         self.multiworld = parent
-        self.reachable_regions = {player: set() for player in parent.get_all_ids()}
-        self.blocked_connections = {player: set() for player in parent.get_all_ids()}
+        self.reachable_regions = CopyOnAccessDict({player: set() for player in parent.get_all_ids()})
+        self.blocked_connections = CopyOnAccessDict({player: set() for player in parent.get_all_ids()})
         self.advancements = set()
         self.path = {}
         self.locations_checked = set()
@@ -748,6 +985,15 @@ class CollectionState():
             for item in items:
                 self.collect(item, True)
 
+    def __getattr__(self, name: str) -> Any:
+        # only called for missing attributes, which includes those that copy() left to be copied on first use
+        shared = self.__dict__.get("_shared_attributes")
+        if shared and name in shared:
+            value = shared.pop(name).copy()
+            setattr(self, name, value)
+            return value
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
     def update_reachable_regions(self, player: int):
         self.stale[player] = False
         world: AutoWorld.World = self.multiworld.worlds[player]
@@ -815,17 +1061,35 @@ class CollectionState():
             # sweep for indirect connections, mostly Entrance.can_reach(unrelated_Region)
             queue.extend(blocked_connections)
 
+    def _share(self, name: str) -> CopyOnAccessDict:
+        value = getattr(self, name)
+        if not isinstance(value, CopyOnAccessDict):
+            value = CopyOnAccessDict(value)
+            setattr(self, name, value)
+        return value.share()
+
     def copy(self) -> CollectionState:
-        ret = CollectionState(self.multiworld)
-        ret.prog_items = {player: counter.copy() for player, counter in self.prog_items.items()}
-        ret.reachable_regions = {player: region_set.copy() for player, region_set in
-                                 self.reachable_regions.items()}
-        ret.blocked_connections = {player: entrance_set.copy() for player, entrance_set in
-                                   self.blocked_connections.items()}
-        ret.advancements = self.advancements.copy()
-        ret.path = self.path.copy()
-        ret.locations_checked = self.locations_checked.copy()
+        """
+        Copies are copy-on-write: per-player containers and the sets of advancements, checked locations and paths are
+        only copied once they are used by either state, so copying costs little beyond what is changed afterwards.
+        """
+        ret = self.__class__.__new__(self.__class__)
+        ret.multiworld = self.multiworld
+        ret.prog_items = self._share("prog_items")
+        ret.reachable_regions = self._share("reachable_regions")
+        ret.blocked_connections = self._share("blocked_connections")
+
+        shared = self.__dict__.get("_shared_attributes", {}).copy()
+        for name in self._copy_on_write_attributes:
+            if name in self.__dict__:
+                shared[name] = self.__dict__.pop(name)
+        self._shared_attributes = shared
+        ret._shared_attributes = shared.copy()
+
+        ret.stale = dict.fromkeys(self.stale, True)
         ret.allow_partial_entrances = self.allow_partial_entrances
+        for function in self.additional_init_functions:
+            function(ret, self.multiworld)
         for function in self.additional_copy_functions:
             ret = function(self, ret)
         return ret
@@ -855,6 +1119,27 @@ class CollectionState():
     def can_reach_region(self, spot: str, player: int) -> bool:
         return self.multiworld.get_region(spot, player).can_reach(self)
 
+    def reachable_locations(self, locations: Sequence[Location]) -> int:
+        """
+        Checks all locations against this state at once, asking each world about its own locations through
+        World.reachable_locations. Returns a bitset with bit i set when locations[i] can be reached,
+        see select_by_bitset to turn it back into locations.
+        """
+        if not locations:
+            return 0
+        indices_per_player: Dict[int, List[int]] = defaultdict(list)
+        for index, location in enumerate(locations):
+            indices_per_player[location.player].append(index)
+        if len(indices_per_player) == 1:
+            return self.multiworld.worlds[locations[0].player].reachable_locations(self, locations)
+
+        flags = bytearray(len(locations))
+        for player, indices in indices_per_player.items():
+            reachable = self.multiworld.worlds[player].reachable_locations(self, [locations[i] for i in indices])
+            for index in select_by_bitset(indices, reachable):
+                flags[index] = 1
+        return bitset_from_flags(flags)
+
     def sweep_for_events(self, locations: Optional[Iterable[Location]] = None) -> None:
         Utils.deprecate("sweep_for_events has been renamed to sweep_for_advancements. The functionality is the same. "
                         "Please switch over to sweep_for_advancements.")
@@ -868,6 +1153,8 @@ class CollectionState():
         """
         all_players = {player for player, _ in advancements_per_player}
         players_to_check = all_players
+        dependencies = {player: SweepDependencies(player, locations) for player, locations in advancements_per_player
+                        if self.multiworld.worlds[player].incremental_sweep}
         # As an optimization, it is assumed that each player's world only logically depends on itself. However, worlds
         # are allowed to logically depend on other worlds, so once there are no more players that should be checked
         # under this assumption, an extra sweep iteration is performed that checks every player, to confirm that the
@@ -884,16 +1171,22 @@ class CollectionState():
 
                 # Accessibility of each location is checked first because a player's region accessibility cache becomes
                 # stale whenever one of their own items is collected into the state.
-                reachable_locations: List[Location] = []
-                unreachable_locations: List[Location] = []
-                for location in locations:
-                    if location.can_reach(self):
-                        # Locations containing items that do not belong to `player` could be collected immediately
-                        # because they won't stale `player`'s region accessibility cache, but, for simplicity, all the
-                        # items at reachable locations are collected in a single loop.
-                        reachable_locations.append(location)
-                    else:
-                        unreachable_locations.append(location)
+                # Locations containing items that do not belong to `player` could be collected immediately because
+                # they won't stale `player`'s region accessibility cache, but, for simplicity, all the items at
+                # reachable locations are collected in a single loop.
+                player_dependencies = dependencies.get(player)
+                if player_dependencies:
+                    # Only the locations whose rules read something that changed are checked, except when confirming
+                    # that the sweep is finished, in case a rule depends on more than it was seen to read.
+                    if checking_if_finished:
+                        player_dependencies.check_all()
+                    reachable_locations = player_dependencies.check(self, player_dependencies.candidates(self))
+                    unreachable_locations = [location for location in locations
+                                             if location in player_dependencies.order]
+                else:
+                    reachable = self.reachable_locations(locations)
+                    reachable_locations = list(select_by_bitset(locations, reachable))
+                    unreachable_locations = list(select_by_bitset(locations, reachable ^ ((1 << len(locations)) - 1)))
                 if unreachable_locations:
                     next_advancements_per_player.append((player, unreachable_locations))
 
@@ -1705,7 +1998,8 @@ class Spoiler:
             # build up spheres of collection radius.
             # Everything in each sphere is independent from each other in dependencies and only depends on lower spheres
 
-            sphere = {location for location in sphere_candidates if state.can_reach(location)}
+            candidates = list(sphere_candidates)
+            sphere = set(select_by_bitset(candidates, state.reachable_locations(candidates)))
 
             for location in sphere:
                 state.collect(location.item, True, location)
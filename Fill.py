@@ -4,7 +4,8 @@ import logging
 import typing
 from collections import Counter, deque
 
-from BaseClasses import CollectionState, Item, Location, LocationProgressType, MultiWorld, PlandoItemBlock
+from BaseClasses import CollectionState, Item, Location, LocationProgressType, MultiWorld, PlandoItemBlock, \
+    select_by_bitset
 from Options import Accessibility
 
 from worlds.AutoWorld import call_all
@@ -771,7 +772,8 @@ def balance_multiworld_progression(multiworld: MultiWorld) -> None:
 
         def get_sphere_locations(sphere_state: CollectionState,
                                  locations: typing.Set[Location]) -> typing.Set[Location]:
-            return {loc for loc in locations if sphere_state.can_reach(loc)}
+            candidates = list(locations)
+            return set(select_by_bitset(candidates, sphere_state.reachable_locations(candidates)))
 
         def item_percentage(player: int, num: int) -> float:
             return num / total_locations_count[player]
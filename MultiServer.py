@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 import asyncio
 import collections
+import concurrent.futures
 import contextlib
 import copy
 import datetime
@@ -13,9 +14,11 @@ import itertools
 import logging
 import math
 import operator
+import os
 import pickle
 import random
 import shlex
+import struct
 import threading
 import time
 import typing
@@ -43,7 +46,7 @@ import NetUtils
 import Utils
 from Utils import version_tuple, restricted_loads, Version, async_start, get_intended_text
 from NetUtils import Endpoint, ClientStatus, NetworkItem, decode, encode, NetworkPlayer, Permission, NetworkSlot, \
-    SlotType, LocationStore, MultiData, Hint, HintStatus
+    SlotType, LocationStore, MultiData, Hint, HintStatus, JSONFragment, encode_with_fragments
 from BaseClasses import ItemClassification
 
 
@@ -204,6 +207,32 @@ class Client(Endpoint):
 
 
 team_slot = typing.Tuple[int, int]
+_Return = typing.TypeVar("_Return")
+
+
+class GamePackageFragments:
+    """
+    Encoded data packages by checksum, shared by all rooms of the process, as most of them use the same games.
+    Rooms can also bring other versions of a game, so it keeps as many packages as there are loaded games,
+    and evicts the least recently used ones.
+    """
+
+    def __init__(self):
+        self.maxsize = 1
+        self.fragments: collections.OrderedDict[str, JSONFragment] = collections.OrderedDict()
+
+    def get(self, checksum: str, make: typing.Callable[[], typing.Any]) -> JSONFragment:
+        fragment = self.fragments.get(checksum)
+        if fragment is None:
+            fragment = self.fragments[checksum] = JSONFragment.of(make())
+            while len(self.fragments) > self.maxsize:
+                self.fragments.popitem(last=False)
+        else:
+            self.fragments.move_to_end(checksum)
+        return fragment
+
+
+game_package_fragments = GamePackageFragments()
 
 
 class Context:
@@ -231,6 +260,7 @@ class Context:
     stored_data: typing.Dict[str, object]
     read_data: typing.Dict[str, object]
     stored_data_notification_clients: typing.Dict[str, typing.Set[Client]]
+    stored_data_prefix_notification_clients: typing.Dict[str, typing.Set[Client]]
     slot_info: typing.Dict[int, NetworkSlot]
     generator_version = Version(0, 0, 0)
     checksums: typing.Dict[str, str]
@@ -243,6 +273,8 @@ class Context:
     non_hintable_names: typing.Dict[str, typing.AbstractSet[str]]
     spheres: typing.List[typing.Dict[int, typing.Set[int]]]
     """ each sphere is { player: { location_id, ... } } """
+    location_spheres: typing.Dict[int, typing.Dict[int, int]]
+    """ player -> location_id -> index of its sphere in spheres """
     logger: logging.Logger
 
     def __init__(self, host: str, port: int, server_password: str, password: str, location_check_points: int,
@@ -260,6 +292,23 @@ class Context:
         self.data_filename = None
         self.save_filename = None
         self.saving = False
+        self.save_journal = False
+        self.journal_generation = 0
+        self.journal_size = 0
+        self.snapshot_size = 0
+        # what the journal already holds of the state that is journaled by its changes
+        self.journaled_item_counts: typing.Dict[typing.Tuple[int, int, bool], int] = {}
+        self.journaled_location_checks: typing.Dict[team_slot, typing.Set[int]] = {}
+        self.journaled_state: typing.Dict[str, typing.Any] = {}
+        # marked after changing them, so that a journal record never misses a change
+        self.dirty_hints: typing.Set[team_slot] = set()
+        self.dirty_stored_data: typing.Set[str] = set()
+        # receivers of new items, which get sent once per event loop iteration by send_new_items
+        self.dirty_item_receivers: typing.Set[team_slot] = set()
+        self.item_delivery_scheduled = False
+        # encoded SetReply packets per client, which get sent once per event loop iteration by send_set_reply
+        self.queued_set_replies: typing.Dict[Client, typing.List[JSONFragment]] = {}
+        self.set_reply_delivery_scheduled = False
         self.player_names: typing.Dict[team_slot, str] = {}
         self.player_name_lookup: typing.Dict[str, team_slot] = {}
         self.connect_names = {}  # names of slots clients can connect to
@@ -278,6 +327,8 @@ class Context:
         self.location_check_points = location_check_points
         self.hints_used = collections.defaultdict(int)
         self.hints: typing.Dict[team_slot, typing.Set[Hint]] = collections.defaultdict(set)
+        # (team, finding player, location) -> the hints for that location, as they are in the hint sets
+        self.hint_index: typing.Dict[typing.Tuple[int, int, int], typing.Set[Hint]] = collections.defaultdict(set)
         self.release_mode: str = release_mode
         self.remaining_mode: str = remaining_mode
         self.collect_mode: str = collect_mode
@@ -296,6 +347,8 @@ class Context:
         self.client_ids: typing.Dict[typing.Tuple[int, int], datetime.datetime] = {}
         self.auto_save_interval = 60  # in seconds
         self.auto_saver_thread: typing.Optional[threading.Thread] = None
+        # event loop that changes the state, which saves read it on
+        self.save_loop: typing.Optional[asyncio.AbstractEventLoop] = None
         self.save_dirty = False
         self.tags = ['AP']
         self.games: typing.Dict[int, str] = {}
@@ -306,8 +359,14 @@ class Context:
         self.random = random.Random()
         self.stored_data = {}
         self.stored_data_notification_clients = collections.defaultdict(weakref.WeakSet)
+        self.stored_data_prefix_notification_clients = {}
+        # how many subscribed prefixes there are of each length, so a key is only compared to prefixes of its own
+        self.stored_data_prefix_lengths: typing.Counter[int] = collections.Counter()
         self.read_data = {}
         self.spheres = []
+        self.location_spheres = {}
+        # encoded JSON of data that is sent over and over, like slot_info, see get_fragment
+        self.encoded_fragments: typing.Dict[typing.Hashable, JSONFragment] = {}
 
         # init empty to satisfy linter, I suppose
         self.gamespackage = {}
@@ -323,6 +382,7 @@ class Context:
         self.non_hintable_names = collections.defaultdict(frozenset)
 
         self._load_game_data()
+        game_package_fragments.maxsize = max(game_package_fragments.maxsize, len(self.gamespackage))
 
     # Data package retrieval
     def _load_game_data(self):
@@ -338,8 +398,9 @@ class Context:
 
         for game_package in self.gamespackage.values():
             # remove groups from data sent to clients
-            del game_package["item_name_groups"]
-            del game_package["location_name_groups"]
+            # the data package is shared, so another Context may have done this already
+            game_package.pop("item_name_groups", None)
+            game_package.pop("location_name_groups", None)
 
     def _init_game_data(self):
         for game_name, game_package in self.gamespackage.items():
@@ -368,6 +429,34 @@ class Context:
         return self.gamespackage[game]["location_name_to_id"] if game in self.gamespackage else None
 
     # General networking
+    def get_fragment(self, key: typing.Hashable, make: typing.Callable[[], typing.Any]) -> JSONFragment:
+        """Returns make() encoded as JSON, encoding it only the first time key is requested.
+        The fragment has to be dropped from encoded_fragments whenever the data it was made from changes."""
+        fragment = self.encoded_fragments.get(key)
+        if fragment is None:
+            fragment = self.encoded_fragments[key] = JSONFragment.of(make())
+        return fragment
+
+    def get_players_fragment(self) -> JSONFragment:
+        return self.get_fragment("players", self.get_players_package)
+
+    def get_game_package_fragment(self, game: str) -> JSONFragment:
+        game_package = self.gamespackage[game]
+        checksum = game_package.get("checksum")
+        if checksum is None:  # custom data package, which only this room knows
+            return self.get_fragment(("game_package", game), lambda: game_package)
+        return game_package_fragments.get(checksum, lambda: game_package)
+
+    def encode_with_fragments(self, msgs: typing.Iterable[dict]) -> str:
+        """Encodes msgs with NetUtils.encode_with_fragments, which only matches the default dumper."""
+        assert self.dumper is encode, "JSONFragments are made with NetUtils.encode, so they need it as dumper"
+        return encode_with_fragments(msgs)
+
+    def encode_data_package(self, games: typing.Iterable[str]) -> str:
+        """Returns the DataPackage packet for games, made from their cached encoded data packages."""
+        games = {game: self.get_game_package_fragment(game) for game in games}
+        return self.encode_with_fragments([{"cmd": "DataPackage", "data": {"games": games}}])
+
     async def send_msgs(self, endpoint: Endpoint, msgs: typing.Iterable[dict]) -> bool:
         if not endpoint.socket or not endpoint.socket.open:
             return False
@@ -489,6 +578,7 @@ class Context:
               use_embedded_server_options: bool):
 
         self.read_data = {}
+        self.encoded_fragments.clear()
         # there might be a better place to put this.
         self.read_data["race_mode"] = lambda: decoded_obj.get("race_mode", 0)
         mdata_ver = decoded_obj["minimum_versions"]["server"]
@@ -540,6 +630,7 @@ class Context:
 
         for slot, hints in decoded_obj["precollected_hints"].items():
             self.hints[0, slot].update(hints)
+        self.index_hints()
 
         # declare slots that aren't players as done
         for slot, slot_info in self.slot_info.items():
@@ -570,6 +661,7 @@ class Context:
 
         # sorted access spheres
         self.spheres = decoded_obj.get("spheres", [])
+        self.index_spheres()
 
     # saving
 
@@ -586,36 +678,192 @@ class Context:
 
     def _save(self, exit_save: bool = False) -> bool:
         try:
-            # Does not use Utils.restricted_dumps because we'd rather make a save than not make one
-            encoded_save = pickle.dumps(self.get_save())
-            with open(self.save_filename, "wb") as f:
-                f.write(zlib.compress(encoded_save))
+            if self.save_journal and not exit_save and self.journal_size < self.snapshot_size:
+                self._append_journal()
+            else:
+                self._save_snapshot()
         except Exception as e:
             self.logger.exception(e)
+            # the journal may be missing changes now, so the next save writes everything
+            self.snapshot_size = 0
             return False
         else:
             return True
 
+    @property
+    def journal_filename(self) -> str:
+        return self.save_filename + ".journal"
+
+    def call_on_save_loop(self, func: typing.Callable[[], _Return]) -> _Return:
+        """
+        Returns func(), called on the event loop that changes the state, so that what it reads is consistent when
+        saving from another thread.
+        """
+        loop = self.save_loop
+        if loop is None or not loop.is_running():
+            return func()
+        try:
+            if asyncio.get_running_loop() is loop:
+                return func()
+        except RuntimeError:  # no event loop in this thread
+            pass
+        future: concurrent.futures.Future = concurrent.futures.Future()
+
+        def call():
+            try:
+                future.set_result(func())
+            except BaseException as e:
+                future.set_exception(e)
+
+        loop.call_soon_threadsafe(call)
+        while True:
+            try:
+                return future.result(1)
+            except concurrent.futures.TimeoutError:
+                if not loop.is_running():
+                    raise
+
+    def _save_snapshot(self) -> None:
+        """Writes the whole save, which also compacts the journal if there is one."""
+        # Does not use Utils.restricted_dumps because we'd rather make a save than not make one
+        data = zlib.compress(self.call_on_save_loop(self._dump_snapshot))
+        with open(self.save_filename + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(self.save_filename + ".tmp", self.save_filename)
+        self.snapshot_size = len(data)
+        self.journal_size = 0
+        if os.path.exists(self.journal_filename):
+            # records of older generations are ignored anyway, removing them only saves space
+            os.remove(self.journal_filename)
+
+    def _dump_snapshot(self) -> bytes:
+        """Returns the pickled save, and marks what the journal holds from that same save."""
+        if self.save_journal:
+            self.journal_generation += 1
+        save = self.get_save()
+        save["journal_generation"] = self.journal_generation
+        if self.save_journal:
+            self.dirty_hints = set()
+            self.dirty_stored_data = set()
+            self.journaled_item_counts = {key: len(items) for key, items in save["received_items"].items()}
+            self.journaled_location_checks = {key: set(checks) for key, checks in save["location_checks"].items()}
+            self.journaled_state = self._get_journaled_state(save)
+        return pickle.dumps(save)
+
+    def _mark_journaled(self) -> typing.Dict[str, typing.Any]:
+        """
+        Returns what changed since the journal or snapshot was last written, for the state that is journaled by its
+        changes, and marks it as written.
+        """
+        dirty_hints, self.dirty_hints = self.dirty_hints, set()
+        dirty_stored_data, self.dirty_stored_data = self.dirty_stored_data, set()
+        received_items = {}
+        for key, items in self.received_items.items():
+            count = len(items)
+            if count != self.journaled_item_counts.get(key, 0):
+                received_items[key] = items[self.journaled_item_counts.get(key, 0):count]
+                self.journaled_item_counts[key] = count
+        location_checks = {}
+        for key, checks in self.location_checks.items():
+            journaled = self.journaled_location_checks.setdefault(key, set())
+            if len(checks) != len(journaled):
+                location_checks[key] = checks - journaled
+                journaled |= location_checks[key]
+        return {
+            "received_items": received_items,
+            "location_checks": location_checks,
+            "hints": {key: set(self.hints[key]) for key in dirty_hints},
+            "stored_data": {key: self.stored_data[key] for key in dirty_stored_data},
+        }
+
+    def _get_journaled_state(self, save: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        """Returns a copy of the rest of the save, which stays small, so it is compared and written per entry."""
+        return copy.deepcopy({key: value for key, value in save.items()
+                              if key not in ("received_items", "location_checks", "hints", "stored_data")})
+
+    def _append_journal(self) -> None:
+        """
+        Appends the changes since the last save to the journal. Items, checks, hints and data storage are written as
+        what was added or changed, the rest of the save as the entries that changed.
+        """
+        data = zlib.compress(self.call_on_save_loop(self._dump_journal_record))
+        with open(self.journal_filename, "ab") as f:
+            f.write(struct.pack("<II", len(data), zlib.crc32(data)) + data)
+        self.journal_size += 8 + len(data)
+
+    def _dump_journal_record(self) -> bytes:
+        record = self._mark_journaled()
+        state = self._get_journaled_state(self.get_save())
+        record["state"] = {key: value for key, value in state.items() if self.journaled_state.get(key) != value}
+        self.journaled_state = state
+        return pickle.dumps((self.journal_generation, record))
+
+    def read_journal(self, generation: int) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Returns the journal records of the generation, stopping at the first record that is incomplete or damaged,
+        which is where writing it stopped when the server did not shut down cleanly.
+        """
+        records = []
+        try:
+            with open(self.journal_filename, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return records
+        position = 0
+        while position + 8 <= len(data):
+            length, checksum = struct.unpack_from("<II", data, position)
+            payload = data[position + 8:position + 8 + length]
+            if len(payload) != length or zlib.crc32(payload) != checksum:
+                self.logger.warning(f"Ignoring damaged end of save journal {self.journal_filename}.")
+                break
+            record_generation, record = restricted_loads(zlib.decompress(payload))
+            if record_generation == generation:
+                records.append(record)
+            position += 8 + length
+        return records
+
+    @staticmethod
+    def apply_journal_record(savedata: dict, record: typing.Dict[str, typing.Any]) -> None:
+        for key, items in record["received_items"].items():
+            savedata["received_items"].setdefault(key, []).extend(items)
+        for key, checks in record["location_checks"].items():
+            savedata["location_checks"].setdefault(key, set()).update(checks)
+        savedata["hints"].update(record["hints"])
+        savedata.setdefault("stored_data", {}).update(record["stored_data"])
+        savedata.update(record["state"])
+
     def init_save(self, enabled: bool = True):
         self.saving = enabled
         if self.saving:
             if not self.save_filename:
-                import os
                 name, ext = os.path.splitext(self.data_filename)
                 self.save_filename = name + '.apsave' if ext.lower() in ('.archipelago', '.zip') \
                     else self.data_filename + '_' + 'apsave'
             try:
                 with open(self.save_filename, 'rb') as f:
                     save_data = restricted_loads(zlib.decompress(f.read()))
-                    self.set_save(save_data)
+                self.journal_generation = save_data.get("journal_generation", 0)
+                records = self.read_journal(self.journal_generation)
+                for record in records:
+                    self.apply_journal_record(save_data, record)
+                self.set_save(save_data)
+                if records:
+                    self.logger.info(f"Replayed {len(records)} records from the save journal.")
             except FileNotFoundError:
                 self.logger.error('No save data found, starting a new game')
             except Exception as e:
                 self.logger.exception(e)
+            if self.save_journal:
+                # journal records are only written on top of a snapshot of the current generation
+                self._save()
             self._start_async_saving()
 
     def _start_async_saving(self, atexit_save: bool = True):
         if not self.auto_saver_thread:
+            try:
+                self.save_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass  # saves read the state right away then
             def save_regularly():
                 # time.time() is platform dependent, so using the expensive datetime method instead
                 def get_datetime_second():
@@ -646,7 +894,6 @@ class Context:
                 atexit.register(self._save, True)  # make sure we save on exit too
 
     def get_save(self) -> dict:
-        self.recheck_hints()
         d = {
             "version": self.save_version,
             "connect_names": self.connect_names,
@@ -684,6 +931,7 @@ class Context:
         self.hints.update(savedata["hints"])
 
         self.name_aliases.update(savedata["name_aliases"])
+        self.encoded_fragments.pop("players", None)
         self.client_game_state.update(savedata["client_game_state"])
         self.client_connection_timers.update(
             {tuple(key): datetime.datetime.fromtimestamp(value, datetime.timezone.utc) for key, value
@@ -711,6 +959,8 @@ class Context:
 
         if "stored_data" in savedata:
             self.stored_data = savedata["stored_data"]
+        self.index_hints()
+        self.recheck_hints()
         # count items and slots from lists for items_handling = remote
         self.logger.info(
             f'Loaded save file with {sum([len(v) for k, v in self.received_items.items() if k[2]])} received items '
@@ -740,23 +990,60 @@ class Context:
                 new_hints.add(new_hint)
                 if hint == new_hint:
                     continue
+                location_hints = self.hint_index[hint_team, hint.finding_player, hint.location]
+                location_hints.discard(hint)
+                location_hints.add(new_hint)
                 for player in self.slot_set(hint.receiving_player) | {hint.finding_player}:
                     if changed is not None:
                         changed.add((hint_team,player))
                     if slot is not None and slot != player:
                         self.replace_hint(hint_team, player, hint, new_hint)
             self.hints[hint_team, hint_slot] = new_hints
+            self.mark_dirty_hints([(hint_team, hint_slot)])
+
+    def recheck_location_hints(self, team: int, slot: int, locations: typing.Iterable[int],
+                               changed: typing.Optional[typing.Set[team_slot]] = None) -> None:
+        """Refreshes only the hints for the specified locations of team/slot, such as after they got checked.
+        If a set is passed for 'changed', each (team,slot) pair that has at least one hint modified will be added to
+        the set.
+        """
+        for location in locations:
+            location_hints = self.hint_index.get((team, slot, location))
+            if not location_hints:
+                continue
+            for hint in list(location_hints):
+                new_hint = hint.re_check(self, team)
+                if hint == new_hint:
+                    continue
+                for player in self.slot_set(hint.receiving_player) | {hint.finding_player}:
+                    if changed is not None:
+                        changed.add((team, player))
+                    self.replace_hint(team, player, hint, new_hint)
+
+    def index_hints(self) -> None:
+        """Rebuilds hint_index from the hint sets."""
+        self.hint_index.clear()
+        for (team, _), hints in self.hints.items():
+            for hint in hints:
+                self.hint_index[team, hint.finding_player, hint.location].add(hint)
 
     def get_rechecked_hints(self, team: int, slot: int):
         self.recheck_hints(team, slot)
         return self.hints[team, slot]
 
+    def index_spheres(self) -> None:
+        """Rebuilds location_spheres from spheres."""
+        self.location_spheres = collections.defaultdict(dict)
+        for i, sphere in reversed(list(enumerate(self.spheres))):  # so the first sphere of a location is kept
+            for player, location_ids in sphere.items():
+                self.location_spheres[player].update(dict.fromkeys(location_ids, i))
+
     def get_sphere(self, player: int, location_id: int) -> int:
         """Get sphere of a location, -1 if spheres are not available."""
         if self.spheres:
-            for i, sphere in enumerate(self.spheres):
-                if location_id in sphere.get(player, set()):
-                    return i
+            player_spheres = self.location_spheres.get(player, {})
+            if location_id in player_spheres:
+                return player_spheres[location_id]
             raise KeyError(f"No Sphere found for location ID {location_id} belonging to player {player}. "
                            f"Location or player may not exist.")
         return -1
@@ -821,22 +1108,24 @@ class Context:
                     for player in self.slot_set(hint.receiving_player):
                         self.hints[team, player].add(hint)
                         new_hint_events.add(player)
+                    self.hint_index[team, hint.finding_player, hint.location].add(hint)
+                    self.mark_dirty_hints([(team, hint.finding_player)])
+                    self.mark_dirty_hints((team, player) for player in self.slot_set(hint.receiving_player))
 
             self.logger.info("Notice (Team #%d): %s" % (team + 1, format_hint(self, team, hint)))
         for slot in new_hint_events:
             self.on_new_hint(team, slot)
         for slot, hint_data in concerns.items():
             if recipients is None or slot in recipients:
-                clients = filter(lambda c: not c.no_text, self.clients[team].get(slot, []))
+                clients = [client for client in self.clients[team].get(slot, []) if not client.no_text]
                 if not clients:
                     continue
                 client_hints = [datum[1] for datum in sorted(hint_data, key=lambda x: x[0].finding_player != slot)]
-                for client in clients:
-                    async_start(self.send_msgs(client, client_hints))
+                self.broadcast(clients, client_hints)
 
     def get_hint(self, team: int, finding_player: int, seeked_location: int) -> typing.Optional[Hint]:
-        for hint in self.hints[team, finding_player]:
-            if hint.location == seeked_location and hint.finding_player == finding_player:
+        for hint in self.hint_index.get((team, finding_player, seeked_location), ()):
+            if hint in self.hints[team, finding_player]:
                 return hint
         return None
     
@@ -844,6 +1133,20 @@ class Context:
         if old_hint in self.hints[team, slot]:
             self.hints[team, slot].remove(old_hint)
             self.hints[team, slot].add(new_hint)
+            location_hints = self.hint_index[team, old_hint.finding_player, old_hint.location]
+            location_hints.discard(old_hint)
+            location_hints.add(new_hint)
+            self.mark_dirty_hints([(team, slot)])
+
+    def mark_dirty_hints(self, keys: typing.Iterable[team_slot]) -> None:
+        """Remembers whose hints changed since the last save. Only the journal needs this."""
+        if self.save_journal:
+            self.dirty_hints.update(keys)
+
+    def mark_dirty_stored_data(self, key: str) -> None:
+        """Remembers which data storage keys changed since the last save. Only the journal needs this."""
+        if self.save_journal:
+            self.dirty_stored_data.add(key)
     
     # "events"
 
@@ -866,20 +1169,93 @@ class Context:
 
     def on_changed_hints(self, team: int, slot: int):
         key: str = f"_read_hints_{team}_{slot}"
-        targets: typing.Set[Client] = set(self.stored_data_notification_clients[key])
+        targets: typing.Set[Client] = self.get_notification_targets(key)
         if targets:
-            self.broadcast(targets, [{"cmd": "SetReply", "key": key, "value": self.hints[team, slot]}])
+            self.send_set_reply(targets, {"cmd": "SetReply", "key": key, "value": self.hints[team, slot]})
 
     def on_client_status_change(self, team: int, slot: int):
         key: str = f"_read_client_status_{team}_{slot}"
-        targets: typing.Set[Client] = set(self.stored_data_notification_clients[key])
+        targets: typing.Set[Client] = self.get_notification_targets(key)
         if targets:
-            self.broadcast(targets, [{"cmd": "SetReply", "key": key, "value": self.client_game_state[team, slot]}])
+            self.send_set_reply(targets, {"cmd": "SetReply", "key": key, "value": self.client_game_state[team, slot]})
+
+    # data storage
+    def get_notification_targets(self, key: str) -> typing.Set[Client]:
+        """Returns the clients that asked to be notified about key with SetNotify, by the key or a prefix of it."""
+        targets = set(self.stored_data_notification_clients.get(key, ()))
+        for length in list(self.stored_data_prefix_lengths):
+            if length > len(key):
+                continue
+            clients = self.stored_data_prefix_notification_clients.get(key[:length])
+            if clients:
+                targets.update(clients)
+            elif clients is not None:
+                self.remove_notification_prefix(key[:length])
+        return targets
+
+    def add_notification_prefix(self, prefix: str, client: Client):
+        clients = self.stored_data_prefix_notification_clients.get(prefix)
+        if clients is None:
+            clients = self.stored_data_prefix_notification_clients[prefix] = weakref.WeakSet()
+            self.stored_data_prefix_lengths[len(prefix)] += 1
+        clients.add(client)
+
+    def remove_notification_prefix(self, prefix: str):
+        del self.stored_data_prefix_notification_clients[prefix]
+        self.stored_data_prefix_lengths[len(prefix)] -= 1
+        if not self.stored_data_prefix_lengths[len(prefix)]:
+            del self.stored_data_prefix_lengths[len(prefix)]
+
+    def remove_notification_client(self, client: Client):
+        """Unsubscribes client from all prefixes, and drops the prefixes that no one is subscribed to anymore."""
+        for prefix, clients in list(self.stored_data_prefix_notification_clients.items()):
+            clients.discard(client)
+            if not clients:
+                self.remove_notification_prefix(prefix)
+
+    def send_set_reply(self, targets: typing.Iterable[Client], msg: dict):
+        """
+        Queues the SetReply packet msg for targets. It is encoded right away, as the value may be changed in place by
+        later operations, and sent once the current event loop iteration is done, together with the other SetReply
+        packets for the same client.
+        """
+        fragment = JSONFragment(self.dumper(msg))
+        for client in targets:
+            self.queued_set_replies.setdefault(client, []).append(fragment)
+        if self.set_reply_delivery_scheduled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.deliver_set_replies()
+        else:
+            self.set_reply_delivery_scheduled = True
+            loop.call_soon(self.deliver_set_replies)
+
+    def encode_set_reply(self, client: Client, msg: dict) -> str:
+        """
+        Encodes the SetReply packet msg for the client that asked for it, to be sent right away instead of queued.
+        The SetReply packets still queued for the client go in front of it, so the client gets them in order.
+        """
+        fragments = self.queued_set_replies.pop(client, [])
+        fragments.append(JSONFragment(self.dumper(msg)))
+        return self.encode_with_fragments(fragments)
+
+    def deliver_set_replies(self):
+        self.set_reply_delivery_scheduled = False
+        queued, self.queued_set_replies = self.queued_set_replies, {}
+        # clients that got the same packets, like subscribers of the same keys, get them encoded only once
+        payloads: typing.Dict[typing.Tuple[JSONFragment, ...], typing.List[Client]] = collections.defaultdict(list)
+        for client, fragments in queued.items():
+            payloads[tuple(fragments)].append(client)
+        for fragments, clients in payloads.items():
+            async_start(self.broadcast_send_encoded_msgs(clients, self.encode_with_fragments(fragments)))
 
 
 def update_aliases(ctx: Context, team: int):
-    cmd = ctx.dumper([{"cmd": "RoomUpdate",
-                       "players": ctx.get_players_package()}])
+    ctx.encoded_fragments.pop("players", None)
+    cmd = ctx.encode_with_fragments([{"cmd": "RoomUpdate",
+                                      "players": ctx.get_players_fragment()}])
 
     for clients in ctx.clients[team].values():
         for client in clients:
@@ -947,6 +1323,7 @@ def get_permissions(ctx) -> typing.Dict[str, Permission]:
 
 
 async def on_client_disconnected(ctx: Context, client: Client):
+    ctx.remove_notification_client(client)
     if client.auth:
         await on_client_left(ctx, client)
 
@@ -1066,20 +1443,42 @@ def get_start_inventory(ctx: Context, player: int, remote_start_inventory: bool)
 
 
 def send_new_items(ctx: Context):
-    for team, clients in ctx.clients.items():
-        for slot, clients in clients.items():
-            for client in clients:
-                if client.no_items:
-                    continue
-                start_inventory = get_start_inventory(ctx, slot, client.remote_start_inventory)
-                items = get_received_items(ctx, team, slot, client.remote_items)
-                if len(start_inventory) + len(items) > client.send_index:
-                    first_new_item = max(0, client.send_index - len(start_inventory))
-                    async_start(ctx.send_msgs(client, [{
-                        "cmd": "ReceivedItems",
-                        "index": client.send_index,
-                        "items": start_inventory[client.send_index:] + items[first_new_item:]}]))
-                    client.send_index = len(start_inventory) + len(items)
+    """
+    Sends new items to the clients of the slots in ctx.dirty_item_receivers. This is done once the current event loop
+    iteration is done, so all items received until then are sent together, in one packet per client.
+    """
+    if ctx.item_delivery_scheduled:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        deliver_new_items(ctx)
+    else:
+        ctx.item_delivery_scheduled = True
+        loop.call_soon(deliver_new_items, ctx)
+
+
+def deliver_new_items(ctx: Context):
+    ctx.item_delivery_scheduled = False
+    receivers, ctx.dirty_item_receivers = ctx.dirty_item_receivers, set()
+    for team, slot in receivers:
+        # clients of a slot that are at the same item get the same packet, so it is only encoded once
+        packets: typing.Dict[typing.Tuple[bool, bool, int], typing.List[Client]] = collections.defaultdict(list)
+        for client in ctx.clients.get(team, {}).get(slot, ()):
+            if client.no_items:
+                continue
+            start_inventory = get_start_inventory(ctx, slot, client.remote_start_inventory)
+            items = get_received_items(ctx, team, slot, client.remote_items)
+            if len(start_inventory) + len(items) > client.send_index:
+                packets[client.remote_start_inventory, client.remote_items, client.send_index].append(client)
+                client.send_index = len(start_inventory) + len(items)
+        for (remote_start_inventory, remote_items, send_index), clients in packets.items():
+            start_inventory = get_start_inventory(ctx, slot, remote_start_inventory)
+            items = get_received_items(ctx, team, slot, remote_items)
+            new_items = items[max(0, send_index - len(start_inventory)):]
+            if send_index < len(start_inventory):
+                new_items = start_inventory[send_index:] + new_items
+            ctx.broadcast(clients, [{"cmd": "ReceivedItems", "index": send_index, "items": new_items}])
 
 
 def update_checked_locations(ctx: Context, team: int, slot: int):
@@ -1127,6 +1526,7 @@ def send_items_to(ctx: Context, team: int, target_slot: int, *items: NetworkItem
             if item.player != target_slot:
                 get_received_items(ctx, team, target, False).append(item)
             get_received_items(ctx, team, target, True).append(item)
+        ctx.dirty_item_receivers.add((team, target))
 
 
 def register_location_checks(ctx: Context, team: int, slot: int, locations: typing.Iterable[int],
@@ -1171,7 +1571,7 @@ def register_location_checks(ctx: Context, team: int, slot: int, locations: typi
             "checked_locations": new_locations,  # send back new checks only
         }])
         updated_slots: typing.Set[tuple[int, int]] = set()
-        ctx.recheck_hints(team, slot, updated_slots)
+        ctx.recheck_location_hints(team, slot, new_locations, updated_slots)
         for hint_team, hint_slot in updated_slots:
             ctx.on_changed_hints(hint_team, hint_slot)
         ctx.save()
@@ -1304,7 +1704,6 @@ class CommandMeta(type):
         return super(CommandMeta, cls).__new__(cls, name, bases, attrs)
 
 
-_Return = typing.TypeVar("_Return")
 # TODO: when python 3.10 is lowest supported, typing.ParamSpec
 
 
@@ -1663,6 +2062,7 @@ class ClientMessageProcessor(CommonCommandProcessor):
                 new_item = NetworkItem(names[item_name], -1, self.client.slot)
                 get_received_items(self.ctx, self.client.team, self.client.slot, False).append(new_item)
                 get_received_items(self.ctx, self.client.team, self.client.slot, True).append(new_item)
+                self.ctx.dirty_item_receivers.add((self.client.team, self.client.slot))
                 self.ctx.broadcast_text_all(
                     'Cheat console: sending "' + item_name + '" to ' + self.ctx.get_aliased_name(self.client.team,
                                                                                                  self.client.slot),
@@ -1680,9 +2080,7 @@ class ClientMessageProcessor(CommonCommandProcessor):
         points_available = get_client_points(self.ctx, self.client)
         cost = self.ctx.get_hint_cost(self.client.slot)
         if not input_text:
-            hints = {hint.re_check(self.ctx, self.client.team) for hint in
-                     self.ctx.hints[self.client.team, self.client.slot]}
-            self.ctx.hints[self.client.team, self.client.slot] = hints
+            hints = self.ctx.get_rechecked_hints(self.client.team, self.client.slot)
             self.ctx.notify_hints(self.client.team, list(hints), recipients=(self.client.slot,))
             self.output(f"A hint costs {self.ctx.get_hint_cost(self.client.slot)} points. "
                         f"You have {points_available} points.")
@@ -1908,10 +2306,10 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
             connected_packet = {
                 "cmd": "Connected",
                 "team": client.team, "slot": client.slot,
-                "players": ctx.get_players_package(),
+                "players": ctx.get_players_fragment(),
                 "missing_locations": get_missing_checks(ctx, team, slot),
                 "checked_locations": get_checked_checks(ctx, team, slot),
-                "slot_info": ctx.slot_info,
+                "slot_info": ctx.get_fragment("slot_info", lambda: ctx.slot_info),
                 "hint_points": get_slot_points(ctx, team, slot),
             }
             reply = [connected_packet]
@@ -1924,29 +2322,22 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
                 client.auth = True
                 await on_client_joined(ctx, client)
             if args.get("slot_data", True):
-                connected_packet["slot_data"] = ctx.slot_data[client.slot]
-            await ctx.send_msgs(client, reply)
+                connected_packet["slot_data"] = ctx.get_fragment(("slot_data", client.slot),
+                                                                 lambda: ctx.slot_data[client.slot])
+            await ctx.send_encoded_msgs(client, ctx.encode_with_fragments(reply))
 
     elif cmd == "GetDataPackage":
         exclusions = args.get("exclusions", [])
         if "games" in args:
-            games = {name: game_data for name, game_data in ctx.gamespackage.items()
-                     if name in set(args.get("games", []))}
-            await ctx.send_msgs(client, [{"cmd": "DataPackage",
-                                          "data": {"games": games}}])
+            requested = set(args.get("games", []))
+            games = [name for name in ctx.gamespackage if name in requested]
         # TODO: remove exclusions behaviour around 0.5.0
         elif exclusions:
             exclusions = set(exclusions)
-            games = {name: game_data for name, game_data in ctx.gamespackage.items()
-                     if name not in exclusions}
-
-            package = {"games": games}
-            await ctx.send_msgs(client, [{"cmd": "DataPackage",
-                                          "data": package}])
-
+            games = [name for name in ctx.gamespackage if name not in exclusions]
         else:
-            await ctx.send_msgs(client, [{"cmd": "DataPackage",
-                                          "data": {"games": ctx.gamespackage}}])
+            games = list(ctx.gamespackage)
+        await ctx.send_encoded_msgs(client, ctx.encode_data_package(games))
 
     elif client.auth:
         if cmd == "ConnectUpdate":
@@ -2175,20 +2566,29 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
                 func = modify_functions[operation["operation"]]
                 value = func(value, operation["value"])
             ctx.stored_data[args["key"]] = args["value"] = value
-            targets = set(ctx.stored_data_notification_clients[args["key"]])
+            ctx.mark_dirty_stored_data(args["key"])
+            targets = ctx.get_notification_targets(args["key"])
             if args.get("want_reply", False):
-                targets.add(client)
+                targets.discard(client)
+                reply = ctx.encode_set_reply(client, args)
             if targets:
-                ctx.broadcast(targets, [args])
+                ctx.send_set_reply(targets, args)
             ctx.save()
+            if args.get("want_reply", False):
+                await ctx.send_encoded_msgs(client, reply)
 
         elif cmd == "SetNotify":
-            if "keys" not in args or type(args["keys"]) != list:
+            keys = args.get("keys", [])
+            prefixes = args.get("prefixes", [])
+            if ("keys" not in args and "prefixes" not in args) or type(keys) != list or type(prefixes) != list \
+                    or not all(type(prefix) == str for prefix in prefixes):
                 await ctx.send_msgs(client, [{'cmd': 'InvalidPacket', "type": "arguments",
                                               "text": 'SetNotify', "original_cmd": cmd}])
                 return
-            for key in args["keys"]:
+            for key in keys:
                 ctx.stored_data_notification_clients[key].add(client)
+            for prefix in prefixes:
+                ctx.add_notification_prefix(prefix, client)
 
 
 def update_client_status(ctx: Context, client: Client, new_status: ClientStatus):
@@ -2577,6 +2977,9 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('--password', default=defaults["password"])
     parser.add_argument('--savefile', default=defaults["savefile"])
     parser.add_argument('--disable_save', default=defaults["disable_save"], action='store_true')
+    parser.add_argument('--save_journal', default=defaults["save_journal"], action='store_true',
+                        help="append changes to a journal next to the save file, instead of rewriting the whole save "
+                             "every time, and only rewrite it once the journal grew as large as the save itself")
     parser.add_argument('--cert', help="Path to a SSL Certificate for encryption.")
     parser.add_argument('--cert_key', help="Path to SSL Certificate Key file")
     parser.add_argument('--loglevel', default=defaults["loglevel"],
@@ -2707,6 +3110,7 @@ async def main(args: argparse.Namespace):
         logging.exception(f"Failed to read multiworld data ({e})")
         raise
 
+    ctx.save_journal = args.save_journal
     ctx.init_save(not args.disable_save)
 
     ssl_context = load_server_cert(args.cert, args.cert_key) if args.cert else None
@@ -139,6 +139,49 @@ def encode(obj: typing.Any) -> str:
     return _encode(_scan_for_TypedTuples(obj))
 
 
+class JSONFragment(str):
+    """Already encoded JSON, which encode_with_fragments inserts into its output as is."""
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, obj: typing.Any) -> JSONFragment:
+        return cls(encode(obj))
+
+
+def _encode_key(key: typing.Any) -> str:
+    # the JSON encoder converts keys its own way, such as True to "true" and None to "null"
+    return _encode({key: None})[1:-len(":null}")]
+
+
+def _encode_with_fragments(obj: typing.Any, parts: typing.List[str]) -> None:
+    if isinstance(obj, JSONFragment):
+        parts.append(obj)
+    elif type(obj) is dict:
+        separator = "{"
+        for key, value in obj.items():
+            parts.append(separator)
+            parts.append(_encode_key(key))
+            parts.append(":")
+            _encode_with_fragments(value, parts)
+            separator = ","
+        parts.append("}" if separator == "," else "{}")
+    else:
+        parts.append(encode(obj))
+
+
+def encode_with_fragments(msgs: typing.Iterable[dict]) -> str:
+    """Encodes msgs like encode, but JSONFragment values found in the (nested) dicts of the messages are inserted
+    as they are, so large parts that are sent over and over only have to be encoded once."""
+    parts = []
+    separator = "["
+    for msg in msgs:
+        parts.append(separator)
+        _encode_with_fragments(msg, parts)
+        separator = ","
+    parts.append("]" if separator == "," else "[]")
+    return "".join(parts)
+
+
 def get_any_version(data: dict) -> Version:
     data = {key.lower(): value for key, value in data.items()}  # .NET version classes have capitalized keys
     return Version(int(data["major"]), int(data["minor"]), int(data["build"]))
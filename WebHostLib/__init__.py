@@ -25,7 +25,11 @@ app.jinja_env.filters['get_file_safe_name'] = get_file_safe_name
 
 app.config["SELFHOST"] = True  # application process is in charge of running the websites
 app.config["GENERATORS"] = 8  # maximum concurrent world gens
+# fork generators from a server process that has all worlds loaded already, instead of loading them in each generator
+app.config["GENERATOR_PREFORK"] = False
 app.config["HOSTERS"] = 8  # maximum concurrent room hosters
+# if set, each room hoster serves all of its rooms on a single port, counting up from this one per hoster
+app.config["HOSTER_PORT"] = None
 app.config["SELFLAUNCH"] = True  # application process is in charge of launching Rooms.
 app.config["SELFLAUNCHCERT"] = None  # can point to a SSL Certificate to encrypt Room websocket connections
 app.config["SELFLAUNCHKEY"] = None  # can point to a SSL Certificate Key to encrypt Room websocket connections
@@ -40,6 +44,9 @@ app.config["SECRET_KEY"] = bytes(socket.gethostname(), encoding="utf-8")
 app.config["JOB_THRESHOLD"] = 1
 # after what time in seconds should generation be aborted, freeing the queue slot. Can be set to None to disable.
 app.config["JOB_TIME"] = 600
+# estimated cost (players + distinct games) from which on a generation is large. Large generations are started after
+# small ones and may not occupy every generator.
+app.config["LARGE_JOB_COST"] = 10
 # memory limit for generator processes in bytes
 app.config["GENERATOR_MEMORY_LIMIT"] = 4294967296
 app.config['SESSION_PERMANENT'] = True
@@ -57,6 +64,8 @@ app.config["MAX_ROLL"] = 20
 app.config["CACHE_TYPE"] = "SimpleCache"
 app.config["HOST_ADDRESS"] = ""
 app.config["ASSET_RIGHTS"] = False
+# allow clients to keep a server-sent events stream of tracker changes open, which takes up a web thread each
+app.config["TRACKER_STREAM"] = False
 
 cache = Cache()
 Compress(app)
@@ -83,6 +92,17 @@ class B64UUIDConverter(BaseConverter):
 # short UUID
 app.url_map.converters["suuid"] = B64UUIDConverter
 app.jinja_env.filters["suuid"] = to_url
+
+
+def room_address(room) -> str:
+    """Address clients connect to for a hosted room."""
+    address = f"{app.config['HOST_ADDRESS']}:{room.last_port}"
+    if app.config["HOSTER_PORT"]:
+        address += f"/{to_url(room.id)}"
+    return address
+
+
+app.jinja_env.filters["room_address"] = room_address
 app.jinja_env.filters["title_sorted"] = title_sorted
 
 
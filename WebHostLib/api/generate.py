@@ -82,4 +82,9 @@ def wait_seed_api(seed: UUID):
         return {"text": "Generation not found"}, 404
     elif generation.state == STATE_ERROR:
         return {"text": "Generation failed"}, 500
+    elif generation.state == STATE_QUEUED:
+        queue_position = json.loads(generation.meta).get("queue_position")
+        if queue_position:
+            return {"text": f"Generation queued, position {queue_position} in queue",
+                    "queue_position": queue_position}, 202
     return {"text": "Generation running"}, 202
@@ -1,14 +1,21 @@
+import json
+import time
 from datetime import datetime, timezone
-from typing import Any, TypedDict
+from typing import Any, Iterator, TypedDict
 from uuid import UUID
 
-from flask import abort
+from flask import Response, abort, make_response, request
+from pony.orm import db_session
 
 from NetUtils import ClientStatus, Hint, NetworkItem, SlotType
-from WebHostLib import cache
+from WebHostLib import app, cache
 from WebHostLib.api import api_endpoints
 from WebHostLib.models import Room
-from WebHostLib.tracker import TrackerData
+from WebHostLib.tracker import TrackerData, get_cached_multisave, get_save_version
+
+# how often a tracker stream checks whether the room saved, and how long until a client has to reconnect
+TRACKER_STREAM_INTERVAL_IN_SECONDS = 10
+TRACKER_STREAM_DURATION_IN_SECONDS = 30 * 60
 
 
 class PlayerAlias(TypedDict):
@@ -58,11 +65,18 @@ class PlayerLocationsTotal(TypedDict):
     total_locations: int
 
 
+def _is_save_version_known(save_version: int) -> bool:
+    """Whether the request's If-None-Match has the ETag of save_version, which compression may have suffixed."""
+    tag = str(save_version)
+    return request.if_none_match.star_tag or any(
+        etag.split(":", 1)[0] == tag for etag in request.if_none_match.as_set(include_weak=True))
+
+
 @api_endpoints.route("/tracker/<suuid:tracker>")
-@cache.memoize(timeout=60)
-def tracker_data(tracker: UUID) -> dict[str, Any]:
+def tracker_data(tracker: UUID) -> Response:
     """
     Outputs json data to <root_path>/api/tracker/<id of current session tracker>.
+    The response's ETag is the room's save version, so a request with it in If-None-Match only gets data after a save.
 
     :param tracker: UUID of current session tracker.
 
@@ -72,6 +86,18 @@ def tracker_data(tracker: UUID) -> dict[str, Any]:
     if not room:
         abort(404)
 
+    save_version = get_save_version(room)
+    if _is_save_version_known(save_version):
+        response = make_response("", 304)
+    else:
+        response = make_response(_get_tracker_data(tracker, save_version))
+    response.set_etag(str(save_version))
+    return response
+
+
+@cache.memoize(timeout=60)
+def _get_tracker_data(tracker: UUID, save_version: int) -> dict[str, Any]:
+    room: Room = Room.get(tracker=tracker)
     tracker_data = TrackerData(room)
 
     all_players: dict[int, list[int]] = tracker_data.get_all_players()
@@ -121,7 +147,7 @@ def tracker_data(tracker: UUID) -> dict[str, Any]:
         for player in players:
             activity_timers.append({"team": team, "player": player, "time": None})
 
-    for (team, player), timestamp in tracker_data._multisave.get("client_activity_timers", []):
+    for (team, player), timestamp in tracker_data.get_multisave().get("client_activity_timers", []):
         for entry in activity_timers:
             if entry["team"] == team and entry["player"] == player:
                 entry["time"] = datetime.fromtimestamp(timestamp, timezone.utc)
@@ -133,7 +159,7 @@ def tracker_data(tracker: UUID) -> dict[str, Any]:
         for player in players:
             connection_timers.append({"team": team, "player": player, "time": None})
 
-    for (team, player), timestamp in tracker_data._multisave.get("client_connection_timers", []):
+    for (team, player), timestamp in tracker_data.get_multisave().get("client_connection_timers", []):
         # find the matching entry
         for entry in connection_timers:
             if entry["team"] == team and entry["player"] == player:
@@ -158,6 +184,105 @@ def tracker_data(tracker: UUID) -> dict[str, Any]:
     }
 
 
+def _get_tracker_delta(tracker_data: TrackerData, since: int | None,
+                       previous_multisave: dict[str, Any] | None) -> dict[str, Any]:
+    """Returns what players received and checked since the save previous_multisave is of, or everything without it."""
+    if previous_multisave is None:
+        since = None
+        previous_multisave = {}
+    previous_received_items = previous_multisave.get("received_items", {})
+    previous_location_checks = previous_multisave.get("location_checks", {})
+
+    player_items_received: list[PlayerItemsReceived] = []
+    player_checks_done: list[PlayerChecksDone] = []
+    for team, players in tracker_data.get_all_players().items():
+        for player in players:
+            items = tracker_data.get_player_received_items(team, player)
+            items = items[len(previous_received_items.get((team, player, True), ())):]
+            if items:
+                player_items_received.append({"team": team, "player": player, "items": items})
+            locations = tracker_data.get_player_checked_locations(team, player)
+            locations = locations - previous_location_checks.get((team, player), set())
+            if locations:
+                player_checks_done.append({"team": team, "player": player, "locations": sorted(locations)})
+
+    return {
+        "version": tracker_data.get_save_version(),
+        "since": since,
+        "player_items_received": player_items_received,
+        "player_checks_done": player_checks_done,
+    }
+
+
+@api_endpoints.route("/tracker_delta/<suuid:tracker>")
+def tracker_delta(tracker: UUID) -> Response:
+    """
+    Outputs json data to <root_path>/api/tracker_delta/<id of current session tracker>?since=<save version>.
+
+    :param tracker: UUID of current session tracker.
+
+    :return: Items received and locations checked since the save version, which is the ETag of the tracker endpoint or
+        the version of an earlier delta. If that version is not known anymore, since is null and everything is returned.
+    """
+    room: Room | None = Room.get(tracker=tracker)
+    if not room:
+        abort(404)
+
+    since: int | None = request.args.get("since", None, type=int)
+    save_version = get_save_version(room)
+    if since == save_version:
+        delta = {"version": save_version, "since": since, "player_items_received": [], "player_checks_done": []}
+    else:
+        previous_multisave = get_cached_multisave(room, since) if since is not None else None
+        delta = _get_tracker_delta(TrackerData(room), since, previous_multisave)
+    return make_response(delta)
+
+
+@api_endpoints.route("/tracker_stream/<suuid:tracker>")
+def tracker_stream(tracker: UUID) -> Response:
+    """
+    Outputs server-sent events to <root_path>/api/tracker_stream/<id of current session tracker>, if enabled with the
+    TRACKER_STREAM setting. Each time the room saves, a delta event is sent, holding the same as the tracker_delta
+    endpoint. The first event is relative to the since argument or the Last-Event-ID of a reconnect, if given.
+
+    :param tracker: UUID of current session tracker.
+    """
+    if not app.config["TRACKER_STREAM"]:
+        abort(404)
+    room: Room | None = Room.get(tracker=tracker)
+    if not room:
+        abort(404)
+
+    since: int | None = request.args.get("since", None, type=int)
+    if since is None:
+        since = request.headers.get("Last-Event-ID", None, type=int)
+
+    def stream(since: int | None) -> Iterator[str]:
+        previous_multisave: dict[str, Any] | None = None
+        end = time.monotonic() + TRACKER_STREAM_DURATION_IN_SECONDS
+        while time.monotonic() < end:
+            with db_session:
+                room: Room | None = Room.get(tracker=tracker)
+                if not room:
+                    return
+                save_version = get_save_version(room)
+                delta = None
+                if save_version != since:
+                    if previous_multisave is None and since is not None:
+                        previous_multisave = get_cached_multisave(room, since)
+                    tracker_data = TrackerData(room)
+                    delta = _get_tracker_delta(tracker_data, since, previous_multisave)
+                    previous_multisave = tracker_data.get_multisave()
+                    since = save_version
+            if delta is not None:
+                yield f"id: {save_version}\nevent: delta\ndata: {json.dumps(delta)}\n\n"
+            else:
+                yield ": no new save\n\n"  # comment, which lets the server notice a closed connection
+            time.sleep(TRACKER_STREAM_INTERVAL_IN_SECONDS)
+
+    return Response(stream(since), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 class PlayerGroups(TypedDict):
     slot: int
     name: str
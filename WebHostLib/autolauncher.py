@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import gc
+import itertools
 import json
 import logging
 import multiprocessing
+import os
+import time
 import typing
 from datetime import timedelta, datetime
 from threading import Event, Thread
@@ -52,12 +56,13 @@ def _mp_gen_game(
         setproctitle(f"Generator (idle)")
 
 
-def launch_generator(pool: multiprocessing.pool.Pool, generation: Generation, timeout: int|None) -> None:
+def launch_generator(pool: multiprocessing.pool.Pool, generation: Generation,
+                     timeout: int|None) -> multiprocessing.pool.AsyncResult | None:
     try:
         meta = json.loads(generation.meta)
         options = restricted_loads(generation.options)
         logging.info(f"Generating {generation.id} for {len(options)} players")
-        pool.apply_async(
+        result = pool.apply_async(
             _mp_gen_game,
             (options,),
             {
@@ -73,13 +78,134 @@ def launch_generator(pool: multiprocessing.pool.Pool, generation: Generation, ti
         generation.state = STATE_ERROR
         commit()
         logging.exception(e)
+        return None
     else:
         generation.state = STATE_STARTED
+        return result
+
+
+def estimate_cost(options: dict[str, dict[str, Any]]) -> int:
+    """Rough cost of generating, every player and every distinct game adds to it."""
+    return len(options) + len({str(player_options.get("game")) for player_options in options.values()})
+
+
+class GenerationScheduler:
+    """Starts queued generations whenever a generator is free, small ones first.
+    Large generations can't take up every generator, so small ones don't have to wait for them."""
+    # time past JOB_TIME after which a generation that didn't report back is given up on
+    grace_time = 60
+
+    running: dict[UUID, tuple[bool, float, multiprocessing.pool.AsyncResult, multiprocessing.pool.Pool]]
+    queued: dict[UUID, tuple[int, int]]
+    positions: dict[UUID, int]
+    retired_pools: list[multiprocessing.pool.Pool]
+
+    def __init__(self, make_pool: typing.Callable[[], multiprocessing.pool.Pool], config: dict[str, Any]):
+        self.make_pool = make_pool
+        self.pool = make_pool()
+        self.generators = config["GENERATORS"]
+        self.job_time = config["JOB_TIME"]
+        self.large_job_cost = config["LARGE_JOB_COST"]
+        self.running = {}  # generation id -> is large, start time, result, pool it runs in
+        self.queued = {}  # generation id -> arrival, cost
+        self.positions = {}  # generation id -> last queue position written to its meta
+        self.retired_pools = []  # pools that take no new generations, terminated once their generations are done
+        self._arrivals = itertools.count()
+
+    def start(self, generation: Generation, cost: int | None = None) -> None:
+        if cost is None:
+            cost = estimate_cost(restricted_loads(generation.options))
+        result = launch_generator(self.pool, generation, timeout=self.job_time)
+        if result:
+            self.running[generation.id] = cost >= self.large_job_cost, time.monotonic(), result, self.pool
+
+    def recycle_pool(self) -> None:
+        """Replaces the pool, as a timed out generation keeps running in its generator's thread.
+        Generations still running in the old pool get to finish, then its generators are terminated."""
+        logging.info("A generation timed out, replacing the generator pool.")
+        self.pool.close()
+        self.retired_pools.append(self.pool)
+        self.pool = self.make_pool()
+
+    def stop(self) -> None:
+        for pool in self.retired_pools + [self.pool]:
+            pool.terminate()
+        self.retired_pools.clear()
+
+    def tick(self) -> None:
+        now = time.monotonic()
+        timed_out = False
+        for generation_id, (_, started, result, _) in list(self.running.items()):
+            if result.ready():
+                del self.running[generation_id]
+                # gen_game already recorded the timeout as an error on the generation and returned None
+                timed_out |= result.successful() and result.get() is None
+            elif self.job_time and now - started > self.job_time + self.grace_time:
+                del self.running[generation_id]
+                timed_out = True
+        if timed_out:
+            self.recycle_pool()
+        if self.retired_pools:
+            busy_pools = {id(pool) for _, _, _, pool in self.running.values()}
+            for pool in self.retired_pools:
+                if id(pool) not in busy_pools:
+                    pool.terminate()
+            self.retired_pools = [pool for pool in self.retired_pools if id(pool) in busy_pools]
+
+        with db_session:
+            # for update locks the database row(s) during transaction, preventing writes from elsewhere
+            generations = select(
+                generation for generation in Generation
+                if generation.state == STATE_QUEUED).for_update()[:]
+            if not generations and not self.queued:
+                return
+            lanes: tuple[list[tuple[int, Generation]], list[tuple[int, Generation]]] = [], []
+            for generation in generations:
+                if generation.id not in self.queued:
+                    self.queued[generation.id] = (next(self._arrivals),
+                                                  estimate_cost(restricted_loads(generation.options)))
+                arrival, cost = self.queued[generation.id]
+                lanes[cost >= self.large_job_cost].append((arrival, generation))
+
+            large_running = sum(large for large, _, _, _ in self.running.values())
+            large_limit = max(1, self.generators - 1)
+            waiting: list[Generation] = []
+            for large, lane in enumerate(lanes):
+                for arrival, generation in sorted(lane, key=lambda job: job[0]):
+                    if len(self.running) < self.generators and (not large or large_running < large_limit):
+                        self.start(generation, self.queued[generation.id][1])
+                        large_running += large
+                    else:
+                        waiting.append(generation)
+
+            for position, generation in enumerate(waiting, 1):
+                if self.positions.get(generation.id) != position:
+                    meta = json.loads(generation.meta)
+                    meta["queue_position"] = position
+                    generation.meta = json.dumps(meta)
+                    self.positions[generation.id] = position
+            waiting_ids = {generation.id for generation in waiting}
+            self.queued = {generation_id: job for generation_id, job in self.queued.items()
+                           if generation_id in waiting_ids}
+            self.positions = {generation_id: position for generation_id, position in self.positions.items()
+                              if generation_id in waiting_ids}
+
+
+def get_generator_context(prefork: bool) -> multiprocessing.context.BaseContext:
+    if prefork:
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            # the fork server loads all worlds once, generators then get forked from it
+            context.set_forkserver_preload(["worlds", f"{__package__}.generator_preload"])
+            return context
+        logging.warning("GENERATOR_PREFORK is not supported on this platform, starting generators normally.")
+    return multiprocessing.get_context()
 
 
 def init_generator(config: dict[str, Any]) -> None:
     from setproctitle import setproctitle
 
+    start = time.perf_counter()
     setproctitle("Generator (idle)")
 
     try:
@@ -99,6 +225,15 @@ def init_generator(config: dict[str, Any]) -> None:
     db.bind(**pony_config)
     db.generate_mapping()
 
+    # everything loaded so far lives as long as the generator, don't have the garbage collector walk it every time.
+    # the fork server already froze what it preloaded, see generator_preload.
+    gc.freeze()
+    if _loaded_by == os.getpid():
+        loaded = f"loaded worlds in {_load_time:.2f}s"
+    else:
+        loaded = f"worlds were preloaded in {_load_time:.2f}s"
+    logging.info(f"Generator {os.getpid()} ready after {time.perf_counter() - start:.2f}s, {loaded}.")
+
 
 def cleanup():
     """delete unowned user-content"""
@@ -113,6 +248,41 @@ def cleanup():
         logging.info(f"{rooms} Rooms, {seeds} Seeds and {slots} Slots have been deleted.")
 
 
+class RoomScheduler:
+    """Starts rooms on their hosters, only looking at rooms whose activity changed since the previous tick."""
+    # re-check a bit of the past, in case activity got committed after it was set
+    lookback = timedelta(seconds=5)
+
+    def __init__(self, hosters: list[MultiworldInstance]):
+        self.hosters = hosters
+        self.checked_until: datetime | None = None
+
+    def tick(self) -> None:
+        now = datetime.utcnow()
+        if self.checked_until is None:
+            since = now - timedelta(days=3)
+        else:
+            since = self.checked_until - self.lookback
+        shut_down = [room_id for hoster in self.hosters for room_id in hoster.collect_shut_down_rooms()]
+        with db_session:
+            rooms = select((room.id, room.last_activity, room.timeout)
+                           for room in Room if room.last_activity >= since)[:]
+            if shut_down:
+                # activity may have happened while those were shutting down
+                rooms += select((room.id, room.last_activity, room.timeout)
+                                for room in Room if room.id in shut_down)[:]
+        self.checked_until = now
+
+        to_start: dict[MultiworldInstance, list[UUID]] = {}
+        for room_id, last_activity, timeout in rooms:
+            # the per-room timeout can't currently be PonyORM transpiled.
+            if last_activity >= now - timedelta(seconds=timeout + 5):
+                hoster = self.hosters[room_id.int % len(self.hosters)]
+                to_start.setdefault(hoster, []).append(room_id)
+        for hoster, room_ids in to_start.items():
+            hoster.start_rooms(room_ids)
+
+
 def autohost(config: dict):
     def keep_running():
         stop_event = _stop_event
@@ -125,15 +295,9 @@ def autohost(config: dict):
                     hosters.append(hoster)
                     hoster.start()
 
+                scheduler = RoomScheduler(hosters)
                 while not stop_event.wait(0.1):
-                    with db_session:
-                        rooms = select(
-                            room for room in Room if
-                            room.last_activity >= datetime.utcnow() - timedelta(days=3))
-                        for room in rooms:
-                            # we have to filter twice, as the per-room timeout can't currently be PonyORM transpiled.
-                            if room.last_activity >= datetime.utcnow() - timedelta(seconds=room.timeout + 5):
-                                hosters[room.id.int % len(hosters)].start_room(room.id)
+                    scheduler.tick()
 
         except AlreadyRunningException:
             logging.info("Autohost reports as already running, not starting another.")
@@ -147,9 +311,11 @@ def autogen(config: dict):
         try:
             with Locker("autogen"):
 
-                with multiprocessing.Pool(config["GENERATORS"], initializer=init_generator,
-                                          initargs=(config,), maxtasksperchild=10) as generator_pool:
-                    job_time = config["JOB_TIME"]
+                context = get_generator_context(config["GENERATOR_PREFORK"])
+                scheduler = GenerationScheduler(lambda: context.Pool(config["GENERATORS"], initializer=init_generator,
+                                                                     initargs=(config,), maxtasksperchild=10),
+                                                config)
+                try:
                     with db_session:
                         to_start = select(generation for generation in Generation if generation.state == STATE_STARTED)
 
@@ -160,19 +326,15 @@ def autogen(config: dict):
                                 if sid:
                                     generation.delete()
                                 else:
-                                    launch_generator(generator_pool, generation, timeout=job_time)
+                                    scheduler.start(generation)
 
                             commit()
                         select(generation for generation in Generation if generation.state == STATE_ERROR).delete()
 
                     while not stop_event.wait(0.1):
-                        with db_session:
-                            # for update locks the database row(s) during transaction, preventing writes from elsewhere
-                            to_start = select(
-                                generation for generation in Generation
-                                if generation.state == STATE_QUEUED).for_update()
-                            for generation in to_start:
-                                launch_generator(generator_pool, generation, timeout=job_time)
+                        scheduler.tick()
+                finally:
+                    scheduler.stop()
         except AlreadyRunningException:
             logging.info("Autogen reports as already running, not starting another.")
 
@@ -190,6 +352,7 @@ class MultiworldInstance():
         self.rooms_to_start = multiprocessing.Queue()
         self.rooms_shutting_down = multiprocessing.Queue()
         self.name = f"MultiHoster{id}"
+        self.port = config["HOSTER_PORT"] + id if config["HOSTER_PORT"] else None
 
     def start(self):
         if self.process and self.process.is_alive():
@@ -198,19 +361,26 @@ class MultiworldInstance():
         process = multiprocessing.Process(group=None, target=run_server_process,
                                           args=(self.name, self.ponyconfig, get_static_server_data(),
                                                 self.cert, self.key, self.host,
-                                                self.rooms_to_start, self.rooms_shutting_down),
+                                                self.rooms_to_start, self.rooms_shutting_down, self.port),
                                           name=self.name)
         process.start()
         self.process = process
 
-    def start_room(self, room_id):
+    def collect_shut_down_rooms(self) -> list[UUID]:
+        room_ids = []
         while not self.rooms_shutting_down.empty():
-            self.room_ids.remove(self.rooms_shutting_down.get(block=True, timeout=None))
-        if room_id in self.room_ids:
-            pass  # should already be hosted currently.
-        else:
-            self.room_ids.add(room_id)
-            self.rooms_to_start.put(room_id)
+            room_id = self.rooms_shutting_down.get(block=True, timeout=None)
+            self.room_ids.remove(room_id)
+            room_ids.append(room_id)
+        return room_ids
+
+    def start_rooms(self, room_ids: typing.Iterable[UUID]):
+        for room_id in room_ids:
+            if room_id in self.room_ids:
+                pass  # should already be hosted currently.
+            else:
+                self.room_ids.add(room_id)
+                self.rooms_to_start.put(room_id)
 
     def stop(self):
         if self.process:
@@ -225,6 +395,10 @@ class MultiworldInstance():
         self.process = None
 
 
+_load_start = time.perf_counter()
 from .models import Room, Generation, STATE_QUEUED, STATE_STARTED, STATE_ERROR, db, Seed, Slot
 from .customserver import run_server_process, get_static_server_data
-from .generate import gen_game
+from .generate import gen_game  # loads all worlds
+_load_time = time.perf_counter() - _load_start
+_loaded_by = os.getpid()
+del _load_start
@@ -4,6 +4,7 @@ import asyncio
 import collections
 import datetime
 import functools
+import http
 import logging
 import multiprocessing
 import pickle
@@ -13,6 +14,7 @@ import threading
 import time
 import typing
 import sys
+import urllib.parse
 
 import websockets
 from pony.orm import commit, db_session, select
@@ -23,7 +25,8 @@ from MultiServer import (
     Context, server, auto_shutdown, ServerCommandProcessor, ClientMessageProcessor, load_server_cert,
     server_per_message_deflate_factory,
 )
-from Utils import restricted_loads, cache_argsless
+from Utils import restricted_loads, cache_argsless, async_start
+from . import to_python
 from .locker import Locker
 from .models import Command, GameDataPackage, Room, db
 
@@ -89,20 +92,6 @@ class WebHostContext(Context):
             setattr(self, key, value)
         self.non_hintable_names = collections.defaultdict(frozenset, self.non_hintable_names)
 
-    def listen_to_db_commands(self):
-        cmdprocessor = DBCommandProcessor(self)
-
-        while not self.exit_event.is_set():
-            with db_session:
-                commands = select(command for command in Command if command.room.id == self.room_id)
-                if commands:
-                    for command in commands:
-                        self.main_loop.call_soon_threadsafe(cmdprocessor, command.commandtext)
-                        command.delete()
-                    commit()
-            del commands
-            time.sleep(5)
-
     @db_session
     def load(self, room_id: int):
         self.room_id = room_id
@@ -158,16 +147,17 @@ class WebHostContext(Context):
                 if savegame_data:
                     self.set_save(restricted_loads(Room.get(id=self.room_id).multisave))
             self._start_async_saving(atexit_save=False)
-        threading.Thread(target=self.listen_to_db_commands, daemon=True).start()
+        command_dispatcher.add_room(self)
 
-    @db_session
     def _save(self, exit_save: bool = False) -> bool:
-        room = Room.get(id=self.room_id)
         # Does not use Utils.restricted_dumps because we'd rather make a save than not make one
-        room.multisave = pickle.dumps(self.get_save())
-        # saving only occurs on activity, so we can "abuse" this information to mark this as last_activity
-        if not exit_save:  # we don't want to count a shutdown as activity, which would restart the server again
-            room.last_activity = datetime.datetime.utcnow()
+        multisave = self.call_on_save_loop(lambda: pickle.dumps(self.get_save()))
+        with db_session:
+            room = Room.get(id=self.room_id)
+            room.multisave = multisave
+            # saving only occurs on activity, so we can "abuse" this information to mark this as last_activity
+            if not exit_save:  # we don't want to count a shutdown as activity, which would restart the server again
+                room.last_activity = datetime.datetime.utcnow()
         return True
 
     def get_save(self) -> dict:
@@ -176,6 +166,116 @@ class WebHostContext(Context):
         return d
 
 
+class CommandDispatcher(threading.Thread):
+    """Delivers the Commands of all rooms hosted by this process, fetching them with a single query per interval
+    instead of one polling thread per room."""
+    interval: float = 1
+    _rooms: typing.Dict[typing.Any, typing.Tuple[WebHostContext, DBCommandProcessor]]
+
+    def __init__(self):
+        super().__init__(name="CommandDispatcher", daemon=True)
+        self._rooms = {}
+        self._lock = threading.Lock()
+
+    def add_room(self, ctx: WebHostContext) -> None:
+        with self._lock:
+            self._rooms[ctx.room_id] = ctx, DBCommandProcessor(ctx)
+            if not self.is_alive():
+                self.start()
+
+    def remove_room(self, room_id) -> None:
+        with self._lock:
+            self._rooms.pop(room_id, None)
+
+    def run(self):
+        while 1:
+            with self._lock:
+                for room_id, (ctx, _) in list(self._rooms.items()):
+                    if ctx.exit_event.is_set():
+                        del self._rooms[room_id]
+                rooms = self._rooms.copy()
+            if rooms:
+                try:
+                    self.dispatch(rooms)
+                except Exception as e:
+                    logging.exception(e)
+            del rooms
+            time.sleep(self.interval)
+
+    @staticmethod
+    def dispatch(rooms: typing.Dict[typing.Any, typing.Tuple[WebHostContext, DBCommandProcessor]]) -> None:
+        room_ids = list(rooms)
+        with db_session:
+            commands = select(command for command in Command if command.room.id in room_ids).order_by(Command.id)
+            if commands:
+                for command in commands:
+                    ctx, cmdprocessor = rooms[command.room.id]
+                    ctx.main_loop.call_soon_threadsafe(cmdprocessor, command.commandtext)
+                    command.delete()
+                commit()
+            del commands
+
+
+command_dispatcher = CommandDispatcher()
+
+
+class RoomListener:
+    """Serves all rooms of a hoster process behind a single websocket listener,
+    routing each connection by the room's short id in its path or its room query argument."""
+    rooms: typing.Dict[typing.Any, WebHostContext]
+
+    def __init__(self, port: int):
+        self.port = port
+        self.rooms = {}
+
+    def serve(self, ssl_context) -> websockets.serve:
+        return websockets.serve(self.handler, None, self.port, ssl=ssl_context,
+                                extensions=[server_per_message_deflate_factory],
+                                process_request=self.process_request)
+
+    def add_room(self, ctx: WebHostContext) -> ListenerRoom:
+        self.rooms[ctx.room_id] = ctx
+        return ListenerRoom(self, ctx)
+
+    def remove_room(self, room_id) -> None:
+        self.rooms.pop(room_id, None)
+
+    def get_room(self, path: str) -> typing.Optional[WebHostContext]:
+        url = urllib.parse.urlsplit(path)
+        room = url.path.strip("/") or urllib.parse.parse_qs(url.query).get("room", [""])[0]
+        try:
+            return self.rooms.get(to_python(room))
+        except ValueError:
+            return None
+
+    async def process_request(self, path: str, request_headers):
+        if not self.get_room(path):
+            return http.HTTPStatus.NOT_FOUND, [], b"Room not found.\n"
+
+    async def handler(self, websocket) -> None:
+        ctx = self.get_room(websocket.path)
+        if ctx:  # may have shut down during the handshake
+            await server(websocket, websocket.path, ctx=ctx)
+
+
+class ListenerRoom:
+    """Stands in for a room's own websockets server while it is served by a RoomListener,
+    so shutting the room down only closes its own connections."""
+
+    def __init__(self, listener: RoomListener, ctx: WebHostContext):
+        self.listener = listener
+        self.ctx = ctx
+
+    @property
+    def ws_server(self) -> ListenerRoom:
+        return self
+
+    def close(self) -> None:
+        self.listener.remove_room(self.ctx.room_id)
+        for endpoint in self.ctx.endpoints:
+            async_start(endpoint.socket.close(1001))
+
+
 def get_random_port():
     return random.randint(49152, 65535)
 
@@ -231,7 +331,8 @@ def set_up_logging(room_id) -> logging.Logger:
 
 def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                        cert_file: typing.Optional[str], cert_key_file: typing.Optional[str],
-                       host: str, rooms_to_run: multiprocessing.Queue, rooms_shutting_down: multiprocessing.Queue):
+                       host: str, rooms_to_run: multiprocessing.Queue, rooms_shutting_down: multiprocessing.Queue,
+                       port: typing.Optional[int] = None):
     from setproctitle import setproctitle
 
     setproctitle(name)
@@ -267,7 +368,8 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
             nonlocal load_date, ssl_context
             today = datetime.date.today()
             if load_date != today:
-                ssl_context = load_server_cert(cert_file, cert_key_file)
+                # reload into the same context, so a long-running RoomListener picks up the renewed certificate
+                ssl_context.load_cert_chain(cert_file, cert_key_file if cert_key_file else cert_file)
                 load_date = today
             return ssl_context
 
@@ -276,6 +378,40 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
 
     loop = asyncio.get_event_loop()
 
+    if port:
+        listener: typing.Optional[RoomListener] = RoomListener(port)
+        loop.run_until_complete(listener.serve(get_ssl_context()))
+        logging.info(f"Serving rooms of {name} on port {port}.")
+    else:
+        listener = None
+
+    async def serve_room(ctx: WebHostContext) -> int:
+        """Starts a websockets server of the room's own, returns its port or 0 if it could not be determined."""
+        try:
+            ctx.server = websockets.serve(
+                functools.partial(server, ctx=ctx),
+                ctx.host,
+                ctx.port,
+                ssl=get_ssl_context(),
+                extensions=[server_per_message_deflate_factory],
+            )
+            await ctx.server
+        except OSError:  # likely port in use
+            ctx.server = websockets.serve(
+                functools.partial(server, ctx=ctx), ctx.host, 0, ssl=get_ssl_context())
+
+            await ctx.server
+        port = 0
+        for wssocket in ctx.server.ws_server.sockets:
+            socketname = wssocket.getsockname()
+            if wssocket.family == socket.AF_INET6:
+                # Prefer IPv4, as most users seem to not have working ipv6 support
+                if not port:
+                    port = socketname[1]
+            elif wssocket.family == socket.AF_INET:
+                port = socketname[1]
+        return port
+
     async def start_room(room_id):
         with Locker(f"RoomLocker {room_id}"):
             try:
@@ -284,29 +420,12 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                 ctx.load(room_id)
                 ctx.init_save()
                 assert ctx.server is None
-                try:
-                    ctx.server = websockets.serve(
-                        functools.partial(server, ctx=ctx),
-                        ctx.host,
-                        ctx.port,
-                        ssl=get_ssl_context(),
-                        extensions=[server_per_message_deflate_factory],
-                    )
-                    await ctx.server
-                except OSError:  # likely port in use
-                    ctx.server = websockets.serve(
-                        functools.partial(server, ctx=ctx), ctx.host, 0, ssl=get_ssl_context())
-
-                    await ctx.server
-                port = 0
-                for wssocket in ctx.server.ws_server.sockets:
-                    socketname = wssocket.getsockname()
-                    if wssocket.family == socket.AF_INET6:
-                        # Prefer IPv4, as most users seem to not have working ipv6 support
-                        if not port:
-                            port = socketname[1]
-                    elif wssocket.family == socket.AF_INET:
-                        port = socketname[1]
+                if listener:
+                    get_ssl_context()  # renews the certificate of the listener when needed
+                    ctx.server = listener.add_room(ctx)
+                    port = listener.port
+                else:
+                    port = await serve_room(ctx)
                 if port:
                     ctx.logger.info(f'Hosting game at {host}:{port}')
                     with db_session:
@@ -342,6 +461,9 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                 try:
                     ctx.save_dirty = False  # make sure the saving thread does not write to DB after final wakeup
                     ctx.exit_event.set()  # make sure the saving thread stops at some point
+                    command_dispatcher.remove_room(room_id)
+                    if listener:
+                        listener.remove_room(room_id)
                     # NOTE: async saving should probably be an async task and could be merged with shutdown_task
                     with db_session:
                         # ensure the Room does not spin up again on its own, minute of safety buffer
@@ -6,7 +6,7 @@ from flask import send_file, Response, render_template
 from pony.orm import select
 
 from worlds.Files import AutoPatchRegister
-from . import app, cache
+from . import app, cache, room_address
 from .models import Slot, Room, Seed
 
 
@@ -17,7 +17,6 @@ def download_patch(room_id, patch_id):
         return "Patch not found"
     else:
         room = Room.get(id=room_id)
-        last_port = room.last_port
         filelike = BytesIO(patch.data)
         greater_than_version_3 = zipfile.is_zipfile(filelike)
         if greater_than_version_3:
@@ -26,7 +25,7 @@ def download_patch(room_id, patch_id):
             with zipfile.ZipFile(filelike, "a") as zf:
                 with zf.open("archipelago.json", "r") as f:
                     manifest = json.load(f)
-                manifest["server"] = f"{app.config['HOST_ADDRESS']}:{last_port}" if last_port else None
+                manifest["server"] = room_address(room) if room.last_port else None
                 with zipfile.ZipFile(new_file, "w") as new_zip:
                     for file in zf.infolist():
                         if file.filename == "archipelago.json":
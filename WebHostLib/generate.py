@@ -225,7 +225,8 @@ def wait_seed(seed: UUID):
         meta = json.loads(generation.meta)
         details = json.dumps(meta, indent=4).strip()
         return render_template("seedError.html", seed_error=meta["error"], details=details)
-    return render_template("waitSeed.html", seed_id=seed_id)
+    queue_position = json.loads(generation.meta).get("queue_position") if generation.state == STATE_QUEUED else None
+    return render_template("waitSeed.html", seed_id=seed_id, queue_position=queue_position)
 
 
 def upload_to_db(folder, sid, owner, race):
@@ -0,0 +1,10 @@
+"""Preloaded by the generator fork server, see autolauncher.get_generator_context.
+Everything imported here is loaded once and shared with every generator forked from the fork server."""
+import gc
+
+import worlds  # noqa: F401
+from . import autolauncher  # noqa: F401  # loads the generator
+
+# everything loaded so far lives as long as the fork server and its generators, don't have the garbage collector walk it.
+# this also keeps the generators from copying the memory they share with the fork server.
+gc.freeze()
@@ -1,5 +1,8 @@
 import datetime
 import collections
+import hashlib
+import threading
+import time
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, NamedTuple, Counter
 from uuid import UUID
@@ -16,6 +19,8 @@ from .models import GameDataPackage, Room
 
 # Multisave is currently updated, at most, every minute.
 TRACKER_CACHE_TIMEOUT_IN_SECONDS = 60
+# Decoded multidata, multisaves and data packages are dropped after not being used for this long.
+TRACKER_SNAPSHOT_TIMEOUT_IN_SECONDS = 10 * 60
 
 _multiworld_trackers: Dict[str, Callable] = {}
 _player_trackers: Dict[str, Callable] = {}
@@ -24,6 +29,74 @@ TeamPlayer = Tuple[int, int]
 ItemMetadata = Tuple[int, int, int]
 
 
+class _SnapshotCache:
+    """Decoded room data, shared by all requests of this process.
+
+    Cached values are never modified after being stored, so they are read without locking. Entries that were not used
+    for the timeout are dropped the next time something gets stored.
+    """
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._entries: Dict[Any, List[Any]] = {}  # key -> [time of last use, value]
+        self._lock = threading.Lock()
+
+    def lookup(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        entry[0] = time.monotonic()
+        return entry[1]
+
+    def store(self, key: Any, value: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            # replaced instead of changed, so readers never see the dict change size while reading it
+            entries = {key: entry for key, entry in self._entries.items() if now - entry[0] < self.timeout}
+            entries[key] = [now, value]
+            self._entries = entries
+
+    def get(self, key: Any, load: Callable[[], Any]) -> Any:
+        value = self.lookup(key)
+        if value is None:
+            value = load()
+            self.store(key, value)
+        return value
+
+
+# by seed id, as multidata never changes
+_multidata_snapshots = _SnapshotCache(TRACKER_SNAPSHOT_TIMEOUT_IN_SECONDS)
+# by (room id, save version), see get_save_version
+_multisave_snapshots = _SnapshotCache(TRACKER_SNAPSHOT_TIMEOUT_IN_SECONDS)
+# lookup tables by data package checksum
+_game_package_snapshots = _SnapshotCache(TRACKER_SNAPSHOT_TIMEOUT_IN_SECONDS)
+# RoomTrackerView by room id, brought up to date for each new save
+_room_views = _SnapshotCache(TRACKER_SNAPSHOT_TIMEOUT_IN_SECONDS)
+
+
+def get_save_version(room: Room) -> int:
+    """Returns a number identifying the room's current multisave, from its hash, so it changes whenever a save does.
+    Versions don't tell which save is newer."""
+    # 6 bytes, so it stays exact as a javascript number
+    return int.from_bytes(hashlib.blake2b(room.multisave or b"", digest_size=6).digest(), "big")
+
+
+def get_cached_multisave(room: Room, save_version: int) -> Optional[Dict[str, Any]]:
+    """Returns the room's multisave of an earlier save version, if a request still has it in memory."""
+    return _multisave_snapshots.lookup((room.id, save_version))
+
+
+def _load_game_package_tables(checksum: str) -> Tuple[Dict[int, str], Dict[int, str], Dict[str, int], Dict[str, int]]:
+    game_package = restricted_loads(GameDataPackage.get(checksum=checksum).data)
+    return (
+        KeyedDefaultDict(lambda code: f"Unknown Item (ID: {code})", {
+            id: name for name, id in game_package["item_name_to_id"].items()}),
+        KeyedDefaultDict(lambda code: f"Unknown Location (ID: {code})", {
+            id: name for name, id in game_package["location_name_to_id"].items()}),
+        game_package["item_name_to_id"],
+        game_package["location_name_to_id"],
+    )
+
+
 def _cache_results(func: Callable) -> Callable:
     """Stores the results of any computationally expensive methods after the initial call in TrackerData.
     If called again, returns the cached result instead, as results will not change for the lifetime of TrackerData.
@@ -40,12 +113,36 @@ def _cache_results(func: Callable) -> Callable:
     return method_wrapper
 
 
+@dataclass(frozen=True)
+class RoomTrackerView:
+    """Values of every player in a room that trackers show, kept across requests.
+
+    Made from a multisave once, then brought up to date with only what was received since, as received items and
+    location checks only ever grow. Shared by requests, so it is replaced instead of modified.
+    """
+    save_key: Tuple[UUID, int]
+    received_item_counts: Dict[TeamPlayer, int]
+    inventory_counts: Dict[TeamPlayer, Counter[int]]
+    locations_complete: Dict[TeamPlayer, int]
+    team_locations_checked_count: Dict[int, int]
+    client_statuses: Dict[TeamPlayer, ClientStatus]
+    team_completed_worlds_count: Dict[int, int]
+    activity_timestamps: Dict[TeamPlayer, float]
+
+    @property
+    def progress(self) -> int:
+        """How much was received and checked in the save the view is of, which only grows from save to save."""
+        return sum(self.received_item_counts.values()) + sum(self.team_locations_checked_count.values())
+
+
 @dataclass
 class TrackerData:
     """A helper dataclass that is instantiated each time an HTTP request comes in for tracker data.
 
     Provides helper methods to lazily load necessary data that each tracker require and caches any results so any
     subsequent helper method calls do not need to recompute results during the lifetime of this instance.
+    The decoded multidata and multisave are shared with other requests for the same room and save, so they must not be
+    modified.
     """
     room: Room
     _multidata: Dict[str, Any]
@@ -55,8 +152,10 @@ class TrackerData:
     def __init__(self, room: Room):
         """Initialize a new RoomMultidata object for the current room."""
         self.room = room
-        self._multidata = Context.decompress(room.seed.multidata)
-        self._multisave = restricted_loads(room.multisave) if room.multisave else {}
+        self._save_key = (room.id, get_save_version(room))
+        self._multidata = _multidata_snapshots.get(room.seed.id, lambda: Context.decompress(room.seed.multidata))
+        self._multisave = _multisave_snapshots.get(
+            self._save_key, lambda: restricted_loads(room.multisave) if room.multisave else {})
         self._tracker_cache = {}
 
         self.item_name_to_id: Dict[str, Dict[str, int]] = {}
@@ -70,15 +169,19 @@ class TrackerData:
             game_name: KeyedDefaultDict(lambda code: f"Unknown Game {game_name} - Location (ID: {code})")
         })
         for game, game_package in self._multidata["datapackage"].items():
-            game_package = restricted_loads(GameDataPackage.get(checksum=game_package["checksum"]).data)
-            self.item_id_to_name[game] = KeyedDefaultDict(lambda code: f"Unknown Item (ID: {code})", {
-                id: name for name, id in game_package["item_name_to_id"].items()})
-            self.location_id_to_name[game] = KeyedDefaultDict(lambda code: f"Unknown Location (ID: {code})", {
-                id: name for name, id in game_package["location_name_to_id"].items()})
+            checksum = game_package["checksum"]
+            (self.item_id_to_name[game], self.location_id_to_name[game],
+             # Normal lookup tables as well.
+             self.item_name_to_id[game], self.location_name_to_id[game]) = _game_package_snapshots.get(
+                checksum, lambda: _load_game_package_tables(checksum))
 
-            # Normal lookup tables as well.
-            self.item_name_to_id[game] = game_package["item_name_to_id"]
-            self.location_name_to_id[game] = game_package["location_name_to_id"]
+    def get_save_version(self) -> int:
+        """Retrieves the save version of the data this was made from, see get_save_version."""
+        return self._save_key[1]
+
+    def get_multisave(self) -> Dict[str, Any]:
+        """Retrieves the decoded multisave, which is shared with other requests and must not be modified."""
+        return self._multisave
 
     def get_seed_name(self) -> str:
         """Retrieves the seed name."""
@@ -124,6 +227,10 @@ class TrackerData:
     @_cache_results
     def get_player_inventory_counts(self, team: int, player: int) -> collections.Counter:
         """Retrieves a dictionary of all items received by their id and their received count."""
+        inventory = self.get_room_view().inventory_counts.get((team, player), None)
+        if inventory is not None:
+            return inventory.copy()  # some trackers add to the inventory they get
+
         received_items = self.get_player_received_items(team, player)
         starting_items = self.get_player_starting_inventory(player)
         inventory = collections.Counter()
@@ -154,14 +261,9 @@ class TrackerData:
         """Returns the alias of a particular player, if any."""
         return self._multisave.get("name_aliases", {}).get((team, player), None)
 
-    @_cache_results
     def get_team_completed_worlds_count(self) -> Dict[int, int]:
         """Retrieves a dictionary of number of completed worlds per team."""
-        return {
-            team: sum(
-                self.get_player_client_status(team, player) == ClientStatus.CLIENT_GOAL for player in players
-            ) for team, players in self.get_all_players().items()
-        }
+        return self.get_room_view().team_completed_worlds_count
 
     @_cache_results
     def get_team_hints(self) -> Dict[int, Set[Hint]]:
@@ -182,13 +284,9 @@ class TrackerData:
             for team, players in self.get_all_players().items()
         }
 
-    @_cache_results
     def get_team_locations_checked_count(self) -> Dict[int, int]:
         """Retrieves a dictionary of checked player locations each team has."""
-        return {
-            team: sum(len(self.get_player_checked_locations(team, player)) for player in players)
-            for team, players in self.get_all_players().items()
-        }
+        return self.get_room_view().team_locations_checked_count
 
     # TODO: Change this method to properly build for each team once teams are properly implemented, as they don't
     #       currently exist in multidata to easily look up, so these are all assuming only 1 team: Team #0
@@ -237,21 +335,13 @@ class TrackerData:
             for team, players in self.get_all_slots().items() for player in players
         }
 
-    @_cache_results
     def get_room_locations_complete(self) -> Dict[TeamPlayer, int]:
         """Retrieves a dictionary of all locations complete per player."""
-        return {
-            (team, player): len(self.get_player_checked_locations(team, player))
-            for team, players in self.get_all_players().items() for player in players
-        }
+        return self.get_room_view().locations_complete
 
-    @_cache_results
     def get_room_client_statuses(self) -> Dict[TeamPlayer, ClientStatus]:
         """Retrieves a dictionary of all ClientStatus values per player."""
-        return {
-            (team, player): self.get_player_client_status(team, player)
-            for team, players in self.get_all_players().items() for player in players
-        }
+        return self.get_room_view().client_statuses
 
     @_cache_results
     def get_room_long_player_names(self) -> Dict[TeamPlayer, str]:
@@ -274,8 +364,8 @@ class TrackerData:
         """
         last_activity: Dict[TeamPlayer, datetime.timedelta] = {}
         now = datetime.datetime.utcnow()
-        for (team, player), timestamp in self._multisave.get("client_activity_timers", []):
-            last_activity[team, player] = now - datetime.datetime.utcfromtimestamp(timestamp)
+        for team_player, timestamp in self.get_room_view().activity_timestamps.items():
+            last_activity[team_player] = now - datetime.datetime.utcfromtimestamp(timestamp)
 
         return last_activity
 
@@ -291,6 +381,59 @@ class TrackerData:
 
         return video_feeds
 
+    @_cache_results
+    def get_room_view(self) -> RoomTrackerView:
+        """Retrieves the room's RoomTrackerView for this save, updating the one of the room's previous save."""
+        view: Optional[RoomTrackerView] = _room_views.lookup(self.room.id)
+        if view is None or view.save_key != self._save_key:
+            previous = view
+            view = self._make_room_view(previous)
+            # a request that loaded an older save must not replace the view of a newer one
+            if previous is None or previous.progress <= view.progress:
+                _room_views.store(self.room.id, view)
+        return view
+
+    def _make_room_view(self, previous: Optional[RoomTrackerView]) -> RoomTrackerView:
+        received_item_counts: Dict[TeamPlayer, int] = {}
+        inventory_counts: Dict[TeamPlayer, Counter[int]] = {}
+        locations_complete: Dict[TeamPlayer, int] = {}
+        client_statuses: Dict[TeamPlayer, ClientStatus] = {}
+        team_locations_checked_count: Dict[int, int] = {}
+        team_completed_worlds_count: Dict[int, int] = {}
+        for team, players in self.get_all_players().items():
+            for player in players:
+                received_items = self.get_player_received_items(team, player)
+                inventory = previous.inventory_counts.get((team, player), None) if previous else None
+                count = previous.received_item_counts[team, player] if inventory is not None else 0
+                if inventory is None or count > len(received_items):
+                    # new to the view, or the view is of a newer save than this one
+                    inventory = collections.Counter(self.get_player_starting_inventory(player))
+                    count = 0
+                elif count < len(received_items):
+                    inventory = inventory.copy()
+                if count < len(received_items):
+                    inventory.update(item.item for item in received_items[count:])
+                received_item_counts[team, player] = len(received_items)
+                inventory_counts[team, player] = inventory
+
+                locations_complete[team, player] = len(self.get_player_checked_locations(team, player))
+                client_statuses[team, player] = self.get_player_client_status(team, player)
+            team_locations_checked_count[team] = sum(locations_complete[team, player] for player in players)
+            team_completed_worlds_count[team] = sum(
+                client_statuses[team, player] == ClientStatus.CLIENT_GOAL for player in players)
+
+        return RoomTrackerView(
+            save_key=self._save_key,
+            received_item_counts=received_item_counts,
+            inventory_counts=inventory_counts,
+            locations_complete=locations_complete,
+            team_locations_checked_count=team_locations_checked_count,
+            client_statuses=client_statuses,
+            team_completed_worlds_count=team_completed_worlds_count,
+            activity_timestamps={(team, player): timestamp for (team, player), timestamp
+                                 in self._multisave.get("client_activity_timers", [])},
+        )
+
     @_cache_results
     def get_spheres(self) -> List[List[int]]:
         """ each sphere is { player: { location_id, ... } } """
@@ -590,6 +590,12 @@ class ServerOptions(Group):
         "auto" -> !countdown will be available for any room with less than 30 slots.
         """
 
+    class SaveJournal(Bool):
+        """
+        Append changes to a journal next to the save file, instead of rewriting the whole save every time.
+        The save is only rewritten once the journal grew as large as it, which is much less writing for big games.
+        """
+
     class AutoShutdown(int):
         """Automatically shut down the server after this many seconds without new location checks, 0 to keep running"""
 
@@ -615,6 +621,7 @@ class ServerOptions(Group):
     multidata: str | None = None
     savefile: str | None = None
     disable_save: bool = False
+    save_journal: SaveJournal | bool = False
     loglevel: str = "info"
     logtime: bool = False
     server_password: ServerPassword | None = None
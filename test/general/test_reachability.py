@@ -1,6 +1,6 @@
 import unittest
 
-from BaseClasses import CollectionState
+from BaseClasses import CollectionState, select_by_bitset
 from worlds.AutoWorld import AutoWorldRegister
 from . import setup_solo_multiworld, gen_steps
 
@@ -79,3 +79,32 @@ class TestBase(unittest.TestCase):
                             locations.add(location)
                     self.assertGreater(len(locations), 0,
                                        msg="Need to be able to reach at least one location to get started.")
+
+    def test_batched_reachability_matches_can_reach(self):
+        """Ensure CollectionState.reachable_locations agrees with Location.can_reach, including world overrides"""
+        for game_name, world_type in AutoWorldRegister.world_types.items():
+            with self.subTest("Game", game=game_name):
+                multiworld = setup_solo_multiworld(world_type)
+                locations = list(multiworld.get_locations())
+                for state in (CollectionState(multiworld), multiworld.get_all_state(False)):
+                    expected = [location for location in locations if location.can_reach(state)]
+                    self.assertEqual(list(select_by_bitset(locations, state.reachable_locations(locations))),
+                                     expected)
+
+    def test_incremental_sweep_matches_full_sweep(self):
+        """Ensure sweeps that only check locations whose rules read changed items find the same locations each step"""
+        for game_name, world_type in AutoWorldRegister.world_types.items():
+            with self.subTest("Game", game=game_name):
+                multiworld = setup_solo_multiworld(world_type)
+                world = multiworld.worlds[1]
+                steps = []
+                for incremental in (False, True):
+                    world.incremental_sweep = incremental
+                    state = CollectionState(multiworld)
+                    steps.append([set(state.advancements) for _ in state.sweep_for_advancements(yield_each_sweep=True)])
+                    steps[-1].append(state.advancements)
+                # rules that read more than the incremental sweep can see are only found by its final check
+                if world_type.incremental_sweep:
+                    self.assertEqual(steps[1], steps[0])
+                else:
+                    self.assertEqual(steps[1][-1], steps[0][-1])
@@ -1,5 +1,6 @@
 import unittest
 
+from BaseClasses import CollectionState
 from worlds.AutoWorld import AutoWorldRegister, call_all
 from . import setup_solo_multiworld
 
@@ -27,3 +28,25 @@ class TestBase(unittest.TestCase):
                     with self.subTest("Step", step=step):
                         call_all(multiworld, step)
                         self.assertTrue(multiworld.get_all_state(False, allow_partial_entrances=True))
+
+    def test_copies_are_independent(self):
+        """Ensure copy-on-write copies of a state do not see changes made to each other."""
+        multiworld = setup_solo_multiworld(AutoWorldRegister.world_types["A Link to the Past"])
+        first, second = multiworld.worlds[1].create_item("Hammer"), multiworld.worlds[1].create_item("Hookshot")
+        empty = CollectionState(multiworld)
+        state = CollectionState(multiworld)
+        state.update_reachable_regions(1)
+        regions = set(state.reachable_regions[1])
+
+        copy = state.copy()
+        copy_of_copy = copy.copy()
+        copy.collect(first, True)
+        copy.sweep_for_advancements()
+        state.collect(second, True)
+
+        self.assertEqual(copy.count(first.name, 1), empty.count(first.name, 1) + 1)
+        self.assertEqual(copy.count(second.name, 1), empty.count(second.name, 1))
+        self.assertEqual(state.count(first.name, 1), empty.count(first.name, 1))
+        self.assertEqual(dict(copy_of_copy.prog_items), dict(empty.prog_items))
+        self.assertEqual(copy_of_copy.reachable_regions[1], regions)
+        self.assertEqual(copy_of_copy.advancements, set())
@@ -0,0 +1,31 @@
+import unittest
+
+from NetUtils import JSONFragment, NetworkPlayer, NetworkSlot, SlotType, decode, encode, encode_with_fragments
+
+
+class TestEncodeWithFragments(unittest.TestCase):
+    def test_matches_encode(self) -> None:
+        players = [NetworkPlayer(0, 1, "Alias", "Player1"), NetworkPlayer(0, 2, "Player2", "Player2")]
+        slot_info = {1: NetworkSlot("Player1", "Game", SlotType.player),
+                     2: NetworkSlot("Player2", "Other Game", SlotType.player)}
+        msgs = [{"cmd": "Connected", "team": 0, "slot": 1, "players": players, "missing_locations": [1, 2],
+                 "slot_info": slot_info, "slot_data": {"goal": "ü", "nested": {"list": [1, "2"]}}},
+                {"cmd": "ReceivedItems", "index": 0, "items": []}]
+        fragmented = [{**msgs[0],
+                       "players": JSONFragment.of(players),
+                       "slot_info": JSONFragment.of(slot_info),
+                       "slot_data": {"goal": "ü", "nested": JSONFragment.of({"list": [1, "2"]})}},
+                      msgs[1]]
+        self.assertEqual(encode(msgs), encode_with_fragments(fragmented))
+        self.assertEqual(decode(encode(msgs)), decode(encode_with_fragments(fragmented)))
+
+    def test_keys_match_encode(self) -> None:
+        data = {"str": 1, 2: "int", 1.5: "float", True: "bool", False: "bool", None: "null"}
+        msgs = [{"cmd": "Bounced", "data": data, "nested": {"data": data}}]
+        self.assertEqual(encode(msgs).encode(), encode_with_fragments(msgs).encode())
+        self.assertEqual(encode(msgs).encode(),
+                         encode_with_fragments([{**msgs[0], "nested": {"data": JSONFragment.of(data)}}]).encode())
+
+    def test_empty(self) -> None:
+        for msgs in ([], [{}], [{"cmd": "Bounced", "data": {}}]):
+            self.assertEqual(encode(msgs), encode_with_fragments(msgs))
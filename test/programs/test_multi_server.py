@@ -1,5 +1,16 @@
+import asyncio
+import gc
+import json
+import os
+import tempfile
 import unittest
-from MultiServer import Context, ServerCommandProcessor
+import zlib
+from unittest import mock
+
+from MultiServer import Client, ClientMessageProcessor, Context, GamePackageFragments, ServerCommandProcessor, \
+    process_client_cmd, register_location_checks
+from NetUtils import Hint, HintStatus, LocationStore, NetworkItem, NetworkSlot, SlotType
+from Utils import Version, restricted_loads
 
 
 class TestResolvePlayerName(unittest.TestCase):
@@ -38,3 +49,273 @@ class TestResolvePlayerName(unittest.TestCase):
         assert p.resolve_player("ABC") == (1, 2, "abc"), "case insensitive resolves when 1 match"
         assert p.resolve_player("abcd") == (1, 3, "abCD"), "case insensitive resolves when 1 match"
         assert not p.resolve_player("aB"), "partial name shouldn't resolve to player"
+
+
+class TestHintIndex(unittest.TestCase):
+    def test_recheck_location_hints(self) -> None:
+        ctx = Context("", 0, "", "", 0, 0, False)
+        hint = Hint(2, 1, 100, 5, False)
+        other_hint = Hint(1, 2, 200, 6, False)
+        ctx.hints[0, 1] = {hint, other_hint}
+        ctx.hints[0, 2] = {hint, other_hint}
+        ctx.index_hints()
+
+        ctx.location_checks[0, 1].add(100)
+        changed = set()
+        ctx.recheck_location_hints(0, 1, [100], changed)
+        found_hint = hint._replace(found=True, status=HintStatus.HINT_FOUND)
+        self.assertEqual(changed, {(0, 1), (0, 2)})
+        self.assertEqual(ctx.hints[0, 1], {found_hint, other_hint})
+        self.assertEqual(ctx.hints[0, 2], {found_hint, other_hint})
+        self.assertEqual(ctx.get_hint(0, 1, 100), found_hint)
+        self.assertEqual(ctx.get_hint(0, 2, 200), other_hint)
+        self.assertIsNone(ctx.get_hint(0, 2, 100))
+
+    def test_hint_command_rechecks_index(self) -> None:
+        ctx = Context("", 0, "", "", 0, 0, False)
+        hint = Hint(2, 1, 100, 5, False)
+        ctx.hints[0, 1] = {hint}
+        ctx.hints[0, 2] = {hint}
+        ctx.index_hints()
+        client = Client(None, ctx)
+        client.team, client.slot = 0, 2
+
+        ctx.location_checks[0, 1].add(100)
+        with mock.patch.object(ctx, "notify_hints") as notify_hints:
+            self.assertTrue(ClientMessageProcessor(ctx, client).get_hints(""))
+        found_hint = hint._replace(found=True, status=HintStatus.HINT_FOUND)
+        notify_hints.assert_called_once_with(0, [found_hint], recipients=(2,))
+        self.assertEqual(ctx.hints[0, 1], {found_hint})
+        self.assertEqual(ctx.hints[0, 2], {found_hint})
+        self.assertEqual(ctx.get_hint(0, 1, 100), found_hint)
+
+
+class TestSpheres(unittest.TestCase):
+    def test_get_sphere(self) -> None:
+        ctx = Context("", 0, "", "", 0, 0, False)
+        ctx.spheres = [{1: {100}, 2: {200}}, {1: {101, 100}}, {2: {201, 200}}]
+        ctx.index_spheres()
+        self.assertEqual(ctx.get_sphere(1, 100), 0)
+        self.assertEqual(ctx.get_sphere(1, 101), 1)
+        self.assertEqual(ctx.get_sphere(2, 200), 0)
+        self.assertEqual(ctx.get_sphere(2, 201), 2)
+        with self.assertRaises(KeyError):
+            ctx.get_sphere(1, 999)
+        with self.assertRaises(KeyError):
+            ctx.get_sphere(3, 100)
+
+    def test_without_spheres(self) -> None:
+        """Multidata from before spheres were added has no "spheres", which gives -1 for every location."""
+        ctx = Context("", 0, "", "", 0, 0, False)
+        ctx.spheres = []
+        ctx.index_spheres()
+        self.assertEqual(ctx.get_sphere(1, 100), -1)
+
+
+class TestNotificationTargets(unittest.TestCase):
+    def test_prefixes(self) -> None:
+        ctx = Context("", 0, "", "", 0, 0, False)
+        key_client, prefix_client, all_client = (Client(None, ctx) for _ in range(3))
+        ctx.stored_data_notification_clients["tracker_0_1"].add(key_client)
+        ctx.add_notification_prefix("tracker_", prefix_client)
+        ctx.add_notification_prefix("", all_client)
+        self.assertEqual(ctx.get_notification_targets("tracker_0_1"), {key_client, prefix_client, all_client})
+        self.assertEqual(ctx.get_notification_targets("tracker_0_2"), {prefix_client, all_client})
+        self.assertEqual(ctx.get_notification_targets("other"), {all_client})
+        self.assertEqual(ctx.get_notification_targets("tra"), {all_client})
+
+        ctx.remove_notification_client(prefix_client)
+        self.assertEqual(ctx.get_notification_targets("tracker_0_1"), {key_client, all_client})
+        self.assertEqual(set(ctx.stored_data_prefix_notification_clients), {""})
+        self.assertEqual(dict(ctx.stored_data_prefix_lengths), {0: 1})
+
+    def test_collected_clients_are_pruned(self) -> None:
+        ctx = Context("", 0, "", "", 0, 0, False)
+        ctx.add_notification_prefix("tracker_", Client(None, ctx))
+        gc.collect()
+        self.assertEqual(ctx.get_notification_targets("tracker_0_1"), set())
+        self.assertEqual(ctx.stored_data_prefix_notification_clients, {})
+        self.assertEqual(ctx.stored_data_prefix_lengths, {})
+
+
+class FakeSocket:
+    open = True
+    extensions = ()
+
+    def __init__(self) -> None:
+        self.sent = []
+
+    async def send(self, msg: str) -> None:
+        self.sent.append(msg)
+
+
+class TestSetReply(unittest.IsolatedAsyncioTestCase):
+    async def test_want_reply_is_sent_right_away(self) -> None:
+        ctx = Context("", 0, "", "", 0, 0, False)
+        client = Client(FakeSocket(), ctx)
+        client.auth, client.team, client.slot = True, 0, 1
+        ctx.stored_data_notification_clients["key"].add(client)
+        ctx.send_set_reply([client], {"cmd": "SetReply", "key": "other", "value": 1})
+
+        with mock.patch.object(ctx, "save"):
+            await process_client_cmd(ctx, client, {"cmd": "Set", "key": "key", "want_reply": True,
+                                                   "operations": [{"operation": "replace", "value": 2}]})
+        self.assertEqual(len(client.socket.sent), 1)
+        self.assertEqual([(msg["key"], msg["value"]) for msg in json.loads(client.socket.sent[0])],
+                         [("other", 1), ("key", 2)])
+        self.assertEqual(ctx.queued_set_replies, {})
+
+
+class TestItemDelivery(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.ctx = ctx = Context("", 0, "", "", 0, 0, False)
+        # slot 1 finds items for slot 2 and 3, slot 3 is offline
+        ctx.locations = LocationStore({1: {100: (10, 2, 0), 101: (11, 2, 0), 102: (12, 3, 0)}, 2: {}, 3: {}})
+        ctx.slot_info = {slot: NetworkSlot(name, "Game", SlotType.player)
+                         for slot, name in ((1, "Player1"), (2, "Player2"), (3, "Player3"))}
+        ctx.games = {slot: "Game" for slot in ctx.slot_info}
+        ctx.player_names = {(0, slot): slot_info.name for slot, slot_info in ctx.slot_info.items()}
+        ctx.connect_names = {slot_info.name: (0, slot) for slot, slot_info in ctx.slot_info.items()}
+        ctx.minimum_client_versions = {slot: Version(0, 0, 0) for slot in ctx.slot_info}
+        ctx.clients = {0: {slot: [] for slot in ctx.slot_info}}
+        self.clients = {}
+        for slot in (1, 2):
+            client = self.clients[slot] = Client(FakeSocket(), ctx)
+            client.auth, client.team, client.slot = True, 0, slot
+            ctx.clients[0][slot].append(client)
+
+    def received_items_packets(self, broadcast: mock.Mock) -> list:
+        return [(clients, msgs[0]) for (clients, msgs), _ in broadcast.call_args_list
+                if msgs[0]["cmd"] == "ReceivedItems"]
+
+    async def test_checks_are_delivered_together(self) -> None:
+        with mock.patch.object(self.ctx, "broadcast") as broadcast, mock.patch.object(self.ctx, "broadcast_team"):
+            register_location_checks(self.ctx, 0, 1, [100])
+            register_location_checks(self.ctx, 0, 1, [101, 102])
+            self.assertEqual(self.received_items_packets(broadcast), [])
+            await asyncio.sleep(0)
+
+        packets = self.received_items_packets(broadcast)
+        self.assertEqual(len(packets), 1)
+        clients, packet = packets[0]
+        self.assertEqual(clients, [self.clients[2]])
+        self.assertEqual(packet["index"], 0)
+        self.assertEqual([item.item for item in packet["items"]], [10, 11])
+        self.assertEqual(self.clients[2].send_index, 2)
+        # the finding slot receives nothing, so its client is left alone
+        self.assertEqual(self.clients[1].send_index, 0)
+
+    async def test_offline_receiver_gets_items_on_connect(self) -> None:
+        with mock.patch.object(self.ctx, "broadcast"), mock.patch.object(self.ctx, "broadcast_team"):
+            register_location_checks(self.ctx, 0, 1, [102])
+            await asyncio.sleep(0)
+
+        client = Client(FakeSocket(), self.ctx)
+        with mock.patch.object(self.ctx, "broadcast_text_all"):
+            await process_client_cmd(self.ctx, client, {
+                "cmd": "Connect", "name": "Player3", "password": None, "game": "Game", "uuid": "uuid",
+                "version": Version(0, 6, 0), "tags": [], "items_handling": 0b111, "slot_data": False})
+        reply = json.loads(client.socket.sent[0])
+        self.assertEqual([msg["cmd"] for msg in reply], ["Connected", "ReceivedItems"])
+        self.assertEqual(reply[1]["index"], 0)
+        self.assertEqual([item["item"] for item in reply[1]["items"]], [12])
+        self.assertEqual(client.send_index, 1)
+
+
+class TestGamePackageFragments(unittest.TestCase):
+    def test_evicts_least_recently_used(self) -> None:
+        fragments = GamePackageFragments()
+        fragments.maxsize = 2
+        first = fragments.get("a", lambda: {"checksum": "a"})
+        fragments.get("b", lambda: {"checksum": "b"})
+        self.assertIs(fragments.get("a", dict), first)
+        fragments.get("c", lambda: {"checksum": "c"})
+        self.assertEqual(list(fragments.fragments), ["a", "c"])
+
+
+class TestSaveJournal(unittest.TestCase):
+    def test_replay(self) -> None:
+        ctx = Context("", 0, "", "", 0, 0, False)
+        ctx.connect_names = {}
+        ctx.save_journal = True
+        with tempfile.TemporaryDirectory() as directory:
+            ctx.save_filename = os.path.join(directory, "test.apsave")
+            self.assertTrue(ctx._save())
+            ctx.snapshot_size = 1 << 30  # keep appending to the journal
+            ctx.received_items[0, 1, True] = [NetworkItem(1, 2, 3, 0)]
+            ctx.location_checks[0, 1] |= {2, 3}
+            ctx.stored_data["key"] = [1]
+            ctx.mark_dirty_stored_data("key")
+            self.assertTrue(ctx._save())
+            ctx.received_items[0, 1, True].append(NetworkItem(4, 5, 6, 0))
+            ctx.location_checks[0, 1].add(5)
+            ctx.name_aliases[0, 1] = "alias"
+            self.assertTrue(ctx._save())
+            # a record that was cut off while writing it is ignored
+            with open(ctx.journal_filename, "ab") as f:
+                f.write(b"\x10\0\0\0\0\0\0\0incomplete")
+
+            with open(ctx.save_filename, "rb") as f:
+                save = restricted_loads(zlib.decompress(f.read()))
+            records = ctx.read_journal(save["journal_generation"])
+            self.assertEqual(len(records), 2)
+            for record in records:
+                ctx.apply_journal_record(save, record)
+            self.assertEqual(save, ctx.get_save() | {"journal_generation": ctx.journal_generation})
+
+            self.assertTrue(ctx._save(exit_save=True))
+            self.assertFalse(os.path.exists(ctx.journal_filename))
+
+    def test_dirty_marks_only_with_journal(self) -> None:
+        ctx = Context("", 0, "", "", 0, 0, False)
+        ctx.mark_dirty_hints([(0, 1)])
+        ctx.mark_dirty_stored_data("key")
+        self.assertEqual((ctx.dirty_hints, ctx.dirty_stored_data), (set(), set()))
+        ctx.save_journal = True
+        ctx.mark_dirty_hints([(0, 1)])
+        ctx.mark_dirty_stored_data("key")
+        self.assertEqual((ctx.dirty_hints, ctx.dirty_stored_data), ({(0, 1)}, {"key"}))
+
+    def test_item_received_while_saving(self) -> None:
+        """An item that arrives while the save is being read must not be replayed twice from the journal."""
+        ctx = Context("", 0, "", "", 0, 0, False)
+        ctx.connect_names = {}
+        ctx.save_journal = True
+        with tempfile.TemporaryDirectory() as directory:
+            ctx.save_filename = os.path.join(directory, "test.apsave")
+            ctx.received_items[0, 1, True] = [NetworkItem(1, 2, 3, 0)]
+            get_save = ctx.get_save
+
+            def get_save_receiving_item() -> dict:
+                save = get_save()
+                ctx.received_items[0, 1, True].append(NetworkItem(4, 5, 6, 0))
+                return save
+
+            ctx.get_save = get_save_receiving_item  # type: ignore
+            self.assertTrue(ctx._save())
+            ctx.get_save = get_save  # type: ignore
+            ctx.snapshot_size = 1 << 30  # keep appending to the journal
+            ctx.received_items[0, 1, True].append(NetworkItem(7, 8, 9, 0))
+            self.assertTrue(ctx._save())
+
+            with open(ctx.save_filename, "rb") as f:
+                save = restricted_loads(zlib.decompress(f.read()))
+            for record in ctx.read_journal(save["journal_generation"]):
+                ctx.apply_journal_record(save, record)
+            self.assertEqual(save["received_items"][0, 1, True], ctx.received_items[0, 1, True])
+            self.assertEqual(len(save["received_items"][0, 1, True]), 3)
+
+    def test_save_on_event_loop(self) -> None:
+        """Saving from another thread reads the state on the event loop that changes it."""
+        import asyncio
+        import threading
+
+        ctx = Context("", 0, "", "", 0, 0, False)
+
+        async def main() -> None:
+            ctx.save_loop = asyncio.get_running_loop()
+            loop_thread = threading.get_ident()
+            result = await asyncio.to_thread(ctx.call_on_save_loop, threading.get_ident)
+            self.assertEqual(result, loop_thread)
+
+        asyncio.run(main())
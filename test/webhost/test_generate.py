@@ -71,3 +71,118 @@ class TestGenerate(TestBase):
                           "Response shows unexpected error")
             self.assertIn("generate-game-form", response.text,
                           "Response did not get user back to the form")
+
+    def test_scheduler_lanes(self) -> None:
+        """Verify small generations get started ahead of large ones and large ones leave a generator free."""
+        import json
+        from types import SimpleNamespace
+        from uuid import uuid4
+        from pony.orm import db_session, select
+        from Utils import restricted_dumps
+        from WebHostLib.autolauncher import GenerationScheduler
+        from WebHostLib.models import Generation, STATE_QUEUED, STATE_STARTED
+
+        class FakePool:
+            def __init__(self) -> None:
+                self.started: list = []
+
+            def apply_async(self, func, args, kwargs, callback, error_callback):
+                self.started.append(kwargs["sid"])
+                return SimpleNamespace(ready=lambda: False)
+
+        def make_generation(players: int) -> Generation:
+            options = {f"Player{n}.yaml": {"game": "Archipelago"} for n in range(players)}
+            return Generation(options=restricted_dumps(options), state=STATE_QUEUED, owner=uuid4())
+
+        with db_session:
+            select(generation for generation in Generation).delete(bulk=True)
+            large = [make_generation(20).id for _ in range(3)]
+            small = [make_generation(1).id for _ in range(2)]
+
+        scheduler = GenerationScheduler(FakePool, {"GENERATORS": 3, "JOB_TIME": 600, "LARGE_JOB_COST": 10})  # type: ignore
+        pool = scheduler.pool
+        scheduler.tick()
+        self.assertEqual(pool.started, small + large[:1])
+        with db_session:
+            self.assertEqual(Generation[small[0]].state, STATE_STARTED)
+            self.assertEqual(json.loads(Generation[large[1]].meta)["queue_position"], 1)
+            self.assertEqual(json.loads(Generation[large[2]].meta)["queue_position"], 2)
+
+        with self.app.app_context(), self.app.test_request_context():
+            response = self.client.get(url_for("api.wait_seed_api", seed=large[2]))
+            self.assertEqual(response.status_code, 202)
+            self.assertEqual(response.json["queue_position"], 2)
+
+        with db_session:
+            select(generation for generation in Generation).delete(bulk=True)
+
+    def test_scheduler_recycles_pool_on_timeout(self) -> None:
+        """Verify a timed out generation gets its pool replaced, letting the other generations in it finish first."""
+        from types import SimpleNamespace
+        from uuid import uuid4
+        from pony.orm import db_session, select
+        from Utils import restricted_dumps
+        from WebHostLib.autolauncher import GenerationScheduler
+        from WebHostLib.models import Generation, STATE_QUEUED
+
+        class FakePool:
+            def __init__(self) -> None:
+                self.results: dict = {}
+                self.closed = False
+                self.terminated = False
+
+            def apply_async(self, func, args, kwargs, callback, error_callback):
+                result = SimpleNamespace(ready=lambda: False, successful=lambda: True, get=lambda: None)
+                self.results[kwargs["sid"]] = result
+                return result
+
+            def close(self) -> None:
+                self.closed = True
+
+            def terminate(self) -> None:
+                self.terminated = True
+
+        with db_session:
+            select(generation for generation in Generation).delete(bulk=True)
+            first, second = (Generation(options=restricted_dumps({"Player1.yaml": {"game": "Archipelago"}}),
+                                        state=STATE_QUEUED, owner=uuid4()).id for _ in range(2))
+
+        scheduler = GenerationScheduler(FakePool, {"GENERATORS": 3, "JOB_TIME": 600, "LARGE_JOB_COST": 10})  # type: ignore
+        old_pool = scheduler.pool
+        scheduler.tick()
+        self.assertEqual(set(old_pool.results), {first, second})
+
+        # gen_game returns None after recording the timeout
+        old_pool.results[first].ready = lambda: True
+        scheduler.tick()
+        self.assertIsNot(scheduler.pool, old_pool)
+        self.assertTrue(old_pool.closed)
+        self.assertFalse(old_pool.terminated, "Pool was terminated while a generation was still running in it")
+
+        old_pool.results[second].get = lambda: uuid4()
+        old_pool.results[second].ready = lambda: True
+        scheduler.tick()
+        self.assertTrue(old_pool.terminated)
+        self.assertEqual(scheduler.retired_pools, [])
+        self.assertFalse(scheduler.pool.closed)
+
+        with db_session:
+            select(generation for generation in Generation).delete(bulk=True)
+
+    def test_prefork_context(self) -> None:
+        """Verify generators get forked from a fork server that preloads the worlds and the generator."""
+        import multiprocessing
+        import multiprocessing.forkserver
+        import unittest
+        from WebHostLib.autolauncher import get_generator_context
+
+        if "forkserver" not in multiprocessing.get_all_start_methods():
+            raise unittest.SkipTest("fork server is not supported on this platform")
+        preload = multiprocessing.forkserver._forkserver._preload_modules
+        try:
+            context = get_generator_context(True)
+            self.assertEqual(context.get_start_method(), "forkserver")
+            self.assertEqual(multiprocessing.forkserver._forkserver._preload_modules,
+                             ["worlds", "WebHostLib.generator_preload"])
+        finally:
+            multiprocessing.forkserver.set_forkserver_preload(preload)
@@ -191,3 +191,74 @@ class TestHostFakeRoom(TestBase):
         with db_session:
             commands = select(command for command in Command if command.room.id == self.room_id)  # type: ignore
             self.assertNotIn("/help", (command.commandtext for command in commands))
+
+    def test_dispatch_commands(self) -> None:
+        """Verify queued commands get delivered to their room's event loop in order and removed."""
+        import asyncio
+        from types import SimpleNamespace
+        from pony.orm import db_session, select
+        from WebHostLib.customserver import CommandDispatcher
+        from WebHostLib.models import Command, Room
+
+        with db_session:
+            room = Room.get(id=self.room_id)
+            Command(room=room, commandtext="/help")
+            Command(room=room, commandtext="/players")
+
+        loop = asyncio.new_event_loop()
+        try:
+            received: "list[str]" = []
+            ctx = SimpleNamespace(main_loop=loop)
+            CommandDispatcher.dispatch({self.room_id: (ctx, received.append)})  # type: ignore
+            loop.call_soon(loop.stop)
+            loop.run_forever()
+        finally:
+            loop.close()
+        self.assertEqual(received, ["/help", "/players"])
+
+        with db_session:
+            commands = select(command for command in Command if command.room.id == self.room_id)  # type: ignore
+            self.assertFalse(commands.exists())
+
+    def test_room_scheduler(self) -> None:
+        """Verify the scheduler starts active rooms once and ignores rooms without new activity."""
+        import datetime
+        from pony.orm import db_session
+        from WebHostLib.autolauncher import MultiworldInstance, RoomScheduler
+        from WebHostLib.models import Room
+
+        config = {"PONY": {}, "SELFLAUNCHCERT": None, "SELFLAUNCHKEY": None, "HOST_ADDRESS": "", "HOSTER_PORT": None}
+        hoster = MultiworldInstance(config, 0)
+        scheduler = RoomScheduler([hoster])
+        scheduler.tick()
+        self.assertIn(self.room_id, hoster.room_ids)
+        self.assertEqual(self.room_id, hoster.rooms_to_start.get(timeout=1))
+        scheduler.tick()
+        self.assertTrue(hoster.rooms_to_start.empty())
+
+        hoster.room_ids.clear()
+        with db_session:
+            Room.get(id=self.room_id).last_activity = datetime.datetime.utcnow() - datetime.timedelta(minutes=1)
+        scheduler.tick()
+        self.assertNotIn(self.room_id, hoster.room_ids)
+
+    def test_room_listener_routing(self) -> None:
+        """Verify the shared room listener finds rooms by path or room argument and rejects unknown ones."""
+        import asyncio
+        from types import SimpleNamespace
+        from WebHostLib import to_url
+        from WebHostLib.customserver import RoomListener
+
+        listener = RoomListener(0)
+        ctx = SimpleNamespace(room_id=self.room_id, endpoints=[])
+        room = listener.add_room(ctx)  # type: ignore
+        short_id = to_url(self.room_id)
+        for path in (f"/{short_id}", f"/{short_id}/", f"/?game=Archipelago&room={short_id}"):
+            self.assertIs(listener.get_room(path), ctx, path)
+        for path in ("/", "/nope", f"/{short_id[:-1]}", "/?room="):
+            self.assertIsNone(listener.get_room(path), path)
+        self.assertIsNone(asyncio.run(listener.process_request(f"/{short_id}", {})))
+
+        room.ws_server.close()
+        self.assertIsNone(listener.get_room(f"/{short_id}"))
+        self.assertEqual(asyncio.run(listener.process_request(f"/{short_id}", {}))[0], 404)
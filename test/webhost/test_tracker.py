@@ -1,5 +1,6 @@
 import os
 import pickle
+import zlib
 from pathlib import Path
 from typing import ClassVar
 from uuid import UUID, uuid4
@@ -103,3 +104,115 @@ class TestTracker(TestBase):
                 self.assertEqual(response.status_code, 200)
             with self.client.open(url_for("api.tracker_slot_data", tracker=self.tracker_uuid)) as response:
                 self.assertEqual(response.status_code, 200)
+
+    def test_tracker_api_versions(self) -> None:
+        """Verify that the tracker api only sends data again after a save, and deltas since a save."""
+        from pony.orm import db_session
+        from MultiServer import Context as MultiServerContext
+        from NetUtils import NetworkItem, SlotType
+        from WebHostLib.models import Room
+
+        multidata = MultiServerContext.decompress(self.data)
+        multidata["slot_info"][1] = multidata["slot_info"][1]._replace(type=SlotType.player)
+        with db_session:
+            Room.get(id=self.room_id).seed.multidata = self.data[:1] + zlib.compress(pickle.dumps(multidata))
+
+        items = [NetworkItem(1, 1, 1), NetworkItem(2, 2, 1)]
+        versions = []
+        for saved_items in (items[:1], items):
+            with db_session:
+                room = Room.get(id=self.room_id)
+                room.multisave = pickle.dumps({"received_items": {(0, 1, True): saved_items},
+                                               "location_checks": {(0, 1): {item.location for item in saved_items}}})
+            with self.app.test_request_context():
+                url = url_for("api.tracker_data", tracker=self.tracker_uuid)
+                with self.client.open(url) as response:
+                    self.assertEqual(response.status_code, 200)
+                    etag = response.headers["ETag"]
+                with self.client.open(url, headers={"If-None-Match": etag}) as response:
+                    self.assertEqual(response.status_code, 304)
+                versions.append(int(etag.strip('"')))
+        self.assertNotEqual(versions[0], versions[1])
+
+        with self.app.test_request_context():
+            with self.client.open(url_for("api.tracker_delta", tracker=self.tracker_uuid)) as response:
+                self.assertEqual(response.json["since"], None)
+                self.assertEqual(response.json["version"], versions[1])
+                self.assertEqual(response.json["player_checks_done"], [{"team": 0, "player": 1, "locations": [1, 2]}])
+            with self.client.open(url_for("api.tracker_delta", tracker=self.tracker_uuid,
+                                          since=versions[0])) as response:
+                self.assertEqual(response.json["since"], versions[0])
+                self.assertEqual(response.json["player_items_received"],
+                                 [{"team": 0, "player": 1, "items": [list(items[1])]}])
+                self.assertEqual(response.json["player_checks_done"], [{"team": 0, "player": 1, "locations": [2]}])
+
+    def test_tracker_data_snapshots(self) -> None:
+        """Verify that decoded room data is shared between requests until the room saves again."""
+        from pony.orm import db_session
+        from WebHostLib.models import Room
+        from WebHostLib.tracker import TrackerData
+
+        with db_session:
+            room = Room.get(id=self.room_id)
+            first, second = TrackerData(room), TrackerData(room)
+            self.assertIs(first._multidata, second._multidata)
+            self.assertIs(first.get_multisave(), second.get_multisave())
+            self.assertIs(first.item_id_to_name["Archipelago"], second.item_id_to_name["Archipelago"])
+
+            room.multisave = pickle.dumps({"location_checks": {(0, 1): {1}}})
+            saved = TrackerData(room)
+            self.assertIs(first._multidata, saved._multidata)
+            self.assertEqual(saved.get_player_checked_locations(0, 1), {1})
+
+    def test_room_view(self) -> None:
+        """Verify that the room view is brought up to date with what was received since the last save."""
+        from pony.orm import db_session
+        from MultiServer import Context as MultiServerContext
+        from NetUtils import ClientStatus, NetworkItem, SlotType
+        from WebHostLib.models import Room
+        from WebHostLib.tracker import TrackerData, get_save_version
+
+        multidata = MultiServerContext.decompress(self.data)
+        multidata["slot_info"][1] = multidata["slot_info"][1]._replace(type=SlotType.player)
+        with db_session:
+            room = Room.get(id=self.room_id)
+            room.seed.multidata = self.data[:1] + zlib.compress(pickle.dumps(multidata))
+            first = TrackerData(room)
+            starting_inventory = first.get_player_inventory_counts(0, 1)
+
+            items = [NetworkItem(1, 1, 1), NetworkItem(2, 2, 1)]
+            saves = []
+            for received_items in (items[:1], items):
+                room.multisave = pickle.dumps({
+                    "received_items": {(0, 1, True): received_items},
+                    "location_checks": {(0, 1): {1, 2}},
+                    "client_game_state": {(0, 1): ClientStatus.CLIENT_GOAL},
+                })
+                saves.append(room.multisave)
+                tracker_data = TrackerData(room)
+                expected = starting_inventory.copy()
+                expected.update(item.item for item in received_items)
+                self.assertEqual(tracker_data.get_player_inventory_counts(0, 1), expected)
+            self.assertEqual(tracker_data.get_room_locations_complete()[0, 1], 2)
+            self.assertEqual(tracker_data.get_team_locations_checked_count()[0], 2)
+            self.assertEqual(tracker_data.get_team_completed_worlds_count()[0], 1)
+            # the view only changes for new saves
+            self.assertIs(TrackerData(room).get_room_view(), tracker_data.get_room_view())
+
+            # the exit save only changes activity, its view is still kept
+            room.multisave = pickle.dumps({
+                "received_items": {(0, 1, True): items},
+                "location_checks": {(0, 1): {1, 2}},
+                "client_game_state": {(0, 1): ClientStatus.CLIENT_GOAL},
+                "client_activity_timers": (((0, 1), 1745008545.0),),
+            })
+            exit_view = TrackerData(room).get_room_view()
+            self.assertEqual(exit_view.save_key, (room.id, get_save_version(room)))
+            self.assertIs(TrackerData(room).get_room_view(), exit_view)
+
+            # a request still loading an older save doesn't replace it
+            exit_save = room.multisave
+            room.multisave = saves[0]
+            TrackerData(room).get_room_view()
+            room.multisave = exit_save
+            self.assertIs(TrackerData(room).get_room_view(), exit_view)
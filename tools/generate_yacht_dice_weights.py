@@ -0,0 +1,298 @@
+"""Yacht Dice weights generation script
+This script simulates every category for every number of dice and rolls, and writes the resulting score distributions
+in the format of yacht_weights.bin, which is what the logic in Rules.py uses.
+
+The output is NOT interchangeable with the yacht_weights.bin that ships with the apworld.
+That file holds the distributions of the original simulation, which used its own strategy for keeping dice.
+The keep strategies below are different, so the scores in logic change when the shipped file is replaced.
+Only replace it on purpose, together with the tests in worlds/yachtdicebliss/test that pin its contents.
+
+To run the script, use `python -m tools.generate_yacht_dice_weights` from the repository root.
+See `--help` for the options. The same seed and number of samples always give the same file,
+no matter how many processes are used. Requires NumPy, which is not needed to generate or play.
+It lives outside of the world, so it is not bundled into the apworld.
+"""
+
+import argparse
+import itertools
+import logging
+import multiprocessing
+import os
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from worlds.yachtdicebliss.YachtWeights import encode_weights, weights_file_name
+
+# Dice are simulated in batches: a batch is an array with, per sample, how many dice show each face (1 to 6).
+# Each roll, the dice that are not kept are rolled again, and after the last roll the category is scored.
+# Which dice are kept depends on the category:
+# - categories that add up a value per die keep the dice worth at least the expected value of rolling that die again,
+#   with the remaining rolls. Since the dice are independent, this is the best strategy.
+# - categories that ask for a pattern of dice keep the dice of the pattern that is closest to being complete.
+# - Distincts keeps one die of every face.
+
+# value per face, for categories that add up a value per die
+additive_categories = {
+    "Category Ones": [1, 0, 0, 0, 0, 0],
+    "Category Choice": [1, 2, 3, 4, 5, 6],
+    "Category Twos and Threes": [0, 2, 3, 0, 0, 0],
+    "Category Sum of Odds": [1, 0, 3, 0, 5, 0],
+    "Category Sum of Evens": [0, 2, 0, 4, 0, 6],
+    "Category Double Threes and Fours": [0, 0, 6, 8, 0, 0],
+    "Category Quadruple Ones and Twos": [4, 8, 0, 0, 0, 0],
+}
+
+
+def n_of_a_kind(n: int) -> List[Dict[int, int]]:
+    return [{face: n} for face in range(1, 7)]
+
+
+def straights(length: int) -> List[Dict[int, int]]:
+    return [{face: 1 for face in range(start, start + length)} for start in range(1, 8 - length)]
+
+
+def consecutive(counts: Tuple[int, ...]) -> List[Dict[int, int]]:
+    return [{start + i: count for i, count in enumerate(counts)} for start in range(1, 8 - len(counts))]
+
+
+def distinct(faces: Tuple[int, ...], n: int) -> List[Dict[int, int]]:
+    return [{face: 1 for face in combination} for combination in itertools.combinations(faces, n)]
+
+
+# (score, patterns) for categories that score when any of the patterns is among the dice
+pattern_categories = {
+    "Category Pair": (10, n_of_a_kind(2)),
+    "Category Three of a Kind": (20, n_of_a_kind(3)),
+    "Category Four of a Kind": (30, n_of_a_kind(4)),
+    # the weights have always counted only three tiny straights instead of four
+    "Category Tiny Straight": (20, straights(3)[:3]),
+    "Category Small Straight": (30, straights(4)),
+    "Category Large Straight": (40, straights(5)),
+    "Category Full House": (32, [{a: 3, b: 2} for a, b in itertools.permutations(range(1, 7), 2)]),
+    "Category Yacht": (50, n_of_a_kind(5)),
+    "Category Micro Straight": (10, straights(2)),
+    "Category Three Odds": (
+        20,
+        [
+            {face: combination.count(face) for face in set(combination)}
+            for combination in itertools.combinations_with_replacement((1, 3, 5), 3)
+        ],
+    ),
+    "Category 1-2-1 Consecutive": (30, consecutive((1, 2, 1))),
+    "Category Three Distinct Dice": (20, distinct(tuple(range(1, 7)), 3)),
+    "Category Two Pair": (22, [{a: 2, b: 2} for a, b in itertools.combinations(range(1, 7), 2)]),
+    "Category 2-1-2 Consecutive": (40, consecutive((2, 1, 2))),
+    "Category Five Distinct Dice": (25, distinct(tuple(range(1, 7)), 5)),
+    "Category 4&5 Full House": (50, [{4: 3, 5: 2}, {5: 3, 4: 2}]),
+}
+
+# same order as the weights have always been in
+categories = [
+    "Category Ones",
+    "Category Choice",
+    "Category Pair",
+    "Category Three of a Kind",
+    "Category Four of a Kind",
+    "Category Tiny Straight",
+    "Category Small Straight",
+    "Category Large Straight",
+    "Category Full House",
+    "Category Yacht",
+    "Category Distincts",
+    "Category Twos and Threes",
+    "Category Sum of Odds",
+    "Category Sum of Evens",
+    "Category Double Threes and Fours",
+    "Category Quadruple Ones and Twos",
+    "Category Micro Straight",
+    "Category Three Odds",
+    "Category 1-2-1 Consecutive",
+    "Category Three Distinct Dice",
+    "Category Two Pair",
+    "Category 2-1-2 Consecutive",
+    "Category Five Distinct Dice",
+    "Category 4&5 Full House",
+]
+
+total_probability = 100000
+
+# yacht_weights.bin stores the highest number of dice and rolls in one byte each
+max_dice_limit = 255
+max_rolls_limit = 255
+
+
+def roll(rng: np.random.Generator, number_of_dice: np.ndarray) -> np.ndarray:
+    """
+    Rolls number_of_dice[i] dice for every sample i, and returns how many dice show each face.
+    Counts go up to max_dice_limit, so they need 16 bits.
+    """
+    return rng.multinomial(number_of_dice, [1 / 6] * 6).astype(np.int16)
+
+
+def reroll_values(values: np.ndarray, max_rolls: int) -> List[float]:
+    """
+    Returns the expected value of rolling a single die again, when it may be rolled again 0, 1, ... times after that.
+    """
+    expected = [values.mean()]
+    for _ in range(max_rolls):
+        expected.append(np.maximum(values, expected[-1]).mean())
+    return expected
+
+
+def simulate(category: str, num_dice: int, num_rolls: int, samples: int, seed: int) -> np.ndarray:
+    """
+    Returns the score of every sample of a category, playing with the given number of dice and rolls.
+    """
+    if num_dice == 0 or num_rolls == 0:
+        return np.zeros(samples, dtype=np.int64)
+    rng = np.random.default_rng([seed, categories.index(category), num_dice, num_rolls])
+
+    if category in additive_categories:
+        values = np.array(additive_categories[category])
+        expected = reroll_values(values, num_rolls)
+
+        def keep(counts, rolls_left):
+            return counts * (values >= expected[rolls_left - 1])
+
+        def score(counts):
+            return counts.astype(np.int64) @ values
+
+    elif category in pattern_categories:
+        pattern_score, pattern_dicts = pattern_categories[category]
+        patterns = np.zeros((len(pattern_dicts), 6), dtype=np.int16)
+        for i, pattern in enumerate(pattern_dicts):
+            for face, count in pattern.items():
+                patterns[i, face - 1] = count
+
+        def matched(counts):
+            return np.minimum(counts[:, None, :], patterns[None, :, :])
+
+        def keep(counts, rolls_left):
+            matches = matched(counts)
+            closest = matches.sum(axis=2).argmax(axis=1)
+            return matches[np.arange(len(counts)), closest]
+
+        def score(counts):
+            complete = (matched(counts) == patterns[None, :, :]).all(axis=2).any(axis=1)
+            return complete * pattern_score
+
+    elif category == "Category Distincts":
+
+        def keep(counts, rolls_left):
+            return np.minimum(counts, 1)
+
+        def score(counts):
+            return np.count_nonzero(counts, axis=1)
+
+    else:
+        raise Exception(f"[Yacht Dice] No simulation for category {category}")
+
+    counts = roll(rng, np.full(samples, num_dice))
+    for rolls_left in range(num_rolls - 1, 0, -1):
+        kept = keep(counts, rolls_left)
+        counts = kept + roll(rng, num_dice - kept.sum(axis=1))
+    return score(counts)
+
+
+def simulate_distribution(task: Tuple[str, int, int, int, int]) -> Tuple[Tuple[str, int, int], Dict[int, int]]:
+    category, num_dice, num_rolls, samples, seed = task
+    scores, occurrences = np.unique(simulate(category, num_dice, num_rolls, samples, seed), return_counts=True)
+    return (category, num_dice, num_rolls), normalize(dict(zip(scores.tolist(), occurrences.tolist())), samples)
+
+
+def normalize(distribution: Dict[int, int], samples: int) -> Dict[int, int]:
+    """
+    Scales the number of occurrences of each score to add up to total_probability, rounding by largest remainder.
+    """
+    scaled = {score: divmod(occurrences * total_probability, samples) for score, occurrences in distribution.items()}
+    result = {score: quotient for score, (quotient, _) in scaled.items()}
+    missing = total_probability - sum(result.values())
+    for score in sorted(scaled, key=lambda s: scaled[s][1], reverse=True)[:missing]:
+        result[score] += 1
+    return result
+
+
+def dominate(worse: Dict[int, int], better: Dict[int, int]) -> Dict[int, int]:
+    """
+    Returns better if it stochastically dominates worse, and otherwise the distribution of the maximum of both.
+    Having more dice or rolls should never lower the score in logic, which random noise could otherwise do.
+    """
+    scores = sorted(worse.keys() | better.keys())
+    cumulative_worse = np.cumsum([worse.get(score, 0) for score in scores])
+    cumulative_better = np.cumsum([better.get(score, 0) for score in scores])
+    if (cumulative_better <= cumulative_worse).all():
+        return better
+    cumulative = cumulative_worse * cumulative_better // total_probability
+    cumulative[-1] = total_probability
+    probabilities = np.diff(cumulative, prepend=0)
+    return {score: probability for score, probability in zip(scores, probabilities.tolist()) if probability}
+
+
+def make_monotone(weights: Dict[Tuple[str, int, int], Dict[int, int]], max_dice: int, max_rolls: int):
+    """
+    Adjusts the distributions until more rolls or more dice always dominate fewer.
+    """
+    done = False
+    while not done:
+        done = True
+        for category in categories:
+            for num_dice in range(1, max_dice + 1):
+                for num_rolls in range(1, max_rolls + 1):
+                    key = category, num_dice, num_rolls
+                    for previous in ((category, num_dice, num_rolls - 1), (category, num_dice - 1, num_rolls)):
+                        if previous[1] == 0 or previous[2] == 0:
+                            continue
+                        adjusted = dominate(weights[previous], weights[key])
+                        if adjusted is not weights[key]:
+                            weights[key] = adjusted
+                            done = False
+
+
+def generate_weights(
+    max_dice: int, max_rolls: int, samples: int, seed: int, processes: int
+) -> Dict[Tuple[str, int, int], Dict[int, int]]:
+    tasks = [
+        (category, num_dice, num_rolls, samples, seed)
+        for category in categories
+        for num_dice in range(max_dice + 1)
+        for num_rolls in range(max_rolls + 1)
+    ]
+    with multiprocessing.Pool(processes) as pool:
+        weights = dict(pool.imap(simulate_distribution, tasks, chunksize=4))
+    make_monotone(weights, max_dice, max_rolls)
+    return weights
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Simulate the Yacht Dice score distributions used by logic. "
+        f"The result is not interchangeable with the {weights_file_name} that ships with the apworld, "
+        "since that was made by the original simulation with a different strategy for keeping dice."
+    )
+    parser.add_argument(
+        "--max-dice", type=int, default=8, help=f"highest number of dice to simulate (at most {max_dice_limit})"
+    )
+    parser.add_argument(
+        "--max-rolls", type=int, default=8, help=f"highest number of rolls to simulate (at most {max_rolls_limit})"
+    )
+    parser.add_argument("--samples", type=int, default=100000, help="number of games simulated per entry")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the simulation")
+    parser.add_argument("--processes", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument(
+        "--output",
+        default=weights_file_name,
+        help="file to write the weights to, defaults to the current directory. "
+        "Overwriting the weights of the apworld changes the scores in logic",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s", force=True)
+    if not 1 <= args.max_dice <= max_dice_limit:
+        parser.error(f"--max-dice must be between 1 and {max_dice_limit}")
+    if not 1 <= args.max_rolls <= max_rolls_limit:
+        parser.error(f"--max-rolls must be between 1 and {max_rolls_limit}")
+
+    result = generate_weights(args.max_dice, args.max_rolls, args.samples, args.seed, args.processes)
+    with open(args.output, "wb") as f:
+        f.write(encode_weights(result))
+    logging.info(f"Wrote {len(result)} distributions to {args.output}")
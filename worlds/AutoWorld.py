@@ -7,11 +7,11 @@ import sys
 import time
 from random import Random
 from dataclasses import make_dataclass
-from typing import (Any, Callable, ClassVar, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, TextIO, Tuple,
-                    TYPE_CHECKING, Type, Union)
+from typing import (Any, Callable, ClassVar, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set, TextIO,
+                    Tuple, TYPE_CHECKING, Type, Union)
 
 from Options import item_and_loc_options, ItemsAccessibility, OptionGroup, PerGameCommonOptions
-from BaseClasses import CollectionState
+from BaseClasses import CollectionState, bitset_from_flags
 from Utils import Version
 
 if TYPE_CHECKING:
@@ -314,6 +314,12 @@ class World(metaclass=AutoWorldRegister):
     If False, everything is rechecked at every step, which is slower computationally, 
     but may be desirable in complex/dynamic worlds."""
 
+    incremental_sweep: bool = False
+    """If True, sweeps record which of this player's item names and regions each location rule reads through the
+    CollectionState, and only check a location again after one of those changed.
+    Rules that depend on anything else, like custom state attributes, are still found by the final check of the sweep,
+    but later than they would otherwise be."""
+
     multiworld: "MultiWorld"
     """autoset on creation. The MultiWorld object for the currently generating multiworld."""
     player: int
@@ -538,6 +544,15 @@ class World(metaclass=AutoWorldRegister):
             return True
         return False
 
+    def reachable_locations(self, state: "CollectionState", locations: Sequence["Location"]) -> int:
+        """
+        Called with locations of this world, to check all of them against the state at once.
+        Returns a bitset with bit i set when locations[i] can be reached.
+        Override this for a faster check than calling can_reach on each location, for example when many locations
+        share a rule, but the result has to match can_reach.
+        """
+        return bitset_from_flags([location.can_reach(state) for location in locations])
+
     # following methods should not need to be overridden.
     def create_filler(self) -> "Item":
         return self.create_item(self.get_filler_item_name())
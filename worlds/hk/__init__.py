@@ -186,6 +186,7 @@ class HKWorld(World):
     location_name_to_id = {location_name: location_id for location_id, location_name in
                            enumerate(locations, start=0x1000000)}
     item_name_groups = item_name_groups
+    incremental_sweep = True
 
     ranges: typing.Dict[str, typing.Tuple[int, int]]
     charm_costs: typing.List[int]
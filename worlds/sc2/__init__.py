@@ -102,6 +102,7 @@ class SC2World(World):
     location_cache: List[Location]
     final_missions: List[int]
     required_client_version = 0, 6, 4
+    incremental_sweep = True
     custom_mission_order: SC2MissionOrder
     logic: Optional['SC2Logic']
     filler_items_distribution: Dict[str, int]
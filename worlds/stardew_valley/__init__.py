@@ -78,6 +78,7 @@ class StardewValleyWorld(World):
     """
     game = STARDEW_VALLEY
     topology_present = False
+    incremental_sweep = True
 
     item_name_to_id = {name: data.code for name, data in item_table.items()}
     location_name_to_id = {name: data.code for name, data in location_table.items()}
@@ -0,0 +1,127 @@
+import math
+import sys
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from itertools import accumulate
+from typing import List, Tuple
+
+from .YachtWeights import get_yacht_weights
+
+# This module calculates the distribution of the total score, instead of estimating it per category.
+# A term is one category with its multiplier: (category name in the weights, dice, rolls, multiplier).
+# The score of a term is floor(score * multiplier), and the total score is the sum over all terms.
+#
+# A distribution is (lowest score, integer weights from that score on), and terms are convolved one at a time.
+# To convolve quickly without NumPy, the weights are packed into one big integer, with 64 bits per weight.
+# Adding a shifted and scaled copy of that integer for every possible score of the term then does the work
+# in a few big integer operations (Kronecker substitution).
+# Term weights add up to 100000 (< 2^17), and partial convolutions are scaled down to add up to at most 2^40,
+# so every weight of a product fits in its 64 bits. Weights that get scaled down to 0 are dropped.
+#
+# Terms are sorted before convolving, so every prefix of the sorted terms is a partial convolution
+# that other collections of categories can build upon. These partial convolutions are kept in a LRU cache.
+
+Term = Tuple[str, int, int, float]
+Distribution = Tuple[int, array]
+
+weight_bits = 40
+
+
+def term_distribution(term: Term) -> List[Tuple[int, int]]:
+    """
+    Returns the distribution of the score of a single term, as (score, weight out of 100000) pairs.
+    """
+    category_name, num_dice, num_rolls, multiplier = term
+    weights = get_yacht_weights()
+    start, end = weights.score_range(category_name, num_dice, num_rolls)
+    if start == end:
+        return [(0, 1)]
+    dist = []
+    previous = 0
+    for i in range(start, end):
+        score = math.floor(weights.scores[i] * multiplier)
+        if dist and dist[-1][0] == score:
+            dist[-1] = score, dist[-1][1] + weights.cumulative[i] - previous
+        else:
+            dist.append((score, weights.cumulative[i] - previous))
+        previous = weights.cumulative[i]
+    return dist
+
+
+def convolve(dist: Distribution, term: List[Tuple[int, int]]) -> Distribution:
+    """
+    Returns the distribution of the sum of two independent scores, where the second is the score of a term.
+    """
+    lowest, weights = dist
+    term_lowest = term[0][0]
+    packed = pack(weights)
+    product = 0
+    for score, weight in term:
+        product += (packed * weight) << (64 * (score - term_lowest))
+    result = unpack(product, len(weights) + term[-1][0] - term_lowest)
+
+    shift = sum(result).bit_length() - weight_bits
+    if shift > 0:
+        result = array("Q", map(shift.__rrshift__, result))
+
+    # drop the weights that became 0 at both ends
+    data = result.tobytes()
+    start = (len(data) - len(data.lstrip(b"\0"))) // 8
+    end = len(result) - (len(data) - len(data.rstrip(b"\0"))) // 8
+    return lowest + term_lowest + start, result[start:end]
+
+
+def pack(weights: array) -> int:
+    if sys.byteorder == "big":
+        weights = array("Q", weights)
+        weights.byteswap()
+    return int.from_bytes(weights.tobytes(), "little")
+
+
+def unpack(packed: int, length: int) -> array:
+    weights = array("Q", packed.to_bytes(8 * length, "little"))
+    if sys.byteorder == "big":
+        weights.byteswap()
+    return weights
+
+
+class TotalScoreEngine:
+    """
+    Calculates total score distributions and answers percentile queries on them.
+    """
+
+    def __init__(self, maxsize=2048):
+        self.maxsize = maxsize
+        self.partial_convolutions: "OrderedDict[Tuple[Term, ...], Distribution]" = OrderedDict()
+
+    def total_distribution(self, terms: Tuple[Term, ...]) -> Distribution:
+        terms = tuple(sorted(terms))
+
+        # find the longest prefix that has been convolved before
+        known = len(terms)
+        while known and terms[:known] not in self.partial_convolutions:
+            known -= 1
+        if known:
+            dist = self.partial_convolutions[terms[:known]]
+            self.partial_convolutions.move_to_end(terms[:known])
+        else:
+            dist = 0, array("Q", [1])
+
+        for i in range(known, len(terms)):
+            dist = convolve(dist, term_distribution(terms[i]))
+            self.partial_convolutions[terms[: i + 1]] = dist
+            if len(self.partial_convolutions) > self.maxsize:
+                self.partial_convolutions.popitem(last=False)
+        return dist
+
+    def percentile(self, terms: Tuple[Term, ...], percentile: float) -> int:
+        """
+        Returns the lowest total score such that at least the given fraction of the distribution scores at most that.
+        """
+        lowest, weights = self.total_distribution(terms)
+        cumulative = list(accumulate(weights))
+        return lowest + bisect_left(cumulative, percentile * cumulative[-1])
+
+
+total_score_engine = TotalScoreEngine()
@@ -24,6 +24,21 @@ class GameDifficulty(Choice):
     default = 2
 
 
+class ScoreLogic(Choice):
+    """
+    How the score in logic is calculated from your items.
+    estimate: add up a typical score for every category. This is how logic has always worked.
+    exact: calculate the distribution of your total score, and take a typical total score from that.
+    The difficulty determines what is typical. Exact stays closer to your average total score,
+    which makes it a bit harder on low difficulties and easier on high difficulties.
+    """
+
+    display_name = "Score logic"
+    option_estimate = 1
+    option_exact = 2
+    default = 1
+
+
 class ScoreForLastCheck(Range):
     """
     The items in the item pool will always allow you to reach a score of 1000.
@@ -425,6 +440,7 @@ class NumberOfKeys(Range):
 @dataclass
 class YachtDiceOptions(PerGameCommonOptions):
     game_difficulty: GameDifficulty
+    score_logic: ScoreLogic
     score_for_last_check: ScoreForLastCheck
     score_for_goal: ScoreForGoal
 
@@ -1,13 +1,17 @@
 import math
-from collections import Counter, defaultdict
+from bisect import bisect_right
+from collections import Counter, OrderedDict, defaultdict
 from typing import List, Optional
 
 from BaseClasses import MultiWorld
+from Utils import cache_argsless
 
 from worlds.generic.Rules import set_rule
 
+from .Convolution import total_score_engine
 from .Items import all_categories
-from .YachtWeights import yacht_weights
+from .Locations import YachtDiceLocation
+from .YachtWeights import get_yacht_weights
 
 # This module adds logic to the apworld.
 # In short, we ran a simulation for every possible combination of dice and rolls you can have, per category.
@@ -23,7 +27,8 @@ class Category:
         self.name = name
         self.quantity = quantity  # how many times you have the category
 
-    def get_dist(self, num_dice, num_rolls):
+    # return the name of the category in the weights, and the multiplier that turns its score into ours
+    def get_weights_category(self):
         category_name = self.name
         category_mult = 1
 
@@ -31,21 +36,34 @@ class Category:
             category_mult = all_categories[category_name][0][1]
             category_name = all_categories[category_name][0][0]
 
-        dist = yacht_weights[category_name, num_dice, num_rolls]
+        return category_name, category_mult
+
+    def get_dist(self, num_dice, num_rolls):
+        category_name, category_mult = self.get_weights_category()
+
+        dist = get_yacht_weights()[category_name, num_dice, num_rolls]
         return dist, category_mult
 
+    # return the scores at both border values of the difficulty, using the precompiled percentile table
+    def get_percentiles(self, num_dice, num_rolls, diff):
+        category_name, category_mult = self.get_weights_category()
+
+        percentile_table = get_percentile_table()
+        index = percentile_index(get_yacht_weights().category_index[category_name], num_dice, num_rolls, diff)
+        return percentile_table[index] * category_mult, percentile_table[index + 1] * category_mult
+
     # return mean score of a category
     def mean_score(self, num_dice, num_rolls):
         if num_dice <= 0 or num_rolls <= 0:
             return 0
-        mean_score = 0
+        category_name, category_mult = self.get_weights_category()
 
-        dist, mult = self.get_dist(num_dice=num_dice, num_rolls=num_rolls)
+        return get_mean_score_table()[category_name, num_dice, num_rolls] * category_mult
 
-        for key, value in dist.items():
-            mean_score += key * value / 100000
-
-        return mean_score * mult
+    # return the term of this category for the total score distribution, see Convolution.py
+    def get_term(self, num_dice, num_rolls, mult):
+        category_name, category_mult = self.get_weights_category()
+        return category_name, num_dice, num_rolls, category_mult * mult
 
 
 class ListState:
@@ -91,14 +109,116 @@ def extract_progression(state, player, frags_per_dice, frags_per_roll, allowed_c
     )
 
 
+def progression_counts(state, player, frags_per_dice, frags_per_roll, allowed_categories):
+    """
+    Returns the counts that determine the dice score in logic, as a hashable tuple:
+    (dice, rolls, fixed score multipliers, step score multipliers, count per allowed category).
+    Points are left out, since they are simply added on top of the dice score.
+    """
+    return (
+        state.count("Dice", player) + state.count("Dice Fragment", player) // frags_per_dice,
+        state.count("Roll", player) + state.count("Roll Fragment", player) // frags_per_roll,
+        state.count("Fixed Score Multiplier", player),
+        state.count("Step Score Multiplier", player),
+        tuple(state.count(category_name, player) for category_name in allowed_categories),
+    )
+
+
+class ScoreCache:
+    """
+    Memo of dice scores in logic for one world, keyed on the tuple returned by progression_counts.
+    CollectionStates get copied and rebuilt a lot during fill, while the same counts keep coming back,
+    so this is shared between all states instead of living in the state. Least recently used scores are evicted.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.scores = OrderedDict()
+
+    def get(self, key):
+        score = self.scores.get(key)
+        if score is not None:
+            self.scores.move_to_end(key)
+        return score
+
+    def put(self, key, score):
+        self.scores[key] = score
+        if len(self.scores) > self.maxsize:
+            self.scores.popitem(last=False)
+
+
 border_values = [0, [0.22, 0.41], [0.41, 0.51], [0.51, 0.64], [0.64, 0.76], [0.76, 0.88], [0.88, 0.93], [0.93, 0.97]]
 
+# Logic only needs the two border-value percentiles of a distribution, never the distribution itself.
+# Walking the distributions on every state change is slow, so we compile a flat table the first time logic runs.
+# For every (category, dice, rolls, difficulty) it holds the score at both border values, multiplier not applied.
+max_dice_in_logic = 8
+max_rolls_in_logic = 8
+
+
+def percentile_index(category_index, num_dice, num_rolls, diff):
+    """
+    Returns the position of the first of the two border-value percentiles in the flat percentile table.
+    """
+    return (
+        ((category_index * (max_dice_in_logic + 1) + num_dice) * (max_rolls_in_logic + 1) + num_rolls)
+        * len(border_values)
+        + diff
+    ) * 2
+
+
+@cache_argsless
+def get_mean_score_table():
+    """
+    Builds the mean score of every distribution, used to order categories for the step multiplier.
+    """
+    weights = get_yacht_weights()
+    table = {}
+    for key in weights:
+        start, end = weights.score_range(*key)
+        mean_score = 0
+        previous = 0
+        for i in range(start, end):
+            mean_score += weights.scores[i] * (weights.cumulative[i] - previous) / 100000
+            previous = weights.cumulative[i]
+        table[key] = mean_score
+    return table
+
+
+@cache_argsless
+def get_percentile_table():
+    """
+    Builds the flat table of border-value percentiles. Combinations without a distribution score 0.
+    """
+    weights = get_yacht_weights()
+    table = [0] * percentile_index(len(weights.categories), 0, 0, 0)
+    for category_name, num_dice, num_rolls in weights:
+        if num_dice > max_dice_in_logic or num_rolls > max_rolls_in_logic:
+            continue
+        category_index = weights.category_index[category_name]
+        for diff in range(1, len(border_values)):
+            index = percentile_index(category_index, num_dice, num_rolls, diff)
+            table[index] = weights.find_percentile(category_name, num_dice, num_rolls, border_values[diff][0])
+            table[index + 1] = weights.find_percentile(category_name, num_dice, num_rolls, border_values[diff][1])
+    return table
+
 
 def dice_simulation_strings(
-    categories, num_dice, num_rolls, fixed_mult, step_mult, double_category_doubled, diff, recurse=True, debug=False
+    categories,
+    num_dice,
+    num_rolls,
+    fixed_mult,
+    step_mult,
+    double_category_doubled,
+    diff,
+    recurse=True,
+    debug=False,
+    exact=False,
 ):
     """
     Function that returns the feasible score in logic based on items obtained.
+    By default, this adds up the border-value percentiles per category, which estimates the total score.
+    With exact, it takes the percentile halfway between the border values of the total score distribution instead.
     """
 
     # sort categories because for the step multiplier, you will want low-scoring categories first
@@ -107,57 +227,75 @@ def dice_simulation_strings(
         categories.sort(key=lambda category: category.mean_score(6, 4))
 
     total_score = 0
-    bv1 = border_values[diff][0]
-    bv2 = border_values[diff][1]
 
     if num_dice <= 0 or num_rolls <= 0:
         return 0
 
-    dice_limited = min(8, num_dice)
-    rolls_limited = min(8, num_rolls)
+    dice_limited = min(max_dice_in_logic, num_dice)
+    rolls_limited = min(max_rolls_in_logic, num_rolls)
+    terms = []
 
     for j, category in enumerate(categories):
-        dist, mult_d = category.get_dist(dice_limited, rolls_limited)
-
-        def find_percentile(distribution, percentile):
-            perc = percentile * 100000
-            cumulative_prob = 0
-            for key, value in distribution.items():
-                cumulative_prob += value
-                if cumulative_prob >= perc:
-                    return key * mult_d
-            return 0
-
         if double_category_doubled:
             cat_mult = 2 ** (category.quantity - 1)
         else:
             cat_mult = category.quantity
 
         mult = (1 + fixed_mult + step_mult / 1.2 * j) * cat_mult
-        v1 = find_percentile(dist, bv1)
-        v2 = find_percentile(dist, bv2)
+        if exact:
+            terms.append(category.get_term(dice_limited, rolls_limited, mult))
+            continue
+        v1, v2 = category.get_percentiles(dice_limited, rolls_limited, diff)
         if debug:
+            dist, _ = category.get_dist(dice_limited, rolls_limited)
             print(f"{category.name} {dist} {v1} {v2} {mult} {math.floor( ( v1 + v2 ) * mult / 2 )}")
         total_score += math.floor((v1 + v2) * mult / 2)
 
+    if exact:
+        total_score = total_score_engine.percentile(tuple(terms), (border_values[diff][0] + border_values[diff][1]) / 2)
+
     if recurse and total_score < 5 and diff < 6:
         return min(
             dice_simulation_strings(
-                categories, num_dice, num_rolls, fixed_mult, step_mult, double_category_doubled, 6, recurse=False
+                categories,
+                num_dice,
+                num_rolls,
+                fixed_mult,
+                step_mult,
+                double_category_doubled,
+                6,
+                recurse=False,
+                exact=exact,
             ),
             5,
         )
     if recurse and total_score < 10 and diff < 5:
         return min(
             dice_simulation_strings(
-                categories, num_dice, num_rolls, fixed_mult, step_mult, double_category_doubled, 5, recurse=False
+                categories,
+                num_dice,
+                num_rolls,
+                fixed_mult,
+                step_mult,
+                double_category_doubled,
+                5,
+                recurse=False,
+                exact=exact,
             ),
             10,
         )
     if recurse and total_score < 15 and diff < 4:
         return min(
             dice_simulation_strings(
-                categories, num_dice, num_rolls, fixed_mult, step_mult, double_category_doubled, 4, recurse=False
+                categories,
+                num_dice,
+                num_rolls,
+                fixed_mult,
+                step_mult,
+                double_category_doubled,
+                4,
+                recurse=False,
+                exact=exact,
             ),
             15,
         )
@@ -166,7 +304,14 @@ def dice_simulation_strings(
 
 
 def dice_simulation_fill_pool(
-    state, frags_per_dice, frags_per_roll, allowed_categories, double_category_doubled, difficulty, debug=False
+    state,
+    frags_per_dice,
+    frags_per_roll,
+    allowed_categories,
+    double_category_doubled,
+    difficulty,
+    debug=False,
+    exact=False,
 ):
     """
     Returns the feasible score that one can reach with the current state, options and difficulty.
@@ -177,35 +322,223 @@ def dice_simulation_fill_pool(
     )
     return (
         dice_simulation_strings(
-            categories, num_dice, num_rolls, fixed_mult, step_mult, double_category_doubled, difficulty, debug=debug
+            categories,
+            num_dice,
+            num_rolls,
+            fixed_mult,
+            step_mult,
+            double_category_doubled,
+            difficulty,
+            debug=debug,
+            exact=exact,
         )
         + expoints
     )
 
 
+def dice_simulation_cached(
+    state,
+    player,
+    frags_per_dice,
+    frags_per_roll,
+    allowed_categories,
+    double_category_doubled,
+    difficulty,
+    score_cache: ScoreCache,
+    exact=False,
+):
+    """
+    Returns the feasible score that one can reach with the current state, options and difficulty.
+    The dice score is looked up in score_cache by the relevant item counts, and only simulated if it is not there.
+    """
+    key = progression_counts(state, player, frags_per_dice, frags_per_roll, allowed_categories)
+    score = score_cache.get(key)
+    if score is None:
+        num_dice, num_rolls, number_of_fixed_mults, number_of_step_mults, category_counts = key
+        categories = [
+            Category(category_name, count)
+            for category_name, count in zip(allowed_categories, category_counts)
+            if count  # want all categories that have count >= 1
+        ]
+        score = dice_simulation_strings(
+            categories,
+            num_dice,
+            num_rolls,
+            number_of_fixed_mults * 0.1,
+            number_of_step_mults * 0.01,
+            double_category_doubled,
+            difficulty,
+            exact=exact,
+        )
+        score_cache.put(key, score)
+
+    extra_points_in_logic = state.count("1 Point", player)
+    extra_points_in_logic += state.count("10 Points", player) * 10
+    extra_points_in_logic += state.count("100 Points", player) * 100
+    return score + extra_points_in_logic
+
+
+class PoolScoreTracker:
+    """
+    Keeps track of the item counts of a pool, so its score in logic can be asked for while items are added
+    and removed one at a time, without rebuilding lists or counters.
+    Scores are cached per difficulty, so going back to earlier counts does not simulate again.
+    Behaves like a state for the functions in this module, with the pool belonging to every player.
+    """
+
+    def __init__(
+        self, items, frags_per_dice, frags_per_roll, allowed_categories, double_category_doubled, difficulty, exact
+    ):
+        self.item_counts = Counter(items)
+        self.frags_per_dice = frags_per_dice
+        self.frags_per_roll = frags_per_roll
+        self.allowed_categories = allowed_categories
+        self.double_category_doubled = double_category_doubled
+        self.difficulty = difficulty
+        self.exact = exact
+        self.score_caches = defaultdict(ScoreCache)
+
+    def count(self, item: str, player: Optional[str] = None) -> int:
+        return self.item_counts[item]
+
+    def add(self, item: str):
+        self.item_counts[item] += 1
+
+    def remove(self, item: str):
+        self.item_counts[item] -= 1
+
+    def score(self, difficulty=None) -> int:
+        if difficulty is None:
+            difficulty = self.difficulty
+        return dice_simulation_cached(
+            self,
+            "state_is_a_pool",
+            self.frags_per_dice,
+            self.frags_per_roll,
+            self.allowed_categories,
+            self.double_category_doubled,
+            difficulty,
+            self.score_caches[difficulty],
+            self.exact,
+        )
+
+
 def dice_simulation_state_change(
-    state, player, frags_per_dice, frags_per_roll, allowed_categories, double_category_doubled, difficulty
+    state,
+    player,
+    frags_per_dice,
+    frags_per_roll,
+    allowed_categories,
+    double_category_doubled,
+    difficulty,
+    score_cache: ScoreCache,
+    exact=False,
 ):
     """
     Returns the feasible score that one can reach with the current state, options and difficulty.
     This function is called with state being a AP state object, while doing access rules.
+    The score is kept in the state until it changes, and the dice score is shared between states via score_cache.
     """
 
     if state.prog_items[player]["state_is_fresh"] == 0:
         state.prog_items[player]["state_is_fresh"] = 1
-        categories, num_dice, num_rolls, fixed_mult, step_mult, expoints = extract_progression(
-            state, player, frags_per_dice, frags_per_roll, allowed_categories
-        )
-        state.prog_items[player]["maximum_achievable_score"] = (
-            dice_simulation_strings(
-                categories, num_dice, num_rolls, fixed_mult, step_mult, double_category_doubled, difficulty
-            )
-            + expoints
+        state.prog_items[player]["maximum_achievable_score"] = dice_simulation_cached(
+            state,
+            player,
+            frags_per_dice,
+            frags_per_roll,
+            allowed_categories,
+            double_category_doubled,
+            difficulty,
+            score_cache,
+            exact,
         )
 
     return state.prog_items[player]["maximum_achievable_score"]
 
 
+class ScoreRule:
+    """
+    Access rule of all score locations of one world, which only differ in the score they need.
+    The achievable score is computed once per state, and the locations are sorted on their score,
+    so the reachable locations are found with a single binary search.
+    """
+
+    def __init__(
+        self,
+        locations: List[YachtDiceLocation],
+        player,
+        frags_per_dice,
+        frags_per_roll,
+        allowed_categories,
+        double_category_doubled,
+        difficulty,
+        number_of_keys,
+        score_cache: ScoreCache,
+        exact=False,
+    ):
+        self.locations = sorted(locations, key=lambda location: location.yacht_dice_score)
+        self.scores = [location.yacht_dice_score for location in self.locations]
+        self.player = player
+        self.frags_per_dice = frags_per_dice
+        self.frags_per_roll = frags_per_roll
+        self.allowed_categories = allowed_categories
+        self.double_category_doubled = double_category_doubled
+        self.difficulty = difficulty
+        self.number_of_keys = number_of_keys
+        self.score_cache = score_cache
+        self.exact = exact
+
+    def achievable_score(self, state) -> int:
+        """
+        Returns the score in logic for the state, or -1 if the state does not have all keys.
+        """
+        if not state.has("Key", self.player, self.number_of_keys):
+            return -1
+        return dice_simulation_state_change(
+            state,
+            self.player,
+            self.frags_per_dice,
+            self.frags_per_roll,
+            self.allowed_categories,
+            self.double_category_doubled,
+            self.difficulty,
+            self.score_cache,
+            self.exact,
+        )
+
+    def number_reachable(self, state) -> int:
+        """
+        Returns how many locations are reachable with the state; these are the first ones of self.locations.
+        """
+        return bisect_right(self.scores, self.achievable_score(state))
+
+    def reachable_locations(self, state, start: int = 0) -> List[YachtDiceLocation]:
+        """
+        Returns the reachable locations, skipping the first start of them.
+        Passing the previous number_reachable gives the locations that just became reachable.
+        """
+        return self.locations[start : self.number_reachable(state)]
+
+    def threshold(self, score: int) -> "ScoreThreshold":
+        return ScoreThreshold(self, score)
+
+
+class ScoreThreshold:
+    """
+    Access rule of a single location, which asks the shared ScoreRule for the score of the state.
+    """
+
+    __slots__ = ("rule", "score")
+
+    def __init__(self, rule: ScoreRule, score: int):
+        self.rule = rule
+        self.score = score
+
+    def __call__(self, state) -> bool:
+        return self.rule.achievable_score(state) >= self.score
+
+
 def set_yacht_rules(
     world: MultiWorld,
     player: int,
@@ -215,20 +548,28 @@ def set_yacht_rules(
     double_category_doubled,
     difficulty,
     number_of_keys,
-):
+    score_cache: ScoreCache,
+    exact=False,
+) -> ScoreRule:
     """
-    Sets rules on reaching scores
+    Sets rules on reaching scores, and returns the rule shared by all locations
     """
 
-    for location in world.get_locations(player):
-        set_rule(
-            location,
-            lambda state, curscore=location.yacht_dice_score, player=player: state.has("Key", player, number_of_keys)
-            and dice_simulation_state_change(
-                state, player, frags_per_dice, frags_per_roll, allowed_categories, double_category_doubled, difficulty
-            )
-            >= curscore,
-        )
+    score_rule = ScoreRule(
+        world.get_locations(player),
+        player,
+        frags_per_dice,
+        frags_per_roll,
+        allowed_categories,
+        double_category_doubled,
+        difficulty,
+        number_of_keys,
+        score_cache,
+        exact,
+    )
+    for location in score_rule.locations:
+        set_rule(location, score_rule.threshold(location.yacht_dice_score))
+    return score_rule
 
 
 def set_yacht_completion_rules(world: MultiWorld, player: int):
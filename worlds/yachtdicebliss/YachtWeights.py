@@ -1,7223 +1,141 @@
-yacht_weights = {
-    ("Category Ones", 0, 0): {0: 100000},
-    ("Category Ones", 0, 1): {0: 100000},
-    ("Category Ones", 0, 2): {0: 100000},
-    ("Category Ones", 0, 3): {0: 100000},
-    ("Category Ones", 0, 4): {0: 100000},
-    ("Category Ones", 0, 5): {0: 100000},
-    ("Category Ones", 0, 6): {0: 100000},
-    ("Category Ones", 0, 7): {0: 100000},
-    ("Category Ones", 0, 8): {0: 100000},
-    ("Category Ones", 1, 0): {0: 100000},
-    ("Category Ones", 1, 1): {0: 83416, 1: 16584},
-    ("Category Ones", 1, 2): {0: 69346, 1: 30654},
-    ("Category Ones", 1, 3): {0: 57756, 1: 42244},
-    ("Category Ones", 1, 4): {0: 48709, 1: 51291},
-    ("Category Ones", 1, 5): {0: 40214, 1: 59786},
-    ("Category Ones", 1, 6): {0: 33491, 1: 66509},
-    ("Category Ones", 1, 7): {0: 27838, 1: 72162},
-    ("Category Ones", 1, 8): {0: 23094, 1: 76906},
-    ("Category Ones", 2, 0): {0: 100000},
-    ("Category Ones", 2, 1): {0: 69715, 1: 27502, 2: 2783},
-    ("Category Ones", 2, 2): {0: 48066, 1: 42669, 2: 9265},
-    ("Category Ones", 2, 3): {0: 33544, 1: 48585, 2: 17871},
-    ("Category Ones", 2, 4): {0: 23342, 1: 50092, 2: 26566},
-    ("Category Ones", 2, 5): {0: 16036, 1: 48250, 2: 35714},
-    ("Category Ones", 2, 6): {0: 11355, 1: 44545, 2: 44100},
-    ("Category Ones", 2, 7): {0: 7812, 1: 40248, 2: 51940},
-    ("Category Ones", 2, 8): {0: 5395, 1: 35484, 2: 59121},
-    ("Category Ones", 3, 0): {0: 100000},
-    ("Category Ones", 3, 1): {0: 57462, 1: 35151, 2: 6907, 3: 480},
-    ("Category Ones", 3, 2): {0: 33327, 1: 44253, 2: 19531, 3: 2889},
-    ("Category Ones", 3, 3): {0: 19432, 1: 42237, 2: 30821, 3: 7510},
-    ("Category Ones", 3, 4): {0: 11191, 1: 36208, 2: 38606, 3: 13995},
-    ("Category Ones", 3, 5): {0: 6536, 1: 28891, 2: 43130, 3: 21443},
-    ("Category Ones", 3, 6): {0: 3697, 1: 22501, 2: 44196, 3: 29606},
-    ("Category Ones", 3, 7): {0: 2134, 1: 16717, 2: 43782, 3: 37367},
-    ("Category Ones", 3, 8): {0: 1280, 1: 12567, 2: 40951, 3: 45202},
-    ("Category Ones", 4, 0): {0: 100000},
-    ("Category Ones", 4, 1): {0: 48178, 1: 38635, 2: 11592, 3: 1534, 4: 61},
-    ("Category Ones", 4, 2): {0: 23349, 1: 40775, 2: 26967, 3: 8051, 4: 858},
-    ("Category Ones", 4, 3): {0: 11366, 1: 32547, 2: 35556, 3: 17371, 4: 3160},
-    ("Category Ones", 4, 4): {0: 5331, 1: 23241, 2: 37271, 3: 26943, 4: 7214},
-    ("Category Ones", 4, 5): {0: 2640, 1: 15336, 2: 34536, 3: 34496, 4: 12992},
-    ("Category Ones", 4, 6): {0: 1253, 1: 10073, 2: 29743, 3: 39298, 4: 19633},
-    ("Category Ones", 4, 7): {0: 611, 1: 6304, 2: 24313, 3: 41680, 4: 27092},
-    ("Category Ones", 4, 8): {0: 313, 1: 3915, 2: 19045, 3: 42267, 4: 34460},
-    ("Category Ones", 5, 0): {0: 100000},
-    ("Category Ones", 5, 1): {0: 40042, 1: 40202, 2: 16165, 3: 3249, 4: 331, 5: 11},
-    ("Category Ones", 5, 2): {0: 16212, 1: 35432, 2: 31231, 3: 13849, 4: 3032, 5: 244},
-    ("Category Ones", 5, 3): {0: 6556, 1: 23548, 2: 34509, 3: 24952, 4: 9117, 5: 1318},
-    ("Category Ones", 5, 4): {0: 2552, 1: 14157, 2: 30176, 3: 32048, 4: 17403, 5: 3664},
-    ("Category Ones", 5, 5): {0: 1079, 1: 7704, 2: 23245, 3: 34614, 4: 25625, 5: 7733},
-    ("Category Ones", 5, 6): {0: 409, 1: 4104, 2: 16702, 3: 32901, 4: 32816, 5: 13068},
-    ("Category Ones", 5, 7): {0: 175, 1: 2120, 2: 11497, 3: 28973, 4: 37869, 5: 19366},
-    ("Category Ones", 5, 8): {0: 73, 1: 1094, 2: 7382, 3: 24639, 4: 40166, 5: 26646},
-    ("Category Ones", 6, 0): {0: 100000},
-    ("Category Ones", 6, 1): {0: 33501, 1: 40042, 2: 20320, 3: 5295, 4: 773, 5: 69},
-    ("Category Ones", 6, 2): {0: 11326, 1: 29379, 2: 32368, 3: 19350, 4: 6344, 5: 1141, 6: 92},
-    ("Category Ones", 6, 3): {0: 3764, 1: 16463, 2: 30197, 3: 28928, 4: 15450, 5: 4634, 6: 564},
-    ("Category Ones", 6, 4): {0: 1231, 1: 8093, 2: 21790, 3: 31038, 4: 25136, 5: 10779, 6: 1933},
-    ("Category Ones", 6, 5): {0: 418, 1: 3790, 2: 14029, 3: 27868, 4: 30878, 5: 18389, 6: 4628},
-    ("Category Ones", 6, 6): {0: 158, 1: 1692, 2: 8389, 3: 22007, 4: 33022, 5: 26133, 6: 8599},
-    ("Category Ones", 6, 7): {0: 47, 1: 707, 2: 4749, 3: 16397, 4: 31702, 5: 32432, 6: 13966},
-    ("Category Ones", 6, 8): {0: 17, 1: 304, 2: 2575, 3: 11500, 4: 28116, 5: 37005, 6: 20483},
-    ("Category Ones", 7, 0): {0: 100000},
-    ("Category Ones", 7, 1): {0: 27838, 1: 39224, 2: 23331, 3: 7827, 4: 1536, 5: 235, 6: 9},
-    ("Category Ones", 7, 2): {0: 7796, 1: 23850, 2: 31678, 3: 23224, 4: 10350, 5: 2696, 6: 387, 7: 19},
-    ("Category Ones", 7, 3): {0: 2247, 1: 11142, 2: 24317, 3: 29131, 4: 21297, 5: 9405, 6: 2239, 7: 222},
-    ("Category Ones", 7, 4): {0: 605, 1: 4647, 2: 14787, 3: 26420, 4: 28065, 5: 17986, 6: 6464, 7: 1026},
-    ("Category Ones", 7, 5): {0: 174, 1: 1773, 2: 7907, 3: 19667, 4: 28867, 5: 26190, 6: 12698, 7: 2724},
-    ("Category Ones", 7, 6): {0: 51, 1: 669, 2: 3905, 3: 12915, 4: 25653, 5: 30596, 6: 20371, 7: 5840},
-    ("Category Ones", 7, 7): {0: 17, 1: 213, 2: 1802, 3: 7943, 4: 20364, 5: 32077, 6: 27540, 7: 10044},
-    ("Category Ones", 7, 8): {0: 6, 1: 78, 2: 856, 3: 4579, 4: 15425, 5: 30293, 6: 33357, 7: 15406},
-    ("Category Ones", 8, 0): {0: 100000},
-    ("Category Ones", 8, 1): {0: 23156, 1: 37295, 2: 26136, 3: 10332, 4: 2620, 5: 417, 6: 39, 7: 4, 8: 1},
-    ("Category Ones", 8, 2): {0: 5472, 1: 19058, 2: 29314, 3: 25847, 4: 14130, 5: 5000, 6: 1038, 7: 133, 8: 8},
-    ("Category Ones", 8, 3): {0: 1209, 1: 7452, 2: 18864, 3: 27032, 4: 24664, 5: 14360, 6: 5203, 7: 1114, 8: 102},
-    ("Category Ones", 8, 4): {0: 267, 1: 2540, 2: 9318, 3: 20389, 4: 27157, 5: 23430, 6: 12536, 7: 3804, 8: 559},
-    ("Category Ones", 8, 5): {0: 58, 1: 817, 2: 4298, 3: 12395, 4: 23638, 5: 27792, 6: 20582, 7: 8765, 8: 1655},
-    ("Category Ones", 8, 6): {0: 13, 1: 242, 2: 1716, 3: 6901, 4: 17025, 5: 27508, 6: 27112, 7: 15535, 8: 3948},
-    ("Category Ones", 8, 7): {0: 3, 1: 82, 2: 643, 3: 3508, 4: 11343, 5: 23980, 6: 30438, 7: 22673, 8: 7330},
-    ("Category Ones", 8, 8): {0: 1, 1: 23, 2: 286, 3: 1768, 4: 7029, 5: 18895, 6: 30830, 7: 29143, 8: 12025},
-    ("Category Choice", 0, 0): {0: 100000},
-    ("Category Choice", 0, 1): {0: 100000},
-    ("Category Choice", 0, 2): {0: 100000},
-    ("Category Choice", 0, 3): {0: 100000},
-    ("Category Choice", 0, 4): {0: 100000},
-    ("Category Choice", 0, 5): {0: 100000},
-    ("Category Choice", 0, 6): {0: 100000},
-    ("Category Choice", 0, 7): {0: 100000},
-    ("Category Choice", 0, 8): {0: 100000},
-    ("Category Choice", 1, 0): {0: 100000},
-    ("Category Choice", 1, 1): {1: 16642, 2: 16673, 3: 16828, 4: 16600, 5: 16618, 6: 16639},
-    ("Category Choice", 1, 2): {1: 10921, 2: 11161, 3: 10899, 4: 11333, 5: 27898, 6: 27788},
-    ("Category Choice", 1, 3): {1: 9416, 2: 9316, 3: 9263, 4: 9338, 5: 22740, 6: 39927},
-    ("Category Choice", 1, 4): {1: 7775, 2: 7715, 3: 7698, 4: 7791, 5: 19312, 6: 49709},
-    ("Category Choice", 1, 5): {1: 6390, 2: 6427, 3: 6241, 4: 6516, 5: 16005, 6: 58421},
-    ("Category Choice", 1, 6): {1: 5313, 2: 5200, 3: 5363, 4: 5356, 5: 13424, 6: 65344},
-    ("Category Choice", 1, 7): {1: 4428, 2: 4465, 3: 4321, 4: 4587, 5: 11028, 6: 71171},
-    ("Category Choice", 1, 8): {1: 3644, 2: 3648, 3: 3773, 4: 3633, 5: 9298, 6: 76004},
-    ("Category Choice", 2, 0): {0: 100000},
-    ("Category Choice", 2, 1): {
-        2: 2857,
-        3: 5647,
-        4: 8292,
-        5: 11014,
-        6: 13681,
-        7: 16670,
-        8: 13823,
-        9: 11170,
-        10: 8384,
-        11: 5596,
-        12: 2866,
-    },
-    ("Category Choice", 2, 2): {
-        2: 1269,
-        3: 2445,
-        4: 3769,
-        5: 4889,
-        6: 9840,
-        7: 14772,
-        8: 13639,
-        9: 12220,
-        10: 13755,
-        11: 15622,
-        12: 7780,
-    },
-    ("Category Choice", 2, 3): {
-        2: 840,
-        3: 1706,
-        4: 2567,
-        5: 3532,
-        6: 6870,
-        7: 13487,
-        8: 12296,
-        9: 11489,
-        10: 12684,
-        11: 18510,
-        12: 16019,
-    },
-    ("Category Choice", 2, 4): {
-        2: 580,
-        3: 1203,
-        4: 1793,
-        5: 2349,
-        6: 4766,
-        7: 11794,
-        8: 11395,
-        9: 10694,
-        10: 11421,
-        11: 19145,
-        12: 24860,
-    },
-    ("Category Choice", 2, 5): {
-        2: 463,
-        3: 820,
-        4: 1282,
-        5: 1683,
-        6: 3327,
-        7: 10459,
-        8: 9985,
-        9: 9457,
-        10: 10101,
-        11: 18504,
-        12: 33919,
-    },
-    ("Category Choice", 2, 6): {
-        2: 278,
-        3: 562,
-        4: 897,
-        5: 1127,
-        6: 2289,
-        7: 9329,
-        8: 8711,
-        9: 8343,
-        10: 8640,
-        11: 17310,
-        12: 42514,
-    },
-    ("Category Choice", 2, 7): {
-        2: 205,
-        3: 412,
-        4: 631,
-        5: 804,
-        6: 1586,
-        7: 7617,
-        8: 7580,
-        9: 7474,
-        10: 7514,
-        11: 15801,
-        12: 50376,
-    },
-    ("Category Choice", 2, 8): {
-        2: 136,
-        3: 262,
-        4: 385,
-        5: 551,
-        6: 1114,
-        7: 6849,
-        8: 6457,
-        9: 6208,
-        10: 6546,
-        11: 14067,
-        12: 57425,
-    },
-    ("Category Choice", 3, 0): {0: 100000},
-    ("Category Choice", 3, 1): {
-        3: 487,
-        4: 1375,
-        5: 2727,
-        6: 4574,
-        7: 6986,
-        8: 9834,
-        9: 11635,
-        10: 12552,
-        11: 12455,
-        12: 11648,
-        13: 9762,
-        14: 6922,
-        15: 4476,
-        16: 2778,
-        17: 1329,
-        18: 460,
-    },
-    ("Category Choice", 3, 2): {
-        3: 113,
-        4: 384,
-        5: 883,
-        6: 1345,
-        7: 2555,
-        8: 4722,
-        9: 6436,
-        10: 7981,
-        11: 10449,
-        12: 13008,
-        13: 13398,
-        14: 11409,
-        15: 9806,
-        16: 8963,
-        17: 6384,
-        18: 2164,
-    },
-    ("Category Choice", 3, 3): {
-        3: 85,
-        4: 226,
-        5: 478,
-        6: 816,
-        7: 1551,
-        8: 3168,
-        9: 4651,
-        10: 5921,
-        11: 7570,
-        12: 10775,
-        13: 13633,
-        14: 12157,
-        15: 10908,
-        16: 10859,
-        17: 10915,
-        18: 6287,
-    },
-    ("Category Choice", 3, 4): {
-        3: 56,
-        4: 138,
-        5: 288,
-        6: 466,
-        7: 929,
-        8: 2116,
-        9: 3219,
-        10: 4350,
-        11: 5627,
-        12: 8677,
-        13: 13346,
-        14: 11945,
-        15: 10762,
-        16: 11330,
-        17: 14452,
-        18: 12299,
-    },
-    ("Category Choice", 3, 5): {
-        3: 19,
-        4: 90,
-        5: 158,
-        6: 259,
-        7: 533,
-        8: 1365,
-        9: 2335,
-        10: 3230,
-        11: 4057,
-        12: 6699,
-        13: 12249,
-        14: 11562,
-        15: 10586,
-        16: 11082,
-        17: 16329,
-        18: 19447,
-    },
-    ("Category Choice", 3, 6): {
-        3: 14,
-        4: 45,
-        5: 100,
-        6: 147,
-        7: 306,
-        8: 1005,
-        9: 1634,
-        10: 2306,
-        11: 2960,
-        12: 5006,
-        13: 11050,
-        14: 10603,
-        15: 9701,
-        16: 10252,
-        17: 17096,
-        18: 27775,
-    },
-    ("Category Choice", 3, 7): {
-        3: 10,
-        4: 30,
-        5: 45,
-        6: 82,
-        7: 176,
-        8: 675,
-        9: 1136,
-        10: 1679,
-        11: 2084,
-        12: 3692,
-        13: 9808,
-        14: 9250,
-        15: 9022,
-        16: 9459,
-        17: 17010,
-        18: 35842,
-    },
-    ("Category Choice", 3, 8): {
-        3: 5,
-        4: 19,
-        5: 32,
-        6: 41,
-        7: 98,
-        8: 454,
-        9: 824,
-        10: 1179,
-        11: 1492,
-        12: 2698,
-        13: 8621,
-        14: 8389,
-        15: 8108,
-        16: 8392,
-        17: 16142,
-        18: 43506,
-    },
-    ("Category Choice", 4, 0): {0: 100000},
-    ("Category Choice", 4, 1): {
-        4: 84,
-        5: 318,
-        6: 723,
-        7: 1574,
-        8: 2687,
-        9: 4374,
-        10: 6187,
-        11: 8105,
-        12: 9516,
-        13: 10880,
-        14: 11229,
-        15: 10673,
-        16: 9725,
-        17: 8088,
-        18: 6186,
-        19: 4323,
-        20: 2726,
-        21: 1512,
-        22: 736,
-        23: 286,
-        24: 68,
-    },
-    ("Category Choice", 4, 2): {
-        4: 17,
-        5: 56,
-        6: 172,
-        7: 285,
-        8: 609,
-        9: 1277,
-        10: 2080,
-        11: 3014,
-        12: 4393,
-        13: 6253,
-        14: 8110,
-        15: 9539,
-        16: 10496,
-        17: 11349,
-        18: 11247,
-        19: 9825,
-        20: 7880,
-        21: 6005,
-        22: 4467,
-        23: 2326,
-        24: 600,
-    },
-    ("Category Choice", 4, 3): {
-        4: 8,
-        5: 28,
-        6: 65,
-        7: 128,
-        8: 309,
-        9: 675,
-        10: 1179,
-        11: 1850,
-        12: 2634,
-        13: 4063,
-        14: 5818,
-        15: 7482,
-        16: 8383,
-        17: 9883,
-        18: 11621,
-        19: 11785,
-        20: 9895,
-        21: 8490,
-        22: 7386,
-        23: 5811,
-        24: 2507,
-    },
-    ("Category Choice", 4, 4): {
-        4: 4,
-        5: 19,
-        6: 41,
-        7: 71,
-        8: 132,
-        9: 312,
-        10: 658,
-        11: 1021,
-        12: 1624,
-        13: 2517,
-        14: 4089,
-        15: 5448,
-        16: 6768,
-        17: 8169,
-        18: 10557,
-        19: 12760,
-        20: 11157,
-        21: 9541,
-        22: 9333,
-        23: 9579,
-        24: 6200,
-    },
-    ("Category Choice", 4, 5): {
-        4: 1,
-        5: 10,
-        6: 14,
-        7: 32,
-        8: 60,
-        9: 180,
-        10: 389,
-        11: 599,
-        12: 924,
-        13: 1575,
-        14: 2916,
-        15: 3993,
-        16: 5012,
-        17: 6331,
-        18: 9020,
-        19: 12893,
-        20: 11414,
-        21: 10261,
-        22: 10446,
-        23: 12551,
-        24: 11379,
-    },
-    ("Category Choice", 4, 6): {
-        4: 1,
-        5: 5,
-        6: 1,
-        7: 23,
-        8: 34,
-        9: 104,
-        10: 189,
-        11: 348,
-        12: 512,
-        13: 962,
-        14: 1923,
-        15: 2911,
-        16: 3870,
-        17: 4745,
-        18: 7311,
-        19: 12054,
-        20: 11246,
-        21: 10350,
-        22: 10306,
-        23: 14883,
-        24: 18222,
-    },
-    ("Category Choice", 4, 7): {
-        5: 2,
-        6: 2,
-        7: 10,
-        8: 18,
-        9: 50,
-        10: 136,
-        11: 230,
-        12: 333,
-        13: 540,
-        14: 1379,
-        15: 2120,
-        16: 2832,
-        17: 3629,
-        18: 5654,
-        19: 11206,
-        20: 10646,
-        21: 9719,
-        22: 10265,
-        23: 15911,
-        24: 25318,
-    },
-    ("Category Choice", 4, 8): {
-        5: 2,
-        6: 1,
-        7: 2,
-        8: 7,
-        9: 32,
-        10: 73,
-        11: 111,
-        12: 172,
-        13: 359,
-        14: 948,
-        15: 1524,
-        16: 1967,
-        17: 2697,
-        18: 4294,
-        19: 10211,
-        20: 9548,
-        21: 9030,
-        22: 9596,
-        23: 16241,
-        24: 33185,
-    },
-    ("Category Choice", 5, 0): {0: 100000},
-    ("Category Choice", 5, 1): {
-        5: 5,
-        6: 74,
-        7: 195,
-        8: 435,
-        9: 866,
-        10: 1646,
-        11: 2671,
-        12: 3976,
-        13: 5372,
-        14: 6758,
-        15: 8305,
-        16: 9529,
-        17: 10211,
-        18: 9956,
-        19: 9571,
-        20: 8205,
-        21: 7039,
-        22: 5328,
-        23: 3986,
-        24: 2664,
-        25: 1646,
-        26: 872,
-        27: 430,
-        28: 189,
-        29: 57,
-        30: 14,
-    },
-    ("Category Choice", 5, 2): {
-        5: 1,
-        6: 6,
-        7: 22,
-        8: 53,
-        9: 138,
-        10: 271,
-        11: 486,
-        12: 891,
-        13: 1430,
-        14: 2286,
-        15: 3317,
-        16: 4608,
-        17: 5788,
-        18: 7330,
-        19: 8702,
-        20: 9600,
-        21: 9902,
-        22: 10013,
-        23: 9510,
-        24: 8226,
-        25: 6329,
-        26: 4778,
-        27: 3308,
-        28: 1996,
-        29: 837,
-        30: 172,
-    },
-    ("Category Choice", 5, 3): {
-        6: 7,
-        7: 9,
-        8: 24,
-        9: 63,
-        10: 118,
-        11: 218,
-        12: 402,
-        13: 672,
-        14: 1120,
-        15: 1876,
-        16: 2672,
-        17: 3768,
-        18: 4821,
-        19: 6481,
-        20: 8079,
-        21: 8990,
-        22: 9536,
-        23: 10122,
-        24: 10309,
-        25: 9165,
-        26: 7319,
-        27: 5769,
-        28: 4603,
-        29: 2846,
-        30: 1011,
-    },
-    ("Category Choice", 5, 4): {
-        13: 4,
-        14: 19,
-        15: 68,
-        16: 176,
-        17: 386,
-        18: 777,
-        19: 1552,
-        20: 2947,
-        21: 4633,
-        22: 6603,
-        23: 9149,
-        24: 12143,
-        25: 13726,
-        26: 12874,
-        27: 11602,
-        28: 10643,
-        29: 8348,
-        30: 4350,
-    },
-    ("Category Choice", 5, 5): {
-        16: 1,
-        17: 13,
-        18: 50,
-        19: 167,
-        20: 509,
-        21: 1186,
-        22: 2372,
-        23: 4397,
-        24: 7951,
-        25: 12286,
-        26: 13912,
-        27: 14626,
-        28: 15613,
-        29: 15958,
-        30: 10959,
-    },
-    ("Category Choice", 5, 6): {
-        19: 6,
-        20: 43,
-        21: 171,
-        22: 516,
-        23: 1336,
-        24: 3434,
-        25: 7659,
-        26: 11089,
-        27: 13944,
-        28: 17460,
-        29: 22753,
-        30: 21589,
-    },
-    ("Category Choice", 5, 7): {
-        21: 12,
-        22: 66,
-        23: 265,
-        24: 1005,
-        25: 3459,
-        26: 6699,
-        27: 10367,
-        28: 15686,
-        29: 26600,
-        30: 35841,
-    },
-    ("Category Choice", 5, 8): {22: 3, 23: 30, 24: 195, 25: 1157, 26: 3151, 27: 6233, 28: 11463, 29: 25667, 30: 52101},
-    ("Category Choice", 6, 0): {0: 100000},
-    ("Category Choice", 6, 1): {
-        6: 1,
-        7: 15,
-        8: 49,
-        9: 114,
-        10: 282,
-        11: 532,
-        12: 962,
-        13: 1658,
-        14: 2489,
-        15: 3502,
-        16: 4809,
-        17: 6178,
-        18: 7257,
-        19: 8212,
-        20: 8945,
-        21: 9367,
-        22: 9220,
-        23: 8405,
-        24: 7379,
-        25: 6226,
-        26: 4860,
-        27: 3548,
-        28: 2495,
-        29: 1608,
-        30: 938,
-        31: 508,
-        32: 256,
-        33: 121,
-        34: 53,
-        35: 9,
-        36: 2,
-    },
-    ("Category Choice", 6, 2): {
-        8: 6,
-        9: 12,
-        10: 21,
-        11: 52,
-        12: 113,
-        13: 227,
-        14: 387,
-        15: 686,
-        16: 1159,
-        17: 1733,
-        18: 2440,
-        19: 3344,
-        20: 4423,
-        21: 5609,
-        22: 6866,
-        23: 7807,
-        24: 8800,
-        25: 9290,
-        26: 9222,
-        27: 8618,
-        28: 7991,
-        29: 6823,
-        30: 5310,
-        31: 3853,
-        32: 2553,
-        33: 1577,
-        34: 767,
-        35: 264,
-        36: 47,
-    },
-    ("Category Choice", 6, 3): {
-        15: 3,
-        16: 14,
-        17: 47,
-        18: 120,
-        19: 267,
-        20: 573,
-        21: 1095,
-        22: 1980,
-        23: 3143,
-        24: 4820,
-        25: 6802,
-        26: 8805,
-        27: 10368,
-        28: 11476,
-        29: 12023,
-        30: 11154,
-        31: 9368,
-        32: 7158,
-        33: 5154,
-        34: 3248,
-        35: 1600,
-        36: 782,
-    },
-    ("Category Choice", 6, 4): {
-        19: 4,
-        20: 21,
-        21: 76,
-        22: 219,
-        23: 528,
-        24: 1162,
-        25: 2310,
-        26: 4159,
-        27: 6405,
-        28: 8912,
-        29: 11596,
-        30: 13583,
-        31: 13715,
-        32: 12061,
-        33: 9967,
-        34: 7663,
-        35: 5075,
-        36: 2544,
-    },
-    ("Category Choice", 6, 5): {
-        22: 8,
-        23: 40,
-        24: 143,
-        25: 427,
-        26: 1112,
-        27: 2353,
-        28: 4334,
-        29: 7250,
-        30: 11063,
-        31: 14395,
-        32: 14693,
-        33: 14050,
-        34: 12793,
-        35: 10689,
-        36: 6650,
-    },
-    ("Category Choice", 6, 6): {
-        24: 5,
-        25: 38,
-        26: 169,
-        27: 532,
-        28: 1366,
-        29: 3049,
-        30: 6242,
-        31: 10962,
-        32: 13822,
-        33: 15486,
-        34: 16584,
-        35: 17697,
-        36: 14048,
-    },
-    ("Category Choice", 6, 7): {
-        26: 13,
-        27: 74,
-        28: 280,
-        29: 872,
-        30: 2499,
-        31: 6268,
-        32: 10084,
-        33: 13646,
-        34: 17374,
-        35: 23627,
-        36: 25263,
-    },
-    ("Category Choice", 6, 8): {
-        27: 3,
-        28: 35,
-        29: 167,
-        30: 712,
-        31: 2722,
-        32: 5821,
-        33: 9713,
-        34: 14948,
-        35: 26338,
-        36: 39541,
-    },
-    ("Category Choice", 7, 0): {0: 100000},
-    ("Category Choice", 7, 1): {
-        7: 1,
-        8: 2,
-        9: 5,
-        10: 31,
-        11: 68,
-        12: 182,
-        13: 303,
-        14: 645,
-        15: 1013,
-        16: 1531,
-        17: 2350,
-        18: 3206,
-        19: 4340,
-        20: 5480,
-        21: 6693,
-        22: 7434,
-        23: 8119,
-        24: 8658,
-        25: 8584,
-        26: 8246,
-        27: 7412,
-        28: 6528,
-        29: 5372,
-        30: 4364,
-        31: 3311,
-        32: 2300,
-        33: 1609,
-        34: 1003,
-        35: 620,
-        36: 331,
-        37: 144,
-        38: 75,
-        39: 31,
-        40: 7,
-        41: 2,
-    },
-    ("Category Choice", 7, 2): {
-        10: 4,
-        11: 3,
-        12: 13,
-        13: 23,
-        14: 48,
-        15: 117,
-        16: 162,
-        17: 312,
-        18: 535,
-        19: 869,
-        20: 1291,
-        21: 1820,
-        22: 2549,
-        23: 3300,
-        24: 4282,
-        25: 5385,
-        26: 6611,
-        27: 7379,
-        28: 8075,
-        29: 8544,
-        30: 8645,
-        31: 8185,
-        32: 7574,
-        33: 6776,
-        34: 5580,
-        35: 4362,
-        36: 3021,
-        37: 2072,
-        38: 1338,
-        39: 723,
-        40: 295,
-        41: 96,
-        42: 11,
-    },
-    ("Category Choice", 7, 3): {
-        20: 5,
-        21: 24,
-        22: 82,
-        23: 221,
-        24: 520,
-        25: 1088,
-        26: 2040,
-        27: 3479,
-        28: 5255,
-        29: 7480,
-        30: 9421,
-        31: 10819,
-        32: 11279,
-        33: 10871,
-        34: 9851,
-        35: 8177,
-        36: 6683,
-        37: 4699,
-        38: 3232,
-        39: 2289,
-        40: 1417,
-        41: 641,
-        42: 427,
-    },
-    ("Category Choice", 7, 4): {
-        22: 1,
-        23: 9,
-        24: 43,
-        25: 147,
-        26: 411,
-        27: 967,
-        28: 1960,
-        29: 3583,
-        30: 5853,
-        31: 8199,
-        32: 10290,
-        33: 11435,
-        34: 12000,
-        35: 11424,
-        36: 10060,
-        37: 7332,
-        38: 5576,
-        39: 4396,
-        40: 3274,
-        41: 2031,
-        42: 1009,
-    },
-    ("Category Choice", 7, 5): {
-        22: 1,
-        23: 8,
-        24: 26,
-        25: 66,
-        26: 155,
-        27: 332,
-        28: 628,
-        29: 1147,
-        30: 1960,
-        31: 3139,
-        32: 4778,
-        33: 6411,
-        34: 8365,
-        35: 10069,
-        36: 12049,
-        37: 12524,
-        38: 11201,
-        39: 9528,
-        40: 8086,
-        41: 6219,
-        42: 3308,
-    },
-    ("Category Choice", 7, 6): {
-        26: 1,
-        27: 8,
-        28: 35,
-        29: 103,
-        30: 260,
-        31: 615,
-        32: 1348,
-        33: 2508,
-        34: 4256,
-        35: 6556,
-        36: 9958,
-        37: 13310,
-        38: 13799,
-        39: 13489,
-        40: 13110,
-        41: 12363,
-        42: 8281,
-    },
-    ("Category Choice", 7, 7): {
-        29: 2,
-        30: 14,
-        31: 59,
-        32: 210,
-        33: 576,
-        34: 1345,
-        35: 2741,
-        36: 5568,
-        37: 9963,
-        38: 12668,
-        39: 14471,
-        40: 16397,
-        41: 19215,
-        42: 16771,
-    },
-    ("Category Choice", 7, 8): {
-        31: 1,
-        32: 15,
-        33: 78,
-        34: 268,
-        35: 764,
-        36: 2161,
-        37: 5585,
-        38: 9000,
-        39: 12429,
-        40: 16465,
-        41: 24229,
-        42: 29005,
-    },
-    ("Category Choice", 8, 0): {0: 100000},
-    ("Category Choice", 8, 1): {
-        10: 3,
-        11: 8,
-        12: 22,
-        13: 52,
-        14: 99,
-        15: 215,
-        16: 353,
-        17: 592,
-        18: 961,
-        19: 1530,
-        20: 2288,
-        21: 3014,
-        22: 3783,
-        23: 4938,
-        24: 5910,
-        25: 6829,
-        26: 7482,
-        27: 7879,
-        28: 8093,
-        29: 7997,
-        30: 7423,
-        31: 6835,
-        32: 5875,
-        33: 4822,
-        34: 3978,
-        35: 2971,
-        36: 2152,
-        37: 1519,
-        38: 1040,
-        39: 601,
-        40: 344,
-        41: 205,
-        42: 99,
-        43: 54,
-        44: 23,
-        45: 10,
-        46: 1,
-    },
-    ("Category Choice", 8, 2): {
-        11: 1,
-        12: 1,
-        13: 5,
-        14: 6,
-        15: 14,
-        16: 29,
-        17: 44,
-        18: 82,
-        19: 136,
-        20: 248,
-        21: 412,
-        22: 614,
-        23: 997,
-        24: 1433,
-        25: 1878,
-        26: 2602,
-        27: 3436,
-        28: 4293,
-        29: 5278,
-        30: 6157,
-        31: 6977,
-        32: 7556,
-        33: 8107,
-        34: 7996,
-        35: 7836,
-        36: 7415,
-        37: 6440,
-        38: 5614,
-        39: 4551,
-        40: 3569,
-        41: 2514,
-        42: 1681,
-        43: 1084,
-        44: 579,
-        45: 279,
-        46: 97,
-        47: 33,
-        48: 6,
-    },
-    ("Category Choice", 8, 3): {
-        24: 5,
-        25: 26,
-        26: 84,
-        27: 232,
-        28: 539,
-        29: 1146,
-        30: 2109,
-        31: 3380,
-        32: 4994,
-        33: 6657,
-        34: 8160,
-        35: 9279,
-        36: 10200,
-        37: 9911,
-        38: 9397,
-        39: 8482,
-        40: 7338,
-        41: 5899,
-        42: 4503,
-        43: 2980,
-        44: 2000,
-        45: 1280,
-        46: 708,
-        47: 280,
-        48: 411,
-    },
-    ("Category Choice", 8, 4): {
-        26: 3,
-        27: 21,
-        28: 73,
-        29: 216,
-        30: 543,
-        31: 1148,
-        32: 2130,
-        33: 3430,
-        34: 5145,
-        35: 6784,
-        36: 8444,
-        37: 9283,
-        38: 10078,
-        39: 10073,
-        40: 9658,
-        41: 8925,
-        42: 7427,
-        43: 5534,
-        44: 4153,
-        45: 3067,
-        46: 1996,
-        47: 1200,
-        48: 669,
-    },
-    ("Category Choice", 8, 5): {
-        27: 1,
-        28: 7,
-        29: 28,
-        30: 84,
-        31: 220,
-        32: 499,
-        33: 1001,
-        34: 1875,
-        35: 3123,
-        36: 4967,
-        37: 7160,
-        38: 9141,
-        39: 10509,
-        40: 11569,
-        41: 11860,
-        42: 10599,
-        43: 7630,
-        44: 6271,
-        45: 4957,
-        46: 4014,
-        47: 2864,
-        48: 1621,
-    },
-    ("Category Choice", 8, 6): {
-        30: 1,
-        31: 13,
-        32: 56,
-        33: 170,
-        34: 452,
-        35: 1007,
-        36: 2159,
-        37: 4029,
-        38: 6252,
-        39: 8524,
-        40: 10902,
-        41: 13343,
-        42: 13632,
-        43: 9699,
-        44: 8235,
-        45: 6756,
-        46: 6002,
-        47: 5372,
-        48: 3396,
-    },
-    ("Category Choice", 8, 7): {
-        32: 1,
-        33: 15,
-        34: 65,
-        35: 216,
-        36: 654,
-        37: 1707,
-        38: 3350,
-        39: 5618,
-        40: 8454,
-        41: 12749,
-        42: 16206,
-        43: 11121,
-        44: 9352,
-        45: 8209,
-        46: 7639,
-        47: 8064,
-        48: 6580,
-    },
-    ("Category Choice", 8, 8): {
-        34: 3,
-        35: 26,
-        36: 130,
-        37: 533,
-        38: 1412,
-        39: 2952,
-        40: 5512,
-        41: 10494,
-        42: 17606,
-        43: 11626,
-        44: 10169,
-        45: 9098,
-        46: 8821,
-        47: 10680,
-        48: 10938,
-    },
-    ("Category Pair", 0, 0): {0: 100000},
-    ("Category Pair", 0, 1): {0: 100000},
-    ("Category Pair", 0, 2): {0: 100000},
-    ("Category Pair", 0, 3): {0: 100000},
-    ("Category Pair", 0, 4): {0: 100000},
-    ("Category Pair", 0, 5): {0: 100000},
-    ("Category Pair", 0, 6): {0: 100000},
-    ("Category Pair", 0, 7): {0: 100000},
-    ("Category Pair", 0, 8): {0: 100000},
-    ("Category Pair", 1, 0): {0: 100000},
-    ("Category Pair", 1, 1): {0: 100000},
-    ("Category Pair", 1, 2): {0: 100000},
-    ("Category Pair", 1, 3): {0: 100000},
-    ("Category Pair", 1, 4): {0: 100000},
-    ("Category Pair", 1, 5): {0: 100000},
-    ("Category Pair", 1, 6): {0: 100000},
-    ("Category Pair", 1, 7): {0: 100000},
-    ("Category Pair", 1, 8): {0: 100000},
-    ("Category Pair", 2, 0): {0: 100000},
-    ("Category Pair", 2, 1): {0: 83388, 10: 16612},
-    ("Category Pair", 2, 2): {0: 69422, 10: 30578},
-    ("Category Pair", 2, 3): {0: 57830, 10: 42170},
-    ("Category Pair", 2, 4): {0: 48195, 10: 51805},
-    ("Category Pair", 2, 5): {0: 40117, 10: 59883},
-    ("Category Pair", 2, 6): {0: 33286, 10: 66714},
-    ("Category Pair", 2, 7): {0: 27917, 10: 72083},
-    ("Category Pair", 2, 8): {0: 23354, 10: 76646},
-    ("Category Pair", 3, 0): {0: 100000},
-    ("Category Pair", 3, 1): {0: 55518, 10: 44482},
-    ("Category Pair", 3, 2): {0: 30904, 10: 69096},
-    ("Category Pair", 3, 3): {0: 17242, 10: 82758},
-    ("Category Pair", 3, 4): {0: 9486, 10: 90514},
-    ("Category Pair", 3, 5): {0: 5362, 10: 94638},
-    ("Category Pair", 3, 6): {0: 2909, 10: 97091},
-    ("Category Pair", 3, 7): {0: 1574, 10: 98426},
-    ("Category Pair", 3, 8): {0: 902, 10: 99098},
-    ("Category Pair", 4, 0): {0: 100000},
-    ("Category Pair", 4, 1): {0: 27789, 10: 72211},
-    ("Category Pair", 4, 2): {0: 7799, 10: 92201},
-    ("Category Pair", 4, 3): {0: 2113, 10: 97887},
-    ("Category Pair", 4, 4): {0: 601, 10: 99399},
-    ("Category Pair", 4, 5): {0: 155, 10: 99845},
-    ("Category Pair", 4, 6): {0: 43, 10: 99957},
-    ("Category Pair", 4, 7): {0: 10, 10: 99990},
-    ("Category Pair", 4, 8): {0: 3, 10: 99997},
-    ("Category Pair", 5, 0): {0: 100000},
-    ("Category Pair", 5, 1): {0: 9298, 10: 90702},
-    ("Category Pair", 5, 2): {0: 863, 10: 99137},
-    ("Category Pair", 5, 3): {0: 79, 10: 99921},
-    ("Category Pair", 5, 4): {0: 2, 10: 99998},
-    ("Category Pair", 5, 5): {0: 2, 10: 99998},
-    ("Category Pair", 5, 6): {10: 100000},
-    ("Category Pair", 5, 7): {10: 100000},
-    ("Category Pair", 5, 8): {10: 100000},
-    ("Category Pair", 6, 0): {0: 100000},
-    ("Category Pair", 6, 1): {0: 1541, 10: 98459},
-    ("Category Pair", 6, 2): {0: 23, 10: 99977},
-    ("Category Pair", 6, 3): {10: 100000},
-    ("Category Pair", 6, 4): {10: 100000},
-    ("Category Pair", 6, 5): {10: 100000},
-    ("Category Pair", 6, 6): {10: 100000},
-    ("Category Pair", 6, 7): {10: 100000},
-    ("Category Pair", 6, 8): {10: 100000},
-    ("Category Pair", 7, 0): {0: 100000},
-    ("Category Pair", 7, 1): {10: 100000},
-    ("Category Pair", 7, 2): {10: 100000},
-    ("Category Pair", 7, 3): {10: 100000},
-    ("Category Pair", 7, 4): {10: 100000},
-    ("Category Pair", 7, 5): {10: 100000},
-    ("Category Pair", 7, 6): {10: 100000},
-    ("Category Pair", 7, 7): {10: 100000},
-    ("Category Pair", 7, 8): {10: 100000},
-    ("Category Pair", 8, 0): {0: 100000},
-    ("Category Pair", 8, 1): {10: 100000},
-    ("Category Pair", 8, 2): {10: 100000},
-    ("Category Pair", 8, 3): {10: 100000},
-    ("Category Pair", 8, 4): {10: 100000},
-    ("Category Pair", 8, 5): {10: 100000},
-    ("Category Pair", 8, 6): {10: 100000},
-    ("Category Pair", 8, 7): {10: 100000},
-    ("Category Pair", 8, 8): {10: 100000},
-    ("Category Three of a Kind", 0, 0): {0: 100000},
-    ("Category Three of a Kind", 0, 1): {0: 100000},
-    ("Category Three of a Kind", 0, 2): {0: 100000},
-    ("Category Three of a Kind", 0, 3): {0: 100000},
-    ("Category Three of a Kind", 0, 4): {0: 100000},
-    ("Category Three of a Kind", 0, 5): {0: 100000},
-    ("Category Three of a Kind", 0, 6): {0: 100000},
-    ("Category Three of a Kind", 0, 7): {0: 100000},
-    ("Category Three of a Kind", 0, 8): {0: 100000},
-    ("Category Three of a Kind", 1, 0): {0: 100000},
-    ("Category Three of a Kind", 1, 1): {0: 100000},
-    ("Category Three of a Kind", 1, 2): {0: 100000},
-    ("Category Three of a Kind", 1, 3): {0: 100000},
-    ("Category Three of a Kind", 1, 4): {0: 100000},
-    ("Category Three of a Kind", 1, 5): {0: 100000},
-    ("Category Three of a Kind", 1, 6): {0: 100000},
-    ("Category Three of a Kind", 1, 7): {0: 100000},
-    ("Category Three of a Kind", 1, 8): {0: 100000},
-    ("Category Three of a Kind", 2, 0): {0: 100000},
-    ("Category Three of a Kind", 2, 1): {0: 100000},
-    ("Category Three of a Kind", 2, 2): {0: 100000},
-    ("Category Three of a Kind", 2, 3): {0: 100000},
-    ("Category Three of a Kind", 2, 4): {0: 100000},
-    ("Category Three of a Kind", 2, 5): {0: 100000},
-    ("Category Three of a Kind", 2, 6): {0: 100000},
-    ("Category Three of a Kind", 2, 7): {0: 100000},
-    ("Category Three of a Kind", 2, 8): {0: 100000},
-    ("Category Three of a Kind", 3, 0): {0: 100000},
-    ("Category Three of a Kind", 3, 1): {0: 97222, 20: 2778},
-    ("Category Three of a Kind", 3, 2): {0: 88880, 20: 11120},
-    ("Category Three of a Kind", 3, 3): {0: 78187, 20: 21813},
-    ("Category Three of a Kind", 3, 4): {0: 67476, 20: 32524},
-    ("Category Three of a Kind", 3, 5): {0: 57476, 20: 42524},
-    ("Category Three of a Kind", 3, 6): {0: 48510, 20: 51490},
-    ("Category Three of a Kind", 3, 7): {0: 40921, 20: 59079},
-    ("Category Three of a Kind", 3, 8): {0: 34533, 20: 65467},
-    ("Category Three of a Kind", 4, 0): {0: 100000},
-    ("Category Three of a Kind", 4, 1): {0: 90316, 20: 9684},
-    ("Category Three of a Kind", 4, 2): {0: 68401, 20: 31599},
-    ("Category Three of a Kind", 4, 3): {0: 49383, 20: 50617},
-    ("Category Three of a Kind", 4, 4): {0: 34399, 20: 65601},
-    ("Category Three of a Kind", 4, 5): {0: 24154, 20: 75846},
-    ("Category Three of a Kind", 4, 6): {0: 16802, 20: 83198},
-    ("Category Three of a Kind", 4, 7): {0: 11623, 20: 88377},
-    ("Category Three of a Kind", 4, 8): {0: 8105, 20: 91895},
-    ("Category Three of a Kind", 5, 0): {0: 100000},
-    ("Category Three of a Kind", 5, 1): {0: 78629, 20: 21371},
-    ("Category Three of a Kind", 5, 2): {0: 46013, 20: 53987},
-    ("Category Three of a Kind", 5, 3): {0: 25698, 20: 74302},
-    ("Category Three of a Kind", 5, 4): {0: 14205, 20: 85795},
-    ("Category Three of a Kind", 5, 5): {0: 7932, 20: 92068},
-    ("Category Three of a Kind", 5, 6): {0: 4357, 20: 95643},
-    ("Category Three of a Kind", 5, 7): {0: 2432, 20: 97568},
-    ("Category Three of a Kind", 5, 8): {0: 1378, 20: 98622},
-    ("Category Three of a Kind", 6, 0): {0: 100000},
-    ("Category Three of a Kind", 6, 1): {0: 63231, 20: 36769},
-    ("Category Three of a Kind", 6, 2): {0: 26818, 20: 73182},
-    ("Category Three of a Kind", 6, 3): {0: 11075, 20: 88925},
-    ("Category Three of a Kind", 6, 4): {0: 4749, 20: 95251},
-    ("Category Three of a Kind", 6, 5): {0: 1982, 20: 98018},
-    ("Category Three of a Kind", 6, 6): {0: 827, 20: 99173},
-    ("Category Three of a Kind", 6, 7): {0: 358, 20: 99642},
-    ("Category Three of a Kind", 6, 8): {0: 146, 20: 99854},
-    ("Category Three of a Kind", 7, 0): {0: 100000},
-    ("Category Three of a Kind", 7, 1): {0: 45975, 20: 54025},
-    ("Category Three of a Kind", 7, 2): {0: 13207, 20: 86793},
-    ("Category Three of a Kind", 7, 3): {0: 3727, 20: 96273},
-    ("Category Three of a Kind", 7, 4): {0: 1097, 20: 98903},
-    ("Category Three of a Kind", 7, 5): {0: 313, 20: 99687},
-    ("Category Three of a Kind", 7, 6): {0: 96, 20: 99904},
-    ("Category Three of a Kind", 7, 7): {0: 22, 20: 99978},
-    ("Category Three of a Kind", 7, 8): {0: 8, 20: 99992},
-    ("Category Three of a Kind", 8, 0): {0: 100000},
-    ("Category Three of a Kind", 8, 1): {0: 29316, 20: 70684},
-    ("Category Three of a Kind", 8, 2): {0: 5027, 20: 94973},
-    ("Category Three of a Kind", 8, 3): {0: 857, 20: 99143},
-    ("Category Three of a Kind", 8, 4): {0: 162, 20: 99838},
-    ("Category Three of a Kind", 8, 5): {0: 25, 20: 99975},
-    ("Category Three of a Kind", 8, 6): {0: 4, 20: 99996},
-    ("Category Three of a Kind", 8, 7): {0: 1, 20: 99999},
-    ("Category Three of a Kind", 8, 8): {20: 100000},
-    ("Category Four of a Kind", 0, 0): {0: 100000},
-    ("Category Four of a Kind", 0, 1): {0: 100000},
-    ("Category Four of a Kind", 0, 2): {0: 100000},
-    ("Category Four of a Kind", 0, 3): {0: 100000},
-    ("Category Four of a Kind", 0, 4): {0: 100000},
-    ("Category Four of a Kind", 0, 5): {0: 100000},
-    ("Category Four of a Kind", 0, 6): {0: 100000},
-    ("Category Four of a Kind", 0, 7): {0: 100000},
-    ("Category Four of a Kind", 0, 8): {0: 100000},
-    ("Category Four of a Kind", 1, 0): {0: 100000},
-    ("Category Four of a Kind", 1, 1): {0: 100000},
-    ("Category Four of a Kind", 1, 2): {0: 100000},
-    ("Category Four of a Kind", 1, 3): {0: 100000},
-    ("Category Four of a Kind", 1, 4): {0: 100000},
-    ("Category Four of a Kind", 1, 5): {0: 100000},
-    ("Category Four of a Kind", 1, 6): {0: 100000},
-    ("Category Four of a Kind", 1, 7): {0: 100000},
-    ("Category Four of a Kind", 1, 8): {0: 100000},
-    ("Category Four of a Kind", 2, 0): {0: 100000},
-    ("Category Four of a Kind", 2, 1): {0: 100000},
-    ("Category Four of a Kind", 2, 2): {0: 100000},
-    ("Category Four of a Kind", 2, 3): {0: 100000},
-    ("Category Four of a Kind", 2, 4): {0: 100000},
-    ("Category Four of a Kind", 2, 5): {0: 100000},
-    ("Category Four of a Kind", 2, 6): {0: 100000},
-    ("Category Four of a Kind", 2, 7): {0: 100000},
-    ("Category Four of a Kind", 2, 8): {0: 100000},
-    ("Category Four of a Kind", 3, 0): {0: 100000},
-    ("Category Four of a Kind", 3, 1): {0: 100000},
-    ("Category Four of a Kind", 3, 2): {0: 100000},
-    ("Category Four of a Kind", 3, 3): {0: 100000},
-    ("Category Four of a Kind", 3, 4): {0: 100000},
-    ("Category Four of a Kind", 3, 5): {0: 100000},
-    ("Category Four of a Kind", 3, 6): {0: 100000},
-    ("Category Four of a Kind", 3, 7): {0: 100000},
-    ("Category Four of a Kind", 3, 8): {0: 100000},
-    ("Category Four of a Kind", 4, 0): {0: 100000},
-    ("Category Four of a Kind", 4, 1): {0: 99516, 30: 484},
-    ("Category Four of a Kind", 4, 2): {0: 96122, 30: 3878},
-    ("Category Four of a Kind", 4, 3): {0: 89867, 30: 10133},
-    ("Category Four of a Kind", 4, 4): {0: 81771, 30: 18229},
-    ("Category Four of a Kind", 4, 5): {0: 72893, 30: 27107},
-    ("Category Four of a Kind", 4, 6): {0: 64000, 30: 36000},
-    ("Category Four of a Kind", 4, 7): {0: 55921, 30: 44079},
-    ("Category Four of a Kind", 4, 8): {0: 48175, 30: 51825},
-    ("Category Four of a Kind", 5, 0): {0: 100000},
-    ("Category Four of a Kind", 5, 1): {0: 97938, 30: 2062},
-    ("Category Four of a Kind", 5, 2): {0: 86751, 30: 13249},
-    ("Category Four of a Kind", 5, 3): {0: 70886, 30: 29114},
-    ("Category Four of a Kind", 5, 4): {0: 54807, 30: 45193},
-    ("Category Four of a Kind", 5, 5): {0: 41729, 30: 58271},
-    ("Category Four of a Kind", 5, 6): {0: 30960, 30: 69040},
-    ("Category Four of a Kind", 5, 7): {0: 22207, 30: 77793},
-    ("Category Four of a Kind", 5, 8): {0: 16027, 30: 83973},
-    ("Category Four of a Kind", 6, 0): {0: 100000},
-    ("Category Four of a Kind", 6, 1): {0: 94810, 30: 5190},
-    ("Category Four of a Kind", 6, 2): {0: 73147, 30: 26853},
-    ("Category Four of a Kind", 6, 3): {0: 49873, 30: 50127},
-    ("Category Four of a Kind", 6, 4): {0: 31913, 30: 68087},
-    ("Category Four of a Kind", 6, 5): {0: 19877, 30: 80123},
-    ("Category Four of a Kind", 6, 6): {0: 11973, 30: 88027},
-    ("Category Four of a Kind", 6, 7): {0: 7324, 30: 92676},
-    ("Category Four of a Kind", 6, 8): {0: 4221, 30: 95779},
-    ("Category Four of a Kind", 7, 0): {0: 100000},
-    ("Category Four of a Kind", 7, 1): {0: 89422, 30: 10578},
-    ("Category Four of a Kind", 7, 2): {0: 57049, 30: 42951},
-    ("Category Four of a Kind", 7, 3): {0: 30903, 30: 69097},
-    ("Category Four of a Kind", 7, 4): {0: 15962, 30: 84038},
-    ("Category Four of a Kind", 7, 5): {0: 8148, 30: 91852},
-    ("Category Four of a Kind", 7, 6): {0: 3943, 30: 96057},
-    ("Category Four of a Kind", 7, 7): {0: 1933, 30: 98067},
-    ("Category Four of a Kind", 7, 8): {0: 912, 30: 99088},
-    ("Category Four of a Kind", 8, 0): {0: 100000},
-    ("Category Four of a Kind", 8, 1): {0: 81614, 30: 18386},
-    ("Category Four of a Kind", 8, 2): {0: 40524, 30: 59476},
-    ("Category Four of a Kind", 8, 3): {0: 17426, 30: 82574},
-    ("Category Four of a Kind", 8, 4): {0: 6958, 30: 93042},
-    ("Category Four of a Kind", 8, 5): {0: 2862, 30: 97138},
-    ("Category Four of a Kind", 8, 6): {0: 1049, 30: 98951},
-    ("Category Four of a Kind", 8, 7): {0: 401, 30: 99599},
-    ("Category Four of a Kind", 8, 8): {0: 156, 30: 99844},
-    ("Category Tiny Straight", 0, 0): {0: 100000},
-    ("Category Tiny Straight", 0, 1): {0: 100000},
-    ("Category Tiny Straight", 0, 2): {0: 100000},
-    ("Category Tiny Straight", 0, 3): {0: 100000},
-    ("Category Tiny Straight", 0, 4): {0: 100000},
-    ("Category Tiny Straight", 0, 5): {0: 100000},
-    ("Category Tiny Straight", 0, 6): {0: 100000},
-    ("Category Tiny Straight", 0, 7): {0: 100000},
-    ("Category Tiny Straight", 0, 8): {0: 100000},
-    ("Category Tiny Straight", 1, 0): {0: 100000},
-    ("Category Tiny Straight", 1, 1): {0: 100000},
-    ("Category Tiny Straight", 1, 2): {0: 100000},
-    ("Category Tiny Straight", 1, 3): {0: 100000},
-    ("Category Tiny Straight", 1, 4): {0: 100000},
-    ("Category Tiny Straight", 1, 5): {0: 100000},
-    ("Category Tiny Straight", 1, 6): {0: 100000},
-    ("Category Tiny Straight", 1, 7): {0: 100000},
-    ("Category Tiny Straight", 1, 8): {0: 100000},
-    ("Category Tiny Straight", 2, 0): {0: 100000},
-    ("Category Tiny Straight", 2, 1): {0: 100000},
-    ("Category Tiny Straight", 2, 2): {0: 100000},
-    ("Category Tiny Straight", 2, 3): {0: 100000},
-    ("Category Tiny Straight", 2, 4): {0: 100000},
-    ("Category Tiny Straight", 2, 5): {0: 100000},
-    ("Category Tiny Straight", 2, 6): {0: 100000},
-    ("Category Tiny Straight", 2, 7): {0: 100000},
-    ("Category Tiny Straight", 2, 8): {0: 100000},
-    ("Category Tiny Straight", 3, 0): {0: 100000},
-    ("Category Tiny Straight", 3, 1): {0: 91672, 20: 8328},
-    ("Category Tiny Straight", 3, 2): {0: 79082, 20: 20918},
-    ("Category Tiny Straight", 3, 3): {0: 66490, 20: 33510},
-    ("Category Tiny Straight", 3, 4): {0: 55797, 20: 44203},
-    ("Category Tiny Straight", 3, 5): {0: 46967, 20: 53033},
-    ("Category Tiny Straight", 3, 6): {0: 39595, 20: 60405},
-    ("Category Tiny Straight", 3, 7): {0: 33384, 20: 66616},
-    ("Category Tiny Straight", 3, 8): {0: 28747, 20: 71253},
-    ("Category Tiny Straight", 4, 0): {0: 100000},
-    ("Category Tiny Straight", 4, 1): {0: 78812, 20: 21188},
-    ("Category Tiny Straight", 4, 2): {0: 55525, 20: 44475},
-    ("Category Tiny Straight", 4, 3): {0: 38148, 20: 61852},
-    ("Category Tiny Straight", 4, 4): {0: 26432, 20: 73568},
-    ("Category Tiny Straight", 4, 5): {0: 18225, 20: 81775},
-    ("Category Tiny Straight", 4, 6): {0: 12758, 20: 87242},
-    ("Category Tiny Straight", 4, 7): {0: 8991, 20: 91009},
-    ("Category Tiny Straight", 4, 8): {0: 6325, 20: 93675},
-    ("Category Tiny Straight", 5, 0): {0: 100000},
-    ("Category Tiny Straight", 5, 1): {0: 64979, 20: 35021},
-    ("Category Tiny Straight", 5, 2): {0: 36509, 20: 63491},
-    ("Category Tiny Straight", 5, 3): {0: 20576, 20: 79424},
-    ("Category Tiny Straight", 5, 4): {0: 11585, 20: 88415},
-    ("Category Tiny Straight", 5, 5): {0: 6874, 20: 93126},
-    ("Category Tiny Straight", 5, 6): {0: 3798, 20: 96202},
-    ("Category Tiny Straight", 5, 7): {0: 2214, 20: 97786},
-    ("Category Tiny Straight", 5, 8): {0: 1272, 20: 98728},
-    ("Category Tiny Straight", 6, 0): {0: 100000},
-    ("Category Tiny Straight", 6, 1): {0: 52157, 20: 47843},
-    ("Category Tiny Straight", 6, 2): {0: 23641, 20: 76359},
-    ("Category Tiny Straight", 6, 3): {0: 10883, 20: 89117},
-    ("Category Tiny Straight", 6, 4): {0: 5127, 20: 94873},
-    ("Category Tiny Straight", 6, 5): {0: 2442, 20: 97558},
-    ("Category Tiny Straight", 6, 6): {0: 1158, 20: 98842},
-    ("Category Tiny Straight", 6, 7): {0: 542, 20: 99458},
-    ("Category Tiny Straight", 6, 8): {0: 252, 20: 99748},
-    ("Category Tiny Straight", 7, 0): {0: 100000},
-    ("Category Tiny Straight", 7, 1): {0: 41492, 20: 58508},
-    ("Category Tiny Straight", 7, 2): {0: 15072, 20: 84928},
-    ("Category Tiny Straight", 7, 3): {0: 5905, 20: 94095},
-    ("Category Tiny Straight", 7, 4): {0: 2246, 20: 97754},
-    ("Category Tiny Straight", 7, 5): {0: 942, 20: 99058},
-    ("Category Tiny Straight", 7, 6): {0: 337, 20: 99663},
-    ("Category Tiny Straight", 7, 7): {0: 155, 20: 99845},
-    ("Category Tiny Straight", 7, 8): {0: 61, 20: 99939},
-    ("Category Tiny Straight", 8, 0): {0: 100000},
-    ("Category Tiny Straight", 8, 1): {0: 32993, 20: 67007},
-    ("Category Tiny Straight", 8, 2): {0: 10074, 20: 89926},
-    ("Category Tiny Straight", 8, 3): {0: 3158, 20: 96842},
-    ("Category Tiny Straight", 8, 4): {0: 1060, 20: 98940},
-    ("Category Tiny Straight", 8, 5): {0: 356, 20: 99644},
-    ("Category Tiny Straight", 8, 6): {0: 117, 20: 99883},
-    ("Category Tiny Straight", 8, 7): {0: 32, 20: 99968},
-    ("Category Tiny Straight", 8, 8): {0: 10, 20: 99990},
-    ("Category Small Straight", 0, 0): {0: 100000},
-    ("Category Small Straight", 0, 1): {0: 100000},
-    ("Category Small Straight", 0, 2): {0: 100000},
-    ("Category Small Straight", 0, 3): {0: 100000},
-    ("Category Small Straight", 0, 4): {0: 100000},
-    ("Category Small Straight", 0, 5): {0: 100000},
-    ("Category Small Straight", 0, 6): {0: 100000},
-    ("Category Small Straight", 0, 7): {0: 100000},
-    ("Category Small Straight", 0, 8): {0: 100000},
-    ("Category Small Straight", 1, 0): {0: 100000},
-    ("Category Small Straight", 1, 1): {0: 100000},
-    ("Category Small Straight", 1, 2): {0: 100000},
-    ("Category Small Straight", 1, 3): {0: 100000},
-    ("Category Small Straight", 1, 4): {0: 100000},
-    ("Category Small Straight", 1, 5): {0: 100000},
-    ("Category Small Straight", 1, 6): {0: 100000},
-    ("Category Small Straight", 1, 7): {0: 100000},
-    ("Category Small Straight", 1, 8): {0: 100000},
-    ("Category Small Straight", 2, 0): {0: 100000},
-    ("Category Small Straight", 2, 1): {0: 100000},
-    ("Category Small Straight", 2, 2): {0: 100000},
-    ("Category Small Straight", 2, 3): {0: 100000},
-    ("Category Small Straight", 2, 4): {0: 100000},
-    ("Category Small Straight", 2, 5): {0: 100000},
-    ("Category Small Straight", 2, 6): {0: 100000},
-    ("Category Small Straight", 2, 7): {0: 100000},
-    ("Category Small Straight", 2, 8): {0: 100000},
-    ("Category Small Straight", 3, 0): {0: 100000},
-    ("Category Small Straight", 3, 1): {0: 100000},
-    ("Category Small Straight", 3, 2): {0: 100000},
-    ("Category Small Straight", 3, 3): {0: 100000},
-    ("Category Small Straight", 3, 4): {0: 100000},
-    ("Category Small Straight", 3, 5): {0: 100000},
-    ("Category Small Straight", 3, 6): {0: 100000},
-    ("Category Small Straight", 3, 7): {0: 100000},
-    ("Category Small Straight", 3, 8): {0: 100000},
-    ("Category Small Straight", 4, 0): {0: 100000},
-    ("Category Small Straight", 4, 1): {0: 94516, 30: 5484},
-    ("Category Small Straight", 4, 2): {0: 82700, 30: 17300},
-    ("Category Small Straight", 4, 3): {0: 67926, 30: 32074},
-    ("Category Small Straight", 4, 4): {0: 54265, 30: 45735},
-    ("Category Small Straight", 4, 5): {0: 42130, 30: 57870},
-    ("Category Small Straight", 4, 6): {0: 32536, 30: 67464},
-    ("Category Small Straight", 4, 7): {0: 25008, 30: 74992},
-    ("Category Small Straight", 4, 8): {0: 19595, 30: 80405},
-    ("Category Small Straight", 5, 0): {0: 100000},
-    ("Category Small Straight", 5, 1): {0: 84528, 30: 15472},
-    ("Category Small Straight", 5, 2): {0: 60775, 30: 39225},
-    ("Category Small Straight", 5, 3): {0: 39543, 30: 60457},
-    ("Category Small Straight", 5, 4): {0: 24760, 30: 75240},
-    ("Category Small Straight", 5, 5): {0: 15713, 30: 84287},
-    ("Category Small Straight", 5, 6): {0: 10199, 30: 89801},
-    ("Category Small Straight", 5, 7): {0: 6618, 30: 93382},
-    ("Category Small Straight", 5, 8): {0: 4205, 30: 95795},
-    ("Category Small Straight", 6, 0): {0: 100000},
-    ("Category Small Straight", 6, 1): {0: 73121, 30: 26879},
-    ("Category Small Straight", 6, 2): {0: 41832, 30: 58168},
-    ("Category Small Straight", 6, 3): {0: 21949, 30: 78051},
-    ("Category Small Straight", 6, 4): {0: 11304, 30: 88696},
-    ("Category Small Straight", 6, 5): {0: 6063, 30: 93937},
-    ("Category Small Straight", 6, 6): {0: 3362, 30: 96638},
-    ("Category Small Straight", 6, 7): {0: 1799, 30: 98201},
-    ("Category Small Straight", 6, 8): {0: 1069, 30: 98931},
-    ("Category Small Straight", 7, 0): {0: 100000},
-    ("Category Small Straight", 7, 1): {0: 61837, 30: 38163},
-    ("Category Small Straight", 7, 2): {0: 28202, 30: 71798},
-    ("Category Small Straight", 7, 3): {0: 12187, 30: 87813},
-    ("Category Small Straight", 7, 4): {0: 5427, 30: 94573},
-    ("Category Small Straight", 7, 5): {0: 2444, 30: 97556},
-    ("Category Small Straight", 7, 6): {0: 1144, 30: 98856},
-    ("Category Small Straight", 7, 7): {0: 588, 30: 99412},
-    ("Category Small Straight", 7, 8): {0: 258, 30: 99742},
-    ("Category Small Straight", 8, 0): {0: 100000},
-    ("Category Small Straight", 8, 1): {0: 51394, 30: 48606},
-    ("Category Small Straight", 8, 2): {0: 19090, 30: 80910},
-    ("Category Small Straight", 8, 3): {0: 7104, 30: 92896},
-    ("Category Small Straight", 8, 4): {0: 2645, 30: 97355},
-    ("Category Small Straight", 8, 5): {0: 1010, 30: 98990},
-    ("Category Small Straight", 8, 6): {0: 408, 30: 99592},
-    ("Category Small Straight", 8, 7): {0: 153, 30: 99847},
-    ("Category Small Straight", 8, 8): {0: 78, 30: 99922},
-    ("Category Large Straight", 0, 0): {0: 100000},
-    ("Category Large Straight", 0, 1): {0: 100000},
-    ("Category Large Straight", 0, 2): {0: 100000},
-    ("Category Large Straight", 0, 3): {0: 100000},
-    ("Category Large Straight", 0, 4): {0: 100000},
-    ("Category Large Straight", 0, 5): {0: 100000},
-    ("Category Large Straight", 0, 6): {0: 100000},
-    ("Category Large Straight", 0, 7): {0: 100000},
-    ("Category Large Straight", 0, 8): {0: 100000},
-    ("Category Large Straight", 1, 0): {0: 100000},
-    ("Category Large Straight", 1, 1): {0: 100000},
-    ("Category Large Straight", 1, 2): {0: 100000},
-    ("Category Large Straight", 1, 3): {0: 100000},
-    ("Category Large Straight", 1, 4): {0: 100000},
-    ("Category Large Straight", 1, 5): {0: 100000},
-    ("Category Large Straight", 1, 6): {0: 100000},
-    ("Category Large Straight", 1, 7): {0: 100000},
-    ("Category Large Straight", 1, 8): {0: 100000},
-    ("Category Large Straight", 2, 0): {0: 100000},
-    ("Category Large Straight", 2, 1): {0: 100000},
-    ("Category Large Straight", 2, 2): {0: 100000},
-    ("Category Large Straight", 2, 3): {0: 100000},
-    ("Category Large Straight", 2, 4): {0: 100000},
-    ("Category Large Straight", 2, 5): {0: 100000},
-    ("Category Large Straight", 2, 6): {0: 100000},
-    ("Category Large Straight", 2, 7): {0: 100000},
-    ("Category Large Straight", 2, 8): {0: 100000},
-    ("Category Large Straight", 3, 0): {0: 100000},
-    ("Category Large Straight", 3, 1): {0: 100000},
-    ("Category Large Straight", 3, 2): {0: 100000},
-    ("Category Large Straight", 3, 3): {0: 100000},
-    ("Category Large Straight", 3, 4): {0: 100000},
-    ("Category Large Straight", 3, 5): {0: 100000},
-    ("Category Large Straight", 3, 6): {0: 100000},
-    ("Category Large Straight", 3, 7): {0: 100000},
-    ("Category Large Straight", 3, 8): {0: 100000},
-    ("Category Large Straight", 4, 0): {0: 100000},
-    ("Category Large Straight", 4, 1): {0: 100000},
-    ("Category Large Straight", 4, 2): {0: 100000},
-    ("Category Large Straight", 4, 3): {0: 100000},
-    ("Category Large Straight", 4, 4): {0: 100000},
-    ("Category Large Straight", 4, 5): {0: 100000},
-    ("Category Large Straight", 4, 6): {0: 100000},
-    ("Category Large Straight", 4, 7): {0: 100000},
-    ("Category Large Straight", 4, 8): {0: 100000},
-    ("Category Large Straight", 5, 0): {0: 100000},
-    ("Category Large Straight", 5, 1): {0: 96929, 40: 3071},
-    ("Category Large Straight", 5, 2): {0: 87056, 40: 12944},
-    ("Category Large Straight", 5, 3): {0: 75101, 40: 24899},
-    ("Category Large Straight", 5, 4): {0: 63617, 40: 36383},
-    ("Category Large Straight", 5, 5): {0: 53149, 40: 46851},
-    ("Category Large Straight", 5, 6): {0: 44321, 40: 55679},
-    ("Category Large Straight", 5, 7): {0: 36948, 40: 63052},
-    ("Category Large Straight", 5, 8): {0: 30661, 40: 69339},
-    ("Category Large Straight", 6, 0): {0: 100000},
-    ("Category Large Straight", 6, 1): {0: 90756, 40: 9244},
-    ("Category Large Straight", 6, 2): {0: 69805, 40: 30195},
-    ("Category Large Straight", 6, 3): {0: 49814, 40: 50186},
-    ("Category Large Straight", 6, 4): {0: 35102, 40: 64898},
-    ("Category Large Straight", 6, 5): {0: 24385, 40: 75615},
-    ("Category Large Straight", 6, 6): {0: 17018, 40: 82982},
-    ("Category Large Straight", 6, 7): {0: 11739, 40: 88261},
-    ("Category Large Straight", 6, 8): {0: 7972, 40: 92028},
-    ("Category Large Straight", 7, 0): {0: 100000},
-    ("Category Large Straight", 7, 1): {0: 82840, 40: 17160},
-    ("Category Large Straight", 7, 2): {0: 52821, 40: 47179},
-    ("Category Large Straight", 7, 3): {0: 31348, 40: 68652},
-    ("Category Large Straight", 7, 4): {0: 18166, 40: 81834},
-    ("Category Large Straight", 7, 5): {0: 10690, 40: 89310},
-    ("Category Large Straight", 7, 6): {0: 6051, 40: 93949},
-    ("Category Large Straight", 7, 7): {0: 3617, 40: 96383},
-    ("Category Large Straight", 7, 8): {0: 1941, 40: 98059},
-    ("Category Large Straight", 8, 0): {0: 100000},
-    ("Category Large Straight", 8, 1): {0: 73520, 40: 26480},
-    ("Category Large Straight", 8, 2): {0: 39031, 40: 60969},
-    ("Category Large Straight", 8, 3): {0: 19156, 40: 80844},
-    ("Category Large Straight", 8, 4): {0: 9304, 40: 90696},
-    ("Category Large Straight", 8, 5): {0: 4420, 40: 95580},
-    ("Category Large Straight", 8, 6): {0: 2141, 40: 97859},
-    ("Category Large Straight", 8, 7): {0: 1037, 40: 98963},
-    ("Category Large Straight", 8, 8): {0: 511, 40: 99489},
-    ("Category Full House", 0, 0): {0: 100000},
-    ("Category Full House", 0, 1): {0: 100000},
-    ("Category Full House", 0, 2): {0: 100000},
-    ("Category Full House", 0, 3): {0: 100000},
-    ("Category Full House", 0, 4): {0: 100000},
-    ("Category Full House", 0, 5): {0: 100000},
-    ("Category Full House", 0, 6): {0: 100000},
-    ("Category Full House", 0, 7): {0: 100000},
-    ("Category Full House", 0, 8): {0: 100000},
-    ("Category Full House", 1, 0): {0: 100000},
-    ("Category Full House", 1, 1): {0: 100000},
-    ("Category Full House", 1, 2): {0: 100000},
-    ("Category Full House", 1, 3): {0: 100000},
-    ("Category Full House", 1, 4): {0: 100000},
-    ("Category Full House", 1, 5): {0: 100000},
-    ("Category Full House", 1, 6): {0: 100000},
-    ("Category Full House", 1, 7): {0: 100000},
-    ("Category Full House", 1, 8): {0: 100000},
-    ("Category Full House", 2, 0): {0: 100000},
-    ("Category Full House", 2, 1): {0: 100000},
-    ("Category Full House", 2, 2): {0: 100000},
-    ("Category Full House", 2, 3): {0: 100000},
-    ("Category Full House", 2, 4): {0: 100000},
-    ("Category Full House", 2, 5): {0: 100000},
-    ("Category Full House", 2, 6): {0: 100000},
-    ("Category Full House", 2, 7): {0: 100000},
-    ("Category Full House", 2, 8): {0: 100000},
-    ("Category Full House", 3, 0): {0: 100000},
-    ("Category Full House", 3, 1): {0: 100000},
-    ("Category Full House", 3, 2): {0: 100000},
-    ("Category Full House", 3, 3): {0: 100000},
-    ("Category Full House", 3, 4): {0: 100000},
-    ("Category Full House", 3, 5): {0: 100000},
-    ("Category Full House", 3, 6): {0: 100000},
-    ("Category Full House", 3, 7): {0: 100000},
-    ("Category Full House", 3, 8): {0: 100000},
-    ("Category Full House", 4, 0): {0: 100000},
-    ("Category Full House", 4, 1): {0: 100000},
-    ("Category Full House", 4, 2): {0: 100000},
-    ("Category Full House", 4, 3): {0: 100000},
-    ("Category Full House", 4, 4): {0: 100000},
-    ("Category Full House", 4, 5): {0: 100000},
-    ("Category Full House", 4, 6): {0: 100000},
-    ("Category Full House", 4, 7): {0: 100000},
-    ("Category Full House", 4, 8): {0: 100000},
-    ("Category Full House", 5, 0): {0: 100000},
-    ("Category Full House", 5, 1): {0: 96155, 32: 3845},
-    ("Category Full House", 5, 2): {0: 81391, 32: 18609},
-    ("Category Full House", 5, 3): {0: 64300, 32: 35700},
-    ("Category Full House", 5, 4): {0: 49669, 32: 50331},
-    ("Category Full House", 5, 5): {0: 38019, 32: 61981},
-    ("Category Full House", 5, 6): {0: 29751, 32: 70249},
-    ("Category Full House", 5, 7): {0: 22960, 32: 77040},
-    ("Category Full House", 5, 8): {0: 18650, 32: 81350},
-    ("Category Full House", 6, 0): {0: 100000},
-    ("Category Full House", 6, 1): {0: 82989, 32: 17011},
-    ("Category Full House", 6, 2): {0: 47153, 32: 52847},
-    ("Category Full House", 6, 3): {0: 24151, 32: 75849},
-    ("Category Full House", 6, 4): {0: 12519, 32: 87481},
-    ("Category Full House", 6, 5): {0: 6524, 32: 93476},
-    ("Category Full House", 6, 6): {0: 3606, 32: 96394},
-    ("Category Full House", 6, 7): {0: 1959, 32: 98041},
-    ("Category Full House", 6, 8): {0: 1026, 32: 98974},
-    ("Category Full House", 7, 0): {0: 100000},
-    ("Category Full House", 7, 1): {0: 60232, 32: 39768},
-    ("Category Full House", 7, 2): {0: 18894, 32: 81106},
-    ("Category Full House", 7, 3): {0: 5682, 32: 94318},
-    ("Category Full House", 7, 4): {0: 1706, 32: 98294},
-    ("Category Full House", 7, 5): {0: 522, 32: 99478},
-    ("Category Full House", 7, 6): {0: 146, 32: 99854},
-    ("Category Full House", 7, 7): {0: 54, 32: 99946},
-    ("Category Full House", 7, 8): {0: 18, 32: 99982},
-    ("Category Full House", 8, 0): {0: 100000},
-    ("Category Full House", 8, 1): {0: 35909, 32: 64091},
-    ("Category Full House", 8, 2): {0: 5712, 32: 94288},
-    ("Category Full House", 8, 3): {0: 930, 32: 99070},
-    ("Category Full House", 8, 4): {0: 165, 32: 99835},
-    ("Category Full House", 8, 5): {0: 19, 32: 99981},
-    ("Category Full House", 8, 6): {0: 6, 32: 99994},
-    ("Category Full House", 8, 7): {32: 100000},
-    ("Category Full House", 8, 8): {32: 100000},
-    ("Category Yacht", 0, 0): {0: 100000},
-    ("Category Yacht", 0, 1): {0: 100000},
-    ("Category Yacht", 0, 2): {0: 100000},
-    ("Category Yacht", 0, 3): {0: 100000},
-    ("Category Yacht", 0, 4): {0: 100000},
-    ("Category Yacht", 0, 5): {0: 100000},
-    ("Category Yacht", 0, 6): {0: 100000},
-    ("Category Yacht", 0, 7): {0: 100000},
-    ("Category Yacht", 0, 8): {0: 100000},
-    ("Category Yacht", 1, 0): {0: 100000},
-    ("Category Yacht", 1, 1): {0: 100000},
-    ("Category Yacht", 1, 2): {0: 100000},
-    ("Category Yacht", 1, 3): {0: 100000},
-    ("Category Yacht", 1, 4): {0: 100000},
-    ("Category Yacht", 1, 5): {0: 100000},
-    ("Category Yacht", 1, 6): {0: 100000},
-    ("Category Yacht", 1, 7): {0: 100000},
-    ("Category Yacht", 1, 8): {0: 100000},
-    ("Category Yacht", 2, 0): {0: 100000},
-    ("Category Yacht", 2, 1): {0: 100000},
-    ("Category Yacht", 2, 2): {0: 100000},
-    ("Category Yacht", 2, 3): {0: 100000},
-    ("Category Yacht", 2, 4): {0: 100000},
-    ("Category Yacht", 2, 5): {0: 100000},
-    ("Category Yacht", 2, 6): {0: 100000},
-    ("Category Yacht", 2, 7): {0: 100000},
-    ("Category Yacht", 2, 8): {0: 100000},
-    ("Category Yacht", 3, 0): {0: 100000},
-    ("Category Yacht", 3, 1): {0: 100000},
-    ("Category Yacht", 3, 2): {0: 100000},
-    ("Category Yacht", 3, 3): {0: 100000},
-    ("Category Yacht", 3, 4): {0: 100000},
-    ("Category Yacht", 3, 5): {0: 100000},
-    ("Category Yacht", 3, 6): {0: 100000},
-    ("Category Yacht", 3, 7): {0: 100000},
-    ("Category Yacht", 3, 8): {0: 100000},
-    ("Category Yacht", 4, 0): {0: 100000},
-    ("Category Yacht", 4, 1): {0: 100000},
-    ("Category Yacht", 4, 2): {0: 100000},
-    ("Category Yacht", 4, 3): {0: 100000},
-    ("Category Yacht", 4, 4): {0: 100000},
-    ("Category Yacht", 4, 5): {0: 100000},
-    ("Category Yacht", 4, 6): {0: 100000},
-    ("Category Yacht", 4, 7): {0: 100000},
-    ("Category Yacht", 4, 8): {0: 100000},
-    ("Category Yacht", 5, 0): {0: 100000},
-    ("Category Yacht", 5, 1): {0: 99919, 50: 81},
-    ("Category Yacht", 5, 2): {0: 98727, 50: 1273},
-    ("Category Yacht", 5, 3): {0: 95347, 50: 4653},
-    ("Category Yacht", 5, 4): {0: 89969, 50: 10031},
-    ("Category Yacht", 5, 5): {0: 83124, 50: 16876},
-    ("Category Yacht", 5, 6): {0: 75023, 50: 24977},
-    ("Category Yacht", 5, 7): {0: 67007, 50: 32993},
-    ("Category Yacht", 5, 8): {0: 58618, 50: 41382},
-    ("Category Yacht", 6, 0): {0: 100000},
-    ("Category Yacht", 6, 1): {0: 99571, 50: 429},
-    ("Category Yacht", 6, 2): {0: 94726, 50: 5274},
-    ("Category Yacht", 6, 3): {0: 84366, 50: 15634},
-    ("Category Yacht", 6, 4): {0: 70782, 50: 29218},
-    ("Category Yacht", 6, 5): {0: 56573, 50: 43427},
-    ("Category Yacht", 6, 6): {0: 44206, 50: 55794},
-    ("Category Yacht", 6, 7): {0: 33578, 50: 66422},
-    ("Category Yacht", 6, 8): {0: 25079, 50: 74921},
-    ("Category Yacht", 7, 0): {0: 100000},
-    ("Category Yacht", 7, 1): {0: 98833, 50: 1167},
-    ("Category Yacht", 7, 2): {0: 87511, 50: 12489},
-    ("Category Yacht", 7, 3): {0: 68252, 50: 31748},
-    ("Category Yacht", 7, 4): {0: 49065, 50: 50935},
-    ("Category Yacht", 7, 5): {0: 33364, 50: 66636},
-    ("Category Yacht", 7, 6): {0: 21483, 50: 78517},
-    ("Category Yacht", 7, 7): {0: 13597, 50: 86403},
-    ("Category Yacht", 7, 8): {0: 8483, 50: 91517},
-    ("Category Yacht", 8, 0): {0: 100000},
-    ("Category Yacht", 8, 1): {0: 97212, 50: 2788},
-    ("Category Yacht", 8, 2): {0: 76962, 50: 23038},
-    ("Category Yacht", 8, 3): {0: 50533, 50: 49467},
-    ("Category Yacht", 8, 4): {0: 29981, 50: 70019},
-    ("Category Yacht", 8, 5): {0: 16776, 50: 83224},
-    ("Category Yacht", 8, 6): {0: 9079, 50: 90921},
-    ("Category Yacht", 8, 7): {0: 4705, 50: 95295},
-    ("Category Yacht", 8, 8): {0: 2363, 50: 97637},
-    ("Category Distincts", 1, 1): {1: 100000},
-    ("Category Distincts", 1, 2): {1: 100000},
-    ("Category Distincts", 1, 3): {1: 100000},
-    ("Category Distincts", 1, 4): {1: 100000},
-    ("Category Distincts", 1, 5): {1: 100000},
-    ("Category Distincts", 1, 6): {1: 100000},
-    ("Category Distincts", 1, 7): {1: 100000},
-    ("Category Distincts", 1, 8): {1: 100000},
-    ("Category Distincts", 2, 1): {1: 16804, 2: 83196},
-    ("Category Distincts", 2, 2): {1: 2686, 2: 97314},
-    ("Category Distincts", 2, 3): {1: 463, 2: 99537},
-    ("Category Distincts", 2, 4): {1: 66, 2: 99934},
-    ("Category Distincts", 2, 5): {1: 11, 2: 99989},
-    ("Category Distincts", 2, 6): {1: 1, 2: 99999},
-    ("Category Distincts", 2, 7): {2: 100000},
-    ("Category Distincts", 2, 8): {2: 100000},
-    ("Category Distincts", 3, 1): {1: 2760, 2: 41714, 3: 55526},
-    ("Category Distincts", 3, 2): {1: 78, 2: 14936, 3: 84986},
-    ("Category Distincts", 3, 3): {1: 1, 2: 4865, 3: 95134},
-    ("Category Distincts", 3, 4): {2: 1659, 3: 98341},
-    ("Category Distincts", 3, 5): {2: 575, 3: 99425},
-    ("Category Distincts", 3, 6): {2: 200, 3: 99800},
-    ("Category Distincts", 3, 7): {2: 69, 3: 99931},
-    ("Category Distincts", 3, 8): {2: 22, 3: 99978},
-    ("Category Distincts", 4, 1): {1: 494, 2: 16140, 3: 55471, 4: 27895},
-    ("Category Distincts", 4, 2): {1: 2, 2: 1891, 3: 36922, 4: 61185},
-    ("Category Distincts", 4, 3): {2: 230, 3: 19631, 4: 80139},
-    ("Category Distincts", 4, 4): {2: 21, 3: 9858, 4: 90121},
-    ("Category Distincts", 4, 5): {2: 2, 3: 4904, 4: 95094},
-    ("Category Distincts", 4, 6): {3: 2494, 4: 97506},
-    ("Category Distincts", 4, 7): {3: 1297, 4: 98703},
-    ("Category Distincts", 4, 8): {3: 611, 4: 99389},
-    ("Category Distincts", 5, 1): {1: 81, 2: 5717, 3: 38538, 4: 46379, 5: 9285},
-    ("Category Distincts", 5, 2): {2: 196, 3: 11647, 4: 56472, 5: 31685},
-    ("Category Distincts", 5, 3): {2: 6, 3: 3016, 4: 44724, 5: 52254},
-    ("Category Distincts", 5, 4): {3: 722, 4: 31632, 5: 67646},
-    ("Category Distincts", 5, 5): {3: 215, 4: 21391, 5: 78394},
-    ("Category Distincts", 5, 6): {3: 55, 4: 14470, 5: 85475},
-    ("Category Distincts", 5, 7): {3: 15, 4: 9645, 5: 90340},
-    ("Category Distincts", 5, 8): {3: 2, 4: 6461, 5: 93537},
-    ("Category Distincts", 6, 1): {1: 8, 2: 2019, 3: 22985, 4: 50464, 5: 23032, 6: 1492},
-    ("Category Distincts", 6, 2): {2: 26, 3: 3273, 4: 35174, 5: 52573, 6: 8954},
-    ("Category Distincts", 6, 3): {3: 417, 4: 17376, 5: 62578, 6: 19629},
-    ("Category Distincts", 6, 4): {3: 44, 4: 7787, 5: 61029, 6: 31140},
-    ("Category Distincts", 6, 5): {3: 9, 4: 3690, 5: 54997, 6: 41304},
-    ("Category Distincts", 6, 6): {4: 1557, 5: 47225, 6: 51218},
-    ("Category Distincts", 6, 7): {4: 728, 5: 40465, 6: 58807},
-    ("Category Distincts", 6, 8): {4: 321, 5: 33851, 6: 65828},
-    ("Category Distincts", 7, 1): {1: 4, 2: 661, 3: 13006, 4: 44964, 5: 36020, 6: 5345},
-    ("Category Distincts", 7, 2): {2: 1, 3: 838, 4: 18847, 5: 56731, 6: 23583},
-    ("Category Distincts", 7, 3): {3: 68, 4: 5983, 5: 50312, 6: 43637},
-    ("Category Distincts", 7, 4): {3: 4, 4: 1792, 5: 38393, 6: 59811},
-    ("Category Distincts", 7, 5): {4: 529, 5: 27728, 6: 71743},
-    ("Category Distincts", 7, 6): {4: 164, 5: 19417, 6: 80419},
-    ("Category Distincts", 7, 7): {4: 53, 5: 13565, 6: 86382},
-    ("Category Distincts", 7, 8): {4: 14, 5: 9531, 6: 90455},
-    ("Category Distincts", 8, 1): {1: 1, 2: 197, 3: 6939, 4: 36582, 5: 44977, 6: 11304},
-    ("Category Distincts", 8, 2): {3: 1, 4: 1849, 5: 44145, 6: 54005},
-    ("Category Distincts", 8, 3): {4: 36, 5: 16852, 6: 83112},
-    ("Category Distincts", 8, 4): {5: 3612, 6: 96388},
-    ("Category Distincts", 8, 5): {5: 454, 6: 99546},
-    ("Category Distincts", 8, 6): {5: 32, 6: 99968},
-    ("Category Distincts", 8, 7): {5: 1, 6: 99999},
-    ("Category Distincts", 8, 8): {6: 100000},
-    ("Category Twos and Threes", 1, 1): {0: 66466, 2: 16929, 3: 16605},
-    ("Category Twos and Threes", 1, 2): {0: 55640, 2: 13812, 3: 30548},
-    ("Category Twos and Threes", 1, 3): {0: 46223, 2: 11599, 3: 42178},
-    ("Category Twos and Threes", 1, 4): {0: 38552, 2: 9618, 3: 51830},
-    ("Category Twos and Threes", 1, 5): {0: 32320, 2: 7974, 3: 59706},
-    ("Category Twos and Threes", 1, 6): {0: 26733, 2: 6684, 3: 66583},
-    ("Category Twos and Threes", 1, 7): {0: 22289, 2: 5563, 3: 72148},
-    ("Category Twos and Threes", 1, 8): {0: 18676, 2: 4688, 3: 76636},
-    ("Category Twos and Threes", 2, 1): {0: 44565, 2: 21965, 3: 22335, 4: 2837, 5: 5615, 6: 2683},
-    ("Category Twos and Threes", 2, 2): {0: 30855, 2: 15480, 3: 33956, 4: 1993, 5: 8278, 6: 9438},
-    ("Category Twos and Threes", 2, 3): {0: 21509, 2: 10838, 3: 38995, 4: 1345, 5: 9727, 6: 17586},
-    ("Category Twos and Threes", 2, 4): {0: 14935, 2: 7489, 3: 40188, 4: 904, 5: 9825, 6: 26659},
-    ("Category Twos and Threes", 2, 5): {0: 10492, 2: 5169, 3: 38402, 4: 685, 5: 9671, 6: 35581},
-    ("Category Twos and Threes", 2, 6): {0: 7185, 2: 3590, 3: 35460, 4: 476, 5: 8994, 6: 44295},
-    ("Category Twos and Threes", 2, 7): {0: 4880, 2: 2495, 3: 32147, 4: 322, 5: 8139, 6: 52017},
-    ("Category Twos and Threes", 2, 8): {0: 3464, 2: 1748, 3: 28213, 4: 223, 5: 7294, 6: 59058},
-    ("Category Twos and Threes", 3, 1): {
-        0: 29892,
-        2: 22136,
-        3: 22284,
-        4: 5497,
-        5: 11005,
-        6: 6003,
-        7: 1366,
-        8: 1368,
-        9: 449,
-    },
-    ("Category Twos and Threes", 3, 2): {
-        0: 17285,
-        2: 12757,
-        3: 28287,
-        4: 3213,
-        5: 14092,
-        6: 15822,
-        7: 1730,
-        8: 3941,
-        9: 2873,
-    },
-    ("Category Twos and Threes", 3, 3): {
-        0: 9889,
-        2: 7547,
-        3: 27111,
-        4: 1847,
-        5: 13522,
-        6: 24863,
-        7: 1727,
-        8: 6154,
-        9: 7340,
-    },
-    ("Category Twos and Threes", 3, 4): {
-        0: 5717,
-        2: 4245,
-        3: 23072,
-        4: 1000,
-        5: 11617,
-        6: 31427,
-        7: 1438,
-        8: 7719,
-        9: 13765,
-    },
-    ("Category Twos and Threes", 3, 5): {
-        0: 3347,
-        2: 2448,
-        3: 18506,
-        4: 617,
-        5: 9296,
-        6: 34570,
-        7: 1138,
-        8: 8683,
-        9: 21395,
-    },
-    ("Category Twos and Threes", 3, 6): {
-        0: 1821,
-        2: 1452,
-        3: 14399,
-        4: 341,
-        5: 7148,
-        6: 35444,
-        7: 943,
-        8: 8820,
-        9: 29632,
-    },
-    ("Category Twos and Threes", 3, 7): {
-        0: 1082,
-        2: 835,
-        3: 10672,
-        4: 222,
-        5: 5345,
-        6: 34879,
-        7: 725,
-        8: 8739,
-        9: 37501,
-    },
-    ("Category Twos and Threes", 3, 8): {0: 667, 2: 457, 3: 8099, 4: 120, 5: 4003, 6: 33047, 7: 490, 8: 8018, 9: 45099},
-    ("Category Twos and Threes", 4, 1): {
-        0: 19619,
-        2: 19764,
-        3: 19811,
-        4: 7306,
-        5: 14893,
-        6: 8721,
-        7: 3672,
-        8: 3801,
-        9: 1565,
-        10: 469,
-        11: 319,
-        12: 60,
-    },
-    ("Category Twos and Threes", 4, 2): {
-        0: 9395,
-        2: 9519,
-        3: 20826,
-        4: 3581,
-        5: 15873,
-        6: 18083,
-        7: 3876,
-        8: 8667,
-        9: 6678,
-        10: 1077,
-        11: 1595,
-        12: 830,
-    },
-    ("Category Twos and Threes", 4, 3): {
-        0: 4538,
-        2: 4676,
-        3: 16598,
-        4: 1694,
-        5: 12541,
-        6: 23294,
-        7: 3056,
-        8: 11445,
-        9: 14017,
-        10: 1454,
-        11: 3442,
-        12: 3245,
-    },
-    ("Category Twos and Threes", 4, 4): {
-        0: 2183,
-        2: 2219,
-        3: 11827,
-        4: 827,
-        5: 9096,
-        6: 24218,
-        7: 2251,
-        8: 11841,
-        9: 21496,
-        10: 1447,
-        11: 5412,
-        12: 7183,
-    },
-    ("Category Twos and Threes", 4, 5): {
-        0: 987,
-        2: 1078,
-        3: 7946,
-        4: 381,
-        5: 6024,
-        6: 22064,
-        7: 1528,
-        8: 11169,
-        9: 27693,
-        10: 1428,
-        11: 6926,
-        12: 12776,
-    },
-    ("Category Twos and Threes", 4, 6): {
-        0: 530,
-        2: 514,
-        3: 5070,
-        4: 171,
-        5: 3815,
-        6: 19042,
-        7: 971,
-        8: 9649,
-        9: 31606,
-        10: 1243,
-        11: 7894,
-        12: 19495,
-    },
-    ("Category Twos and Threes", 4, 7): {
-        0: 224,
-        2: 239,
-        3: 3337,
-        4: 83,
-        5: 2427,
-        6: 15556,
-        7: 584,
-        8: 7881,
-        9: 33379,
-        10: 918,
-        11: 8601,
-        12: 26771,
-    },
-    ("Category Twos and Threes", 4, 8): {
-        0: 123,
-        2: 130,
-        3: 1931,
-        4: 42,
-        5: 1468,
-        6: 12179,
-        7: 353,
-        8: 6079,
-        9: 33703,
-        10: 738,
-        11: 8379,
-        12: 34875,
-    },
-    ("Category Twos and Threes", 5, 1): {
-        0: 13070,
-        2: 16414,
-        3: 16607,
-        4: 8172,
-        5: 16396,
-        6: 10247,
-        7: 6170,
-        8: 6572,
-        9: 3061,
-        10: 1591,
-        11: 1136,
-        12: 374,
-        13: 124,
-        14: 55,
-        15: 11,
-    },
-    ("Category Twos and Threes", 5, 2): {
-        0: 5213,
-        2: 6515,
-        3: 14466,
-        4: 3294,
-        5: 14763,
-        6: 16838,
-        7: 5565,
-        8: 12090,
-        9: 9616,
-        10: 3040,
-        11: 4470,
-        12: 2659,
-        13: 578,
-        14: 636,
-        15: 257,
-    },
-    ("Category Twos and Threes", 5, 3): {
-        0: 2126,
-        2: 2581,
-        3: 9638,
-        4: 1321,
-        5: 9700,
-        6: 17947,
-        7: 3741,
-        8: 13214,
-        9: 16835,
-        10: 3216,
-        11: 8066,
-        12: 7402,
-        13: 1039,
-        14: 1842,
-        15: 1332,
-    },
-    ("Category Twos and Threes", 5, 4): {
-        0: 848,
-        2: 1086,
-        3: 5807,
-        4: 493,
-        5: 5781,
-        6: 15410,
-        7: 2157,
-        8: 11579,
-        9: 20661,
-        10: 3042,
-        11: 10468,
-        12: 14158,
-        13: 1264,
-        14: 3435,
-        15: 3811,
-    },
-    ("Category Twos and Threes", 5, 5): {
-        0: 380,
-        2: 401,
-        3: 3222,
-        4: 218,
-        5: 3184,
-        6: 12042,
-        7: 1226,
-        8: 8829,
-        9: 22225,
-        10: 2220,
-        11: 11126,
-        12: 20783,
-        13: 1346,
-        14: 5166,
-        15: 7632,
-    },
-    ("Category Twos and Threes", 5, 6): {
-        0: 123,
-        2: 172,
-        3: 1698,
-        4: 82,
-        5: 1670,
-        6: 8412,
-        7: 653,
-        8: 6610,
-        9: 21305,
-        10: 1597,
-        11: 10593,
-        12: 26214,
-        13: 1307,
-        14: 6551,
-        15: 13013,
-    },
-    ("Category Twos and Threes", 5, 7): {
-        0: 59,
-        2: 65,
-        3: 896,
-        4: 41,
-        5: 908,
-        6: 5940,
-        7: 332,
-        8: 4428,
-        9: 18653,
-        10: 1106,
-        11: 9332,
-        12: 30190,
-        13: 1142,
-        14: 7512,
-        15: 19396,
-    },
-    ("Category Twos and Threes", 5, 8): {
-        0: 13,
-        2: 30,
-        3: 470,
-        4: 14,
-        5: 459,
-        6: 3768,
-        7: 153,
-        8: 2819,
-        9: 15520,
-        10: 666,
-        11: 7771,
-        12: 32501,
-        13: 973,
-        14: 7963,
-        15: 26880,
-    },
-    ("Category Twos and Threes", 6, 1): {
-        0: 8955,
-        2: 13135,
-        3: 13212,
-        4: 8191,
-        5: 16659,
-        6: 10713,
-        7: 8276,
-        8: 8621,
-        9: 4879,
-        10: 3108,
-        11: 2290,
-        12: 1026,
-        13: 496,
-        14: 282,
-        15: 100,
-        16: 37,
-        17: 18,
-        18: 2,
-    },
-    ("Category Twos and Threes", 6, 2): {
-        0: 2944,
-        2: 4382,
-        3: 9661,
-        4: 2851,
-        5: 11978,
-        6: 14157,
-        7: 6021,
-        8: 13344,
-        9: 11416,
-        10: 5032,
-        11: 7676,
-        12: 4905,
-        13: 1940,
-        14: 2123,
-        15: 1026,
-        16: 247,
-        17: 202,
-        18: 95,
-    },
-    ("Category Twos and Threes", 6, 3): {
-        0: 977,
-        2: 1507,
-        3: 5429,
-        4: 933,
-        5: 6758,
-        6: 12595,
-        7: 3404,
-        8: 12211,
-        9: 15493,
-        10: 4567,
-        11: 11208,
-        12: 10862,
-        13: 2828,
-        14: 5229,
-        15: 3924,
-        16: 634,
-        17: 912,
-        18: 529,
-    },
-    ("Category Twos and Threes", 6, 4): {
-        0: 320,
-        2: 545,
-        3: 2723,
-        4: 294,
-        5: 3351,
-        6: 9147,
-        7: 1667,
-        8: 9036,
-        9: 16299,
-        10: 3287,
-        11: 12021,
-        12: 16325,
-        13: 2991,
-        14: 8216,
-        15: 8762,
-        16: 1007,
-        17: 2081,
-        18: 1928,
-    },
-    ("Category Twos and Threes", 6, 5): {
-        0: 114,
-        2: 184,
-        3: 1189,
-        4: 123,
-        5: 1525,
-        6: 5681,
-        7: 777,
-        8: 5744,
-        9: 14359,
-        10: 2136,
-        11: 10563,
-        12: 20394,
-        13: 2648,
-        14: 10049,
-        15: 15030,
-        16: 1251,
-        17: 3669,
-        18: 4564,
-    },
-    ("Category Twos and Threes", 6, 6): {
-        0: 34,
-        2: 64,
-        3: 543,
-        4: 25,
-        5: 696,
-        6: 3342,
-        7: 350,
-        8: 3453,
-        9: 11370,
-        10: 1300,
-        11: 8492,
-        12: 21369,
-        13: 2098,
-        14: 10649,
-        15: 21066,
-        16: 1335,
-        17: 5246,
-        18: 8568,
-    },
-    ("Category Twos and Threes", 6, 7): {
-        0: 14,
-        2: 17,
-        3: 221,
-        4: 5,
-        5: 334,
-        6: 1923,
-        7: 158,
-        8: 1973,
-        9: 8281,
-        10: 715,
-        11: 6214,
-        12: 20371,
-        13: 1535,
-        14: 10107,
-        15: 26139,
-        16: 1221,
-        17: 6654,
-        18: 14118,
-    },
-    ("Category Twos and Threes", 6, 8): {
-        0: 7,
-        2: 9,
-        3: 107,
-        4: 2,
-        5: 123,
-        6: 1007,
-        7: 69,
-        8: 1043,
-        9: 5741,
-        10: 416,
-        11: 4522,
-        12: 17854,
-        13: 1062,
-        14: 8991,
-        15: 29815,
-        16: 1197,
-        17: 7602,
-        18: 20433,
-    },
-    ("Category Twos and Threes", 7, 1): {
-        0: 5802,
-        2: 10380,
-        3: 10100,
-        4: 7689,
-        5: 15384,
-        6: 11027,
-        7: 9559,
-        8: 10304,
-        9: 6289,
-        10: 5017,
-        11: 3830,
-        12: 2088,
-        13: 1211,
-        14: 735,
-        15: 309,
-        16: 177,
-        17: 59,
-        18: 27,
-        19: 11,
-        20: 2,
-    },
-    ("Category Twos and Threes", 7, 2): {
-        0: 1605,
-        2: 2810,
-        3: 6242,
-        4: 2215,
-        5: 9442,
-        6: 11269,
-        7: 5824,
-        8: 13172,
-        9: 11600,
-        10: 6466,
-        11: 9919,
-        12: 6844,
-        13: 3610,
-        14: 4206,
-        15: 2299,
-        16: 966,
-        17: 923,
-        18: 376,
-        19: 114,
-        20: 76,
-        21: 22,
-    },
-    ("Category Twos and Threes", 7, 3): {
-        0: 471,
-        2: 792,
-        3: 2956,
-        4: 558,
-        5: 4265,
-        6: 8288,
-        7: 2641,
-        8: 10013,
-        9: 13017,
-        10: 5028,
-        11: 12133,
-        12: 12302,
-        13: 4465,
-        14: 8279,
-        15: 6674,
-        16: 2082,
-        17: 3001,
-        18: 1968,
-        19: 372,
-        20: 437,
-        21: 258,
-    },
-    ("Category Twos and Threes", 7, 4): {
-        0: 127,
-        2: 211,
-        3: 1218,
-        4: 157,
-        5: 1774,
-        6: 4949,
-        7: 1160,
-        8: 6030,
-        9: 10994,
-        10: 3007,
-        11: 11007,
-        12: 15357,
-        13: 3950,
-        14: 10700,
-        15: 12396,
-        16: 2660,
-        17: 5917,
-        18: 5400,
-        19: 710,
-        20: 1270,
-        21: 1006,
-    },
-    ("Category Twos and Threes", 7, 5): {
-        0: 40,
-        2: 56,
-        3: 478,
-        4: 47,
-        5: 671,
-        6: 2533,
-        7: 426,
-        8: 3249,
-        9: 8155,
-        10: 1653,
-        11: 8026,
-        12: 15164,
-        13: 3008,
-        14: 11317,
-        15: 17220,
-        16: 2851,
-        17: 8259,
-        18: 10513,
-        19: 1041,
-        20: 2565,
-        21: 2728,
-    },
-    ("Category Twos and Threes", 7, 6): {
-        0: 9,
-        2: 18,
-        3: 166,
-        4: 17,
-        5: 249,
-        6: 1331,
-        7: 180,
-        8: 1584,
-        9: 5335,
-        10: 827,
-        11: 5449,
-        12: 13233,
-        13: 1883,
-        14: 10114,
-        15: 19936,
-        16: 2451,
-        17: 9948,
-        18: 16405,
-        19: 1171,
-        20: 4044,
-        21: 5650,
-    },
-    ("Category Twos and Threes", 7, 7): {
-        0: 6,
-        2: 4,
-        3: 59,
-        4: 2,
-        5: 86,
-        6: 591,
-        7: 55,
-        8: 779,
-        9: 3282,
-        10: 368,
-        11: 3321,
-        12: 10638,
-        13: 1273,
-        14: 7969,
-        15: 20423,
-        16: 1910,
-        17: 10123,
-        18: 22122,
-        19: 1293,
-        20: 5583,
-        21: 10113,
-    },
-    ("Category Twos and Threes", 7, 8): {
-        0: 2,
-        2: 2,
-        3: 27,
-        5: 36,
-        6: 249,
-        7: 19,
-        8: 318,
-        9: 1983,
-        10: 197,
-        11: 1880,
-        12: 7854,
-        13: 707,
-        14: 5885,
-        15: 19476,
-        16: 1458,
-        17: 9621,
-        18: 26592,
-        19: 1247,
-        20: 6667,
-        21: 15780,
-    },
-    ("Category Twos and Threes", 8, 1): {
-        0: 3799,
-        2: 7917,
-        3: 7840,
-        4: 6794,
-        5: 13610,
-        6: 10144,
-        7: 10309,
-        8: 11477,
-        9: 7504,
-        10: 6648,
-        11: 5342,
-        12: 3210,
-        13: 2299,
-        14: 1498,
-        15: 738,
-        16: 444,
-        17: 245,
-        18: 105,
-        19: 51,
-        20: 20,
-        21: 4,
-        22: 1,
-        23: 1,
-    },
-    ("Category Twos and Threes", 8, 2): {
-        0: 902,
-        2: 1872,
-        3: 4041,
-        4: 1547,
-        5: 6900,
-        6: 8536,
-        7: 5214,
-        8: 11961,
-        9: 10605,
-        10: 7327,
-        11: 11041,
-        12: 8197,
-        13: 5337,
-        14: 6195,
-        15: 3891,
-        16: 2205,
-        17: 2062,
-        18: 1088,
-        19: 479,
-        20: 384,
-        21: 155,
-        22: 37,
-        23: 17,
-        24: 7,
-    },
-    ("Category Twos and Threes", 8, 3): {
-        0: 201,
-        2: 422,
-        3: 1598,
-        4: 392,
-        5: 2625,
-        6: 5105,
-        7: 1931,
-        8: 7389,
-        9: 9728,
-        10: 4686,
-        11: 11338,
-        12: 11675,
-        13: 5514,
-        14: 10523,
-        15: 8898,
-        16: 3854,
-        17: 5667,
-        18: 3828,
-        19: 1391,
-        20: 1681,
-        21: 1014,
-        22: 206,
-        23: 227,
-        24: 107,
-    },
-    ("Category Twos and Threes", 8, 4): {
-        0: 43,
-        2: 97,
-        3: 518,
-        4: 75,
-        5: 884,
-        6: 2558,
-        7: 648,
-        8: 3661,
-        9: 6908,
-        10: 2363,
-        11: 8286,
-        12: 11960,
-        13: 4118,
-        14: 11359,
-        15: 13098,
-        16: 4254,
-        17: 9133,
-        18: 8743,
-        19: 2217,
-        20: 3995,
-        21: 3323,
-        22: 471,
-        23: 768,
-        24: 520,
-    },
-    ("Category Twos and Threes", 8, 5): {
-        0: 16,
-        2: 16,
-        3: 188,
-        4: 30,
-        5: 316,
-        6: 1110,
-        7: 211,
-        8: 1714,
-        9: 4201,
-        10: 1007,
-        11: 5061,
-        12: 9934,
-        13: 2524,
-        14: 9578,
-        15: 14970,
-        16: 3469,
-        17: 10743,
-        18: 14072,
-        19: 2728,
-        20: 6621,
-        21: 7245,
-        22: 848,
-        23: 1727,
-        24: 1671,
-    },
-    ("Category Twos and Threes", 8, 6): {
-        0: 3,
-        2: 8,
-        3: 57,
-        4: 6,
-        5: 96,
-        6: 474,
-        7: 68,
-        8: 683,
-        9: 2273,
-        10: 436,
-        11: 2957,
-        12: 7143,
-        13: 1405,
-        14: 7037,
-        15: 14205,
-        16: 2612,
-        17: 10618,
-        18: 17783,
-        19: 2548,
-        20: 8749,
-        21: 12731,
-        22: 1109,
-        23: 3141,
-        24: 3858,
-    },
-    ("Category Twos and Threes", 8, 7): {
-        0: 1,
-        2: 1,
-        3: 16,
-        4: 1,
-        5: 24,
-        6: 176,
-        7: 19,
-        8: 251,
-        9: 1167,
-        10: 195,
-        11: 1485,
-        12: 4725,
-        13: 775,
-        14: 4727,
-        15: 12345,
-        16: 1804,
-        17: 8935,
-        18: 19896,
-        19: 2324,
-        20: 9757,
-        21: 18331,
-        22: 1237,
-        23: 4503,
-        24: 7305,
-    },
-    ("Category Twos and Threes", 8, 8): {
-        3: 7,
-        5: 7,
-        6: 66,
-        7: 7,
-        8: 90,
-        9: 557,
-        10: 61,
-        11: 718,
-        12: 2912,
-        13: 390,
-        14: 2918,
-        15: 9640,
-        16: 1068,
-        17: 7289,
-        18: 19736,
-        19: 1781,
-        20: 10020,
-        21: 23586,
-        22: 1233,
-        23: 5802,
-        24: 12112,
-    },
-    ("Category Sum of Odds", 1, 1): {0: 50084, 1: 16488, 3: 16584, 5: 16844},
-    ("Category Sum of Odds", 1, 2): {0: 33472, 1: 11017, 3: 27886, 5: 27625},
-    ("Category Sum of Odds", 1, 3): {0: 27892, 1: 9293, 3: 23006, 5: 39809},
-    ("Category Sum of Odds", 1, 4): {0: 23060, 1: 7857, 3: 19299, 5: 49784},
-    ("Category Sum of Odds", 1, 5): {0: 19333, 1: 6559, 3: 15941, 5: 58167},
-    ("Category Sum of Odds", 1, 6): {0: 16250, 1: 5428, 3: 13224, 5: 65098},
-    ("Category Sum of Odds", 1, 7): {0: 13420, 1: 4420, 3: 11191, 5: 70969},
-    ("Category Sum of Odds", 1, 8): {0: 11042, 1: 3648, 3: 9361, 5: 75949},
-    ("Category Sum of Odds", 2, 1): {
-        0: 24611,
-        1: 16800,
-        2: 2815,
-        3: 16654,
-        4: 5580,
-        5: 16856,
-        6: 8312,
-        8: 5540,
-        10: 2832,
-    },
-    ("Category Sum of Odds", 2, 2): {
-        0: 11216,
-        1: 7355,
-        2: 1250,
-        3: 18386,
-        4: 6190,
-        5: 18558,
-        6: 13858,
-        8: 15414,
-        10: 7773,
-    },
-    ("Category Sum of Odds", 2, 3): {
-        0: 7666,
-        1: 5252,
-        2: 812,
-        3: 12782,
-        4: 4273,
-        5: 22224,
-        6: 12709,
-        8: 18363,
-        10: 15919,
-    },
-    ("Category Sum of Odds", 2, 4): {
-        0: 5392,
-        1: 3585,
-        2: 622,
-        3: 8914,
-        4: 2928,
-        5: 23132,
-        6: 11358,
-        8: 19129,
-        10: 24940,
-    },
-    ("Category Sum of Odds", 2, 5): {
-        0: 3735,
-        1: 2502,
-        2: 415,
-        3: 6203,
-        4: 2093,
-        5: 22529,
-        6: 10020,
-        8: 18712,
-        10: 33791,
-    },
-    ("Category Sum of Odds", 2, 6): {
-        0: 2606,
-        1: 1769,
-        2: 282,
-        3: 4279,
-        4: 1468,
-        5: 20970,
-        6: 8852,
-        8: 17272,
-        10: 42502,
-    },
-    ("Category Sum of Odds", 2, 7): {
-        0: 1872,
-        1: 1225,
-        2: 187,
-        3: 2939,
-        4: 1039,
-        5: 19160,
-        6: 7664,
-        8: 15860,
-        10: 50054,
-    },
-    ("Category Sum of Odds", 2, 8): {0: 1230, 1: 781, 2: 147, 3: 2121, 4: 671, 5: 16853, 6: 6400, 8: 14179, 10: 57618},
-    ("Category Sum of Odds", 3, 1): {
-        0: 12467,
-        1: 12587,
-        2: 4149,
-        3: 12861,
-        4: 8109,
-        5: 13902,
-        6: 12607,
-        7: 2743,
-        8: 8321,
-        9: 3339,
-        10: 4223,
-        11: 2801,
-        13: 1412,
-        15: 479,
-    },
-    ("Category Sum of Odds", 3, 2): {
-        0: 3750,
-        1: 3633,
-        2: 1252,
-        3: 9469,
-        4: 6110,
-        5: 10240,
-        6: 13852,
-        7: 3557,
-        8: 15592,
-        9: 7284,
-        10: 7709,
-        11: 9070,
-        13: 6362,
-        15: 2120,
-    },
-    ("Category Sum of Odds", 3, 3): {
-        0: 2140,
-        1: 2180,
-        2: 702,
-        3: 5427,
-        4: 3603,
-        5: 9729,
-        6: 10744,
-        7: 2564,
-        8: 15277,
-        9: 6354,
-        10: 13273,
-        11: 10759,
-        13: 11044,
-        15: 6204,
-    },
-    ("Category Sum of Odds", 3, 4): {
-        0: 1265,
-        1: 1212,
-        2: 414,
-        3: 3247,
-        4: 2122,
-        5: 8380,
-        6: 7837,
-        7: 1738,
-        8: 13319,
-        9: 5211,
-        10: 17343,
-        11: 11288,
-        13: 14216,
-        15: 12408,
-    },
-    ("Category Sum of Odds", 3, 5): {
-        0: 712,
-        1: 660,
-        2: 246,
-        3: 1831,
-        4: 1236,
-        5: 6682,
-        6: 5931,
-        7: 1250,
-        8: 10857,
-        9: 4058,
-        10: 19378,
-        11: 10985,
-        13: 16370,
-        15: 19804,
-    },
-    ("Category Sum of Odds", 3, 6): {
-        0: 406,
-        1: 398,
-        2: 146,
-        3: 1070,
-        4: 746,
-        5: 5144,
-        6: 4205,
-        7: 864,
-        8: 8411,
-        9: 2961,
-        10: 20496,
-        11: 10472,
-        13: 17133,
-        15: 27548,
-    },
-    ("Category Sum of Odds", 3, 7): {
-        0: 233,
-        1: 235,
-        2: 75,
-        3: 539,
-        4: 399,
-        5: 3882,
-        6: 3021,
-        7: 607,
-        8: 6397,
-        9: 2262,
-        10: 20125,
-        11: 9495,
-        13: 16763,
-        15: 35967,
-    },
-    ("Category Sum of Odds", 3, 8): {
-        0: 146,
-        1: 130,
-        2: 55,
-        3: 352,
-        4: 214,
-        5: 2863,
-        6: 2174,
-        7: 406,
-        8: 4737,
-        9: 1594,
-        10: 19242,
-        11: 8430,
-        13: 16221,
-        15: 43436,
-    },
-    ("Category Sum of Odds", 4, 1): {
-        0: 6192,
-        1: 8440,
-        2: 4238,
-        3: 9225,
-        4: 8433,
-        5: 11215,
-        6: 12932,
-        7: 5618,
-        8: 9117,
-        9: 6474,
-        10: 5290,
-        11: 5334,
-        12: 1465,
-        13: 2744,
-        14: 1216,
-        15: 930,
-        16: 760,
-        18: 299,
-        20: 78,
-    },
-    ("Category Sum of Odds", 4, 2): {
-        0: 1267,
-        1: 1599,
-        2: 855,
-        3: 4253,
-        4: 4099,
-        5: 5463,
-        6: 9467,
-        7: 4928,
-        8: 11060,
-        9: 9721,
-        10: 7201,
-        11: 11978,
-        12: 3975,
-        13: 8342,
-        14: 5301,
-        15: 2925,
-        16: 4530,
-        18: 2447,
-        20: 589,
-    },
-    ("Category Sum of Odds", 4, 3): {
-        0: 579,
-        1: 817,
-        2: 382,
-        3: 2070,
-        4: 2033,
-        5: 4051,
-        6: 5991,
-        7: 2789,
-        8: 9018,
-        9: 7238,
-        10: 8843,
-        11: 11998,
-        12: 3466,
-        13: 12173,
-        14: 5857,
-        15: 7108,
-        16: 7373,
-        18: 5690,
-        20: 2524,
-    },
-    ("Category Sum of Odds", 4, 4): {
-        0: 295,
-        1: 371,
-        2: 187,
-        3: 1009,
-        4: 912,
-        5: 2645,
-        6: 3695,
-        7: 1637,
-        8: 6372,
-        9: 4810,
-        10: 8758,
-        11: 10474,
-        12: 2765,
-        13: 13555,
-        14: 5928,
-        15: 11453,
-        16: 9426,
-        18: 9512,
-        20: 6196,
-    },
-    ("Category Sum of Odds", 4, 5): {
-        0: 136,
-        1: 194,
-        2: 103,
-        3: 528,
-        4: 520,
-        5: 1893,
-        6: 2313,
-        7: 932,
-        8: 4270,
-        9: 3010,
-        10: 8159,
-        11: 8461,
-        12: 2054,
-        13: 12479,
-        14: 5099,
-        15: 15171,
-        16: 10401,
-        18: 12704,
-        20: 11573,
-    },
-    ("Category Sum of Odds", 4, 6): {
-        0: 75,
-        1: 84,
-        2: 43,
-        3: 225,
-        4: 198,
-        5: 1123,
-        6: 1369,
-        7: 583,
-        8: 2849,
-        9: 1928,
-        10: 7130,
-        11: 6594,
-        12: 1509,
-        13: 11039,
-        14: 4251,
-        15: 17784,
-        16: 10571,
-        18: 14865,
-        20: 17780,
-    },
-    ("Category Sum of Odds", 4, 7): {
-        0: 33,
-        1: 38,
-        2: 19,
-        3: 129,
-        4: 112,
-        5: 703,
-        6: 798,
-        7: 317,
-        8: 1697,
-        9: 1202,
-        10: 5644,
-        11: 5056,
-        12: 1124,
-        13: 9005,
-        14: 3338,
-        15: 19254,
-        16: 10290,
-        18: 15947,
-        20: 25294,
-    },
-    ("Category Sum of Odds", 4, 8): {
-        0: 15,
-        1: 22,
-        2: 17,
-        3: 50,
-        4: 64,
-        5: 448,
-        6: 480,
-        7: 203,
-        8: 1001,
-        9: 760,
-        10: 4365,
-        11: 3635,
-        12: 747,
-        13: 7294,
-        14: 2618,
-        15: 19503,
-        16: 9512,
-        18: 16250,
-        20: 33016,
-    },
-    ("Category Sum of Odds", 5, 1): {
-        0: 3061,
-        1: 5196,
-        2: 3389,
-        3: 6431,
-        4: 7062,
-        5: 8737,
-        6: 11185,
-        7: 7013,
-        8: 8879,
-        9: 8310,
-        10: 6485,
-        11: 7319,
-        12: 3785,
-        13: 4040,
-        14: 3092,
-        15: 1883,
-        16: 1886,
-        17: 609,
-        18: 788,
-        19: 406,
-        20: 172,
-        21: 205,
-        23: 48,
-        25: 19,
-    },
-    ("Category Sum of Odds", 5, 2): {
-        0: 421,
-        1: 723,
-        2: 455,
-        3: 1889,
-        4: 2325,
-        5: 2829,
-        6: 5351,
-        7: 4166,
-        8: 6951,
-        9: 8227,
-        10: 6439,
-        11: 10285,
-        12: 6880,
-        13: 8344,
-        14: 8806,
-        15: 4531,
-        16: 7538,
-        17: 3048,
-        18: 4003,
-        19: 2919,
-        20: 977,
-        21: 1941,
-        23: 787,
-        25: 165,
-    },
-    ("Category Sum of Odds", 5, 3): {
-        0: 173,
-        1: 292,
-        2: 179,
-        3: 715,
-        4: 938,
-        5: 1584,
-        6: 2861,
-        7: 1955,
-        8: 4456,
-        9: 5007,
-        10: 5293,
-        11: 8533,
-        12: 4910,
-        13: 9355,
-        14: 8325,
-        15: 6633,
-        16: 10471,
-        17: 3498,
-        18: 8174,
-        19: 4741,
-        20: 3505,
-        21: 4463,
-        23: 2922,
-        25: 1017,
-    },
-    ("Category Sum of Odds", 5, 4): {
-        0: 60,
-        1: 121,
-        2: 65,
-        3: 322,
-        4: 353,
-        5: 899,
-        6: 1464,
-        7: 929,
-        8: 2685,
-        9: 2814,
-        10: 4157,
-        11: 6088,
-        12: 3036,
-        13: 8276,
-        14: 6799,
-        15: 8218,
-        16: 10748,
-        17: 3222,
-        18: 10977,
-        19: 5463,
-        20: 7264,
-        21: 7049,
-        23: 5968,
-        25: 3023,
-    },
-    ("Category Sum of Odds", 5, 5): {
-        0: 32,
-        1: 40,
-        2: 23,
-        3: 124,
-        4: 169,
-        5: 490,
-        6: 749,
-        7: 416,
-        8: 1446,
-        9: 1508,
-        10: 2969,
-        11: 4198,
-        12: 1961,
-        13: 6376,
-        14: 5000,
-        15: 8283,
-        16: 9890,
-        17: 2686,
-        18: 12099,
-        19: 5449,
-        20: 11138,
-        21: 8982,
-        23: 9242,
-        25: 6730,
-    },
-    ("Category Sum of Odds", 5, 6): {
-        0: 14,
-        1: 25,
-        2: 10,
-        3: 52,
-        4: 51,
-        5: 265,
-        6: 351,
-        7: 214,
-        8: 764,
-        9: 796,
-        10: 2039,
-        11: 2724,
-        12: 1252,
-        13: 4540,
-        14: 3473,
-        15: 7862,
-        16: 8471,
-        17: 2176,
-        18: 11813,
-        19: 5053,
-        20: 14372,
-        21: 9884,
-        23: 11945,
-        25: 11854,
-    },
-    ("Category Sum of Odds", 5, 7): {
-        0: 4,
-        1: 5,
-        2: 3,
-        3: 14,
-        4: 29,
-        5: 121,
-        6: 212,
-        7: 117,
-        8: 419,
-        9: 393,
-        10: 1317,
-        11: 1707,
-        12: 758,
-        13: 3129,
-        14: 2413,
-        15: 6797,
-        16: 6743,
-        17: 1582,
-        18: 10646,
-        19: 4232,
-        20: 17146,
-        21: 10043,
-        23: 14100,
-        25: 18070,
-    },
-    ("Category Sum of Odds", 5, 8): {
-        0: 2,
-        2: 2,
-        3: 11,
-        4: 7,
-        5: 73,
-        6: 87,
-        7: 43,
-        8: 209,
-        9: 226,
-        10: 885,
-        11: 1045,
-        12: 432,
-        13: 2121,
-        14: 1481,
-        15: 5707,
-        16: 5196,
-        17: 1194,
-        18: 8924,
-        19: 3530,
-        20: 18491,
-        21: 9907,
-        23: 15254,
-        25: 25173,
-    },
-    ("Category Sum of Odds", 6, 1): {
-        0: 1673,
-        1: 3156,
-        2: 2581,
-        3: 4224,
-        4: 5575,
-        5: 6613,
-        6: 9118,
-        7: 7139,
-        8: 8145,
-        9: 8689,
-        10: 7075,
-        11: 8130,
-        12: 5541,
-        13: 5215,
-        14: 4722,
-        15: 3188,
-        16: 3201,
-        17: 1683,
-        18: 1450,
-        19: 1145,
-        20: 581,
-        21: 583,
-        22: 197,
-        23: 176,
-        24: 99,
-        25: 45,
-        26: 37,
-        28: 18,
-        30: 1,
-    },
-    ("Category Sum of Odds", 6, 2): {
-        0: 153,
-        1: 254,
-        2: 207,
-        3: 789,
-        4: 1143,
-        5: 1464,
-        6: 2896,
-        7: 2738,
-        8: 4025,
-        9: 5601,
-        10: 4912,
-        11: 7613,
-        12: 6840,
-        13: 7405,
-        14: 9068,
-        15: 6211,
-        16: 8370,
-        17: 6093,
-        18: 5227,
-        19: 5836,
-        20: 2831,
-        21: 3933,
-        22: 1829,
-        23: 1654,
-        24: 1487,
-        25: 309,
-        26: 784,
-        28: 284,
-        30: 44,
-    },
-    ("Category Sum of Odds", 6, 3): {
-        0: 52,
-        1: 88,
-        2: 81,
-        3: 276,
-        4: 431,
-        5: 678,
-        6: 1241,
-        7: 1136,
-        8: 2096,
-        9: 2863,
-        10: 3056,
-        11: 4913,
-        12: 4062,
-        13: 6032,
-        14: 7165,
-        15: 6056,
-        16: 8872,
-        17: 5775,
-        18: 7891,
-        19: 7784,
-        20: 4889,
-        21: 7711,
-        22: 2922,
-        23: 4730,
-        24: 3166,
-        25: 1697,
-        26: 2610,
-        28: 1319,
-        30: 408,
-    },
-    ("Category Sum of Odds", 6, 4): {
-        0: 14,
-        1: 25,
-        2: 15,
-        3: 73,
-        4: 139,
-        5: 291,
-        6: 531,
-        7: 425,
-        8: 1069,
-        9: 1345,
-        10: 1844,
-        11: 2995,
-        12: 2170,
-        13: 4254,
-        14: 4910,
-        15: 5033,
-        16: 7827,
-        17: 4469,
-        18: 8483,
-        19: 7579,
-        20: 6653,
-        21: 9709,
-        22: 3138,
-        23: 8187,
-        24: 4611,
-        25: 4315,
-        26: 4922,
-        28: 3412,
-        30: 1562,
-    },
-    ("Category Sum of Odds", 6, 5): {
-        0: 13,
-        1: 9,
-        2: 9,
-        3: 28,
-        4: 46,
-        5: 100,
-        6: 204,
-        7: 171,
-        8: 448,
-        9: 598,
-        10: 938,
-        11: 1732,
-        12: 1215,
-        13: 2669,
-        14: 2902,
-        15: 4038,
-        16: 5943,
-        17: 3138,
-        18: 7634,
-        19: 6276,
-        20: 7845,
-        21: 10212,
-        22: 2967,
-        23: 10694,
-        24: 5058,
-        25: 7754,
-        26: 7087,
-        28: 6388,
-        30: 3884,
-    },
-    ("Category Sum of Odds", 6, 6): {
-        0: 1,
-        1: 1,
-        2: 3,
-        3: 8,
-        4: 19,
-        5: 59,
-        6: 80,
-        7: 90,
-        8: 174,
-        9: 239,
-        10: 551,
-        11: 893,
-        12: 598,
-        13: 1594,
-        14: 1658,
-        15: 2949,
-        16: 4061,
-        17: 1975,
-        18: 6055,
-        19: 4880,
-        20: 7981,
-        21: 9505,
-        22: 2547,
-        23: 11565,
-        24: 5317,
-        25: 11411,
-        26: 8543,
-        28: 9447,
-        30: 7796,
-    },
-    ("Category Sum of Odds", 6, 7): {
-        0: 1,
-        1: 1,
-        2: 2,
-        3: 3,
-        4: 6,
-        5: 19,
-        6: 41,
-        7: 22,
-        8: 92,
-        9: 105,
-        10: 331,
-        11: 449,
-        12: 297,
-        13: 945,
-        14: 872,
-        15: 2047,
-        16: 2827,
-        17: 1300,
-        18: 4376,
-        19: 3515,
-        20: 7612,
-        21: 8189,
-        22: 2096,
-        23: 11329,
-        24: 4812,
-        25: 14467,
-        26: 9526,
-        28: 12043,
-        30: 12675,
-    },
-    ("Category Sum of Odds", 6, 8): {
-        0: 1,
-        2: 1,
-        3: 1,
-        4: 2,
-        5: 6,
-        6: 19,
-        7: 8,
-        8: 30,
-        9: 41,
-        10: 167,
-        11: 234,
-        12: 124,
-        13: 439,
-        14: 492,
-        15: 1389,
-        16: 1736,
-        17: 774,
-        18: 3153,
-        19: 2288,
-        20: 6522,
-        21: 6637,
-        22: 1566,
-        23: 10221,
-        24: 4175,
-        25: 16723,
-        26: 10048,
-        28: 13964,
-        30: 19239,
-    },
-    ("Category Sum of Odds", 7, 1): {
-        0: 802,
-        1: 1789,
-        2: 1824,
-        3: 2703,
-        4: 3909,
-        5: 4975,
-        6: 6784,
-        7: 6543,
-        8: 7190,
-        9: 8090,
-        10: 7566,
-        11: 8138,
-        12: 6713,
-        13: 6122,
-        14: 6179,
-        15: 4550,
-        16: 4253,
-        17: 3068,
-        18: 2417,
-        19: 2017,
-        20: 1268,
-        21: 1127,
-        22: 680,
-        23: 463,
-        24: 380,
-        25: 164,
-        26: 155,
-        27: 56,
-        28: 44,
-        29: 18,
-        30: 5,
-        31: 7,
-        33: 1,
-    },
-    ("Category Sum of Odds", 7, 2): {
-        0: 40,
-        1: 111,
-        2: 91,
-        3: 298,
-        4: 563,
-        5: 723,
-        6: 1341,
-        7: 1563,
-        8: 2287,
-        9: 3363,
-        10: 3348,
-        11: 5041,
-        12: 5532,
-        13: 5634,
-        14: 7465,
-        15: 6277,
-        16: 7542,
-        17: 7455,
-        18: 6139,
-        19: 7499,
-        20: 5062,
-        21: 5434,
-        22: 4462,
-        23: 2985,
-        24: 3432,
-        25: 1595,
-        26: 1867,
-        27: 990,
-        28: 649,
-        29: 691,
-        30: 113,
-        31: 298,
-        33: 99,
-        35: 11,
-    },
-    ("Category Sum of Odds", 7, 3): {
-        0: 17,
-        1: 33,
-        2: 19,
-        3: 103,
-        4: 154,
-        5: 250,
-        6: 488,
-        7: 523,
-        8: 962,
-        9: 1363,
-        10: 1718,
-        11: 2734,
-        12: 2708,
-        13: 3610,
-        14: 4810,
-        15: 4550,
-        16: 6596,
-        17: 5660,
-        18: 6591,
-        19: 7837,
-        20: 5725,
-        21: 7920,
-        22: 5553,
-        23: 5788,
-        24: 6130,
-        25: 3421,
-        26: 5052,
-        27: 2110,
-        28: 2665,
-        29: 2008,
-        30: 762,
-        31: 1350,
-        33: 629,
-        35: 161,
-    },
-    ("Category Sum of Odds", 7, 4): {
-        0: 2,
-        1: 8,
-        2: 6,
-        3: 25,
-        4: 41,
-        5: 81,
-        6: 165,
-        7: 180,
-        8: 409,
-        9: 587,
-        10: 716,
-        11: 1257,
-        12: 1233,
-        13: 2066,
-        14: 2709,
-        15: 2790,
-        16: 4487,
-        17: 3663,
-        18: 5325,
-        19: 6437,
-        20: 5489,
-        21: 8147,
-        22: 5187,
-        23: 7672,
-        24: 7375,
-        25: 5310,
-        26: 8008,
-        27: 2827,
-        28: 5802,
-        29: 3397,
-        30: 2521,
-        31: 3220,
-        33: 2088,
-        35: 770,
-    },
-    ("Category Sum of Odds", 7, 5): {
-        0: 1,
-        1: 2,
-        2: 2,
-        3: 5,
-        4: 8,
-        5: 37,
-        6: 54,
-        7: 68,
-        8: 145,
-        9: 201,
-        10: 346,
-        11: 599,
-        12: 495,
-        13: 980,
-        14: 1322,
-        15: 1670,
-        16: 2849,
-        17: 2168,
-        18: 3857,
-        19: 4345,
-        20: 4800,
-        21: 7246,
-        22: 3977,
-        23: 7919,
-        24: 7133,
-        25: 7033,
-        26: 9503,
-        27: 3002,
-        28: 8687,
-        29: 4449,
-        30: 5183,
-        31: 5303,
-        33: 4414,
-        35: 2197,
-    },
-    ("Category Sum of Odds", 7, 6): {
-        2: 1,
-        3: 1,
-        4: 3,
-        5: 12,
-        6: 19,
-        7: 17,
-        8: 40,
-        9: 79,
-        10: 148,
-        11: 287,
-        12: 238,
-        13: 480,
-        14: 665,
-        15: 993,
-        16: 1639,
-        17: 1177,
-        18: 2465,
-        19: 2712,
-        20: 3690,
-        21: 5469,
-        22: 2955,
-        23: 7084,
-        24: 5818,
-        25: 7570,
-        26: 9650,
-        27: 2863,
-        28: 10769,
-        29: 5124,
-        30: 8537,
-        31: 7294,
-        33: 7232,
-        35: 4969,
-    },
-    ("Category Sum of Odds", 7, 7): {
-        4: 3,
-        5: 4,
-        6: 9,
-        7: 7,
-        8: 14,
-        9: 24,
-        10: 62,
-        11: 123,
-        12: 88,
-        13: 225,
-        14: 292,
-        15: 520,
-        16: 885,
-        17: 619,
-        18: 1499,
-        19: 1630,
-        20: 2708,
-        21: 3931,
-        22: 1979,
-        23: 5761,
-        24: 4413,
-        25: 7651,
-        26: 9063,
-        27: 2410,
-        28: 11070,
-        29: 4944,
-        30: 11962,
-        31: 8823,
-        33: 10174,
-        35: 9107,
-    },
-    ("Category Sum of Odds", 7, 8): {
-        15: 1,
-        16: 11,
-        17: 7,
-        18: 51,
-        19: 81,
-        20: 243,
-        21: 516,
-        22: 320,
-        23: 1364,
-        24: 1387,
-        25: 3610,
-        26: 5323,
-        27: 1605,
-        28: 9748,
-        29: 4917,
-        30: 16538,
-        31: 13256,
-        33: 18751,
-        35: 22271,
-    },
-    ("Category Sum of Odds", 8, 1): {
-        0: 378,
-        1: 1044,
-        2: 1248,
-        3: 1858,
-        4: 2641,
-        5: 3542,
-        6: 5091,
-        7: 5127,
-        8: 6002,
-        9: 7107,
-        10: 6937,
-        11: 7580,
-        12: 7278,
-        13: 6521,
-        14: 6878,
-        15: 5596,
-        16: 5205,
-        17: 4595,
-        18: 3437,
-        19: 3115,
-        20: 2333,
-        21: 1887,
-        22: 1354,
-        23: 962,
-        24: 829,
-        25: 463,
-        26: 395,
-        27: 236,
-        28: 128,
-        29: 103,
-        30: 49,
-        31: 46,
-        32: 18,
-        33: 9,
-        34: 3,
-        35: 1,
-        36: 3,
-        38: 1,
-    },
-    ("Category Sum of Odds", 8, 2): {
-        0: 23,
-        1: 49,
-        2: 45,
-        3: 128,
-        4: 215,
-        5: 337,
-        6: 675,
-        7: 900,
-        8: 1212,
-        9: 1946,
-        10: 2215,
-        11: 2990,
-        12: 3804,
-        13: 4133,
-        14: 5466,
-        15: 5383,
-        16: 6218,
-        17: 6885,
-        18: 6191,
-        19: 7293,
-        20: 6332,
-        21: 6155,
-        22: 6139,
-        23: 4676,
-        24: 5102,
-        25: 3414,
-        26: 3036,
-        27: 2787,
-        28: 1650,
-        29: 1691,
-        30: 864,
-        31: 801,
-        32: 520,
-        33: 257,
-        34: 301,
-        35: 32,
-        36: 100,
-        38: 29,
-        40: 6,
-    },
-    ("Category Sum of Odds", 8, 3): {
-        0: 3,
-        1: 11,
-        2: 11,
-        3: 37,
-        4: 59,
-        5: 96,
-        6: 195,
-        7: 258,
-        8: 427,
-        9: 652,
-        10: 812,
-        11: 1306,
-        12: 1570,
-        13: 2026,
-        14: 2793,
-        15: 2967,
-        16: 4132,
-        17: 4333,
-        18: 4806,
-        19: 6137,
-        20: 5410,
-        21: 6969,
-        22: 6440,
-        23: 6079,
-        24: 7157,
-        25: 5103,
-        26: 6224,
-        27: 4784,
-        28: 4085,
-        29: 4385,
-        30: 2256,
-        31: 3023,
-        32: 1454,
-        33: 1451,
-        34: 1120,
-        35: 375,
-        36: 707,
-        38: 289,
-        40: 58,
-    },
-    ("Category Sum of Odds", 8, 4): {
-        1: 3,
-        2: 1,
-        3: 11,
-        4: 9,
-        5: 20,
-        6: 61,
-        7: 80,
-        8: 128,
-        9: 192,
-        10: 298,
-        11: 509,
-        12: 601,
-        13: 828,
-        14: 1230,
-        15: 1461,
-        16: 2324,
-        17: 2281,
-        18: 3110,
-        19: 4245,
-        20: 3884,
-        21: 5745,
-        22: 4858,
-        23: 5931,
-        24: 6969,
-        25: 5462,
-        26: 7943,
-        27: 5213,
-        28: 6390,
-        29: 6408,
-        30: 3992,
-        31: 6210,
-        32: 2327,
-        33: 3862,
-        34: 2510,
-        35: 1308,
-        36: 2079,
-        38: 1180,
-        40: 337,
-    },
-    ("Category Sum of Odds", 8, 5): {
-        1: 3,
-        3: 4,
-        4: 6,
-        5: 15,
-        6: 17,
-        7: 20,
-        8: 48,
-        9: 62,
-        10: 110,
-        11: 205,
-        12: 208,
-        13: 371,
-        14: 495,
-        15: 753,
-        16: 1156,
-        17: 1077,
-        18: 1663,
-        19: 2326,
-        20: 2586,
-        21: 3892,
-        22: 3204,
-        23: 4850,
-        24: 5327,
-        25: 5122,
-        26: 7734,
-        27: 4802,
-        28: 7567,
-        29: 6868,
-        30: 5913,
-        31: 8385,
-        32: 2956,
-        33: 6688,
-        34: 3853,
-        35: 3514,
-        36: 3948,
-        38: 2940,
-        40: 1312,
-    },
-    ("Category Sum of Odds", 8, 6): {
-        4: 1,
-        5: 2,
-        6: 8,
-        7: 3,
-        8: 20,
-        9: 22,
-        10: 30,
-        11: 57,
-        12: 62,
-        13: 153,
-        14: 226,
-        15: 328,
-        16: 546,
-        17: 543,
-        18: 966,
-        19: 1215,
-        20: 1581,
-        21: 2361,
-        22: 1931,
-        23: 3410,
-        24: 3816,
-        25: 4312,
-        26: 6417,
-        27: 3588,
-        28: 7465,
-        29: 6546,
-        30: 7060,
-        31: 9459,
-        32: 2924,
-        33: 9446,
-        34: 4622,
-        35: 6507,
-        36: 5901,
-        38: 5286,
-        40: 3186,
-    },
-    ("Category Sum of Odds", 8, 7): {
-        6: 2,
-        7: 1,
-        8: 2,
-        9: 9,
-        10: 14,
-        11: 27,
-        12: 16,
-        13: 69,
-        14: 86,
-        15: 157,
-        16: 238,
-        17: 211,
-        18: 452,
-        19: 568,
-        20: 945,
-        21: 1439,
-        22: 1065,
-        23: 2239,
-        24: 2332,
-        25: 3456,
-        26: 4869,
-        27: 2522,
-        28: 6608,
-        29: 5348,
-        30: 7550,
-        31: 9499,
-        32: 2682,
-        33: 10568,
-        34: 5082,
-        35: 9851,
-        36: 7726,
-        38: 8073,
-        40: 6294,
-    },
-    ("Category Sum of Odds", 8, 8): {
-        19: 3,
-        20: 14,
-        21: 43,
-        22: 44,
-        23: 151,
-        24: 230,
-        25: 507,
-        26: 1001,
-        27: 629,
-        28: 2256,
-        29: 2259,
-        30: 4666,
-        31: 7018,
-        32: 2181,
-        33: 11325,
-        34: 5894,
-        35: 15577,
-        36: 12950,
-        38: 16243,
-        40: 17009,
-    },
-    ("Category Sum of Evens", 1, 1): {0: 49585, 2: 16733, 4: 16854, 6: 16828},
-    ("Category Sum of Evens", 1, 2): {0: 33244, 2: 11087, 4: 28025, 6: 27644},
-    ("Category Sum of Evens", 1, 3): {0: 22259, 2: 7317, 4: 35040, 6: 35384},
-    ("Category Sum of Evens", 1, 4): {0: 18511, 2: 6233, 4: 29418, 6: 45838},
-    ("Category Sum of Evens", 1, 5): {0: 15428, 2: 5146, 4: 24510, 6: 54916},
-    ("Category Sum of Evens", 1, 6): {0: 12927, 2: 4255, 4: 20115, 6: 62703},
-    ("Category Sum of Evens", 1, 7): {0: 10650, 2: 3502, 4: 17087, 6: 68761},
-    ("Category Sum of Evens", 1, 8): {0: 8911, 2: 3009, 4: 14227, 6: 73853},
-    ("Category Sum of Evens", 2, 1): {0: 25229, 2: 16545, 4: 19538, 6: 21987, 8: 8263, 10: 5607, 12: 2831},
-    ("Category Sum of Evens", 2, 2): {0: 11179, 2: 7503, 4: 19661, 6: 24451, 8: 13966, 10: 15400, 12: 7840},
-    ("Category Sum of Evens", 2, 3): {0: 4850, 2: 3249, 4: 16354, 6: 20647, 8: 17887, 10: 24736, 12: 12277},
-    ("Category Sum of Evens", 2, 4): {0: 3419, 2: 2268, 4: 11219, 6: 20711, 8: 14290, 10: 26976, 12: 21117},
-    ("Category Sum of Evens", 2, 5): {0: 2376, 2: 1615, 4: 7910, 6: 19247, 8: 11641, 10: 26842, 12: 30369},
-    ("Category Sum of Evens", 2, 6): {0: 1649, 2: 1092, 4: 5313, 6: 17810, 8: 9468, 10: 25582, 12: 39086},
-    ("Category Sum of Evens", 2, 7): {0: 1122, 2: 783, 4: 3790, 6: 15965, 8: 7645, 10: 23307, 12: 47388},
-    ("Category Sum of Evens", 2, 8): {0: 794, 2: 538, 4: 2618, 6: 14006, 8: 6462, 10: 20879, 12: 54703},
-    ("Category Sum of Evens", 3, 1): {
-        0: 12538,
-        2: 12516,
-        4: 16530,
-        6: 21270,
-        8: 13745,
-        10: 11209,
-        12: 7524,
-        14: 2828,
-        16: 1389,
-        18: 451,
-    },
-    ("Category Sum of Evens", 3, 2): {
-        0: 3666,
-        2: 3738,
-        4: 10459,
-        6: 15644,
-        8: 15032,
-        10: 18955,
-        12: 15021,
-        14: 8937,
-        16: 6476,
-        18: 2072,
-    },
-    ("Category Sum of Evens", 3, 3): {
-        0: 1083,
-        2: 1093,
-        4: 5572,
-        6: 8576,
-        8: 12295,
-        10: 20247,
-        12: 18001,
-        14: 15953,
-        16: 12864,
-        18: 4316,
-    },
-    ("Category Sum of Evens", 3, 4): {
-        0: 642,
-        2: 676,
-        4: 3238,
-        6: 6844,
-        8: 8218,
-        10: 17232,
-        12: 18975,
-        14: 15832,
-        16: 18749,
-        18: 9594,
-    },
-    ("Category Sum of Evens", 3, 5): {
-        0: 373,
-        2: 377,
-        4: 1825,
-        6: 5105,
-        8: 5720,
-        10: 13927,
-        12: 19533,
-        14: 14402,
-        16: 21954,
-        18: 16784,
-    },
-    ("Category Sum of Evens", 3, 6): {
-        0: 195,
-        2: 216,
-        4: 1064,
-        6: 3732,
-        8: 3796,
-        10: 10614,
-        12: 19070,
-        14: 12940,
-        16: 23882,
-        18: 24491,
-    },
-    ("Category Sum of Evens", 3, 7): {
-        0: 126,
-        2: 123,
-        4: 613,
-        6: 2787,
-        8: 2534,
-        10: 8145,
-        12: 18146,
-        14: 10985,
-        16: 24254,
-        18: 32287,
-    },
-    ("Category Sum of Evens", 3, 8): {
-        0: 68,
-        2: 70,
-        4: 356,
-        6: 2012,
-        8: 1718,
-        10: 5777,
-        12: 16926,
-        14: 9402,
-        16: 23114,
-        18: 40557,
-    },
-    ("Category Sum of Evens", 4, 1): {
-        0: 6214,
-        2: 8516,
-        4: 12405,
-        6: 17434,
-        8: 15427,
-        10: 14158,
-        12: 11354,
-        14: 6828,
-        16: 4295,
-        18: 2141,
-        20: 798,
-        22: 338,
-        24: 92,
-    },
-    ("Category Sum of Evens", 4, 2): {
-        0: 1236,
-        2: 1632,
-        4: 4894,
-        6: 8468,
-        8: 10702,
-        10: 15154,
-        12: 15715,
-        14: 14104,
-        16: 12485,
-        18: 8084,
-        20: 4536,
-        22: 2382,
-        24: 608,
-    },
-    ("Category Sum of Evens", 4, 3): {
-        0: 261,
-        2: 312,
-        4: 1646,
-        6: 3135,
-        8: 5715,
-        10: 10269,
-        12: 12879,
-        14: 16224,
-        16: 17484,
-        18: 13847,
-        20: 10518,
-        22: 6099,
-        24: 1611,
-    },
-    ("Category Sum of Evens", 4, 4): {
-        0: 118,
-        2: 159,
-        4: 842,
-        6: 1945,
-        8: 3179,
-        10: 7096,
-        12: 10298,
-        14: 12763,
-        16: 17947,
-        18: 16566,
-        20: 13338,
-        22: 11215,
-        24: 4534,
-    },
-    ("Category Sum of Evens", 4, 5): {
-        0: 56,
-        2: 80,
-        4: 395,
-        6: 1181,
-        8: 1765,
-        10: 4716,
-        12: 8022,
-        14: 9638,
-        16: 16546,
-        18: 18045,
-        20: 14172,
-        22: 16111,
-        24: 9273,
-    },
-    ("Category Sum of Evens", 4, 6): {
-        0: 31,
-        2: 34,
-        4: 192,
-        6: 734,
-        8: 1036,
-        10: 3003,
-        12: 6097,
-        14: 7068,
-        16: 14021,
-        18: 18805,
-        20: 13848,
-        22: 20013,
-        24: 15118,
-    },
-    ("Category Sum of Evens", 4, 7): {
-        0: 16,
-        2: 26,
-        4: 80,
-        6: 400,
-        8: 583,
-        10: 1826,
-        12: 4654,
-        14: 4930,
-        16: 11590,
-        18: 18952,
-        20: 12601,
-        22: 21947,
-        24: 22395,
-    },
-    ("Category Sum of Evens", 4, 8): {
-        0: 7,
-        2: 15,
-        4: 63,
-        6: 243,
-        8: 314,
-        10: 1156,
-        12: 3395,
-        14: 3386,
-        16: 8943,
-        18: 18203,
-        20: 11505,
-        22: 23056,
-        24: 29714,
-    },
-    ("Category Sum of Evens", 5, 1): {
-        0: 3192,
-        2: 5181,
-        4: 8648,
-        6: 13373,
-        8: 13964,
-        10: 14656,
-        12: 13468,
-        14: 10245,
-        16: 7574,
-        18: 4873,
-        20: 2581,
-        22: 1363,
-        24: 605,
-        26: 198,
-        28: 69,
-        30: 10,
-    },
-    ("Category Sum of Evens", 5, 2): {
-        0: 405,
-        2: 663,
-        4: 2149,
-        6: 4054,
-        8: 6336,
-        10: 9910,
-        12: 12184,
-        14: 13824,
-        16: 14674,
-        18: 12124,
-        20: 9742,
-        22: 6877,
-        24: 4025,
-        26: 2056,
-        28: 808,
-        30: 169,
-    },
-    ("Category Sum of Evens", 5, 3): {
-        0: 61,
-        2: 88,
-        4: 501,
-        6: 1037,
-        8: 2217,
-        10: 4446,
-        12: 6558,
-        14: 10339,
-        16: 13128,
-        18: 14686,
-        20: 15282,
-        22: 13294,
-        24: 9361,
-        26: 5826,
-        28: 2644,
-        30: 532,
-    },
-    ("Category Sum of Evens", 5, 4): {
-        0: 18,
-        2: 25,
-        4: 222,
-        6: 471,
-        8: 992,
-        10: 2340,
-        12: 4093,
-        14: 6555,
-        16: 10437,
-        18: 12724,
-        20: 14710,
-        22: 16005,
-        24: 12896,
-        26: 9761,
-        28: 6646,
-        30: 2105,
-    },
-    ("Category Sum of Evens", 5, 5): {
-        0: 7,
-        2: 12,
-        4: 72,
-        6: 259,
-        8: 464,
-        10: 1369,
-        12: 2559,
-        14: 4006,
-        16: 7635,
-        18: 10297,
-        20: 12344,
-        22: 16826,
-        24: 15490,
-        26: 12235,
-        28: 11323,
-        30: 5102,
-    },
-    ("Category Sum of Evens", 5, 6): {
-        0: 4,
-        2: 5,
-        4: 29,
-        6: 124,
-        8: 212,
-        10: 671,
-        12: 1618,
-        14: 2381,
-        16: 5274,
-        18: 8224,
-        20: 9688,
-        22: 16041,
-        24: 17286,
-        26: 13565,
-        28: 15274,
-        30: 9604,
-    },
-    ("Category Sum of Evens", 5, 7): {
-        0: 3,
-        2: 1,
-        4: 12,
-        6: 52,
-        8: 102,
-        10: 330,
-        12: 973,
-        14: 1478,
-        16: 3465,
-        18: 6367,
-        20: 7478,
-        22: 13863,
-        24: 18114,
-        26: 13349,
-        28: 19048,
-        30: 15365,
-    },
-    ("Category Sum of Evens", 5, 8): {
-        0: 1,
-        4: 9,
-        6: 22,
-        8: 45,
-        10: 172,
-        12: 537,
-        14: 771,
-        16: 2197,
-        18: 4912,
-        20: 5406,
-        22: 11699,
-        24: 18376,
-        26: 12500,
-        28: 21211,
-        30: 22142,
-    },
-    ("Category Sum of Evens", 6, 1): {
-        0: 1657,
-        2: 3110,
-        4: 5715,
-        6: 9535,
-        8: 11527,
-        10: 13220,
-        12: 13855,
-        14: 12217,
-        16: 10036,
-        18: 7641,
-        20: 5155,
-        22: 3134,
-        24: 1769,
-        26: 882,
-        28: 364,
-        30: 125,
-        32: 46,
-        34: 9,
-        36: 3,
-    },
-    ("Category Sum of Evens", 6, 2): {
-        0: 149,
-        2: 295,
-        4: 936,
-        6: 1999,
-        8: 3286,
-        10: 5781,
-        12: 8107,
-        14: 10495,
-        16: 12112,
-        18: 12962,
-        20: 12458,
-        22: 10842,
-        24: 8362,
-        26: 5714,
-        28: 3560,
-        30: 1777,
-        32: 841,
-        34: 279,
-        36: 45,
-    },
-    ("Category Sum of Evens", 6, 3): {
-        0: 8,
-        2: 12,
-        4: 127,
-        6: 309,
-        8: 774,
-        10: 1732,
-        12: 3009,
-        14: 5066,
-        16: 7714,
-        18: 10098,
-        20: 12628,
-        22: 13809,
-        24: 13594,
-        26: 11930,
-        28: 8967,
-        30: 5778,
-        32: 3126,
-        34: 1114,
-        36: 205,
-    },
-    ("Category Sum of Evens", 6, 4): {
-        0: 3,
-        2: 13,
-        4: 36,
-        6: 122,
-        8: 287,
-        10: 774,
-        12: 1479,
-        14: 2613,
-        16: 4678,
-        18: 6764,
-        20: 9551,
-        22: 12530,
-        24: 13471,
-        26: 13991,
-        28: 12906,
-        30: 9662,
-        32: 6534,
-        34: 3599,
-        36: 987,
-    },
-    ("Category Sum of Evens", 6, 5): {
-        0: 2,
-        2: 3,
-        4: 15,
-        6: 51,
-        8: 108,
-        10: 322,
-        12: 740,
-        14: 1416,
-        16: 2702,
-        18: 4392,
-        20: 6604,
-        22: 9916,
-        24: 11810,
-        26: 13874,
-        28: 15232,
-        30: 12927,
-        32: 9788,
-        34: 7399,
-        36: 2699,
-    },
-    ("Category Sum of Evens", 6, 6): {
-        0: 1,
-        2: 1,
-        4: 2,
-        6: 26,
-        8: 52,
-        10: 156,
-        12: 322,
-        14: 664,
-        16: 1568,
-        18: 2686,
-        20: 4214,
-        22: 7418,
-        24: 9870,
-        26: 11838,
-        28: 15982,
-        30: 15534,
-        32: 12014,
-        34: 11679,
-        36: 5973,
-    },
-    ("Category Sum of Evens", 6, 7): {
-        4: 1,
-        6: 9,
-        8: 11,
-        10: 53,
-        12: 179,
-        14: 336,
-        16: 848,
-        18: 1673,
-        20: 2576,
-        22: 5154,
-        24: 8221,
-        26: 9426,
-        28: 15301,
-        30: 17083,
-        32: 13001,
-        34: 15604,
-        36: 10524,
-    },
-    ("Category Sum of Evens", 6, 8): {
-        4: 1,
-        6: 2,
-        8: 4,
-        10: 22,
-        12: 87,
-        14: 154,
-        16: 453,
-        18: 984,
-        20: 1500,
-        22: 3449,
-        24: 6361,
-        26: 7209,
-        28: 13662,
-        30: 18101,
-        32: 12842,
-        34: 18840,
-        36: 16329,
-    },
-    ("Category Sum of Evens", 7, 1): {
-        0: 780,
-        2: 1804,
-        4: 3653,
-        6: 6451,
-        8: 8939,
-        10: 11183,
-        12: 12690,
-        14: 12463,
-        16: 11578,
-        18: 9725,
-        20: 7614,
-        22: 5306,
-        24: 3564,
-        26: 2087,
-        28: 1178,
-        30: 591,
-        32: 276,
-        34: 79,
-        36: 28,
-        38: 9,
-        40: 1,
-        42: 1,
-    },
-    ("Category Sum of Evens", 7, 2): {
-        0: 44,
-        2: 118,
-        4: 405,
-        6: 866,
-        8: 1631,
-        10: 3020,
-        12: 4933,
-        14: 7121,
-        16: 9103,
-        18: 10694,
-        20: 11747,
-        22: 12101,
-        24: 10947,
-        26: 9407,
-        28: 7140,
-        30: 4969,
-        32: 2990,
-        34: 1637,
-        36: 742,
-        38: 279,
-        40: 95,
-        42: 11,
-    },
-    ("Category Sum of Evens", 7, 3): {
-        0: 4,
-        2: 3,
-        4: 32,
-        6: 78,
-        8: 255,
-        10: 585,
-        12: 1178,
-        14: 2216,
-        16: 3620,
-        18: 5753,
-        20: 8013,
-        22: 10305,
-        24: 12043,
-        26: 13153,
-        28: 12644,
-        30: 10884,
-        32: 8457,
-        34: 5494,
-        36: 3227,
-        38: 1526,
-        40: 457,
-        42: 73,
-    },
-    ("Category Sum of Evens", 7, 4): {
-        0: 1,
-        2: 3,
-        4: 7,
-        6: 33,
-        8: 84,
-        10: 212,
-        12: 482,
-        14: 940,
-        16: 1818,
-        18: 3010,
-        20: 4695,
-        22: 6948,
-        24: 9234,
-        26: 11605,
-        28: 12907,
-        30: 13018,
-        32: 11907,
-        34: 10022,
-        36: 6630,
-        38: 4042,
-        40: 1978,
-        42: 424,
-    },
-    ("Category Sum of Evens", 7, 5): {
-        4: 4,
-        6: 14,
-        8: 31,
-        10: 80,
-        12: 186,
-        14: 395,
-        16: 920,
-        18: 1526,
-        20: 2543,
-        22: 4347,
-        24: 6303,
-        26: 8816,
-        28: 11561,
-        30: 12713,
-        32: 13273,
-        34: 13412,
-        36: 10366,
-        38: 7212,
-        40: 4734,
-        42: 1564,
-    },
-    ("Category Sum of Evens", 7, 6): {
-        4: 1,
-        6: 5,
-        8: 4,
-        10: 32,
-        12: 68,
-        14: 148,
-        16: 359,
-        18: 819,
-        20: 1359,
-        22: 2683,
-        24: 4176,
-        26: 6057,
-        28: 9389,
-        30: 11291,
-        32: 12798,
-        34: 15385,
-        36: 13346,
-        38: 10011,
-        40: 8464,
-        42: 3605,
-    },
-    ("Category Sum of Evens", 7, 7): {
-        6: 1,
-        8: 2,
-        10: 3,
-        12: 23,
-        14: 69,
-        16: 135,
-        18: 390,
-        20: 681,
-        22: 1511,
-        24: 2671,
-        26: 3913,
-        28: 7007,
-        30: 9525,
-        32: 11106,
-        34: 15613,
-        36: 15702,
-        38: 12021,
-        40: 12478,
-        42: 7149,
-    },
-    ("Category Sum of Evens", 7, 8): {
-        10: 4,
-        12: 18,
-        14: 24,
-        16: 77,
-        18: 204,
-        20: 339,
-        22: 824,
-        24: 1645,
-        26: 2459,
-        28: 5058,
-        30: 7669,
-        32: 9076,
-        34: 14812,
-        36: 16970,
-        38: 12599,
-        40: 16137,
-        42: 12085,
-    },
-    ("Category Sum of Evens", 8, 1): {
-        0: 373,
-        2: 1020,
-        4: 2316,
-        6: 4344,
-        8: 6532,
-        10: 8598,
-        12: 10648,
-        14: 11696,
-        16: 11862,
-        18: 11145,
-        20: 9463,
-        22: 7414,
-        24: 5501,
-        26: 3771,
-        28: 2435,
-        30: 1376,
-        32: 813,
-        34: 408,
-        36: 180,
-        38: 73,
-        40: 24,
-        42: 4,
-        44: 3,
-        46: 1,
-    },
-    ("Category Sum of Evens", 8, 2): {
-        0: 17,
-        2: 45,
-        4: 141,
-        6: 386,
-        8: 772,
-        10: 1536,
-        12: 2761,
-        14: 4098,
-        16: 6135,
-        18: 7865,
-        20: 9772,
-        22: 10922,
-        24: 11148,
-        26: 10879,
-        28: 9711,
-        30: 8043,
-        32: 6058,
-        34: 4215,
-        36: 2718,
-        38: 1519,
-        40: 769,
-        42: 342,
-        44: 107,
-        46: 37,
-        48: 4,
-    },
-    ("Category Sum of Evens", 8, 3): {
-        2: 1,
-        4: 5,
-        6: 39,
-        8: 65,
-        10: 187,
-        12: 430,
-        14: 874,
-        16: 1616,
-        18: 2630,
-        20: 4428,
-        22: 6221,
-        24: 8306,
-        26: 10158,
-        28: 11561,
-        30: 12249,
-        32: 11747,
-        34: 10070,
-        36: 7860,
-        38: 5627,
-        40: 3315,
-        42: 1741,
-        44: 669,
-        46: 173,
-        48: 28,
-    },
-    ("Category Sum of Evens", 8, 4): {
-        14: 4,
-        16: 24,
-        18: 92,
-        20: 301,
-        22: 806,
-        24: 1833,
-        26: 3656,
-        28: 6433,
-        30: 9822,
-        32: 13298,
-        34: 15041,
-        36: 15001,
-        38: 13264,
-        40: 9617,
-        42: 6109,
-        44: 3046,
-        46: 1187,
-        48: 466,
-    },
-    ("Category Sum of Evens", 8, 5): {
-        20: 3,
-        22: 29,
-        24: 139,
-        26: 502,
-        28: 1480,
-        30: 3500,
-        32: 7090,
-        34: 11545,
-        36: 15367,
-        38: 17689,
-        40: 16701,
-        42: 12625,
-        44: 7863,
-        46: 4031,
-        48: 1436,
-    },
-    ("Category Sum of Evens", 8, 6): {
-        24: 3,
-        26: 26,
-        28: 158,
-        30: 638,
-        32: 2051,
-        34: 5138,
-        36: 9864,
-        38: 15359,
-        40: 19994,
-        42: 18920,
-        44: 14442,
-        46: 9508,
-        48: 3899,
-    },
-    ("Category Sum of Evens", 8, 7): {
-        28: 5,
-        30: 57,
-        32: 327,
-        34: 1407,
-        36: 4137,
-        38: 9136,
-        40: 17064,
-        42: 21458,
-        44: 19884,
-        46: 17678,
-        48: 8847,
-    },
-    ("Category Sum of Evens", 8, 8): {
-        30: 1,
-        32: 27,
-        34: 228,
-        36: 1145,
-        38: 3734,
-        40: 10658,
-        42: 19250,
-        44: 21680,
-        46: 26111,
-        48: 17166,
-    },
-    ("Category Double Threes and Fours", 1, 1): {0: 66749, 6: 16591, 8: 16660},
-    ("Category Double Threes and Fours", 1, 2): {0: 44675, 6: 27694, 8: 27631},
-    ("Category Double Threes and Fours", 1, 3): {0: 29592, 6: 35261, 8: 35147},
-    ("Category Double Threes and Fours", 1, 4): {0: 24601, 6: 29406, 8: 45993},
-    ("Category Double Threes and Fours", 1, 5): {0: 20499, 6: 24420, 8: 55081},
-    ("Category Double Threes and Fours", 1, 6): {0: 17116, 6: 20227, 8: 62657},
-    ("Category Double Threes and Fours", 1, 7): {0: 14193, 6: 17060, 8: 68747},
-    ("Category Double Threes and Fours", 1, 8): {0: 11977, 6: 13924, 8: 74099},
-    ("Category Double Threes and Fours", 2, 1): {0: 44382, 6: 22191, 8: 22251, 12: 2892, 14: 5568, 16: 2716},
-    ("Category Double Threes and Fours", 2, 2): {0: 19720, 6: 24652, 8: 24891, 12: 7693, 14: 15403, 16: 7641},
-    ("Category Double Threes and Fours", 2, 3): {0: 8765, 6: 21008, 8: 20929, 12: 12201, 14: 24721, 16: 12376},
-    ("Category Double Threes and Fours", 2, 4): {0: 6164, 6: 14466, 8: 22828, 12: 8471, 14: 26935, 16: 21136},
-    ("Category Double Threes and Fours", 2, 5): {0: 4307, 6: 10005, 8: 22620, 12: 6057, 14: 26822, 16: 30189},
-    ("Category Double Threes and Fours", 2, 6): {0: 2879, 6: 7047, 8: 21466, 12: 4204, 14: 25326, 16: 39078},
-    ("Category Double Threes and Fours", 2, 7): {0: 2042, 6: 4637, 8: 19698, 12: 2846, 14: 23404, 16: 47373},
-    ("Category Double Threes and Fours", 2, 8): {0: 1385, 6: 3373, 8: 17795, 12: 1998, 14: 20907, 16: 54542},
-    ("Category Double Threes and Fours", 3, 1): {
-        0: 29378,
-        6: 22335,
-        8: 22138,
-        12: 5551,
-        14: 11232,
-        16: 5702,
-        18: 411,
-        20: 1344,
-        22: 1429,
-        24: 480,
-    },
-    ("Category Double Threes and Fours", 3, 2): {
-        0: 8894,
-        6: 16518,
-        8: 16277,
-        12: 10334,
-        14: 20757,
-        16: 10163,
-        18: 2102,
-        20: 6399,
-        22: 6394,
-        24: 2162,
-    },
-    ("Category Double Threes and Fours", 3, 3): {
-        0: 2643,
-        6: 9270,
-        8: 9252,
-        12: 11066,
-        14: 21922,
-        16: 11045,
-        18: 4335,
-        20: 12900,
-        22: 13101,
-        24: 4466,
-    },
-    ("Category Double Threes and Fours", 3, 4): {
-        0: 1523,
-        6: 5443,
-        8: 8330,
-        12: 6223,
-        14: 20310,
-        16: 15697,
-        18: 2579,
-        20: 11695,
-        22: 18521,
-        24: 9679,
-    },
-    ("Category Double Threes and Fours", 3, 5): {
-        0: 845,
-        6: 3180,
-        8: 7038,
-        12: 3700,
-        14: 16545,
-        16: 18825,
-        18: 1468,
-        20: 9740,
-        22: 22168,
-        24: 16491,
-    },
-    ("Category Double Threes and Fours", 3, 6): {
-        0: 499,
-        6: 1774,
-        8: 5456,
-        12: 2033,
-        14: 12995,
-        16: 20078,
-        18: 836,
-        20: 7959,
-        22: 23876,
-        24: 24494,
-    },
-    ("Category Double Threes and Fours", 3, 7): {
-        0: 293,
-        6: 1005,
-        8: 4244,
-        12: 1190,
-        14: 9997,
-        16: 20149,
-        18: 449,
-        20: 5970,
-        22: 24010,
-        24: 32693,
-    },
-    ("Category Double Threes and Fours", 3, 8): {
-        0: 178,
-        6: 598,
-        8: 3029,
-        12: 736,
-        14: 7514,
-        16: 19616,
-        18: 289,
-        20: 4456,
-        22: 23158,
-        24: 40426,
-    },
-    ("Category Double Threes and Fours", 4, 1): {
-        0: 19809,
-        6: 19538,
-        8: 19765,
-        12: 7513,
-        14: 14835,
-        16: 7377,
-        18: 1239,
-        20: 3787,
-        22: 3661,
-        24: 1312,
-        26: 332,
-        28: 426,
-        30: 317,
-        32: 89,
-    },
-    ("Category Double Threes and Fours", 4, 2): {
-        0: 3972,
-        6: 9759,
-        8: 9681,
-        12: 9152,
-        14: 18494,
-        16: 9182,
-        18: 3796,
-        20: 11442,
-        22: 11245,
-        24: 4411,
-        26: 2317,
-        28: 3481,
-        30: 2486,
-        32: 582,
-    },
-    ("Category Double Threes and Fours", 4, 3): {
-        0: 745,
-        6: 3580,
-        8: 3629,
-        12: 6446,
-        14: 12957,
-        16: 6563,
-        18: 5181,
-        20: 15371,
-        22: 15441,
-        24: 6812,
-        26: 6250,
-        28: 9263,
-        30: 6209,
-        32: 1553,
-    },
-    ("Category Double Threes and Fours", 4, 4): {
-        0: 371,
-        6: 1737,
-        8: 2754,
-        12: 3063,
-        14: 10057,
-        16: 7710,
-        18: 2466,
-        20: 11583,
-        22: 18508,
-        24: 10280,
-        26: 4741,
-        28: 10883,
-        30: 11372,
-        32: 4475,
-    },
-    ("Category Double Threes and Fours", 4, 5): {
-        0: 163,
-        6: 827,
-        8: 1901,
-        12: 1523,
-        14: 6844,
-        16: 7733,
-        18: 1219,
-        20: 8048,
-        22: 18097,
-        24: 14117,
-        26: 3189,
-        28: 10930,
-        30: 16244,
-        32: 9165,
-    },
-    ("Category Double Threes and Fours", 4, 6): {
-        0: 79,
-        6: 427,
-        8: 1284,
-        12: 735,
-        14: 4451,
-        16: 6958,
-        18: 584,
-        20: 5399,
-        22: 16364,
-        24: 16773,
-        26: 2088,
-        28: 9736,
-        30: 19782,
-        32: 15340,
-    },
-    ("Category Double Threes and Fours", 4, 7): {
-        0: 49,
-        6: 189,
-        8: 804,
-        12: 341,
-        14: 2915,
-        16: 5625,
-        18: 284,
-        20: 3378,
-        22: 13634,
-        24: 18879,
-        26: 1283,
-        28: 8204,
-        30: 22055,
-        32: 22360,
-    },
-    ("Category Double Threes and Fours", 4, 8): {
-        0: 20,
-        6: 81,
-        8: 471,
-        12: 162,
-        14: 1776,
-        16: 4633,
-        18: 123,
-        20: 2145,
-        22: 10960,
-        24: 19444,
-        26: 825,
-        28: 6551,
-        30: 22891,
-        32: 29918,
-    },
-    ("Category Double Threes and Fours", 5, 1): {
-        0: 13122,
-        6: 16411,
-        8: 16451,
-        12: 8304,
-        14: 16464,
-        16: 8295,
-        18: 2097,
-        20: 6145,
-        22: 6092,
-        24: 2291,
-        26: 1026,
-        28: 1554,
-        30: 1078,
-        32: 320,
-        34: 123,
-        36: 136,
-        38: 72,
-        40: 19,
-    },
-    ("Category Double Threes and Fours", 5, 2): {
-        0: 1676,
-        6: 5469,
-        8: 5318,
-        12: 6656,
-        14: 13562,
-        16: 6786,
-        18: 4316,
-        20: 12668,
-        22: 12832,
-        24: 5636,
-        26: 5358,
-        28: 7847,
-        30: 5450,
-        32: 2093,
-        34: 1650,
-        36: 1673,
-        38: 832,
-        40: 178,
-    },
-    ("Category Double Threes and Fours", 5, 3): {
-        0: 223,
-        6: 1334,
-        8: 1388,
-        12: 3259,
-        14: 6384,
-        16: 3268,
-        18: 3897,
-        20: 11385,
-        22: 11613,
-        24: 6096,
-        26: 9086,
-        28: 13665,
-        30: 9486,
-        32: 4914,
-        34: 5404,
-        36: 5338,
-        38: 2707,
-        40: 553,
-    },
-    ("Category Double Threes and Fours", 5, 4): {
-        0: 95,
-        6: 539,
-        8: 836,
-        12: 1337,
-        14: 4130,
-        16: 3174,
-        18: 1558,
-        20: 7322,
-        22: 11374,
-        24: 6778,
-        26: 5595,
-        28: 13488,
-        30: 14319,
-        32: 7169,
-        34: 5245,
-        36: 8341,
-        38: 6576,
-        40: 2124,
-    },
-    ("Category Double Threes and Fours", 5, 5): {
-        0: 38,
-        6: 229,
-        8: 529,
-        12: 537,
-        14: 2318,
-        16: 2532,
-        18: 608,
-        20: 4128,
-        22: 9485,
-        24: 7483,
-        26: 3289,
-        28: 11201,
-        30: 16810,
-        32: 10248,
-        34: 4446,
-        36: 9980,
-        38: 11129,
-        40: 5010,
-    },
-    ("Category Double Threes and Fours", 5, 6): {
-        0: 16,
-        6: 86,
-        8: 260,
-        12: 201,
-        14: 1301,
-        16: 2019,
-        18: 256,
-        20: 2231,
-        22: 7062,
-        24: 7336,
-        26: 1815,
-        28: 8349,
-        30: 17020,
-        32: 13519,
-        34: 3326,
-        36: 10243,
-        38: 15569,
-        40: 9391,
-    },
-    ("Category Double Threes and Fours", 5, 7): {
-        0: 7,
-        6: 31,
-        8: 123,
-        12: 85,
-        14: 710,
-        16: 1354,
-        18: 105,
-        20: 1203,
-        22: 4805,
-        24: 6675,
-        26: 957,
-        28: 5843,
-        30: 15652,
-        32: 16368,
-        34: 2268,
-        36: 9333,
-        38: 19248,
-        40: 15233,
-    },
-    ("Category Double Threes and Fours", 5, 8): {
-        0: 2,
-        6: 18,
-        8: 62,
-        12: 38,
-        14: 358,
-        16: 957,
-        18: 44,
-        20: 677,
-        22: 3183,
-        24: 5723,
-        26: 458,
-        28: 3938,
-        30: 13694,
-        32: 18163,
-        34: 1518,
-        36: 8113,
-        38: 21064,
-        40: 21990,
-    },
-    ("Category Double Threes and Fours", 6, 1): {
-        0: 8738,
-        6: 13463,
-        8: 12988,
-        12: 8147,
-        14: 16506,
-        16: 8267,
-        18: 2801,
-        20: 8158,
-        22: 8265,
-        24: 3198,
-        26: 2034,
-        28: 3123,
-        30: 2139,
-        32: 737,
-        34: 482,
-        36: 521,
-        38: 251,
-        40: 89,
-        42: 45,
-        44: 31,
-        46: 16,
-        48: 1,
-    },
-    ("Category Double Threes and Fours", 6, 2): {
-        0: 784,
-        6: 2934,
-        8: 2801,
-        12: 4564,
-        14: 8843,
-        16: 4479,
-        18: 3691,
-        20: 11349,
-        22: 11356,
-        24: 5588,
-        26: 6877,
-        28: 10790,
-        30: 7553,
-        32: 3974,
-        34: 4398,
-        36: 4501,
-        38: 2498,
-        40: 1118,
-        42: 878,
-        44: 700,
-        46: 267,
-        48: 57,
-    },
-    ("Category Double Threes and Fours", 6, 3): {
-        0: 72,
-        6: 498,
-        8: 492,
-        12: 1466,
-        14: 2851,
-        16: 1434,
-        18: 2245,
-        20: 6930,
-        22: 6770,
-        24: 4357,
-        26: 8000,
-        28: 12114,
-        30: 9057,
-        32: 6825,
-        34: 9548,
-        36: 9738,
-        38: 6065,
-        40: 3765,
-        42: 3710,
-        44: 2808,
-        46: 1087,
-        48: 168,
-    },
-    ("Category Double Threes and Fours", 6, 4): {
-        0: 24,
-        6: 160,
-        8: 255,
-        12: 491,
-        14: 1534,
-        16: 1101,
-        18: 698,
-        20: 3603,
-        22: 5673,
-        24: 3611,
-        26: 4164,
-        28: 10039,
-        30: 10836,
-        32: 6720,
-        34: 7926,
-        36: 12511,
-        38: 10194,
-        40: 5366,
-        42: 4836,
-        44: 5640,
-        46: 3626,
-        48: 992,
-    },
-    ("Category Double Threes and Fours", 6, 5): {
-        0: 8,
-        6: 45,
-        8: 113,
-        12: 144,
-        14: 771,
-        16: 877,
-        18: 244,
-        20: 1755,
-        22: 3827,
-        24: 3099,
-        26: 2099,
-        28: 6985,
-        30: 10494,
-        32: 7047,
-        34: 5449,
-        36: 12190,
-        38: 14163,
-        40: 7833,
-        42: 4738,
-        44: 8161,
-        46: 7219,
-        48: 2739,
-    },
-    ("Category Double Threes and Fours", 6, 6): {
-        0: 4,
-        6: 19,
-        8: 60,
-        12: 52,
-        14: 311,
-        16: 539,
-        18: 96,
-        20: 762,
-        22: 2383,
-        24: 2528,
-        26: 994,
-        28: 4300,
-        30: 8697,
-        32: 7204,
-        34: 3427,
-        36: 10342,
-        38: 16439,
-        40: 10795,
-        42: 4008,
-        44: 9477,
-        46: 11631,
-        48: 5932,
-    },
-    ("Category Double Threes and Fours", 6, 7): {
-        0: 1,
-        6: 2,
-        8: 28,
-        12: 11,
-        14: 145,
-        16: 278,
-        18: 31,
-        20: 355,
-        22: 1401,
-        24: 1921,
-        26: 437,
-        28: 2646,
-        30: 6708,
-        32: 7113,
-        34: 1922,
-        36: 8028,
-        38: 16374,
-        40: 13795,
-        42: 3210,
-        44: 9660,
-        46: 15581,
-        48: 10353,
-    },
-    ("Category Double Threes and Fours", 6, 8): {
-        8: 9,
-        12: 9,
-        14: 61,
-        16: 162,
-        18: 4,
-        20: 143,
-        22: 812,
-        24: 1352,
-        26: 160,
-        28: 1404,
-        30: 4988,
-        32: 6450,
-        34: 1121,
-        36: 5846,
-        38: 15017,
-        40: 16076,
-        42: 2271,
-        44: 9045,
-        46: 18638,
-        48: 16432,
-    },
-    ("Category Double Threes and Fours", 7, 1): {
-        0: 5803,
-        6: 10242,
-        8: 10404,
-        12: 7634,
-        14: 15252,
-        16: 7739,
-        18: 3195,
-        20: 9418,
-        22: 9715,
-        24: 4020,
-        26: 3173,
-        28: 4897,
-        30: 3270,
-        32: 1409,
-        34: 1182,
-        36: 1226,
-        38: 668,
-        40: 276,
-        42: 226,
-        44: 141,
-        46: 71,
-        48: 17,
-        50: 16,
-        52: 5,
-        54: 1,
-    },
-    ("Category Double Threes and Fours", 7, 2): {
-        0: 357,
-        6: 1500,
-        8: 1462,
-        12: 2776,
-        14: 5631,
-        16: 2846,
-        18: 2867,
-        20: 8788,
-        22: 8736,
-        24: 4687,
-        26: 7287,
-        28: 11132,
-        30: 7900,
-        32: 5286,
-        34: 6959,
-        36: 7000,
-        38: 4228,
-        40: 2927,
-        42: 2873,
-        44: 2245,
-        46: 1083,
-        48: 593,
-        50: 446,
-        52: 276,
-        54: 98,
-        56: 17,
-    },
-    ("Category Double Threes and Fours", 7, 3): {
-        0: 14,
-        6: 177,
-        8: 170,
-        12: 568,
-        14: 1144,
-        16: 593,
-        18: 1218,
-        20: 3613,
-        22: 3517,
-        24: 2466,
-        26: 5630,
-        28: 8269,
-        30: 6641,
-        32: 6333,
-        34: 10088,
-        36: 10081,
-        38: 7494,
-        40: 6987,
-        42: 7821,
-        44: 6306,
-        46: 3838,
-        48: 2709,
-        50: 2457,
-        52: 1356,
-        54: 442,
-        56: 68,
-    },
-    ("Category Double Threes and Fours", 7, 4): {
-        0: 5,
-        6: 43,
-        8: 51,
-        12: 175,
-        14: 499,
-        16: 409,
-        18: 333,
-        20: 1553,
-        22: 2413,
-        24: 1659,
-        26: 2455,
-        28: 5838,
-        30: 6379,
-        32: 4601,
-        34: 6715,
-        36: 10741,
-        38: 9398,
-        40: 6630,
-        42: 8597,
-        44: 10218,
-        46: 7244,
-        48: 4033,
-        50: 3948,
-        52: 3713,
-        54: 1886,
-        56: 464,
-    },
-    ("Category Double Threes and Fours", 7, 5): {
-        14: 1,
-        16: 1,
-        20: 24,
-        22: 98,
-        24: 117,
-        26: 175,
-        28: 775,
-        30: 1635,
-        32: 1577,
-        34: 2449,
-        36: 6151,
-        38: 8213,
-        40: 6692,
-        42: 8725,
-        44: 14905,
-        46: 14308,
-        48: 8472,
-        50: 7620,
-        52: 9337,
-        54: 6505,
-        56: 2220,
-    },
-    ("Category Double Threes and Fours", 7, 6): {
-        26: 2,
-        28: 32,
-        30: 160,
-        32: 245,
-        34: 393,
-        36: 1591,
-        38: 3623,
-        40: 3902,
-        42: 4956,
-        44: 11988,
-        46: 16717,
-        48: 12071,
-        50: 9402,
-        52: 15028,
-        54: 13865,
-        56: 6025,
-    },
-    ("Category Double Threes and Fours", 7, 7): {
-        30: 4,
-        32: 16,
-        34: 28,
-        36: 209,
-        38: 905,
-        40: 1475,
-        42: 1803,
-        44: 6215,
-        46: 13553,
-        48: 13143,
-        50: 8799,
-        52: 18079,
-        54: 22780,
-        56: 12991,
-    },
-    ("Category Double Threes and Fours", 7, 8): {
-        36: 10,
-        38: 132,
-        40: 369,
-        42: 436,
-        44: 2163,
-        46: 7781,
-        48: 11181,
-        50: 6588,
-        52: 17293,
-        54: 30395,
-        56: 23652,
-    },
-    ("Category Double Threes and Fours", 8, 1): {
-        0: 3982,
-        6: 7946,
-        8: 7712,
-        12: 6731,
-        14: 13657,
-        16: 6920,
-        18: 3314,
-        20: 10167,
-        22: 10162,
-        24: 4614,
-        26: 4302,
-        28: 6414,
-        30: 4504,
-        32: 2079,
-        34: 2175,
-        36: 2120,
-        38: 1218,
-        40: 633,
-        42: 533,
-        44: 379,
-        46: 204,
-        48: 108,
-        50: 59,
-        52: 39,
-        54: 15,
-        56: 7,
-        58: 5,
-        60: 1,
-    },
-    ("Category Double Threes and Fours", 8, 2): {
-        0: 161,
-        6: 749,
-        8: 735,
-        12: 1685,
-        14: 3393,
-        16: 1623,
-        18: 2090,
-        20: 6475,
-        22: 6445,
-        24: 3639,
-        26: 6631,
-        28: 9769,
-        30: 7306,
-        32: 5644,
-        34: 8035,
-        36: 8364,
-        38: 5473,
-        40: 4617,
-        42: 5074,
-        44: 4004,
-        46: 2396,
-        48: 1840,
-        50: 1654,
-        52: 1069,
-        54: 537,
-        56: 294,
-        58: 188,
-        60: 80,
-        62: 29,
-        64: 1,
-    },
-    ("Category Double Threes and Fours", 8, 3): {
-        0: 6,
-        6: 58,
-        8: 53,
-        12: 214,
-        14: 525,
-        16: 233,
-        18: 582,
-        20: 1620,
-        22: 1657,
-        24: 1345,
-        26: 3379,
-        28: 4918,
-        30: 4044,
-        32: 4752,
-        34: 8086,
-        36: 8106,
-        38: 6904,
-        40: 7729,
-        42: 9356,
-        44: 8078,
-        46: 5989,
-        48: 6119,
-        50: 5725,
-        52: 4060,
-        54: 2440,
-        56: 1856,
-        58: 1298,
-        60: 670,
-        62: 167,
-        64: 31,
-    },
-    ("Category Double Threes and Fours", 8, 4): {
-        0: 1,
-        6: 13,
-        8: 22,
-        12: 56,
-        14: 161,
-        16: 151,
-        18: 137,
-        20: 611,
-        22: 950,
-        24: 729,
-        26: 1214,
-        28: 2819,
-        30: 3188,
-        32: 2521,
-        34: 4515,
-        36: 7211,
-        38: 6651,
-        40: 5753,
-        42: 8437,
-        44: 10354,
-        46: 8005,
-        48: 6657,
-        50: 7755,
-        52: 7763,
-        54: 4862,
-        56: 3204,
-        58: 2769,
-        60: 2271,
-        62: 1044,
-        64: 176,
-    },
-    ("Category Double Threes and Fours", 8, 5): {
-        28: 23,
-        30: 99,
-        32: 138,
-        34: 300,
-        36: 1160,
-        38: 2333,
-        40: 2534,
-        42: 4158,
-        44: 9424,
-        46: 11934,
-        48: 9190,
-        50: 10488,
-        52: 15513,
-        54: 13152,
-        56: 6512,
-        58: 4166,
-        60: 4694,
-        62: 3085,
-        64: 1097,
-    },
-    ("Category Double Threes and Fours", 8, 6): {
-        28: 21,
-        30: 80,
-        32: 97,
-        34: 150,
-        36: 599,
-        38: 1271,
-        40: 1352,
-        42: 1891,
-        44: 4923,
-        46: 7406,
-        48: 6310,
-        50: 7194,
-        52: 13803,
-        54: 15166,
-        56: 9515,
-        58: 7417,
-        60: 10598,
-        62: 8834,
-        64: 3373,
-    },
-    ("Category Double Threes and Fours", 8, 7): {
-        34: 1,
-        36: 22,
-        38: 110,
-        40: 187,
-        42: 272,
-        44: 1136,
-        46: 2872,
-        48: 3373,
-        50: 3735,
-        52: 9970,
-        54: 16072,
-        56: 12746,
-        58: 8549,
-        60: 15485,
-        62: 16974,
-        64: 8496,
-    },
-    ("Category Double Threes and Fours", 8, 8): {
-        38: 2,
-        40: 10,
-        42: 16,
-        44: 132,
-        46: 646,
-        48: 1172,
-        50: 1248,
-        52: 4700,
-        54: 11746,
-        56: 12907,
-        58: 7487,
-        60: 17383,
-        62: 25479,
-        64: 17072,
-    },
-    ("Category Quadruple Ones and Twos", 1, 1): {0: 66567, 4: 16803, 8: 16630},
-    ("Category Quadruple Ones and Twos", 1, 2): {0: 44809, 4: 27448, 8: 27743},
-    ("Category Quadruple Ones and Twos", 1, 3): {0: 37100, 4: 23184, 8: 39716},
-    ("Category Quadruple Ones and Twos", 1, 4): {0: 30963, 4: 19221, 8: 49816},
-    ("Category Quadruple Ones and Twos", 1, 5): {0: 25316, 4: 16079, 8: 58605},
-    ("Category Quadruple Ones and Twos", 1, 6): {0: 21505, 4: 13237, 8: 65258},
-    ("Category Quadruple Ones and Twos", 1, 7): {0: 17676, 4: 11100, 8: 71224},
-    ("Category Quadruple Ones and Twos", 1, 8): {0: 14971, 4: 9323, 8: 75706},
-    ("Category Quadruple Ones and Twos", 2, 1): {0: 44566, 4: 22273, 8: 24842, 12: 5485, 16: 2834},
-    ("Category Quadruple Ones and Twos", 2, 2): {0: 19963, 4: 24890, 8: 32262, 12: 15172, 16: 7713},
-    ("Category Quadruple Ones and Twos", 2, 3): {0: 13766, 4: 17158, 8: 34907, 12: 18539, 16: 15630},
-    ("Category Quadruple Ones and Twos", 2, 4): {0: 9543, 4: 11981, 8: 34465, 12: 19108, 16: 24903},
-    ("Category Quadruple Ones and Twos", 2, 5): {0: 6472, 4: 8302, 8: 32470, 12: 18612, 16: 34144},
-    ("Category Quadruple Ones and Twos", 2, 6): {0: 4569, 4: 5737, 8: 29716, 12: 17216, 16: 42762},
-    ("Category Quadruple Ones and Twos", 2, 7): {0: 3146, 4: 3974, 8: 26489, 12: 15756, 16: 50635},
-    ("Category Quadruple Ones and Twos", 2, 8): {0: 2265, 4: 2724, 8: 23578, 12: 14167, 16: 57266},
-    ("Category Quadruple Ones and Twos", 3, 1): {0: 29440, 4: 22574, 8: 27747, 12: 11557, 16: 6892, 20: 1331, 24: 459},
-    ("Category Quadruple Ones and Twos", 3, 2): {0: 8857, 4: 16295, 8: 26434, 12: 22986, 16: 16799, 20: 6481, 24: 2148},
-    ("Category Quadruple Ones and Twos", 3, 3): {0: 5063, 4: 9447, 8: 22255, 12: 21685, 16: 24084, 20: 11167, 24: 6299},
-    ("Category Quadruple Ones and Twos", 3, 4): {
-        0: 2864,
-        4: 5531,
-        8: 17681,
-        12: 18400,
-        16: 28524,
-        20: 14552,
-        24: 12448,
-    },
-    ("Category Quadruple Ones and Twos", 3, 5): {
-        0: 1676,
-        4: 3219,
-        8: 13478,
-        12: 14755,
-        16: 30427,
-        20: 16602,
-        24: 19843,
-    },
-    ("Category Quadruple Ones and Twos", 3, 6): {0: 923, 4: 1758, 8: 10259, 12: 11326, 16: 31125, 20: 16984, 24: 27625},
-    ("Category Quadruple Ones and Twos", 3, 7): {0: 586, 4: 1102, 8: 7543, 12: 8769, 16: 29367, 20: 17085, 24: 35548},
-    ("Category Quadruple Ones and Twos", 3, 8): {0: 334, 4: 607, 8: 5277, 12: 6388, 16: 27741, 20: 16170, 24: 43483},
-    ("Category Quadruple Ones and Twos", 4, 1): {
-        0: 19691,
-        4: 19657,
-        8: 27288,
-        12: 16126,
-        16: 11167,
-        20: 3979,
-        24: 1705,
-        28: 307,
-        32: 80,
-    },
-    ("Category Quadruple Ones and Twos", 4, 2): {
-        0: 4023,
-        4: 9776,
-        8: 19015,
-        12: 22094,
-        16: 20986,
-        20: 13805,
-        24: 7340,
-        28: 2393,
-        32: 568,
-    },
-    ("Category Quadruple Ones and Twos", 4, 3): {
-        0: 1848,
-        4: 4705,
-        8: 12411,
-        12: 16853,
-        16: 22831,
-        20: 18400,
-        24: 14480,
-        28: 5902,
-        32: 2570,
-    },
-    ("Category Quadruple Ones and Twos", 4, 4): {
-        0: 930,
-        4: 2291,
-        8: 8084,
-        12: 12063,
-        16: 21220,
-        20: 19266,
-        24: 20615,
-        28: 9443,
-        32: 6088,
-    },
-    ("Category Quadruple Ones and Twos", 4, 5): {
-        0: 424,
-        4: 1137,
-        8: 4963,
-        12: 7649,
-        16: 18209,
-        20: 17910,
-        24: 25474,
-        28: 12864,
-        32: 11370,
-    },
-    ("Category Quadruple Ones and Twos", 4, 6): {
-        0: 190,
-        4: 532,
-        8: 3048,
-        12: 4931,
-        16: 14796,
-        20: 15416,
-        24: 28256,
-        28: 14675,
-        32: 18156,
-    },
-    ("Category Quadruple Ones and Twos", 4, 7): {
-        0: 115,
-        4: 244,
-        8: 1871,
-        12: 3189,
-        16: 11547,
-        20: 12289,
-        24: 29181,
-        28: 16052,
-        32: 25512,
-    },
-    ("Category Quadruple Ones and Twos", 4, 8): {
-        0: 50,
-        4: 114,
-        8: 1062,
-        12: 1909,
-        16: 8888,
-        20: 9679,
-        24: 28785,
-        28: 16180,
-        32: 33333,
-    },
-    ("Category Quadruple Ones and Twos", 5, 1): {
-        0: 13112,
-        4: 16534,
-        8: 24718,
-        12: 18558,
-        16: 14547,
-        20: 7055,
-        24: 3810,
-        28: 1194,
-        32: 390,
-        36: 66,
-        40: 16,
-    },
-    ("Category Quadruple Ones and Twos", 5, 2): {
-        0: 1764,
-        4: 5529,
-        8: 12216,
-        12: 17687,
-        16: 20808,
-        20: 18149,
-        24: 12849,
-        28: 6991,
-        32: 2980,
-        36: 871,
-        40: 156,
-    },
-    ("Category Quadruple Ones and Twos", 5, 3): {
-        0: 719,
-        4: 2161,
-        8: 6362,
-        12: 11074,
-        16: 17322,
-        20: 19002,
-        24: 18643,
-        28: 12827,
-        32: 7960,
-        36: 2946,
-        40: 984,
-    },
-    ("Category Quadruple Ones and Twos", 5, 4): {
-        0: 305,
-        4: 847,
-        8: 3209,
-        12: 6581,
-        16: 12913,
-        20: 15867,
-        24: 20749,
-        28: 16398,
-        32: 14218,
-        36: 5931,
-        40: 2982,
-    },
-    ("Category Quadruple Ones and Twos", 5, 5): {
-        0: 98,
-        4: 340,
-        8: 1729,
-        12: 3480,
-        16: 8863,
-        20: 12037,
-        24: 20010,
-        28: 17568,
-        32: 19789,
-        36: 9319,
-        40: 6767,
-    },
-    ("Category Quadruple Ones and Twos", 5, 6): {
-        0: 38,
-        4: 156,
-        8: 870,
-        12: 1793,
-        16: 5734,
-        20: 8436,
-        24: 17830,
-        28: 16864,
-        32: 24246,
-        36: 12115,
-        40: 11918,
-    },
-    ("Category Quadruple Ones and Twos", 5, 7): {
-        0: 29,
-        4: 51,
-        8: 445,
-        12: 924,
-        16: 3712,
-        20: 5684,
-        24: 14936,
-        28: 14969,
-        32: 27238,
-        36: 14094,
-        40: 17918,
-    },
-    ("Category Quadruple Ones and Twos", 5, 8): {
-        0: 4,
-        4: 21,
-        8: 241,
-        12: 481,
-        16: 2344,
-        20: 3690,
-        24: 11929,
-        28: 12517,
-        32: 28388,
-        36: 15339,
-        40: 25046,
-    },
-    ("Category Quadruple Ones and Twos", 6, 1): {
-        0: 8646,
-        4: 13011,
-        8: 21357,
-        12: 19385,
-        16: 17008,
-        20: 10409,
-        24: 6249,
-        28: 2502,
-        32: 1041,
-        36: 289,
-        40: 96,
-        44: 6,
-        48: 1,
-    },
-    ("Category Quadruple Ones and Twos", 6, 2): {
-        0: 844,
-        4: 2876,
-        8: 7435,
-        12: 12792,
-        16: 17480,
-        20: 18814,
-        24: 16492,
-        28: 11889,
-        32: 6893,
-        36: 3013,
-        40: 1124,
-        44: 304,
-        48: 44,
-    },
-    ("Category Quadruple Ones and Twos", 6, 3): {
-        0: 264,
-        4: 977,
-        8: 3203,
-        12: 6431,
-        16: 11685,
-        20: 15584,
-        24: 17967,
-        28: 16506,
-        32: 13314,
-        36: 8034,
-        40: 4204,
-        44: 1402,
-        48: 429,
-    },
-    ("Category Quadruple Ones and Twos", 6, 4): {
-        0: 83,
-        4: 301,
-        8: 1361,
-        12: 3077,
-        16: 6727,
-        20: 10562,
-        24: 15746,
-        28: 17174,
-        32: 17787,
-        36: 12820,
-        40: 9289,
-        44: 3499,
-        48: 1574,
-    },
-    ("Category Quadruple Ones and Twos", 6, 5): {
-        0: 36,
-        4: 106,
-        8: 590,
-        12: 1344,
-        16: 3781,
-        20: 6466,
-        24: 12264,
-        28: 14810,
-        32: 19588,
-        36: 16002,
-        40: 14682,
-        44: 6410,
-        48: 3921,
-    },
-    ("Category Quadruple Ones and Twos", 6, 6): {
-        0: 12,
-        4: 40,
-        8: 238,
-        12: 594,
-        16: 2094,
-        20: 3849,
-        24: 8774,
-        28: 11481,
-        32: 19145,
-        36: 16864,
-        40: 19906,
-        44: 9386,
-        48: 7617,
-    },
-    ("Category Quadruple Ones and Twos", 6, 7): {
-        0: 3,
-        4: 15,
-        8: 96,
-        12: 240,
-        16: 1032,
-        20: 2123,
-        24: 6015,
-        28: 8372,
-        32: 17207,
-        36: 16148,
-        40: 24051,
-        44: 11862,
-        48: 12836,
-    },
-    ("Category Quadruple Ones and Twos", 6, 8): {
-        0: 1,
-        4: 2,
-        8: 40,
-        12: 121,
-        16: 559,
-        20: 1118,
-        24: 3868,
-        28: 5738,
-        32: 14489,
-        36: 14585,
-        40: 26779,
-        44: 13821,
-        48: 18879,
-    },
-    ("Category Quadruple Ones and Twos", 7, 1): {
-        0: 5780,
-        4: 10185,
-        8: 17905,
-        12: 18364,
-        16: 18160,
-        20: 13115,
-        24: 8617,
-        28: 4458,
-        32: 2221,
-        36: 827,
-        40: 266,
-        44: 77,
-        48: 23,
-        52: 2,
-    },
-    ("Category Quadruple Ones and Twos", 7, 2): {
-        0: 359,
-        4: 1436,
-        8: 4327,
-        12: 8501,
-        16: 13204,
-        20: 16895,
-        24: 17562,
-        28: 15061,
-        32: 11122,
-        36: 6507,
-        40: 3259,
-        44: 1279,
-        48: 388,
-        52: 86,
-        56: 14,
-    },
-    ("Category Quadruple Ones and Twos", 7, 3): {
-        0: 84,
-        4: 437,
-        8: 1544,
-        12: 3419,
-        16: 7076,
-        20: 11008,
-        24: 14839,
-        28: 16393,
-        32: 16118,
-        36: 12681,
-        40: 8773,
-        44: 4707,
-        48: 2126,
-        52: 637,
-        56: 158,
-    },
-    ("Category Quadruple Ones and Twos", 7, 4): {
-        0: 16,
-        4: 109,
-        8: 548,
-        12: 1277,
-        16: 3362,
-        20: 6250,
-        24: 10535,
-        28: 13596,
-        32: 16527,
-        36: 15938,
-        40: 14071,
-        44: 9192,
-        48: 5741,
-        52: 2105,
-        56: 733,
-    },
-    ("Category Quadruple Ones and Twos", 7, 5): {
-        0: 3,
-        4: 35,
-        8: 185,
-        12: 538,
-        16: 1506,
-        20: 3100,
-        24: 6337,
-        28: 9400,
-        32: 14443,
-        36: 15955,
-        40: 17820,
-        44: 13369,
-        48: 10702,
-        52: 4316,
-        56: 2291,
-    },
-    ("Category Quadruple Ones and Twos", 7, 6): {
-        0: 1,
-        4: 8,
-        8: 63,
-        12: 199,
-        16: 694,
-        20: 1535,
-        24: 3747,
-        28: 5988,
-        32: 11398,
-        36: 13738,
-        40: 19063,
-        44: 15587,
-        48: 15867,
-        52: 7202,
-        56: 4910,
-    },
-    ("Category Quadruple Ones and Twos", 7, 7): {
-        16: 1,
-        20: 20,
-        24: 167,
-        28: 624,
-        32: 2718,
-        36: 6091,
-        40: 15177,
-        44: 18712,
-        48: 27571,
-        52: 15296,
-        56: 13623,
-    },
-    ("Category Quadruple Ones and Twos", 7, 8): {
-        24: 1,
-        28: 23,
-        32: 295,
-        36: 1310,
-        40: 6608,
-        44: 12958,
-        48: 30776,
-        52: 21895,
-        56: 26134,
-    },
-    ("Category Quadruple Ones and Twos", 8, 1): {
-        0: 3811,
-        4: 7682,
-        8: 14638,
-        12: 17214,
-        16: 18191,
-        20: 14651,
-        24: 10976,
-        28: 6591,
-        32: 3601,
-        36: 1607,
-        40: 725,
-        44: 234,
-        48: 64,
-        52: 14,
-        56: 1,
-    },
-    ("Category Quadruple Ones and Twos", 8, 2): {
-        0: 136,
-        4: 770,
-        8: 2413,
-        12: 5355,
-        16: 9421,
-        20: 13623,
-        24: 16213,
-        28: 16246,
-        32: 14131,
-        36: 10076,
-        40: 6198,
-        44: 3336,
-        48: 1427,
-        52: 470,
-        56: 160,
-        60: 21,
-        64: 4,
-    },
-    ("Category Quadruple Ones and Twos", 8, 3): {
-        0: 33,
-        4: 191,
-        8: 716,
-        12: 1804,
-        16: 4021,
-        20: 7201,
-        24: 10733,
-        28: 13934,
-        32: 15751,
-        36: 14882,
-        40: 12409,
-        44: 8920,
-        48: 5462,
-        52: 2606,
-        56: 1006,
-        60: 280,
-        64: 51,
-    },
-    ("Category Quadruple Ones and Twos", 8, 4): {
-        0: 4,
-        4: 35,
-        8: 194,
-        12: 542,
-        16: 1518,
-        20: 3103,
-        24: 6057,
-        28: 9073,
-        32: 12990,
-        36: 14756,
-        40: 15851,
-        44: 13795,
-        48: 10706,
-        52: 6310,
-        56: 3456,
-        60: 1207,
-        64: 403,
-    },
-    ("Category Quadruple Ones and Twos", 8, 5): {
-        0: 2,
-        4: 14,
-        8: 60,
-        12: 178,
-        16: 627,
-        20: 1300,
-        24: 2989,
-        28: 5327,
-        32: 8993,
-        36: 12039,
-        40: 15561,
-        44: 15382,
-        48: 15278,
-        52: 10629,
-        56: 7377,
-        60: 2918,
-        64: 1326,
-    },
-    ("Category Quadruple Ones and Twos", 8, 6): {
-        4: 2,
-        8: 23,
-        12: 63,
-        16: 174,
-        20: 520,
-        24: 1484,
-        28: 2711,
-        32: 5606,
-        36: 8463,
-        40: 13177,
-        44: 14818,
-        48: 17731,
-        52: 14024,
-        56: 12425,
-        60: 5446,
-        64: 3333,
-    },
-    ("Category Quadruple Ones and Twos", 8, 7): {
-        24: 1,
-        28: 15,
-        32: 179,
-        36: 871,
-        40: 4241,
-        44: 9486,
-        48: 22521,
-        52: 21458,
-        56: 26451,
-        60: 8143,
-        64: 6634,
-    },
-    ("Category Quadruple Ones and Twos", 8, 8): {
-        32: 6,
-        36: 85,
-        40: 1012,
-        44: 3806,
-        48: 16022,
-        52: 20561,
-        56: 36560,
-        60: 10768,
-        64: 11180,
-    },
-    ("Category Micro Straight", 1, 1): {0: 100000},
-    ("Category Micro Straight", 1, 2): {0: 100000},
-    ("Category Micro Straight", 1, 3): {0: 100000},
-    ("Category Micro Straight", 1, 4): {0: 100000},
-    ("Category Micro Straight", 1, 5): {0: 100000},
-    ("Category Micro Straight", 1, 6): {0: 100000},
-    ("Category Micro Straight", 1, 7): {0: 100000},
-    ("Category Micro Straight", 1, 8): {0: 100000},
-    ("Category Micro Straight", 2, 1): {0: 72326, 10: 27674},
-    ("Category Micro Straight", 2, 2): {0: 48546, 10: 51454},
-    ("Category Micro Straight", 2, 3): {0: 32619, 10: 67381},
-    ("Category Micro Straight", 2, 4): {0: 21659, 10: 78341},
-    ("Category Micro Straight", 2, 5): {0: 14288, 10: 85712},
-    ("Category Micro Straight", 2, 6): {0: 9882, 10: 90118},
-    ("Category Micro Straight", 2, 7): {0: 6502, 10: 93498},
-    ("Category Micro Straight", 2, 8): {0: 4161, 10: 95839},
-    ("Category Micro Straight", 3, 1): {0: 41943, 10: 58057},
-    ("Category Micro Straight", 3, 2): {0: 15524, 10: 84476},
-    ("Category Micro Straight", 3, 3): {0: 5700, 10: 94300},
-    ("Category Micro Straight", 3, 4): {0: 2127, 10: 97873},
-    ("Category Micro Straight", 3, 5): {0: 744, 10: 99256},
-    ("Category Micro Straight", 3, 6): {0: 260, 10: 99740},
-    ("Category Micro Straight", 3, 7): {0: 115, 10: 99885},
-    ("Category Micro Straight", 3, 8): {0: 34, 10: 99966},
-    ("Category Micro Straight", 4, 1): {0: 22307, 10: 77693},
-    ("Category Micro Straight", 4, 2): {0: 4420, 10: 95580},
-    ("Category Micro Straight", 4, 3): {0: 806, 10: 99194},
-    ("Category Micro Straight", 4, 4): {0: 205, 10: 99795},
-    ("Category Micro Straight", 4, 5): {0: 20, 10: 99980},
-    ("Category Micro Straight", 4, 6): {0: 5, 10: 99995},
-    ("Category Micro Straight", 4, 7): {0: 1, 10: 99999},
-    ("Category Micro Straight", 4, 8): {0: 1, 10: 99999},
-    ("Category Micro Straight", 5, 1): {0: 11685, 10: 88315},
-    ("Category Micro Straight", 5, 2): {0: 1141, 10: 98859},
-    ("Category Micro Straight", 5, 3): {0: 119, 10: 99881},
-    ("Category Micro Straight", 5, 4): {0: 11, 10: 99989},
-    ("Category Micro Straight", 5, 5): {0: 1, 10: 99999},
-    ("Category Micro Straight", 5, 6): {10: 100000},
-    ("Category Micro Straight", 5, 7): {10: 100000},
-    ("Category Micro Straight", 5, 8): {10: 100000},
-    ("Category Micro Straight", 6, 1): {0: 5937, 10: 94063},
-    ("Category Micro Straight", 6, 2): {0: 307, 10: 99693},
-    ("Category Micro Straight", 6, 3): {0: 9, 10: 99991},
-    ("Category Micro Straight", 6, 4): {0: 1, 10: 99999},
-    ("Category Micro Straight", 6, 5): {10: 100000},
-    ("Category Micro Straight", 6, 6): {10: 100000},
-    ("Category Micro Straight", 6, 7): {10: 100000},
-    ("Category Micro Straight", 6, 8): {10: 100000},
-    ("Category Micro Straight", 7, 1): {0: 3072, 10: 96928},
-    ("Category Micro Straight", 7, 2): {0: 85, 10: 99915},
-    ("Category Micro Straight", 7, 3): {0: 2, 10: 99998},
-    ("Category Micro Straight", 7, 4): {10: 100000},
-    ("Category Micro Straight", 7, 5): {10: 100000},
-    ("Category Micro Straight", 7, 6): {10: 100000},
-    ("Category Micro Straight", 7, 7): {10: 100000},
-    ("Category Micro Straight", 7, 8): {10: 100000},
-    ("Category Micro Straight", 8, 1): {0: 1544, 10: 98456},
-    ("Category Micro Straight", 8, 2): {0: 15, 10: 99985},
-    ("Category Micro Straight", 8, 3): {10: 100000},
-    ("Category Micro Straight", 8, 4): {10: 100000},
-    ("Category Micro Straight", 8, 5): {10: 100000},
-    ("Category Micro Straight", 8, 6): {10: 100000},
-    ("Category Micro Straight", 8, 7): {10: 100000},
-    ("Category Micro Straight", 8, 8): {10: 100000},
-    ("Category Three Odds", 1, 1): {0: 100000},
-    ("Category Three Odds", 1, 2): {0: 100000},
-    ("Category Three Odds", 1, 3): {0: 100000},
-    ("Category Three Odds", 1, 4): {0: 100000},
-    ("Category Three Odds", 1, 5): {0: 100000},
-    ("Category Three Odds", 1, 6): {0: 100000},
-    ("Category Three Odds", 1, 7): {0: 100000},
-    ("Category Three Odds", 1, 8): {0: 100000},
-    ("Category Three Odds", 2, 1): {0: 100000},
-    ("Category Three Odds", 2, 2): {0: 100000},
-    ("Category Three Odds", 2, 3): {0: 100000},
-    ("Category Three Odds", 2, 4): {0: 100000},
-    ("Category Three Odds", 2, 5): {0: 100000},
-    ("Category Three Odds", 2, 6): {0: 100000},
-    ("Category Three Odds", 2, 7): {0: 100000},
-    ("Category Three Odds", 2, 8): {0: 100000},
-    ("Category Three Odds", 3, 1): {0: 87592, 20: 12408},
-    ("Category Three Odds", 3, 2): {0: 57855, 20: 42145},
-    ("Category Three Odds", 3, 3): {0: 32668, 20: 67332},
-    ("Category Three Odds", 3, 4): {0: 17508, 20: 82492},
-    ("Category Three Odds", 3, 5): {0: 9156, 20: 90844},
-    ("Category Three Odds", 3, 6): {0: 4572, 20: 95428},
-    ("Category Three Odds", 3, 7): {0: 2325, 20: 97675},
-    ("Category Three Odds", 3, 8): {0: 1116, 20: 98884},
-    ("Category Three Odds", 4, 1): {0: 68669, 20: 31331},
-    ("Category Three Odds", 4, 2): {0: 26140, 20: 73860},
-    ("Category Three Odds", 4, 3): {0: 7837, 20: 92163},
-    ("Category Three Odds", 4, 4): {0: 2169, 20: 97831},
-    ("Category Three Odds", 4, 5): {0: 516, 20: 99484},
-    ("Category Three Odds", 4, 6): {0: 156, 20: 99844},
-    ("Category Three Odds", 4, 7): {0: 40, 20: 99960},
-    ("Category Three Odds", 4, 8): {0: 12, 20: 99988},
-    ("Category Three Odds", 5, 1): {0: 49908, 20: 50092},
-    ("Category Three Odds", 5, 2): {0: 10373, 20: 89627},
-    ("Category Three Odds", 5, 3): {0: 1640, 20: 98360},
-    ("Category Three Odds", 5, 4): {0: 223, 20: 99777},
-    ("Category Three Odds", 5, 5): {0: 24, 20: 99976},
-    ("Category Three Odds", 5, 6): {0: 3, 20: 99997},
-    ("Category Three Odds", 5, 7): {0: 1, 20: 99999},
-    ("Category Three Odds", 5, 8): {20: 100000},
-    ("Category Three Odds", 6, 1): {0: 34566, 20: 65434},
-    ("Category Three Odds", 6, 2): {0: 3766, 20: 96234},
-    ("Category Three Odds", 6, 3): {0: 291, 20: 99709},
-    ("Category Three Odds", 6, 4): {0: 22, 20: 99978},
-    ("Category Three Odds", 6, 5): {20: 100000},
-    ("Category Three Odds", 6, 6): {20: 100000},
-    ("Category Three Odds", 6, 7): {20: 100000},
-    ("Category Three Odds", 6, 8): {20: 100000},
-    ("Category Three Odds", 7, 1): {0: 22722, 20: 77278},
-    ("Category Three Odds", 7, 2): {0: 1291, 20: 98709},
-    ("Category Three Odds", 7, 3): {0: 38, 20: 99962},
-    ("Category Three Odds", 7, 4): {0: 2, 20: 99998},
-    ("Category Three Odds", 7, 5): {20: 100000},
-    ("Category Three Odds", 7, 6): {20: 100000},
-    ("Category Three Odds", 7, 7): {20: 100000},
-    ("Category Three Odds", 7, 8): {20: 100000},
-    ("Category Three Odds", 8, 1): {0: 14556, 20: 85444},
-    ("Category Three Odds", 8, 2): {0: 430, 20: 99570},
-    ("Category Three Odds", 8, 3): {0: 3, 20: 99997},
-    ("Category Three Odds", 8, 4): {20: 100000},
-    ("Category Three Odds", 8, 5): {20: 100000},
-    ("Category Three Odds", 8, 6): {20: 100000},
-    ("Category Three Odds", 8, 7): {20: 100000},
-    ("Category Three Odds", 8, 8): {20: 100000},
-    ("Category 1-2-1 Consecutive", 1, 1): {0: 100000},
-    ("Category 1-2-1 Consecutive", 1, 2): {0: 100000},
-    ("Category 1-2-1 Consecutive", 1, 3): {0: 100000},
-    ("Category 1-2-1 Consecutive", 1, 4): {0: 100000},
-    ("Category 1-2-1 Consecutive", 1, 5): {0: 100000},
-    ("Category 1-2-1 Consecutive", 1, 6): {0: 100000},
-    ("Category 1-2-1 Consecutive", 1, 7): {0: 100000},
-    ("Category 1-2-1 Consecutive", 1, 8): {0: 100000},
-    ("Category 1-2-1 Consecutive", 2, 1): {0: 100000},
-    ("Category 1-2-1 Consecutive", 2, 2): {0: 100000},
-    ("Category 1-2-1 Consecutive", 2, 3): {0: 100000},
-    ("Category 1-2-1 Consecutive", 2, 4): {0: 100000},
-    ("Category 1-2-1 Consecutive", 2, 5): {0: 100000},
-    ("Category 1-2-1 Consecutive", 2, 6): {0: 100000},
-    ("Category 1-2-1 Consecutive", 2, 7): {0: 100000},
-    ("Category 1-2-1 Consecutive", 2, 8): {0: 100000},
-    ("Category 1-2-1 Consecutive", 3, 1): {0: 100000},
-    ("Category 1-2-1 Consecutive", 3, 2): {0: 100000},
-    ("Category 1-2-1 Consecutive", 3, 3): {0: 100000},
-    ("Category 1-2-1 Consecutive", 3, 4): {0: 100000},
-    ("Category 1-2-1 Consecutive", 3, 5): {0: 100000},
-    ("Category 1-2-1 Consecutive", 3, 6): {0: 100000},
-    ("Category 1-2-1 Consecutive", 3, 7): {0: 100000},
-    ("Category 1-2-1 Consecutive", 3, 8): {0: 100000},
-    ("Category 1-2-1 Consecutive", 4, 1): {0: 96371, 30: 3629},
-    ("Category 1-2-1 Consecutive", 4, 2): {0: 86605, 30: 13395},
-    ("Category 1-2-1 Consecutive", 4, 3): {0: 75037, 30: 24963},
-    ("Category 1-2-1 Consecutive", 4, 4): {0: 63656, 30: 36344},
-    ("Category 1-2-1 Consecutive", 4, 5): {0: 53869, 30: 46131},
-    ("Category 1-2-1 Consecutive", 4, 6): {0: 45131, 30: 54869},
-    ("Category 1-2-1 Consecutive", 4, 7): {0: 37535, 30: 62465},
-    ("Category 1-2-1 Consecutive", 4, 8): {0: 31425, 30: 68575},
-    ("Category 1-2-1 Consecutive", 5, 1): {0: 86632, 30: 13368},
-    ("Category 1-2-1 Consecutive", 5, 2): {0: 62779, 30: 37221},
-    ("Category 1-2-1 Consecutive", 5, 3): {0: 46034, 30: 53966},
-    ("Category 1-2-1 Consecutive", 5, 4): {0: 34983, 30: 65017},
-    ("Category 1-2-1 Consecutive", 5, 5): {0: 28056, 30: 71944},
-    ("Category 1-2-1 Consecutive", 5, 6): {0: 23150, 30: 76850},
-    ("Category 1-2-1 Consecutive", 5, 7): {0: 19577, 30: 80423},
-    ("Category 1-2-1 Consecutive", 5, 8): {0: 17613, 30: 82387},
-    ("Category 1-2-1 Consecutive", 6, 1): {0: 71928, 30: 28072},
-    ("Category 1-2-1 Consecutive", 6, 2): {0: 40724, 30: 59276},
-    ("Category 1-2-1 Consecutive", 6, 3): {0: 26723, 30: 73277},
-    ("Category 1-2-1 Consecutive", 6, 4): {0: 19685, 30: 80315},
-    ("Category 1-2-1 Consecutive", 6, 5): {0: 15460, 30: 84540},
-    ("Category 1-2-1 Consecutive", 6, 6): {0: 12526, 30: 87474},
-    ("Category 1-2-1 Consecutive", 6, 7): {0: 10014, 30: 89986},
-    ("Category 1-2-1 Consecutive", 6, 8): {0: 8251, 30: 91749},
-    ("Category 1-2-1 Consecutive", 7, 1): {0: 55544, 30: 44456},
-    ("Category 1-2-1 Consecutive", 7, 2): {0: 24840, 30: 75160},
-    ("Category 1-2-1 Consecutive", 7, 3): {0: 15102, 30: 84898},
-    ("Category 1-2-1 Consecutive", 7, 4): {0: 10541, 30: 89459},
-    ("Category 1-2-1 Consecutive", 7, 5): {0: 7720, 30: 92280},
-    ("Category 1-2-1 Consecutive", 7, 6): {0: 5554, 30: 94446},
-    ("Category 1-2-1 Consecutive", 7, 7): {0: 4106, 30: 95894},
-    ("Category 1-2-1 Consecutive", 7, 8): {0: 3025, 30: 96975},
-    ("Category 1-2-1 Consecutive", 8, 1): {0: 40693, 30: 59307},
-    ("Category 1-2-1 Consecutive", 8, 2): {0: 14827, 30: 85173},
-    ("Category 1-2-1 Consecutive", 8, 3): {0: 8195, 30: 91805},
-    ("Category 1-2-1 Consecutive", 8, 4): {0: 5383, 30: 94617},
-    ("Category 1-2-1 Consecutive", 8, 5): {0: 3395, 30: 96605},
-    ("Category 1-2-1 Consecutive", 8, 6): {0: 2299, 30: 97701},
-    ("Category 1-2-1 Consecutive", 8, 7): {0: 1412, 30: 98588},
-    ("Category 1-2-1 Consecutive", 8, 8): {0: 872, 30: 99128},
-    ("Category Three Distinct Dice", 1, 1): {0: 100000},
-    ("Category Three Distinct Dice", 1, 2): {0: 100000},
-    ("Category Three Distinct Dice", 1, 3): {0: 100000},
-    ("Category Three Distinct Dice", 1, 4): {0: 100000},
-    ("Category Three Distinct Dice", 1, 5): {0: 100000},
-    ("Category Three Distinct Dice", 1, 6): {0: 100000},
-    ("Category Three Distinct Dice", 1, 7): {0: 100000},
-    ("Category Three Distinct Dice", 1, 8): {0: 100000},
-    ("Category Three Distinct Dice", 2, 1): {0: 100000},
-    ("Category Three Distinct Dice", 2, 2): {0: 100000},
-    ("Category Three Distinct Dice", 2, 3): {0: 100000},
-    ("Category Three Distinct Dice", 2, 4): {0: 100000},
-    ("Category Three Distinct Dice", 2, 5): {0: 100000},
-    ("Category Three Distinct Dice", 2, 6): {0: 100000},
-    ("Category Three Distinct Dice", 2, 7): {0: 100000},
-    ("Category Three Distinct Dice", 2, 8): {0: 100000},
-    ("Category Three Distinct Dice", 3, 1): {0: 44707, 20: 55293},
-    ("Category Three Distinct Dice", 3, 2): {0: 15078, 20: 84922},
-    ("Category Three Distinct Dice", 3, 3): {0: 5056, 20: 94944},
-    ("Category Three Distinct Dice", 3, 4): {0: 1688, 20: 98312},
-    ("Category Three Distinct Dice", 3, 5): {0: 516, 20: 99484},
-    ("Category Three Distinct Dice", 3, 6): {0: 182, 20: 99818},
-    ("Category Three Distinct Dice", 3, 7): {0: 56, 20: 99944},
-    ("Category Three Distinct Dice", 3, 8): {0: 15, 20: 99985},
-    ("Category Three Distinct Dice", 4, 1): {0: 16721, 20: 83279},
-    ("Category Three Distinct Dice", 4, 2): {0: 1826, 20: 98174},
-    ("Category Three Distinct Dice", 4, 3): {0: 203, 20: 99797},
-    ("Category Three Distinct Dice", 4, 4): {0: 18, 20: 99982},
-    ("Category Three Distinct Dice", 4, 5): {0: 3, 20: 99997},
-    ("Category Three Distinct Dice", 4, 6): {20: 100000},
-    ("Category Three Distinct Dice", 4, 7): {20: 100000},
-    ("Category Three Distinct Dice", 4, 8): {20: 100000},
-    ("Category Three Distinct Dice", 5, 1): {0: 5904, 20: 94096},
-    ("Category Three Distinct Dice", 5, 2): {0: 236, 20: 99764},
-    ("Category Three Distinct Dice", 5, 3): {0: 12, 20: 99988},
-    ("Category Three Distinct Dice", 5, 4): {20: 100000},
-    ("Category Three Distinct Dice", 5, 5): {20: 100000},
-    ("Category Three Distinct Dice", 5, 6): {20: 100000},
-    ("Category Three Distinct Dice", 5, 7): {20: 100000},
-    ("Category Three Distinct Dice", 5, 8): {20: 100000},
-    ("Category Three Distinct Dice", 6, 1): {0: 1992, 20: 98008},
-    ("Category Three Distinct Dice", 6, 2): {0: 21, 20: 99979},
-    ("Category Three Distinct Dice", 6, 3): {20: 100000},
-    ("Category Three Distinct Dice", 6, 4): {20: 100000},
-    ("Category Three Distinct Dice", 6, 5): {20: 100000},
-    ("Category Three Distinct Dice", 6, 6): {20: 100000},
-    ("Category Three Distinct Dice", 6, 7): {20: 100000},
-    ("Category Three Distinct Dice", 6, 8): {20: 100000},
-    ("Category Three Distinct Dice", 7, 1): {0: 692, 20: 99308},
-    ("Category Three Distinct Dice", 7, 2): {0: 4, 20: 99996},
-    ("Category Three Distinct Dice", 7, 3): {20: 100000},
-    ("Category Three Distinct Dice", 7, 4): {20: 100000},
-    ("Category Three Distinct Dice", 7, 5): {20: 100000},
-    ("Category Three Distinct Dice", 7, 6): {20: 100000},
-    ("Category Three Distinct Dice", 7, 7): {20: 100000},
-    ("Category Three Distinct Dice", 7, 8): {20: 100000},
-    ("Category Three Distinct Dice", 8, 1): {0: 243, 20: 99757},
-    ("Category Three Distinct Dice", 8, 2): {0: 1, 20: 99999},
-    ("Category Three Distinct Dice", 8, 3): {20: 100000},
-    ("Category Three Distinct Dice", 8, 4): {20: 100000},
-    ("Category Three Distinct Dice", 8, 5): {20: 100000},
-    ("Category Three Distinct Dice", 8, 6): {20: 100000},
-    ("Category Three Distinct Dice", 8, 7): {20: 100000},
-    ("Category Three Distinct Dice", 8, 8): {20: 100000},
-    ("Category Two Pair", 1, 1): {0: 100000},
-    ("Category Two Pair", 1, 2): {0: 100000},
-    ("Category Two Pair", 1, 3): {0: 100000},
-    ("Category Two Pair", 1, 4): {0: 100000},
-    ("Category Two Pair", 1, 5): {0: 100000},
-    ("Category Two Pair", 1, 6): {0: 100000},
-    ("Category Two Pair", 1, 7): {0: 100000},
-    ("Category Two Pair", 1, 8): {0: 100000},
-    ("Category Two Pair", 2, 1): {0: 100000},
-    ("Category Two Pair", 2, 2): {0: 100000},
-    ("Category Two Pair", 2, 3): {0: 100000},
-    ("Category Two Pair", 2, 4): {0: 100000},
-    ("Category Two Pair", 2, 5): {0: 100000},
-    ("Category Two Pair", 2, 6): {0: 100000},
-    ("Category Two Pair", 2, 7): {0: 100000},
-    ("Category Two Pair", 2, 8): {0: 100000},
-    ("Category Two Pair", 3, 1): {0: 100000},
-    ("Category Two Pair", 3, 2): {0: 100000},
-    ("Category Two Pair", 3, 3): {0: 100000},
-    ("Category Two Pair", 3, 4): {0: 100000},
-    ("Category Two Pair", 3, 5): {0: 100000},
-    ("Category Two Pair", 3, 6): {0: 100000},
-    ("Category Two Pair", 3, 7): {0: 100000},
-    ("Category Two Pair", 3, 8): {0: 100000},
-    ("Category Two Pair", 4, 1): {0: 93065, 22: 6935},
-    ("Category Two Pair", 4, 2): {0: 82102, 22: 17898},
-    ("Category Two Pair", 4, 3): {0: 71209, 22: 28791},
-    ("Category Two Pair", 4, 4): {0: 61609, 22: 38391},
-    ("Category Two Pair", 4, 5): {0: 53036, 22: 46964},
-    ("Category Two Pair", 4, 6): {0: 45705, 22: 54295},
-    ("Category Two Pair", 4, 7): {0: 39398, 22: 60602},
-    ("Category Two Pair", 4, 8): {0: 33673, 22: 66327},
-    ("Category Two Pair", 5, 1): {0: 72847, 22: 27153},
-    ("Category Two Pair", 5, 2): {0: 46759, 22: 53241},
-    ("Category Two Pair", 5, 3): {0: 29462, 22: 70538},
-    ("Category Two Pair", 5, 4): {0: 18351, 22: 81649},
-    ("Category Two Pair", 5, 5): {0: 11793, 22: 88207},
-    ("Category Two Pair", 5, 6): {0: 7385, 22: 92615},
-    ("Category Two Pair", 5, 7): {0: 4610, 22: 95390},
-    ("Category Two Pair", 5, 8): {0: 2938, 22: 97062},
-    ("Category Two Pair", 6, 1): {0: 44431, 22: 55569},
-    ("Category Two Pair", 6, 2): {0: 17183, 22: 82817},
-    ("Category Two Pair", 6, 3): {0: 6759, 22: 93241},
-    ("Category Two Pair", 6, 4): {0: 2562, 22: 97438},
-    ("Category Two Pair", 6, 5): {0: 948, 22: 99052},
-    ("Category Two Pair", 6, 6): {0: 375, 22: 99625},
-    ("Category Two Pair", 6, 7): {0: 138, 22: 99862},
-    ("Category Two Pair", 6, 8): {0: 57, 22: 99943},
-    ("Category Two Pair", 7, 1): {0: 19888, 22: 80112},
-    ("Category Two Pair", 7, 2): {0: 3935, 22: 96065},
-    ("Category Two Pair", 7, 3): {0: 801, 22: 99199},
-    ("Category Two Pair", 7, 4): {0: 175, 22: 99825},
-    ("Category Two Pair", 7, 5): {0: 31, 22: 99969},
-    ("Category Two Pair", 7, 6): {0: 7, 22: 99993},
-    ("Category Two Pair", 7, 7): {0: 2, 22: 99998},
-    ("Category Two Pair", 7, 8): {22: 100000},
-    ("Category Two Pair", 8, 1): {0: 6791, 22: 93209},
-    ("Category Two Pair", 8, 2): {0: 588, 22: 99412},
-    ("Category Two Pair", 8, 3): {0: 61, 22: 99939},
-    ("Category Two Pair", 8, 4): {0: 6, 22: 99994},
-    ("Category Two Pair", 8, 5): {22: 100000},
-    ("Category Two Pair", 8, 6): {22: 100000},
-    ("Category Two Pair", 8, 7): {22: 100000},
-    ("Category Two Pair", 8, 8): {22: 100000},
-    ("Category 2-1-2 Consecutive", 1, 1): {0: 100000},
-    ("Category 2-1-2 Consecutive", 1, 2): {0: 100000},
-    ("Category 2-1-2 Consecutive", 1, 3): {0: 100000},
-    ("Category 2-1-2 Consecutive", 1, 4): {0: 100000},
-    ("Category 2-1-2 Consecutive", 1, 5): {0: 100000},
-    ("Category 2-1-2 Consecutive", 1, 6): {0: 100000},
-    ("Category 2-1-2 Consecutive", 1, 7): {0: 100000},
-    ("Category 2-1-2 Consecutive", 1, 8): {0: 100000},
-    ("Category 2-1-2 Consecutive", 2, 1): {0: 100000},
-    ("Category 2-1-2 Consecutive", 2, 2): {0: 100000},
-    ("Category 2-1-2 Consecutive", 2, 3): {0: 100000},
-    ("Category 2-1-2 Consecutive", 2, 4): {0: 100000},
-    ("Category 2-1-2 Consecutive", 2, 5): {0: 100000},
-    ("Category 2-1-2 Consecutive", 2, 6): {0: 100000},
-    ("Category 2-1-2 Consecutive", 2, 7): {0: 100000},
-    ("Category 2-1-2 Consecutive", 2, 8): {0: 100000},
-    ("Category 2-1-2 Consecutive", 3, 1): {0: 100000},
-    ("Category 2-1-2 Consecutive", 3, 2): {0: 100000},
-    ("Category 2-1-2 Consecutive", 3, 3): {0: 100000},
-    ("Category 2-1-2 Consecutive", 3, 4): {0: 100000},
-    ("Category 2-1-2 Consecutive", 3, 5): {0: 100000},
-    ("Category 2-1-2 Consecutive", 3, 6): {0: 100000},
-    ("Category 2-1-2 Consecutive", 3, 7): {0: 100000},
-    ("Category 2-1-2 Consecutive", 3, 8): {0: 100000},
-    ("Category 2-1-2 Consecutive", 4, 1): {0: 100000},
-    ("Category 2-1-2 Consecutive", 4, 2): {0: 100000},
-    ("Category 2-1-2 Consecutive", 4, 3): {0: 100000},
-    ("Category 2-1-2 Consecutive", 4, 4): {0: 100000},
-    ("Category 2-1-2 Consecutive", 4, 5): {0: 100000},
-    ("Category 2-1-2 Consecutive", 4, 6): {0: 100000},
-    ("Category 2-1-2 Consecutive", 4, 7): {0: 100000},
-    ("Category 2-1-2 Consecutive", 4, 8): {0: 100000},
-    ("Category 2-1-2 Consecutive", 5, 1): {0: 98403, 40: 1597},
-    ("Category 2-1-2 Consecutive", 5, 2): {0: 90651, 40: 9349},
-    ("Category 2-1-2 Consecutive", 5, 3): {0: 80100, 40: 19900},
-    ("Category 2-1-2 Consecutive", 5, 4): {0: 69131, 40: 30869},
-    ("Category 2-1-2 Consecutive", 5, 5): {0: 58252, 40: 41748},
-    ("Category 2-1-2 Consecutive", 5, 6): {0: 49405, 40: 50595},
-    ("Category 2-1-2 Consecutive", 5, 7): {0: 41585, 40: 58415},
-    ("Category 2-1-2 Consecutive", 5, 8): {0: 34952, 40: 65048},
-    ("Category 2-1-2 Consecutive", 6, 1): {0: 93465, 40: 6535},
-    ("Category 2-1-2 Consecutive", 6, 2): {0: 73416, 40: 26584},
-    ("Category 2-1-2 Consecutive", 6, 3): {0: 54041, 40: 45959},
-    ("Category 2-1-2 Consecutive", 6, 4): {0: 38535, 40: 61465},
-    ("Category 2-1-2 Consecutive", 6, 5): {0: 27366, 40: 72634},
-    ("Category 2-1-2 Consecutive", 6, 6): {0: 18924, 40: 81076},
-    ("Category 2-1-2 Consecutive", 6, 7): {0: 13387, 40: 86613},
-    ("Category 2-1-2 Consecutive", 6, 8): {0: 9134, 40: 90866},
-    ("Category 2-1-2 Consecutive", 7, 1): {0: 84168, 40: 15832},
-    ("Category 2-1-2 Consecutive", 7, 2): {0: 52659, 40: 47341},
-    ("Category 2-1-2 Consecutive", 7, 3): {0: 30435, 40: 69565},
-    ("Category 2-1-2 Consecutive", 7, 4): {0: 17477, 40: 82523},
-    ("Category 2-1-2 Consecutive", 7, 5): {0: 9782, 40: 90218},
-    ("Category 2-1-2 Consecutive", 7, 6): {0: 5316, 40: 94684},
-    ("Category 2-1-2 Consecutive", 7, 7): {0: 2995, 40: 97005},
-    ("Category 2-1-2 Consecutive", 7, 8): {0: 1689, 40: 98311},
-    ("Category 2-1-2 Consecutive", 8, 1): {0: 71089, 40: 28911},
-    ("Category 2-1-2 Consecutive", 8, 2): {0: 33784, 40: 66216},
-    ("Category 2-1-2 Consecutive", 8, 3): {0: 14820, 40: 85180},
-    ("Category 2-1-2 Consecutive", 8, 4): {0: 6265, 40: 93735},
-    ("Category 2-1-2 Consecutive", 8, 5): {0: 2600, 40: 97400},
-    ("Category 2-1-2 Consecutive", 8, 6): {0: 1155, 40: 98845},
-    ("Category 2-1-2 Consecutive", 8, 7): {0: 487, 40: 99513},
-    ("Category 2-1-2 Consecutive", 8, 8): {0: 190, 40: 99810},
-    ("Category Five Distinct Dice", 1, 1): {0: 100000},
-    ("Category Five Distinct Dice", 1, 2): {0: 100000},
-    ("Category Five Distinct Dice", 1, 3): {0: 100000},
-    ("Category Five Distinct Dice", 1, 4): {0: 100000},
-    ("Category Five Distinct Dice", 1, 5): {0: 100000},
-    ("Category Five Distinct Dice", 1, 6): {0: 100000},
-    ("Category Five Distinct Dice", 1, 7): {0: 100000},
-    ("Category Five Distinct Dice", 1, 8): {0: 100000},
-    ("Category Five Distinct Dice", 2, 1): {0: 100000},
-    ("Category Five Distinct Dice", 2, 2): {0: 100000},
-    ("Category Five Distinct Dice", 2, 3): {0: 100000},
-    ("Category Five Distinct Dice", 2, 4): {0: 100000},
-    ("Category Five Distinct Dice", 2, 5): {0: 100000},
-    ("Category Five Distinct Dice", 2, 6): {0: 100000},
-    ("Category Five Distinct Dice", 2, 7): {0: 100000},
-    ("Category Five Distinct Dice", 2, 8): {0: 100000},
-    ("Category Five Distinct Dice", 3, 1): {0: 100000},
-    ("Category Five Distinct Dice", 3, 2): {0: 100000},
-    ("Category Five Distinct Dice", 3, 3): {0: 100000},
-    ("Category Five Distinct Dice", 3, 4): {0: 100000},
-    ("Category Five Distinct Dice", 3, 5): {0: 100000},
-    ("Category Five Distinct Dice", 3, 6): {0: 100000},
-    ("Category Five Distinct Dice", 3, 7): {0: 100000},
-    ("Category Five Distinct Dice", 3, 8): {0: 100000},
-    ("Category Five Distinct Dice", 4, 1): {0: 100000},
-    ("Category Five Distinct Dice", 4, 2): {0: 100000},
-    ("Category Five Distinct Dice", 4, 3): {0: 100000},
-    ("Category Five Distinct Dice", 4, 4): {0: 100000},
-    ("Category Five Distinct Dice", 4, 5): {0: 100000},
-    ("Category Five Distinct Dice", 4, 6): {0: 100000},
-    ("Category Five Distinct Dice", 4, 7): {0: 100000},
-    ("Category Five Distinct Dice", 4, 8): {0: 100000},
-    ("Category Five Distinct Dice", 5, 1): {0: 90907, 25: 9093},
-    ("Category Five Distinct Dice", 5, 2): {0: 68020, 25: 31980},
-    ("Category Five Distinct Dice", 5, 3): {0: 47692, 25: 52308},
-    ("Category Five Distinct Dice", 5, 4): {0: 32383, 25: 67617},
-    ("Category Five Distinct Dice", 5, 5): {0: 21631, 25: 78369},
-    ("Category Five Distinct Dice", 5, 6): {0: 14366, 25: 85634},
-    ("Category Five Distinct Dice", 5, 7): {0: 9568, 25: 90432},
-    ("Category Five Distinct Dice", 5, 8): {0: 6360, 25: 93640},
-    ("Category Five Distinct Dice", 6, 1): {0: 75051, 25: 24949},
-    ("Category Five Distinct Dice", 6, 2): {0: 38409, 25: 61591},
-    ("Category Five Distinct Dice", 6, 3): {0: 17505, 25: 82495},
-    ("Category Five Distinct Dice", 6, 4): {0: 7862, 25: 92138},
-    ("Category Five Distinct Dice", 6, 5): {0: 3538, 25: 96462},
-    ("Category Five Distinct Dice", 6, 6): {0: 1645, 25: 98355},
-    ("Category Five Distinct Dice", 6, 7): {0: 714, 25: 99286},
-    ("Category Five Distinct Dice", 6, 8): {0: 341, 25: 99659},
-    ("Category Five Distinct Dice", 7, 1): {0: 58588, 25: 41412},
-    ("Category Five Distinct Dice", 7, 2): {0: 19487, 25: 80513},
-    ("Category Five Distinct Dice", 7, 3): {0: 6043, 25: 93957},
-    ("Category Five Distinct Dice", 7, 4): {0: 1799, 25: 98201},
-    ("Category Five Distinct Dice", 7, 5): {0: 544, 25: 99456},
-    ("Category Five Distinct Dice", 7, 6): {0: 169, 25: 99831},
-    ("Category Five Distinct Dice", 7, 7): {0: 59, 25: 99941},
-    ("Category Five Distinct Dice", 7, 8): {0: 11, 25: 99989},
-    ("Category Five Distinct Dice", 8, 1): {0: 43586, 25: 56414},
-    ("Category Five Distinct Dice", 8, 2): {0: 9615, 25: 90385},
-    ("Category Five Distinct Dice", 8, 3): {0: 1944, 25: 98056},
-    ("Category Five Distinct Dice", 8, 4): {0: 383, 25: 99617},
-    ("Category Five Distinct Dice", 8, 5): {0: 77, 25: 99923},
-    ("Category Five Distinct Dice", 8, 6): {0: 18, 25: 99982},
-    ("Category Five Distinct Dice", 8, 7): {0: 3, 25: 99997},
-    ("Category Five Distinct Dice", 8, 8): {0: 2, 25: 99998},
-    ("Category 4&5 Full House", 1, 1): {0: 100000},
-    ("Category 4&5 Full House", 1, 2): {0: 100000},
-    ("Category 4&5 Full House", 1, 3): {0: 100000},
-    ("Category 4&5 Full House", 1, 4): {0: 100000},
-    ("Category 4&5 Full House", 1, 5): {0: 100000},
-    ("Category 4&5 Full House", 1, 6): {0: 100000},
-    ("Category 4&5 Full House", 1, 7): {0: 100000},
-    ("Category 4&5 Full House", 1, 8): {0: 100000},
-    ("Category 4&5 Full House", 2, 1): {0: 100000},
-    ("Category 4&5 Full House", 2, 2): {0: 100000},
-    ("Category 4&5 Full House", 2, 3): {0: 100000},
-    ("Category 4&5 Full House", 2, 4): {0: 100000},
-    ("Category 4&5 Full House", 2, 5): {0: 100000},
-    ("Category 4&5 Full House", 2, 6): {0: 100000},
-    ("Category 4&5 Full House", 2, 7): {0: 100000},
-    ("Category 4&5 Full House", 2, 8): {0: 100000},
-    ("Category 4&5 Full House", 3, 1): {0: 100000},
-    ("Category 4&5 Full House", 3, 2): {0: 100000},
-    ("Category 4&5 Full House", 3, 3): {0: 100000},
-    ("Category 4&5 Full House", 3, 4): {0: 100000},
-    ("Category 4&5 Full House", 3, 5): {0: 100000},
-    ("Category 4&5 Full House", 3, 6): {0: 100000},
-    ("Category 4&5 Full House", 3, 7): {0: 100000},
-    ("Category 4&5 Full House", 3, 8): {0: 100000},
-    ("Category 4&5 Full House", 4, 1): {0: 100000},
-    ("Category 4&5 Full House", 4, 2): {0: 100000},
-    ("Category 4&5 Full House", 4, 3): {0: 100000},
-    ("Category 4&5 Full House", 4, 4): {0: 100000},
-    ("Category 4&5 Full House", 4, 5): {0: 100000},
-    ("Category 4&5 Full House", 4, 6): {0: 100000},
-    ("Category 4&5 Full House", 4, 7): {0: 100000},
-    ("Category 4&5 Full House", 4, 8): {0: 100000},
-    ("Category 4&5 Full House", 5, 1): {0: 99724, 50: 276},
-    ("Category 4&5 Full House", 5, 2): {0: 96607, 50: 3393},
-    ("Category 4&5 Full House", 5, 3): {0: 88788, 50: 11212},
-    ("Category 4&5 Full House", 5, 4): {0: 77799, 50: 22201},
-    ("Category 4&5 Full House", 5, 5): {0: 65797, 50: 34203},
-    ("Category 4&5 Full House", 5, 6): {0: 54548, 50: 45452},
-    ("Category 4&5 Full House", 5, 7): {0: 44898, 50: 55102},
-    ("Category 4&5 Full House", 5, 8): {0: 36881, 50: 63119},
-    ("Category 4&5 Full House", 6, 1): {0: 98841, 50: 1159},
-    ("Category 4&5 Full House", 6, 2): {0: 88680, 50: 11320},
-    ("Category 4&5 Full House", 6, 3): {0: 70215, 50: 29785},
-    ("Category 4&5 Full House", 6, 4): {0: 50801, 50: 49199},
-    ("Category 4&5 Full House", 6, 5): {0: 35756, 50: 64244},
-    ("Category 4&5 Full House", 6, 6): {0: 24698, 50: 75302},
-    ("Category 4&5 Full House", 6, 7): {0: 17145, 50: 82855},
-    ("Category 4&5 Full House", 6, 8): {0: 11846, 50: 88154},
-    ("Category 4&5 Full House", 7, 1): {0: 97090, 50: 2910},
-    ("Category 4&5 Full House", 7, 2): {0: 77440, 50: 22560},
-    ("Category 4&5 Full House", 7, 3): {0: 51372, 50: 48628},
-    ("Category 4&5 Full House", 7, 4): {0: 30566, 50: 69434},
-    ("Category 4&5 Full House", 7, 5): {0: 17866, 50: 82134},
-    ("Category 4&5 Full House", 7, 6): {0: 10521, 50: 89479},
-    ("Category 4&5 Full House", 7, 7): {0: 6204, 50: 93796},
-    ("Category 4&5 Full House", 7, 8): {0: 3670, 50: 96330},
-    ("Category 4&5 Full House", 8, 1): {0: 94172, 50: 5828},
-    ("Category 4&5 Full House", 8, 2): {0: 64693, 50: 35307},
-    ("Category 4&5 Full House", 8, 3): {0: 35293, 50: 64707},
-    ("Category 4&5 Full House", 8, 4): {0: 17749, 50: 82251},
-    ("Category 4&5 Full House", 8, 5): {0: 8740, 50: 91260},
-    ("Category 4&5 Full House", 8, 6): {0: 4550, 50: 95450},
-    ("Category 4&5 Full House", 8, 7): {0: 2218, 50: 97782},
-    ("Category 4&5 Full House", 8, 8): {0: 1084, 50: 98916},
-}
+import pkgutil
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Mapping, Tuple
+
+from Utils import cache_argsless
+
+# The simulated score distributions live in yacht_weights.bin instead of a Python dict literal.
+# Parsing a dict literal of this size costs a lot of time and memory on every import of the world,
+# while the binary file is only read the first time logic needs it.
+# For every (category, number of dice, number of rolls), the file stores the possible scores in increasing order,
+# together with the cumulative probability (out of 100000) of scoring at most that.
+#
+# File layout, all numbers little endian:
+#   magic b"YDW1", uint8 max dice, uint8 max rolls, uint16 number of categories
+#   per category: uint8 length of the name, followed by the utf-8 encoded name
+#   uint32 offsets into the score arrays, one per (category, dice, rolls) slot plus a final end offset
+#   uint16 scores, followed by uint32 cumulative probabilities
+# Slots without a distribution have an empty range.
+
+weights_magic = b"YDW1"
+weights_file_name = "yacht_weights.bin"
+
+
+class YachtWeights(Mapping[Tuple[str, int, int], Dict[int, int]]):
+    """
+    Read-only view on the binary weight store.
+    Indexing with (category, dice, rolls) gives the distribution as a {score: probability} dict, like the old literal.
+    Logic should prefer the cumulative arrays, which avoid building dicts.
+    """
+
+    def __init__(self, data: bytes):
+        if data[:4] != weights_magic:
+            raise Exception("[Yacht Dice] Unknown format of the weight store.")
+        self.max_dice, self.max_rolls, number_of_categories = struct.unpack_from("<BBH", data, 4)
+        position = 8
+        self.categories: List[str] = []
+        for _ in range(number_of_categories):
+            length = data[position]
+            self.categories.append(data[position + 1 : position + 1 + length].decode("utf-8"))
+            position += 1 + length
+        self.category_index = {name: i for i, name in enumerate(self.categories)}
+
+        number_of_slots = number_of_categories * (self.max_dice + 1) * (self.max_rolls + 1)
+        self.offsets = array("I", data[position : position + 4 * (number_of_slots + 1)])
+        position += 4 * (number_of_slots + 1)
+        number_of_scores = self.offsets[-1]
+        self.scores = array("H", data[position : position + 2 * number_of_scores])
+        position += 2 * number_of_scores
+        self.cumulative = array("I", data[position : position + 4 * number_of_scores])
+        if sys.byteorder == "big":
+            self.offsets.byteswap()
+            self.scores.byteswap()
+            self.cumulative.byteswap()
+
+    def slot(self, category: str, num_dice: int, num_rolls: int) -> int:
+        return (self.category_index[category] * (self.max_dice + 1) + num_dice) * (self.max_rolls + 1) + num_rolls
+
+    def score_range(self, category: str, num_dice: int, num_rolls: int) -> Tuple[int, int]:
+        """
+        Returns the range of self.scores and self.cumulative that holds the distribution.
+        """
+        if not 0 <= num_dice <= self.max_dice or not 0 <= num_rolls <= self.max_rolls:
+            raise KeyError((category, num_dice, num_rolls))
+        slot = self.slot(category, num_dice, num_rolls)
+        return self.offsets[slot], self.offsets[slot + 1]
+
+    def find_percentile(self, category: str, num_dice: int, num_rolls: int, percentile: float) -> int:
+        """
+        Returns the lowest score such that at least the given fraction of the distribution scores at most that.
+        """
+        start, end = self.score_range(category, num_dice, num_rolls)
+        index = bisect_left(self.cumulative, percentile * 100000, start, end)
+        return self.scores[index] if index < end else 0
+
+    def __getitem__(self, key: Tuple[str, int, int]) -> Dict[int, int]:
+        start, end = self.score_range(*key)
+        if start == end:
+            raise KeyError(key)
+        previous = 0
+        dist = {}
+        for i in range(start, end):
+            dist[self.scores[i]] = self.cumulative[i] - previous
+            previous = self.cumulative[i]
+        return dist
+
+    def __iter__(self) -> Iterator[Tuple[str, int, int]]:
+        for category in self.categories:
+            for num_dice in range(self.max_dice + 1):
+                for num_rolls in range(self.max_rolls + 1):
+                    slot = self.slot(category, num_dice, num_rolls)
+                    if self.offsets[slot] != self.offsets[slot + 1]:
+                        yield category, num_dice, num_rolls
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+def encode_weights(weights: Mapping[Tuple[str, int, int], Dict[int, int]]) -> bytes:
+    """
+    Encodes distributions in the format of yacht_weights.bin. Used by the tools that (re)generate the weights.
+    """
+    categories = list(dict.fromkeys(key[0] for key in weights))
+    max_dice = max(key[1] for key in weights)
+    max_rolls = max(key[2] for key in weights)
+
+    offsets = array("I", [0])
+    scores = array("H")
+    cumulative = array("I")
+    for category in categories:
+        for num_dice in range(max_dice + 1):
+            for num_rolls in range(max_rolls + 1):
+                total = 0
+                for score, probability in sorted(weights.get((category, num_dice, num_rolls), {}).items()):
+                    total += probability
+                    scores.append(score)
+                    cumulative.append(total)
+                offsets.append(len(scores))
+
+    if sys.byteorder == "big":
+        offsets.byteswap()
+        scores.byteswap()
+        cumulative.byteswap()
+    header = weights_magic + struct.pack("<BBH", max_dice, max_rolls, len(categories))
+    for category in categories:
+        name = category.encode("utf-8")
+        header += struct.pack("<B", len(name)) + name
+    return header + offsets.tobytes() + scores.tobytes() + cumulative.tobytes()
+
+
+@cache_argsless
+def get_yacht_weights() -> YachtWeights:
+    """
+    Loads the weight store on first use. Uses pkgutil so it also works from a zipped apworld.
+    """
+    data = pkgutil.get_data(__name__, weights_file_name)
+    if data is None:
+        raise FileNotFoundError(weights_file_name)
+    return YachtWeights(data)
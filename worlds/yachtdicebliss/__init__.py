@@ -1,7 +1,17 @@
 import math
-from typing import Dict, TextIO, List
-
-from BaseClasses import CollectionState, Entrance, Item, ItemClassification, MultiWorld, Region, Tutorial
+from typing import Dict, TextIO, List, Optional, Sequence
+
+from BaseClasses import (
+    CollectionState,
+    Entrance,
+    Item,
+    ItemClassification,
+    Location,
+    MultiWorld,
+    Region,
+    Tutorial,
+    bitset_from_flags,
+)
 
 from worlds.AutoWorld import WebWorld, World
 
@@ -28,6 +38,7 @@ from .Options import (
     MinimalNumberOfDiceAndRolls,
     MinimizeExtraItems,
     PointsSize,
+    ScoreLogic,
     YachtDiceOptions,
     DoubleCategoryCalculation,
     yd_option_groups,
@@ -35,7 +46,10 @@ from .Options import (
 from Fill import remaining_fill
 from .Rules import (
     Category,
-    dice_simulation_fill_pool,
+    ScoreCache,
+    PoolScoreTracker,
+    ScoreRule,
+    ScoreThreshold,
     set_yacht_completion_rules,
     set_yacht_rules,
     dice_simulation_strings,
@@ -80,6 +94,8 @@ class YachtDiceWorld(World):
     
     apworld_version = "2.3.4"
 
+    score_rule: Optional[ScoreRule] = None  # set in set_rules
+
     def _get_yachtdice_data(self):
         return {
             # "world_seed": self.multiworld.per_slot_randoms[self.player].getrandbits(32),
@@ -149,6 +165,7 @@ class YachtDiceWorld(World):
         self.double_category_doubled = (
             self.options.double_category_calculation == DoubleCategoryCalculation.option_double
         )
+        self.exact_score_logic = self.options.score_logic == ScoreLogic.option_exact
 
         # which categories to use?
         normal_categories = []
@@ -267,29 +284,29 @@ class YachtDiceWorld(World):
 
         # it is possible the player starts with very bad items,
         # so we fill the starting inventory until at least 5 score is possible
+        # the pool keeps the counts of everything added so far, so scores are not recomputed from scratch every item
+        pool = PoolScoreTracker(
+            self.precollected,
+            self.frags_per_dice,
+            self.frags_per_roll,
+            self.possible_categories,
+            self.double_category_doubled,
+            self.difficulty,
+            self.exact_score_logic,
+        )
         if self.options.fill_start_inventory_if_needed:
             c = 0
-            while (
-                dice_simulation_fill_pool(
-                    self.precollected,
-                    self.frags_per_dice,
-                    self.frags_per_roll,
-                    self.possible_categories,
-                    self.double_category_doubled,
-                    self.difficulty,
-                )
-                < 5
-                and c < 16
-            ):
+            while pool.score() < 5 and c < 16:
                 if c % 3 == 0:
-                    category = self.random.choices(
+                    item = self.random.choices(
                         self.possible_categories, weights=[2 if i < 9 else 1 for i in self.cat_indices]
                     )[0]
-                    self.precollected.append(category)
                 elif c % 3 == 1:
-                    self.precollected.append("Dice")
+                    item = "Dice"
                 else:
-                    self.precollected.append("Roll")
+                    item = "Roll"
+                self.precollected.append(item)
+                pool.add(item)
                 c += 1
 
         # Yacht Dice adds items into the pool until a score of at least 1000 is reached.
@@ -310,6 +327,9 @@ class YachtDiceWorld(World):
         if weights["Roll"] > 0 and self.frags_per_roll > 1:
             self.itempool += ["Roll Fragment"] * (self.frags_per_roll - 1)
 
+        for item in self.itempool:
+            pool.add(item)
+
         # calibrate the weights, since the impact of each of the items is different
         weights["Dice"] = weights["Dice"] / 5 * self.frags_per_dice
         weights["Roll"] = weights["Roll"] / 5 * self.frags_per_roll
@@ -319,11 +339,10 @@ class YachtDiceWorld(World):
 
         # function that will return which item to add next, based on weights and current pool
         def get_item_to_add(weights, extra_points_added, step_score_multipliers_added):
-            all_items = self.itempool + self.precollected
-            dice_fragments_in_pool = all_items.count("Dice") * self.frags_per_dice + all_items.count("Dice Fragment")
+            dice_fragments_in_pool = pool.count("Dice") * self.frags_per_dice + pool.count("Dice Fragment")
             if dice_fragments_in_pool + 1 >= 9 * self.frags_per_dice:
                 weights["Dice"] = 0  # don't allow >=9 dice
-            roll_fragments_in_pool = all_items.count("Roll") * self.frags_per_roll + all_items.count("Roll Fragment")
+            roll_fragments_in_pool = pool.count("Roll") * self.frags_per_roll + pool.count("Roll Fragment")
             if roll_fragments_in_pool + 1 >= 6 * self.frags_per_roll:
                 weights["Roll"] = 0  # don't allow >= 6 rolls
 
@@ -399,36 +418,27 @@ class YachtDiceWorld(World):
 
         # adding 17 items as a start seems like the smartest way to get close to 1000 points
         for _ in range(17):
-            self.itempool.append(get_item_to_add(weights, extra_points_added, step_score_multipliers_added))
+            item_to_add = get_item_to_add(weights, extra_points_added, step_score_multipliers_added)
+            self.itempool.append(item_to_add)
+            pool.add(item_to_add)
 
-        score_in_logic = dice_simulation_fill_pool(
-            self.itempool + self.precollected,
-            self.frags_per_dice,
-            self.frags_per_roll,
-            self.possible_categories,
-            self.double_category_doubled,
-            self.difficulty,
-        )
+        score_in_logic = pool.score()
 
         # if we overshoot, remove items until you get below 1000, then return the last removed item
         if score_in_logic > 1000:
             removed_item = ""
             while score_in_logic > 1000:
                 removed_item = self.itempool.pop()
-                score_in_logic = dice_simulation_fill_pool(
-                    self.itempool + self.precollected,
-                    self.frags_per_dice,
-                    self.frags_per_roll,
-                    self.possible_categories,
-                    self.double_category_doubled,
-                    self.difficulty,
-                )
+                pool.remove(removed_item)
+                score_in_logic = pool.score()
             self.itempool.append(removed_item)
+            pool.add(removed_item)
         else:
             # Keep adding items until a score of 1000 is in logic
             while score_in_logic < 1000:
                 item_to_add = get_item_to_add(weights, extra_points_added, step_score_multipliers_added)
                 self.itempool.append(item_to_add)
+                pool.add(item_to_add)
                 if item_to_add == "1 Point":
                     score_in_logic += 1
                 elif item_to_add == "10 Points":
@@ -436,34 +446,23 @@ class YachtDiceWorld(World):
                 elif item_to_add == "100 Points":
                     score_in_logic += 100
                 else:
-                    score_in_logic = dice_simulation_fill_pool(
-                        self.itempool + self.precollected,
-                        self.frags_per_dice,
-                        self.frags_per_roll,
-                        self.possible_categories,
-                        self.double_category_doubled,
-                        self.difficulty,
-                    )
+                    score_in_logic = pool.score()
 
         # with this little categories, add more to reduce fill errors
+        extra_categories = []
         if len(self.possible_categories) == 3:
-            self.itempool.append(self.possible_categories[0])
-            self.itempool.append(self.possible_categories[1])
-            self.itempool.append(self.possible_categories[2])
+            extra_categories = [self.possible_categories[0], self.possible_categories[1], self.possible_categories[2]]
         elif len(self.possible_categories) == 2:
-            self.itempool.append(self.possible_categories[0])
-            self.itempool.append(self.possible_categories[1])
-            self.itempool.append(self.possible_categories[0])
-            self.itempool.append(self.possible_categories[1])
+            extra_categories = [self.possible_categories[0], self.possible_categories[1]] * 2
         elif len(self.possible_categories) == 1:
-            self.itempool.append(self.possible_categories[0])
-            self.itempool.append(self.possible_categories[0])
-            self.itempool.append(self.possible_categories[0])
-            self.itempool.append(self.possible_categories[0])
+            extra_categories = [self.possible_categories[0]] * 4
             self.multiworld.early_items[self.player][self.possible_categories[0]] = 2
+        for category in extra_categories:
+            self.itempool.append(category)
+            pool.add(category)
 
         self.scores_in_logic = [
-            f"{dice_simulation_fill_pool(self.itempool + self.precollected, self.frags_per_dice, self.frags_per_roll, self.possible_categories, self.double_category_doubled, d)}{'*' if d == self.difficulty else ''}"
+            f"{pool.score(d)}{'*' if d == self.difficulty else ''}"
             for d in [1, 2, 3, 4, 5, 6, 7]
         ]
 
@@ -625,7 +624,8 @@ class YachtDiceWorld(World):
         """
         set rules per location, and add the rule for beating the game
         """
-        set_yacht_rules(
+        self.score_cache = ScoreCache()
+        self.score_rule = set_yacht_rules(
             self.multiworld,
             self.player,
             self.frags_per_dice,
@@ -634,6 +634,8 @@ class YachtDiceWorld(World):
             self.double_category_doubled,
             self.difficulty,
             self.options.number_of_keys.value,
+            self.score_cache,
+            self.exact_score_logic,
         )
         set_yacht_completion_rules(self.multiworld, self.player)
 
@@ -686,6 +688,26 @@ class YachtDiceWorld(World):
 
         return change
 
+    def reachable_locations(self, state: CollectionState, locations: Sequence[Location]) -> int:
+        """
+        All score locations share self.score_rule, so the score in logic is looked up once for all of them.
+        """
+        if self.score_rule is None:
+            return super().reachable_locations(state, locations)
+        score = self.score_rule.achievable_score(state)
+        region_reachable = {}
+        flags = []
+        for location in locations:
+            rule = location.access_rule
+            if isinstance(rule, ScoreThreshold) and rule.rule is self.score_rule:
+                region = location.parent_region
+                if region not in region_reachable:
+                    region_reachable[region] = region.can_reach(state)
+                flags.append(rule.score <= score and region_reachable[region])
+            else:
+                flags.append(location.can_reach(state))
+        return bitset_from_flags(flags)
+
     def write_spoiler(self, spoiler_handle: TextIO) -> None:
         spoiler_handle.write(f"\nYacht Dice scores in logic for Player {self.player_name}: {self.scores_in_logic}")
         spoiler_handle.write(f"\nYacht Dice items in pool for Player {self.player_name}: {self.itempool}")
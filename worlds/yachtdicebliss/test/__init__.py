@@ -0,0 +1,5 @@
+from test.bases import WorldTestBase
+
+
+class YachtDiceTestBase(WorldTestBase):
+    game = "Yacht Dice Bliss"
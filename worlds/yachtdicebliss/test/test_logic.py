@@ -0,0 +1,141 @@
+import hashlib
+import math
+import pkgutil
+import unittest
+from collections import defaultdict
+from itertools import accumulate
+
+from .. import YachtWeights as yacht_weights_module
+from ..Convolution import TotalScoreEngine, weight_bits
+from ..Rules import PoolScoreTracker
+from ..YachtWeights import YachtWeights, encode_weights, get_yacht_weights, weights_file_name
+from . import YachtDiceTestBase, old_rules
+
+
+def naive_total_distribution(terms):
+    """
+    Convolves the distributions of the terms one score at a time, straight from the weights.
+    """
+    weights = get_yacht_weights()
+    total = {0: 1}
+    for category_name, num_dice, num_rolls, multiplier in terms:
+        new_total = defaultdict(int)
+        for score, weight in total.items():
+            for term_score, term_weight in weights[category_name, num_dice, num_rolls].items():
+                new_total[score + math.floor(term_score * multiplier)] += weight * term_weight
+        total = new_total
+    return {score: weight for score, weight in total.items() if weight}
+
+
+class TestConvolution(unittest.TestCase):
+    def test_small_totals_are_exact(self):
+        """Totals of up to two terms are not scaled down, so they match the naive convolution exactly."""
+        for terms in (
+            (("Category Choice", 2, 2, 1),),
+            (("Category Ones", 1, 3, 1.5),),
+            (("Category Choice", 2, 2, 1), ("Category Ones", 1, 3, 1.5)),
+            (("Category Yacht", 3, 1, 2), ("Category Pair", 2, 1, 1.1)),
+            (("Category Ones", 3, 3, 1), ("Category Ones", 3, 3, 1)),
+        ):
+            with self.subTest(terms=terms):
+                lowest, weights = TotalScoreEngine().total_distribution(terms)
+                total = {lowest + i: weight for i, weight in enumerate(weights) if weight}
+                self.assertEqual(naive_total_distribution(terms), total)
+
+    def test_scaled_totals(self):
+        """Larger totals are scaled down, but stay within rounding of the naive convolution."""
+        terms = (
+            ("Category Choice", 2, 2, 1),
+            ("Category Ones", 1, 3, 1.5),
+            ("Category Two Pair", 4, 1, 1),
+            ("Category Yacht", 3, 1, 2),
+        )
+        naive = naive_total_distribution(terms)
+        lowest, weights = TotalScoreEngine().total_distribution(terms)
+        self.assertLessEqual(sum(weights).bit_length(), weight_bits)
+        self.assertEqual(min(naive), lowest)
+        self.assertEqual(max(naive), lowest + len(weights) - 1)
+
+        naive_total = sum(naive.values())
+        naive_cumulative = list(accumulate(naive.get(lowest + i, 0) for i in range(len(weights))))
+        for naive_weight, weight in zip(naive_cumulative, accumulate(weights)):
+            self.assertAlmostEqual(naive_weight / naive_total, weight / sum(weights), places=6)
+
+
+# sha256 of the canonical form (see canonical_digest) of the yacht_weights dict that YachtWeights.py used to hold
+old_weights_digest = "69693f1451be6389fa93cdf47189e33efec5146784c3fdcbb5db13070d2019ec"
+old_weights_entries = 1706
+
+
+def canonical_digest(weights) -> str:
+    return hashlib.sha256(
+        repr(sorted((key, sorted(dist.items())) for key, dist in weights.items())).encode()
+    ).hexdigest()
+
+
+class TestWeightStore(unittest.TestCase):
+    def test_matches_old_weights(self):
+        weights = get_yacht_weights()
+        self.assertEqual(old_weights_entries, len(weights))
+        self.assertEqual(old_weights_digest, canonical_digest(weights))
+        self.assertEqual(
+            {2: 1269, 3: 2445, 4: 3769, 5: 4889, 6: 9840, 7: 14772, 8: 13639, 9: 12220, 10: 13755, 11: 15622, 12: 7780},
+            weights["Category Choice", 2, 2],
+        )
+
+    def test_encoding_round_trip(self):
+        data = pkgutil.get_data(yacht_weights_module.__name__, weights_file_name)
+        self.assertEqual(data, encode_weights(YachtWeights(data)))
+
+
+class TestOldRules(YachtDiceTestBase):
+    run_default_tests = False
+    options = {
+        "game_difficulty": 3,
+        "weight_of_step_score_multiplier": 50,
+        "weight_of_double_category": 50,
+    }
+
+    def old_score(self, items, difficulty) -> int:
+        return old_rules.dice_simulation_fill_pool(
+            items,
+            self.world.frags_per_dice,
+            self.world.frags_per_roll,
+            self.world.possible_categories,
+            self.world.double_category_doubled,
+            difficulty,
+        )
+
+    def test_pool_score_tracker(self):
+        pool = [item.name for item in self.multiworld.precollected_items[self.player]]
+        pool += [item.name for item in self.multiworld.itempool]
+        for difficulty in range(1, 8):
+            tracker = PoolScoreTracker(
+                [],
+                self.world.frags_per_dice,
+                self.world.frags_per_roll,
+                self.world.possible_categories,
+                self.world.double_category_doubled,
+                difficulty,
+                False,
+            )
+            for i, item in enumerate(pool):
+                tracker.add(item)
+                self.assertEqual(self.old_score(pool[: i + 1], difficulty), tracker.score(), (difficulty, i))
+            # going back hits the score caches
+            for i in reversed(range(len(pool))):
+                self.assertEqual(self.old_score(pool[: i + 1], difficulty), tracker.score(), (difficulty, i))
+                tracker.remove(pool[i])
+
+    def test_score_rule(self):
+        score_rule = self.world.score_rule
+        collected = [item.name for item in self.multiworld.precollected_items[self.player]]
+        for item in self.multiworld.itempool:
+            self.collect(item)
+            collected.append(item.name)
+            old_score = self.old_score(collected, self.world.difficulty)
+            self.assertEqual(old_score, score_rule.achievable_score(self.multiworld.state))
+            self.assertEqual(
+                [location for location in score_rule.locations if old_score >= location.yacht_dice_score],
+                score_rule.reachable_locations(self.multiworld.state),
+            )